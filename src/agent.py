@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -13,7 +14,10 @@ from agent_cli import build_agent_command
 from base_runner import BaseRunner
 from diff_sanity import build_diff_sanity_prompt, parse_diff_sanity_result
 from events import EventBus, EventType, HydraFlowEvent
+from execution import CaptureLimits, tail_with_markers
 from models import Task, WorkerResult, WorkerStatus
+from prompt_layers import PromptLayers
+from retrospective import parse_planned_files
 from review_insights import (
     ReviewInsightStore,
     get_common_feedback_section,
@@ -22,8 +26,11 @@ from review_insights import (
 from runner_constants import MEMORY_SUGGESTION_PROMPT
 from subprocess_util import CreditExhaustedError
 from test_adequacy import build_test_adequacy_prompt, parse_test_adequacy_result
+from test_impact import changed_files, select_impacted_tests
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from config import HydraFlowConfig
     from execution import SubprocessRunner
 
@@ -96,9 +103,13 @@ Run through this checklist before your final commit:
         branch: str,
         worker_id: int = 0,
         review_feedback: str = "",
+        on_output: Callable[[str], bool] | None = None,
     ) -> WorkerResult:
         """Run the implementation agent for *task*.
 
+        *on_output* receives the accumulated display text of the main
+        implementation run as it streams (see :meth:`_execute`).
+
         Returns a :class:`WorkerResult` with success/failure info.
         """
         start = time.monotonic()
@@ -128,6 +139,7 @@ Run through this checklist before your final commit:
                 prompt,
                 worktree_path,
                 {"issue": task.id, "source": "implementer"},
+                on_output=on_output,
                 telemetry_stats=prompt_stats,
             )
             result.transcript = transcript
@@ -409,6 +421,10 @@ Run through this checklist before your final commit:
                     extra={"issue": issue.id},
                 )
 
+        learnings_section = self._relevant_learnings_section(
+            issue.title, issue.body, *parse_planned_files(plan_comment)
+        )
+
         plan_section = ""
         if plan_comment:
             plan_comment = self._summarize_for_prompt(
@@ -473,8 +489,6 @@ Run through this checklist before your final commit:
             history_before += len(escalation_section)
             history_after += len(escalation_section)
 
-        manifest_section, memory_section = self._inject_manifest_and_memory()
-
         # Runtime log injection (opt-in)
         log_section = ""
         if self._config.inject_runtime_logs:
@@ -497,13 +511,9 @@ Run through this checklist before your final commit:
 
         test_cmd = self._config.test_command
 
-        prompt = f"""You are implementing GitHub issue #{issue.id}.
-
-## Issue: {issue.title}
-
-{body}{plan_section}{review_feedback_section}{comments_section}{manifest_section}{memory_section}{log_section}
-
-## Instructions
+        # Phase layer: identical for every issue, so it stays in the shared
+        # prefix — issue numbers belong in the issue layer below.
+        phase = f"""## Instructions
 
 1. Understand the issue and relevant code paths.
 2. Implement the solution — write the code changes first.
@@ -511,7 +521,7 @@ Run through this checklist before your final commit:
 4. Diff Sanity Check and Test Adequacy Check run automatically after your implementation.
 5. Run Pre-Quality Review Skill for correctness, plan adherence, and missing tests.
 6. Run Run-Tool Skill: `make lint` → `{test_cmd}` → `make quality-lite`; fix and rerun.
-7. Commit with: "Fixes #{issue.id}: <concise summary>"
+7. Commit with: "Fixes #<issue number>: <concise summary>"
 {feedback_section}{escalation_section}
 {self._build_self_check_checklist(escalations)}
 ## UI Guidelines
@@ -538,6 +548,15 @@ Run through this checklist before your final commit:
   write the code, not to second-guess the plan. Always produce commits.
 
 {MEMORY_SUGGESTION_PROMPT.format(context="implementation")}"""
+        issue_layer = f"""You are implementing GitHub issue #{issue.id}. Commit with: "Fixes #{issue.id}: <concise summary>"
+
+## Issue: {issue.title}
+
+{body}{plan_section}{review_feedback_section}{comments_section}{learnings_section}{log_section}"""
+        layers = PromptLayers(
+            repo=self._repo_context_layer(), phase=phase, issue=issue_layer
+        )
+        prompt = layers.render()
         stats = {
             "history_chars_before": history_before,
             "history_chars_after": history_after,
@@ -551,6 +570,7 @@ Run through this checklist before your final commit:
                 "history_before": history_before,
                 "history_after": history_after,
             },
+            **layers.stats(),
         }
         return prompt, stats
 
@@ -766,6 +786,8 @@ SUMMARY: <one-line summary>
                 ],
                 cwd=str(worktree_path),
                 timeout=self._config.git_command_timeout,
+                # Callers keep only the first max_review_diff_chars.
+                capture=CaptureLimits.head_chars(self._config.max_review_diff_chars),
             )
             return result.stdout or ""
         except (TimeoutError, FileNotFoundError):
@@ -915,6 +937,12 @@ SUMMARY: <one-line summary>
             )
             await self._force_commit_uncommitted(issue, worktree_path)
 
+            if self._config.incremental_quality_enabled:
+                precheck = await self._run_impacted_tests(issue, worktree_path)
+                if precheck is not None and not precheck[0]:
+                    last_error = precheck[1]
+                    continue
+
             success, verify_msg = await self._verify_result(worktree_path, branch)
             if success:
                 return True, "OK", attempt
@@ -923,6 +951,74 @@ SUMMARY: <one-line summary>
 
         return False, last_error, max_attempts
 
+    async def _run_impacted_tests(
+        self, issue: Task, worktree_path: Path
+    ) -> tuple[bool, str] | None:
+        """Run only the tests affected by the branch's changes.
+
+        A fast pre-check for the quality-fix loop: a failure here skips
+        the full ``make quality`` for this attempt, a pass still requires
+        it.  Returns ``None`` when the affected tests cannot be determined,
+        there are none, or the test runner exits without a test verdict.
+        """
+        from execution import get_default_runner
+
+        changed = await changed_files(
+            worktree_path,
+            f"origin/{self._config.main_branch}",
+            get_default_runner(),
+            self._config.git_command_timeout,
+        )
+        if not changed:
+            return None
+        selections = await asyncio.to_thread(
+            select_impacted_tests, self._config, worktree_path, changed
+        )
+        for selection in selections:
+            logger.info(
+                "Issue #%d: running %d affected %s test target(s) before make quality",
+                issue.id,
+                len(selection.targets),
+                selection.stack,
+            )
+            try:
+                result = await self._runner.run_simple(
+                    selection.argv,
+                    cwd=str(worktree_path),
+                    timeout=self._config.quality_timeout,
+                    capture=CaptureLimits.tail_chars(
+                        self._config.error_output_max_chars
+                    ),
+                )
+            except (FileNotFoundError, TimeoutError) as exc:
+                logger.warning(
+                    "Issue #%d: affected-test pre-check unavailable (%s) — "
+                    "falling back to make quality",
+                    issue.id,
+                    type(exc).__name__,
+                )
+                return None
+            if result.returncode == 0:
+                continue
+            output = "\n".join(filter(None, [result.stdout, result.stderr]))
+            if not selection.is_test_failure(result.returncode, output):
+                # Usage error, nothing collected or a missing runner says
+                # nothing about the code — let the full gate decide.
+                logger.warning(
+                    "Issue #%d: affected-test pre-check unavailable "
+                    "(`%s` exited %d) — falling back to make quality",
+                    issue.id,
+                    " ".join(selection.command),
+                    result.returncode,
+                )
+                return None
+            return (
+                False,
+                f"Affected tests failed (`{' '.join(selection.command)}`):\n"
+                + tail_with_markers(output, self._config.error_output_max_chars),
+            )
+        return (True, "OK") if selections else None
+
     async def _force_commit_uncommitted(self, task: Task, worktree_path: Path) -> bool:
         """Stage and commit any uncommitted changes the agent left behind.
 
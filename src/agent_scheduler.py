@@ -0,0 +1,222 @@
+"""Global agent-slot scheduler shared by all pipeline phases.
+
+Each phase still runs its own slot-filling pool capped by its ``max_*``
+setting, but with ``agent_slot_budget`` set every agent run must also
+hold one of a fixed number of global slots.  Phases therefore borrow the
+capacity that others leave idle instead of each owning a fixed share.
+
+When slots are contested, waiters are granted in this order:
+
+1. Phases running fewer than ``agent_slot_min_per_phase`` agents, so no
+   phase can be starved out entirely.
+2. Highest effective priority — review (which merges) before HITL before
+   implementation before planning before triage, with epic children
+   slightly ahead of other issues in the same phase.  Every
+   ``agent_slot_aging_seconds`` spent waiting adds one priority level so
+   long-waiting work eventually outranks fresh higher-priority work.
+3. Longest waiting.
+
+Phases never exceed their own ``max_*`` cap.  Queue waits are recorded
+per phase for the dashboard and the ``/metrics`` endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from runtime_metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+    from models import Task
+
+PHASES = ("triage", "plan", "implement", "review", "hitl")
+
+# Base priority levels; one aging interval of waiting is worth one level.
+_PHASE_PRIORITY: dict[str, float] = {
+    "review": 4.0,
+    "hitl": 3.0,
+    "implement": 2.0,
+    "plan": 1.0,
+    "triage": 0.0,
+}
+_EPIC_CHILD_BONUS = 0.5
+# Recent waits kept per phase for the dashboard averages.
+_WAIT_WINDOW = 100
+
+_SLOT_WAIT = REGISTRY.histogram(
+    "hydraflow_agent_slot_wait_seconds",
+    "Time agent runs waited for a global scheduler slot",
+    ("phase",),
+)
+
+
+@dataclass
+class _Waiter:
+    phase: str
+    priority: float
+    enqueued: float
+    future: asyncio.Future[None] = field(repr=False)
+
+
+class AgentScheduler:
+    """Grants a shared budget of agent slots across pipeline phases."""
+
+    def __init__(
+        self,
+        config: HydraFlowConfig,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config
+        self._clock = clock
+        self._waiters: list[_Waiter] = []
+        self._active: dict[str, int] = dict.fromkeys(PHASES, 0)
+        self._waits: dict[str, deque[float]] = {
+            p: deque(maxlen=_WAIT_WINDOW) for p in PHASES
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.agent_slot_budget > 0
+
+    def _phase_max(self, phase: str) -> int:
+        caps = {
+            "triage": self._config.max_triagers,
+            "plan": self._config.max_planners,
+            "implement": self._config.max_workers,
+            "review": self._config.max_reviewers,
+            "hitl": self._config.max_hitl_workers,
+        }
+        return caps[phase]
+
+    def _is_epic_child(self, issue: Task | None) -> bool:
+        if issue is None:
+            return False
+        if issue.parent_epic is not None:
+            return True
+        child_labels = {lbl.lower() for lbl in self._config.epic_child_label}
+        return bool(child_labels & {t.lower() for t in issue.tags})
+
+    @asynccontextmanager
+    async def slot(self, phase: str, issue: Task | None = None) -> AsyncIterator[None]:
+        """Hold a global agent slot for *phase* while the block runs.
+
+        A no-op when ``agent_slot_budget`` is 0.
+        """
+        if not self.enabled:
+            yield
+            return
+        priority = _PHASE_PRIORITY[phase]
+        if self._is_epic_child(issue):
+            priority += _EPIC_CHILD_BONUS
+        waiter = _Waiter(
+            phase=phase,
+            priority=priority,
+            enqueued=self._clock(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(phase)
+            else:
+                self._waiters.remove(waiter)
+            raise
+        waited = self._clock() - waiter.enqueued
+        self._waits[phase].append(waited)
+        _SLOT_WAIT.observe(waited, phase)
+        try:
+            yield
+        finally:
+            self._release(phase)
+
+    def _release(self, phase: str) -> None:
+        self._active[phase] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the best eligible waiters."""
+        budget = self._config.agent_slot_budget
+        while self._waiters and sum(self._active.values()) < budget:
+            waiter = self._pick()
+            if waiter is None:
+                return
+            self._waiters.remove(waiter)
+            self._active[waiter.phase] += 1
+            waiter.future.set_result(None)
+
+    def _pick(self) -> _Waiter | None:
+        now = self._clock()
+        aging = self._config.agent_slot_aging_seconds
+        minimum = self._config.agent_slot_min_per_phase
+        best: _Waiter | None = None
+        best_key: tuple[bool, float, float] | None = None
+        for waiter in self._waiters:
+            if waiter.future.done():
+                continue
+            active = self._active[waiter.phase]
+            if active >= self._phase_max(waiter.phase):
+                continue
+            effective = waiter.priority + (now - waiter.enqueued) / aging
+            key = (active >= minimum, -effective, waiter.enqueued)
+            if best_key is None or key < best_key:
+                best, best_key = waiter, key
+        return best
+
+    def stats(self) -> dict[str, Any]:
+        """Return the budget and per-phase active, waiting and wait times."""
+        now = self._clock()
+        phases: dict[str, dict[str, Any]] = {}
+        for phase in PHASES:
+            waits = self._waits[phase]
+            waiting = [w for w in self._waiters if w.phase == phase]
+            oldest = max((now - w.enqueued for w in waiting), default=0.0)
+            phases[phase] = {
+                "active": self._active[phase],
+                "waiting": len(waiting),
+                "max": self._phase_max(phase),
+                "avg_wait_seconds": round(sum(waits) / len(waits), 2) if waits else 0.0,
+                "max_wait_seconds": round(max(max(waits, default=0.0), oldest), 2),
+            }
+        return {
+            "enabled": self.enabled,
+            "budget": self._config.agent_slot_budget,
+            "active": sum(self._active.values()),
+            "phases": phases,
+        }
+
+
+_scheduler: AgentScheduler | None = None
+
+
+def configure_agent_scheduler(config: HydraFlowConfig) -> AgentScheduler:
+    """Install the process-wide scheduler for *config* and return it."""
+    global _scheduler  # noqa: PLW0603
+    _scheduler = AgentScheduler(config)
+    return _scheduler
+
+
+def get_agent_scheduler() -> AgentScheduler | None:
+    """Return the process-wide scheduler, or None before configuration."""
+    return _scheduler
+
+
+@asynccontextmanager
+async def agent_slot(phase: str, issue: Task | None = None) -> AsyncIterator[None]:
+    """Hold a slot on the process-wide scheduler (no-op when unconfigured)."""
+    scheduler = _scheduler
+    if scheduler is None:
+        yield
+        return
+    async with scheduler.slot(phase, issue):
+        yield
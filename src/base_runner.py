@@ -13,11 +13,13 @@ from agent_cli import build_agent_command
 from config import HydraFlowConfig
 from context_cache import ContextSectionCache
 from events import EventBus
-from execution import get_default_runner
+from execution import CaptureLimits, get_default_runner, tail_with_markers
 from manifest import load_project_manifest
 from memory import load_memory_digest
+from memory_index import LearningIndex, format_learnings, load_learning_index
 from models import TranscriptEventData
 from prompt_telemetry import PromptTelemetry, parse_command_tool_model
+from quality_cache import QualityGateCache
 from runner_utils import (
     AuthenticationRetryError,
     stream_claude_process,
@@ -32,9 +34,9 @@ class BaseRunner:
     """Shared base for ``AgentRunner``, ``PlannerRunner``, ``ReviewRunner``, and ``HITLRunner``.
 
     Provides the common ``__init__``, ``terminate``, ``_execute``,
-    ``_save_transcript``, ``_inject_manifest_and_memory``, and
-    ``_verify_quality`` implementations so each subclass only needs to
-    implement its own prompt-building and run logic.
+    ``_save_transcript``, ``_inject_manifest_and_memory``,
+    ``_repo_context_layer`` and ``_verify_quality`` implementations so each
+    subclass only needs to implement its own prompt-building and run logic.
     """
 
     _log: ClassVar[logging.Logger]
@@ -51,6 +53,7 @@ class BaseRunner:
         self._runner = runner or get_default_runner()
         self._context_cache = ContextSectionCache(config)
         self._prompt_telemetry = PromptTelemetry(config)
+        self._quality_cache = QualityGateCache(config)
         self._last_context_stats: dict[str, int] = {"cache_hits": 0, "cache_misses": 0}
 
     def terminate(self) -> None:
@@ -162,7 +165,9 @@ class BaseRunner:
         """Load the project manifest and memory digest.
 
         Returns ``(manifest_section, memory_section)`` where each is an
-        empty string when the corresponding file is missing.
+        empty string when the corresponding file is missing.  The digest
+        is skipped when relevance-ranked learnings are available; see
+        :meth:`_relevant_learnings_section`.
         """
         cache_hits = 0
         cache_misses = 0
@@ -180,14 +185,16 @@ class BaseRunner:
             manifest_section = f"\n\n## Project Context\n\n{manifest}"
 
         memory_section = ""
-        digest_path = self._config.data_path("memory", "digest.md")
-        digest, digest_hit = self._context_cache.get_or_load(
-            key="memory_digest",
-            source_path=digest_path,
-            loader=load_memory_digest,
-        )
-        cache_hits += 1 if digest_hit else 0
-        cache_misses += 0 if digest_hit else 1
+        digest = ""
+        if self._learning_index() is None:
+            digest_path = self._config.data_path("memory", "digest.md")
+            digest, digest_hit = self._context_cache.get_or_load(
+                key="memory_digest",
+                source_path=digest_path,
+                loader=load_memory_digest,
+            )
+            cache_hits += 1 if digest_hit else 0
+            cache_misses += 0 if digest_hit else 1
         if digest:
             memory_section = f"\n\n## Accumulated Learnings\n\n{digest}"
 
@@ -200,6 +207,36 @@ class BaseRunner:
 
         return manifest_section, memory_section
 
+    def _learning_index(self) -> LearningIndex | None:
+        """Return the synced learnings index when retrieval is enabled."""
+        if self._config.memory_retrieval_top_k <= 0:
+            return None
+        return load_learning_index(self._config)
+
+    def _relevant_learnings_section(self, *query: str) -> str:
+        """Return the learnings most relevant to *query* as a prompt section.
+
+        The result is issue-specific, so it belongs in the issue layer.
+        Empty when retrieval is disabled, nothing was synced yet, or no
+        learning matches.
+        """
+        index = self._learning_index()
+        if index is None:
+            return ""
+        results = index.search("\n".join(query), self._config.memory_retrieval_top_k)
+        learnings = format_learnings(results, self._config.max_memory_prompt_chars)
+        if not learnings:
+            return ""
+        return f"\n\n## Relevant Learnings\n\n{learnings}"
+
+    def _repo_context_layer(self) -> str:
+        """Return the manifest and memory digest as the repo-context layer.
+
+        See :mod:`prompt_layers` for where this sits in a prompt.
+        """
+        manifest_section, memory_section = self._inject_manifest_and_memory()
+        return (manifest_section + memory_section).strip("\n")
+
     def _consume_context_stats(self) -> dict[str, int]:
         stats = dict(self._last_context_stats)
         self._last_context_stats = {"cache_hits": 0, "cache_misses": 0}
@@ -222,12 +259,28 @@ class BaseRunner:
         )
 
     async def _verify_quality(self, worktree_path: Path) -> tuple[bool, str]:
-        """Run ``make quality`` and return ``(success, error_output)``."""
+        """Run ``make quality`` and return ``(success, error_output)``.
+
+        Results are cached by worktree tree SHA, target and toolchain, so
+        re-verifying an unchanged tree returns the previous verdict.
+        """
+        cache_key = await self._quality_cache.key(worktree_path, "quality")
+        if cache_key is not None:
+            cached = self._quality_cache.get(cache_key, "quality")
+            if cached is not None:
+                self._log.info(
+                    "Reusing cached make quality result for %s", worktree_path
+                )
+                return cached
         try:
             result = await self._runner.run_simple(
                 ["make", "quality"],
                 cwd=str(worktree_path),
                 timeout=self._config.quality_timeout,
+                capture=CaptureLimits.tail_chars(
+                    self._config.error_output_max_chars,
+                    spill_path=self._config.quality_spill_path(worktree_path),
+                ),
             )
         except FileNotFoundError:
             return False, "make not found — cannot run quality checks"
@@ -238,8 +291,13 @@ class BaseRunner:
             )
         if result.returncode != 0:
             output = "\n".join(filter(None, [result.stdout, result.stderr]))
-            return (
+            verdict = (
                 False,
-                f"`make quality` failed:\n{output[-self._config.error_output_max_chars :]}",
+                "`make quality` failed:\n"
+                + tail_with_markers(output, self._config.error_output_max_chars),
             )
-        return True, "OK"
+        else:
+            verdict = (True, "OK")
+        if cache_key is not None:
+            self._quality_cache.put(cache_key, "quality", *verdict)
+        return verdict
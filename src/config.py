@@ -29,6 +29,13 @@ _ENV_INT_OVERRIDES: list[tuple[str, str, int]] = [
     ("max_diff_sanity_attempts", "HYDRAFLOW_MAX_DIFF_SANITY_ATTEMPTS", 1),
     ("max_test_adequacy_attempts", "HYDRAFLOW_MAX_TEST_ADEQUACY_ATTEMPTS", 1),
     ("max_review_fix_attempts", "HYDRAFLOW_MAX_REVIEW_FIX_ATTEMPTS", 2),
+    (
+        "incremental_review_max_delta_lines",
+        "HYDRAFLOW_INCREMENTAL_REVIEW_MAX_DELTA_LINES",
+        400,
+    ),
+    ("full_review_interval", "HYDRAFLOW_FULL_REVIEW_INTERVAL", 3),
+    ("max_overlap_deferrals", "HYDRAFLOW_MAX_OVERLAP_DEFERRALS", 3),
     ("min_review_findings", "HYDRAFLOW_MIN_REVIEW_FINDINGS", 3),
     ("max_issue_body_chars", "HYDRAFLOW_MAX_ISSUE_BODY_CHARS", 10_000),
     ("max_review_diff_chars", "HYDRAFLOW_MAX_REVIEW_DIFF_CHARS", 15_000),
@@ -53,6 +60,16 @@ _ENV_INT_OVERRIDES: list[tuple[str, str, int]] = [
     ("artifact_retention_days", "HYDRAFLOW_ARTIFACT_RETENTION_DAYS", 30),
     ("artifact_max_size_mb", "HYDRAFLOW_ARTIFACT_MAX_SIZE_MB", 500),
     ("runs_gc_interval", "HYDRAFLOW_RUNS_GC_INTERVAL", 3600),
+    ("tracing_min_span_ms", "HYDRAFLOW_TRACING_MIN_SPAN_MS", 0),
+    ("profiling_sample_hz", "HYDRAFLOW_PROFILING_SAMPLE_HZ", 100),
+    ("load_control_interval", "HYDRAFLOW_LOAD_CONTROL_INTERVAL", 10),
+    ("agent_slot_budget", "HYDRAFLOW_AGENT_SLOT_BUDGET", 0),
+    ("agent_slot_min_per_phase", "HYDRAFLOW_AGENT_SLOT_MIN_PER_PHASE", 1),
+    ("agent_slot_aging_seconds", "HYDRAFLOW_AGENT_SLOT_AGING_SECONDS", 300),
+    ("slow_callback_threshold_ms", "HYDRAFLOW_SLOW_CALLBACK_THRESHOLD_MS", 0),
+    ("docker_pool_max_containers", "HYDRAFLOW_DOCKER_POOL_MAX_CONTAINERS", 4),
+    ("docker_pool_idle_timeout", "HYDRAFLOW_DOCKER_POOL_IDLE_TIMEOUT", 300),
+    ("worktree_disk_quota_mb", "HYDRAFLOW_WORKTREE_DISK_QUOTA_MB", 0),
     ("adr_review_interval", "HYDRAFLOW_ADR_REVIEW_INTERVAL", 86400),
     ("adr_review_approval_threshold", "HYDRAFLOW_ADR_REVIEW_APPROVAL_THRESHOLD", 2),
     ("adr_review_max_rounds", "HYDRAFLOW_ADR_REVIEW_MAX_ROUNDS", 3),
@@ -72,6 +89,8 @@ _ENV_INT_OVERRIDES: list[tuple[str, str, int]] = [
     ("git_command_timeout", "HYDRAFLOW_GIT_COMMAND_TIMEOUT", 30),
     ("summarizer_timeout", "HYDRAFLOW_SUMMARIZER_TIMEOUT", 120),
     ("error_output_max_chars", "HYDRAFLOW_ERROR_OUTPUT_MAX_CHARS", 3000),
+    ("quality_cache_max_entries", "HYDRAFLOW_QUALITY_CACHE_MAX_ENTRIES", 256),
+    ("memory_retrieval_top_k", "HYDRAFLOW_MEMORY_RETRIEVAL_TOP_K", 8),
     (
         "max_troubleshooting_prompt_chars",
         "HYDRAFLOW_MAX_TROUBLESHOOTING_PROMPT_CHARS",
@@ -87,6 +106,7 @@ _ENV_INT_OVERRIDES: list[tuple[str, str, int]] = [
 
 _ENV_STR_OVERRIDES: list[tuple[str, str, str]] = [
     ("test_command", "HYDRAFLOW_TEST_COMMAND", "make test"),
+    ("incremental_test_command", "HYDRAFLOW_INCREMENTAL_TEST_COMMAND", ""),
     ("docker_image", "HYDRAFLOW_DOCKER_IMAGE", "ghcr.io/t-rav/hydraflow-agent:latest"),
     ("docker_network", "HYDRAFLOW_DOCKER_NETWORK", ""),
     ("system_model", "HYDRAFLOW_SYSTEM_MODEL", ""),
@@ -106,6 +126,12 @@ _ENV_FLOAT_OVERRIDES: list[tuple[str, str, float]] = [
     ("docker_cpu_limit", "HYDRAFLOW_DOCKER_CPU_LIMIT", 2.0),
     ("docker_spawn_delay", "HYDRAFLOW_DOCKER_SPAWN_DELAY", 2.0),
     ("visual_retry_delay", "HYDRAFLOW_VISUAL_RETRY_DELAY", 2.0),
+    (
+        "load_control_max_load_per_core",
+        "HYDRAFLOW_LOAD_CONTROL_MAX_LOAD_PER_CORE",
+        3.0,
+    ),
+    ("load_control_max_pressure", "HYDRAFLOW_LOAD_CONTROL_MAX_PRESSURE", 40.0),
 ]
 
 # Float overrides with tight [0, 1] bounds — handled separately from the
@@ -114,6 +140,14 @@ _ENV_FLOAT_OVERRIDES: list[tuple[str, str, float]] = [
 _ENV_FLOAT_RATIO_OVERRIDES: list[tuple[str, str, float]] = [
     ("visual_warn_threshold", "HYDRAFLOW_VISUAL_WARN_THRESHOLD", 0.05),
     ("visual_fail_threshold", "HYDRAFLOW_VISUAL_FAIL_THRESHOLD", 0.15),
+    ("tracing_sample_rate", "HYDRAFLOW_TRACING_SAMPLE_RATE", 1.0),
+    (
+        "load_control_min_free_memory_ratio",
+        "HYDRAFLOW_LOAD_CONTROL_MIN_FREE_MEMORY_RATIO",
+        0.1,
+    ),
+    ("load_control_min_fraction", "HYDRAFLOW_LOAD_CONTROL_MIN_FRACTION", 0.25),
+    ("max_planned_file_overlap", "HYDRAFLOW_MAX_PLANNED_FILE_OVERLAP", 0.5),
 ]
 
 _ENV_BOOL_OVERRIDES: list[tuple[str, str, bool]] = [
@@ -130,6 +164,16 @@ _ENV_BOOL_OVERRIDES: list[tuple[str, str, bool]] = [
         False,
     ),
     ("memory_auto_approve", "HYDRAFLOW_MEMORY_AUTO_APPROVE", False),
+    ("tracing_enabled", "HYDRAFLOW_TRACING_ENABLED", False),
+    ("profiling_enabled", "HYDRAFLOW_PROFILING_ENABLED", False),
+    ("load_control_enabled", "HYDRAFLOW_LOAD_CONTROL_ENABLED", False),
+    ("quality_cache_enabled", "HYDRAFLOW_QUALITY_CACHE_ENABLED", True),
+    ("incremental_quality_enabled", "HYDRAFLOW_INCREMENTAL_QUALITY_ENABLED", False),
+    (
+        "artifact_compress_transcripts",
+        "HYDRAFLOW_ARTIFACT_COMPRESS_TRANSCRIPTS",
+        False,
+    ),
     ("debug_escalation_enabled", "HYDRAFLOW_DEBUG_ESCALATION_ENABLED", True),
     ("inject_runtime_logs", "HYDRAFLOW_INJECT_RUNTIME_LOGS", False),
     ("unstick_auto_merge", "HYDRAFLOW_UNSTICK_AUTO_MERGE", True),
@@ -176,6 +220,7 @@ _ENV_LITERAL_OVERRIDES: list[tuple[str, str]] = [
     ("report_issue_tool", "HYDRAFLOW_REPORT_ISSUE_TOOL"),
     ("epic_merge_strategy", "HYDRAFLOW_EPIC_MERGE_STRATEGY"),
     ("release_version_source", "HYDRAFLOW_RELEASE_VERSION_SOURCE"),
+    ("review_diff_source", "HYDRAFLOW_REVIEW_DIFF_SOURCE"),
 ]
 
 # Deprecated env var aliases (HYDRA_ → HYDRAFLOW_).
@@ -313,6 +358,18 @@ class HydraFlowConfig(BaseModel):
         le=5,
         description="Max review fix-and-retry cycles before HITL escalation",
     )
+    incremental_review_max_delta_lines: int = Field(
+        default=400,
+        ge=0,
+        le=10_000,
+        description="Re-review only the changes since the last reviewed SHA when they touch at most this many lines (0 = always review the full diff)",
+    )
+    full_review_interval: int = Field(
+        default=3,
+        ge=1,
+        le=20,
+        description="Force a full review after this many consecutive incremental reviews of a PR",
+    )
     min_review_findings: int = Field(
         default=3,
         ge=0,
@@ -337,6 +394,18 @@ class HydraFlowConfig(BaseModel):
         le=10,
         description="Max total implementation attempts per issue before HITL escalation",
     )
+    max_planned_file_overlap: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Hold a ready issue back while more than this fraction of its planned files are also planned by in-flight implementations",
+    )
+    max_overlap_deferrals: int = Field(
+        default=3,
+        ge=0,
+        le=50,
+        description="Times a ready issue may be held back or passed over for less-overlapping work before it starts anyway (0 = plain FIFO)",
+    )
     gh_max_retries: int = Field(
         default=3,
         ge=0,
@@ -445,6 +514,12 @@ class HydraFlowConfig(BaseModel):
         le=86400,
         description="Worktree GC loop interval in seconds (default 30 min)",
     )
+    worktree_disk_quota_mb: int = Field(
+        default=0,
+        ge=0,
+        le=10_000_000,
+        description="Max total workspace disk usage in MB; oldest idle workspaces are evicted before a new one is created (0 = unlimited)",
+    )
     collaborator_check_enabled: bool = Field(
         default=True,
         description="When True, skip issues from non-collaborators at fetch time",
@@ -469,12 +544,106 @@ class HydraFlowConfig(BaseModel):
         le=10_000,
         description="Max total artifact storage in MB before oldest runs are pruned (default 500)",
     )
+    artifact_compress_transcripts: bool = Field(
+        default=False,
+        description="Write run transcripts as seekable gzip frames (transcript.log.gz)",
+    )
     runs_gc_interval: int = Field(
         default=3600,
         ge=300,
         le=86400,
         description="Runs GC loop interval in seconds (default 1 hour)",
     )
+    tracing_enabled: bool = Field(
+        default=False,
+        description="Record issue-lifecycle spans to .hydraflow/traces/spans.jsonl",
+    )
+    tracing_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of traces (root spans) recorded when tracing is enabled",
+    )
+    tracing_min_span_ms: int = Field(
+        default=0,
+        ge=0,
+        le=3_600_000,
+        description="Drop non-root spans shorter than this many milliseconds (0 = keep all)",
+    )
+    agent_slot_budget: int = Field(
+        default=0,
+        ge=0,
+        le=100,
+        description="Total concurrent agents shared across all phases; each phase "
+        "stays within its own max_* cap (0 = per-phase limits only)",
+    )
+    agent_slot_min_per_phase: int = Field(
+        default=1,
+        ge=0,
+        le=10,
+        description="Slots a phase is served first for when it runs fewer agents "
+        "than this, regardless of priority",
+    )
+    agent_slot_aging_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="Seconds of queue wait that raise a waiter's priority by one "
+        "phase level",
+    )
+    load_control_enabled: bool = Field(
+        default=False,
+        description="Scale agent pool sizes down under CPU, memory or I/O pressure",
+    )
+    load_control_interval: int = Field(
+        default=10,
+        ge=1,
+        le=600,
+        description="Seconds between system load samples",
+    )
+    load_control_max_load_per_core: float = Field(
+        default=3.0,
+        ge=0.1,
+        le=100.0,
+        description="Throttle when the 1-minute load average per core exceeds this",
+    )
+    load_control_min_free_memory_ratio: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Throttle when available memory falls below this share of total",
+    )
+    load_control_max_pressure: float = Field(
+        default=40.0,
+        ge=0.0,
+        le=100.0,
+        description="Throttle when any /proc/pressure 10s stall average exceeds "
+        "this percentage",
+    )
+    load_control_min_fraction: float = Field(
+        default=0.25,
+        ge=0.0,
+        le=1.0,
+        description="Lowest share of each configured pool size the controller "
+        "may throttle to (pools always keep at least one slot)",
+    )
+    profiling_enabled: bool = Field(
+        default=False,
+        description="Continuously sample the event loop thread's stacks",
+    )
+    profiling_sample_hz: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Stack samples per second for continuous and on-demand profiles",
+    )
+    slow_callback_threshold_ms: int = Field(
+        default=0,
+        ge=0,
+        le=60_000,
+        description="Log the stack of any callback blocking the event loop longer "
+        "than this many milliseconds (0 = off)",
+    )
 
     epic_stale_days: int = Field(
         default=7,
@@ -655,11 +824,37 @@ class HydraFlowConfig(BaseModel):
         le=20_000,
         description="Max characters of error output to include in prompts and messages",
     )
+    quality_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse 'make quality' results for worktrees whose tree, "
+        "target and toolchain are unchanged",
+    )
+    quality_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        le=10_000,
+        description="Max quality gate results kept in the cache before the oldest are evicted",
+    )
 
     test_command: str = Field(
         default="make test",
         description="Quick test command for agent prompts",
     )
+    incremental_quality_enabled: bool = Field(
+        default=False,
+        description="In the quality-fix loop, run only the tests affected by the "
+        "worktree's changes before the full 'make quality'",
+    )
+    incremental_test_command: str = Field(
+        default="",
+        description="Command that runs the affected tests (test paths are appended); "
+        "empty uses the detected stack's test runner",
+    )
+    test_impact_rules: list[str] = Field(
+        default_factory=list,
+        description="Extra 'SOURCE_REGEX => TEST_TEMPLATE' rules mapping changed "
+        "files to tests; templates use {1}, {2}... for regex groups",
+    )
     max_issue_body_chars: int = Field(
         default=10_000,
         ge=1_000,
@@ -672,6 +867,10 @@ class HydraFlowConfig(BaseModel):
         le=200_000,
         description="Max characters for PR diff in reviewer prompts before truncation",
     )
+    review_diff_source: Literal["local", "api"] = Field(
+        default="local",
+        description="Where the review phase reads PR diffs: 'local' runs git diff in the review worktree (API fallback), 'api' always uses gh pr diff",
+    )
     max_memory_chars: int = Field(
         default=4000,
         ge=500,
@@ -684,6 +883,12 @@ class HydraFlowConfig(BaseModel):
         le=50_000,
         description="Max characters for memory digest injected into agent prompts",
     )
+    memory_retrieval_top_k: int = Field(
+        default=8,
+        ge=0,
+        le=50,
+        description="Learnings injected per prompt, ranked by relevance to the issue (0 = inject the whole memory digest instead)",
+    )
     max_troubleshooting_prompt_chars: int = Field(
         default=3000,
         ge=500,
@@ -1148,6 +1353,18 @@ class HydraFlowConfig(BaseModel):
         default=[],
         description="Additional volume mounts as host:container:mode strings",
     )
+    docker_pool_max_containers: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description="Max long-lived per-workspace containers for short commands (0 = one container per command)",
+    )
+    docker_pool_idle_timeout: int = Field(
+        default=300,
+        ge=10,
+        le=86400,
+        description="Seconds a pooled container may sit idle before it is removed",
+    )
 
     # Baseline policy
     baseline_snapshot_patterns: list[str] = Field(
@@ -1301,6 +1518,10 @@ class HydraFlowConfig(BaseModel):
         """Return the repo-scoped worktree directory path for a given issue number."""
         return self.worktree_base / self.repo_slug / f"issue-{issue_number}"
 
+    def quality_spill_path(self, worktree_path: Path) -> Path:
+        """Return the spill path prefix for quality gate output of a worktree."""
+        return self.data_path("logs", "quality", worktree_path.name)
+
     @model_validator(mode="after")
     def resolve_defaults(self) -> HydraFlowConfig:
         """Resolve paths, repo slug, and apply env var overrides.
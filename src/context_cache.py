@@ -1,25 +1,76 @@
-"""Filesystem-backed cache for prompt context sections."""
+"""Cache for prompt context sections.
+
+Two tiers:
+
+* a process-level memory tier, validated by the source file's
+  ``(st_mtime_ns, st_size, st_ino)`` alone, so a warm prompt build costs
+  one ``stat`` per section and no file reads; and
+* ``context_sections.json`` on disk, validated by a content digest of the
+  source, which carries sections across restarts.  It is read once per
+  process and rewritten only when a section is reloaded.
+
+A source modified within :data:`_RACY_WINDOW_NS` of being checked may
+change again without its stat fields moving (coarse filesystem
+timestamps), so such entries are re-hashed until they age out of the
+window — the same guard git applies to "racily clean" index entries.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from hashlib import sha256
 from pathlib import Path
 
 from config import HydraFlowConfig
 from file_util import atomic_write
+from runtime_metrics import REGISTRY
 
 logger = logging.getLogger("hydraflow.context_cache")
 
+_CACHE_REQUESTS = REGISTRY.counter(
+    "hydraflow_context_cache_requests_total",
+    "Prompt context section lookups by section and hit/miss",
+    ("section", "result"),
+)
+
+# Sources modified this recently are re-hashed rather than trusted by stat.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_StatKey = tuple[int, int, int]
+
+
+@dataclass
+class _MemoryEntry:
+    stat: _StatKey | None
+    digest: str
+    content: str
+    verified_ns: int
+
+
+# Shared by all ContextSectionCache instances; every runner builds its own.
+# Keyed by cache file path, then section key.
+_MEMORY: dict[str, dict[str, _MemoryEntry]] = {}
+# Parsed ``context_sections.json`` per cache file path.
+_DISK: dict[str, dict[str, dict[str, object]]] = {}
+_LOCK = threading.RLock()
 
-class ContextSectionCache:
-    """Caches expensive prompt context sections on disk.
 
-    Cache key validity is based on source file metadata and content fingerprint.
-    """
+def _stat_key(source_path: Path) -> _StatKey | None:
+    try:
+        st = source_path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class ContextSectionCache:
+    """Caches expensive prompt context sections in memory and on disk."""
 
     def __init__(self, config: HydraFlowConfig) -> None:
         self._config = config
@@ -36,42 +87,76 @@ class ContextSectionCache:
 
         Returns ``(content, cache_hit)``.
         """
-        exists = source_path.is_file()
-        stat_result = source_path.stat() if exists else None
-        mtime_ns = stat_result.st_mtime_ns if stat_result is not None else 0
-        ctime_ns = stat_result.st_ctime_ns if stat_result is not None else 0
-        inode = stat_result.st_ino if stat_result is not None else 0
-        size = stat_result.st_size if stat_result is not None else 0
-        source_digest = self._source_digest(source_path, exists)
-
-        data = self._load_cache_data()
-        entry = data.get(key, {})
-
+        stat = _stat_key(source_path)
+        now = time.time_ns()
+        with _LOCK:
+            entries = _MEMORY.setdefault(str(self._path), {})
+            entry = entries.get(key)
+            if entry is not None and entry.stat == stat and not self._racy(entry):
+                _CACHE_REQUESTS.inc(key, "hit")
+                return entry.content, True
+
+            digest = self._source_digest(source_path, stat is not None)
+            if entry is None:
+                entry = self._from_disk(key, stat, digest, now)
+            if entry is not None and entry.digest == digest:
+                entry.stat = stat
+                entry.verified_ns = now
+                entries[key] = entry
+                _CACHE_REQUESTS.inc(key, "hit")
+                return entry.content, True
+
+            _CACHE_REQUESTS.inc(key, "miss")
+            content = loader(self._config)
+            entries[key] = _MemoryEntry(stat, digest, content, now)
+            self._persist(key, stat, digest, content)
+            return content, False
+
+    @staticmethod
+    def _racy(entry: _MemoryEntry) -> bool:
+        if entry.stat is None:
+            return False
+        return entry.stat[0] >= entry.verified_ns - _RACY_WINDOW_NS
+
+    def _from_disk(
+        self, key: str, stat: _StatKey | None, digest: str, now: int
+    ) -> _MemoryEntry | None:
+        """Return the persisted entry for *key* if it matches the source."""
+        disk = self._disk_data()
+        raw = disk.get(key, {})
+        content = raw.get("content")
         if (
-            entry.get("exists") == exists
-            and entry.get("mtime_ns") == mtime_ns
-            and entry.get("ctime_ns") == ctime_ns
-            and entry.get("inode") == inode
-            and entry.get("size") == size
-            and entry.get("source_digest") == source_digest
+            raw.get("exists") == (stat is not None)
+            and raw.get("source_digest") == digest
+            and isinstance(content, str)
         ):
-            content = entry.get("content")
-            if isinstance(content, str):
-                return content, True
-
-        content = loader(self._config)
-        data[key] = {
-            "exists": exists,
+            return _MemoryEntry(stat, digest, content, now)
+        return None
+
+    def _persist(
+        self, key: str, stat: _StatKey | None, digest: str, content: str
+    ) -> None:
+        disk = self._disk_data()
+        mtime_ns, size, inode = stat or (0, 0, 0)
+        disk[key] = {
+            "exists": stat is not None,
             "mtime_ns": mtime_ns,
-            "ctime_ns": ctime_ns,
             "inode": inode,
             "size": size,
-            "source_digest": source_digest,
+            "source_digest": digest,
             "content": content,
             "updated_at": datetime.now(UTC).isoformat(),
         }
-        self._write_cache_data(data)
-        return content, False
+        self._write_cache_data(disk)
+
+    def _disk_data(self) -> dict[str, dict[str, object]]:
+        """Return the parsed cache file, reading it once per process."""
+        path_key = str(self._path)
+        data = _DISK.get(path_key)
+        if data is None:
+            data = self._load_cache_data()
+            _DISK[path_key] = data
+        return data
 
     def _load_cache_data(self) -> dict[str, dict[str, object]]:
         if not self._path.is_file():
@@ -106,3 +191,10 @@ class ContextSectionCache:
             return sha256(source_path.read_bytes()).hexdigest()
         except OSError:
             return ""
+
+
+def clear_memory_tier() -> None:
+    """Forget all in-process entries, as if the process had restarted."""
+    with _LOCK:
+        _MEMORY.clear()
+        _DISK.clear()
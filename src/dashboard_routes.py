@@ -10,9 +10,8 @@ import logging
 import os
 import sys
 import tempfile
-import time
 from collections import Counter
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Any
@@ -21,12 +20,15 @@ from fastapi import APIRouter, Body, Query, Response, WebSocket, WebSocketDiscon
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from pydantic import ValidationError
 
+from agent_scheduler import get_agent_scheduler
 from app_version import get_app_version
 from config import HydraFlowConfig, save_config_file
 from events import EventBus, EventType, HydraFlowEvent
 from hf_cli.update_check import load_cached_update_result
 from issue_fetcher import IssueFetcher
+from issue_history_index import IssueHistoryIndex, build_history_entry, row_matches
 from issue_store import IssueStoreStage
+from jsonl_store import JsonlStore
 from metrics_manager import get_metrics_cache_dir
 from models import (
     BackgroundWorkersResponse,
@@ -43,9 +45,6 @@ from models import (
     HITLSkipRequest,
     IntentRequest,
     IntentResponse,
-    IssueHistoryEntry,
-    IssueHistoryLink,
-    IssueHistoryPR,
     IssueHistoryResponse,
     IssueOutcomeType,
     MetricsHistoryResponse,
@@ -58,12 +57,15 @@ from models import (
     QueueStats,
     ReportIssueRequest,
     ReportIssueResponse,
-    parse_task_links,
 )
 from pr_manager import PRManager
+from profiling import MAX_CAPTURE_SECONDS, capture_profile
 from prompt_telemetry import PromptTelemetry
+from runtime_metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from runtime_metrics import REGISTRY
 from state import StateTracker
-from timeline import TimelineBuilder
+from timeline import TimelineBuilder, TimelineIndex
+from tracing import SPAN_FILE, build_waterfall, get_tracer, load_issue_spans
 from transcript_summarizer import TranscriptSummarizer
 
 if TYPE_CHECKING:
@@ -72,6 +74,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("hydraflow.dashboard")
 
+_WS_CLIENTS = REGISTRY.gauge(
+    "hydraflow_websocket_clients", "Connected dashboard WebSocket clients"
+)
+_EVENT_BUS_SUBSCRIBERS = REGISTRY.gauge(
+    "hydraflow_event_bus_subscribers", "Live event bus subscriber queues"
+)
+_EVENT_BUS_QUEUE_DEPTH = REGISTRY.gauge(
+    "hydraflow_event_bus_max_queue_depth",
+    "Largest backlog of undelivered events across subscriber queues",
+)
+
 # Backend stage keys → frontend stage names
 _STAGE_NAME_MAP: dict[str, str] = {
     IssueStoreStage.FIND: "triage",
@@ -90,23 +103,6 @@ _FRONTEND_STAGE_TO_LABEL_FIELD = {
 }
 
 
-_INFERENCE_COUNTER_KEYS: tuple[str, ...] = (
-    "inference_calls",
-    "prompt_est_tokens",
-    "total_est_tokens",
-    "total_tokens",
-    "input_tokens",
-    "output_tokens",
-    "cache_creation_input_tokens",
-    "cache_read_input_tokens",
-    "history_chars_saved",
-    "context_chars_saved",
-    "pruned_chars_total",
-    "cache_hits",
-    "cache_misses",
-)
-
-
 async def _run_dialog_command(*cmd: str, timeout_seconds: float = 30.0) -> str | None:
     """Run a folder-picker shell command and return trimmed stdout on success."""
     try:
@@ -212,126 +208,6 @@ def _parse_iso_or_none(raw: str | None) -> datetime | None:
     return parsed
 
 
-def _event_issue_number(data: dict[str, Any]) -> int | None:
-    value = data.get("issue")
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str) and value.isdigit():
-        return int(value)
-    return None
-
-
-def _normalise_event_status(event_type: EventType, data: dict[str, Any]) -> str | None:
-    status = str(data.get("status", "")).lower()
-    result: str | None = None
-    if event_type == EventType.MERGE_UPDATE:
-        result = "merged" if status == "merged" else None
-    elif event_type == EventType.HITL_ESCALATION:
-        result = "hitl"
-    elif event_type == EventType.HITL_UPDATE:
-        result = "reviewed" if status == "resolved" else "hitl"
-    elif event_type == EventType.REVIEW_UPDATE:
-        if status == "done":
-            result = "reviewed"
-        elif status == "failed":
-            result = "failed"
-        else:
-            result = "active"
-    elif event_type in {
-        EventType.WORKER_UPDATE,
-        EventType.PLANNER_UPDATE,
-        EventType.TRIAGE_UPDATE,
-    }:
-        if status == "done":
-            done_map = {
-                EventType.WORKER_UPDATE: "implemented",
-                EventType.PLANNER_UPDATE: "planned",
-                EventType.TRIAGE_UPDATE: "triaged",
-            }
-            result = done_map.get(event_type, "active")
-        elif status == "failed":
-            result = "failed"
-        else:
-            result = "active"
-    elif event_type == EventType.PR_CREATED:
-        result = "in_review"
-    return result
-
-
-_HISTORY_STATUSES = {
-    "unknown",
-    "triaged",
-    "planned",
-    "implemented",
-    "in_review",
-    "reviewed",
-    "hitl",
-    "active",
-    "failed",
-    "merged",
-}
-
-
-def _coerce_history_status(value: str) -> str:
-    """Normalize dashboard history statuses and default to ``unknown``."""
-    cleaned = str(value).strip().lower()
-    if cleaned in _HISTORY_STATUSES:
-        return cleaned
-    logger.warning("Unknown history status %r; falling back to 'unknown'", value)
-    return "unknown"
-
-
-def _status_rank(status: str) -> int:
-    ranks = {
-        "unknown": 0,
-        "triaged": 1,
-        "planned": 2,
-        "implemented": 3,
-        "in_review": 4,
-        "reviewed": 5,
-        "hitl": 6,
-        "active": 7,
-        "failed": 8,
-        "merged": 9,
-    }
-    return ranks.get(status, 0)
-
-
-def _coerce_int(value: object) -> int:
-    if isinstance(value, bool):
-        return int(value)
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        return int(value)
-    if isinstance(value, str):
-        try:
-            return int(value)
-        except ValueError:
-            return 0
-    return 0
-
-
-def _is_timestamp_in_range(
-    raw: str | None, since: datetime | None, until: datetime | None
-) -> bool:
-    if raw is None:
-        return since is None and until is None
-    parsed = _parse_iso_or_none(raw)
-    if parsed is None:
-        return since is None and until is None
-    if since is not None and parsed < since:
-        return False
-    return not (until is not None and parsed > until)
-
-
-def _status_sort_key(status: str, timestamp: str | None) -> tuple[datetime, int]:
-    parsed = _parse_iso_or_none(timestamp)
-    if parsed is None:
-        parsed = datetime.min.replace(tzinfo=UTC)
-    return (parsed, _status_rank(status))
-
-
 def _is_expected_supervisor_unavailable(exc: Exception) -> bool:
     """Return True for the expected local-dev supervisor-down condition."""
     text = str(exc).strip().lower()
@@ -424,6 +300,8 @@ def create_router(
     """
     router = APIRouter()
     hitl_summary_cooldown_seconds = 300
+    _EVENT_BUS_SUBSCRIBERS.set_function(lambda: event_bus.subscriber_count)
+    _EVENT_BUS_QUEUE_DEPTH.set_function(lambda: event_bus.max_queue_depth)
 
     def _parse_compat_json_object(raw: str | None) -> dict[str, Any] | None:
         """Best-effort parse of legacy query/body JSON object payloads."""
@@ -593,104 +471,27 @@ def create_router(
             return []
         return snapshots[-limit:]
 
-    def _build_history_links(
-        raw: dict[int, dict[str, Any]] | Iterable[Any],
-    ) -> list[IssueHistoryLink]:
-        """Convert the internal linked_issues accumulator to a sorted list."""
-        if isinstance(raw, dict):
-            return sorted(
-                (
-                    IssueHistoryLink(
-                        target_id=int(v["target_id"]),
-                        kind=v.get("kind", "relates_to"),
-                        target_url=v.get("target_url"),
-                    )
-                    for v in raw.values()
-                    if isinstance(v, dict) and _coerce_int(v.get("target_id")) > 0
-                ),
-                key=lambda lnk: lnk.target_id,
-            )
-        # Legacy fallback: bare set of ints
-        return sorted(
-            (IssueHistoryLink(target_id=int(v)) for v in raw if _coerce_int(v) > 0),
-            key=lambda lnk: lnk.target_id,
-        )
-
-    def _new_issue_history_entry(issue_number: int) -> dict[str, Any]:
-        repo_slug = (config.repo or "").strip()
-        if repo_slug.startswith("https://github.com/"):
-            repo_slug = repo_slug[len("https://github.com/") :]
-        elif repo_slug.startswith("http://github.com/"):
-            repo_slug = repo_slug[len("http://github.com/") :]
-        repo_slug = repo_slug.strip("/")
-        issue_url = (
-            f"https://github.com/{repo_slug}/issues/{issue_number}" if repo_slug else ""
-        )
-        return {
-            "issue_number": issue_number,
-            "title": f"Issue #{issue_number}",
-            "issue_url": issue_url,
-            "status": "unknown",
-            "epic": "",
-            "crate_number": None,
-            "crate_title": "",
-            "linked_issues": {},
-            "prs": {},
-            "session_ids": set(),
-            "source_calls": {},
-            "model_calls": {},
-            "inference": dict.fromkeys(_INFERENCE_COUNTER_KEYS, 0),
-            "first_seen": None,
-            "last_seen": None,
-            "status_updated_at": None,
-        }
-
-    def _touch_issue_timestamps(row: dict[str, Any], timestamp: str | None) -> None:
-        if not timestamp:
-            return
-        current_first = row.get("first_seen")
-        current_last = row.get("last_seen")
-        if not isinstance(current_first, str) or timestamp < current_first:
-            row["first_seen"] = timestamp
-        if not isinstance(current_last, str) or timestamp > current_last:
-            row["last_seen"] = timestamp
-
     async def _enrich_issue_history_with_github(
-        entries: dict[int, dict[str, Any]], limit: int = 150
+        issue_numbers: list[int], limit: int = 150
     ) -> None:
-        if not entries:
+        if not issue_numbers:
             return
 
         fetcher = IssueFetcher(config)
-        issue_numbers = sorted(entries.keys(), reverse=True)[:limit]
         sem = asyncio.Semaphore(6)
 
         async def _fetch_and_apply(issue_number: int) -> None:
             async with sem:
                 issue = await fetcher.fetch_issue_by_number(issue_number)
-            if issue is None:
-                return
-            row = entries.get(issue_number)
-            if row is None:
-                return
-            row["title"] = issue.title or row.get("title") or f"Issue #{issue_number}"
-            row["issue_url"] = issue.url or row.get("issue_url", "")
-            labels = [str(lbl).strip() for lbl in issue.labels if str(lbl).strip()]
-            if not row.get("epic"):
-                epic = next((lbl for lbl in labels if "epic" in lbl.lower()), "")
-                row["epic"] = epic
-            ms_num = _coerce_int(getattr(issue, "milestone_number", None))
-            if ms_num > 0 and not row.get("crate_number"):
-                row["crate_number"] = ms_num
-            for link in parse_task_links(issue.body or ""):
-                tid = int(link.target_id)
-                row["linked_issues"][tid] = {
-                    "target_id": tid,
-                    "kind": str(link.kind),
-                    "target_url": link.target_url or None,
-                }
+            if issue is not None:
+                history_index.apply_github_issue(issue_number, issue)
 
-        await asyncio.gather(*(_fetch_and_apply(num) for num in issue_numbers))
+        await asyncio.gather(
+            *(
+                _fetch_and_apply(num)
+                for num in sorted(issue_numbers, reverse=True)[:limit]
+            )
+        )
 
     def _build_hitl_context(issue: Any, *, cause: str, origin: str | None) -> str:
         body = str(getattr(issue, "body", "") or "").strip()
@@ -1902,96 +1703,11 @@ def create_router(
         outcomes = state.get_all_outcomes()
         return JSONResponse({k: v.model_dump() for k, v in outcomes.items()})
 
-    # --- Issue history cache ---
-    # Cache the aggregated issue_rows + pr_to_issue for the unfiltered case.
-    # Persisted to disk so the first request after restart is fast.
-    # Invalidated when the event count or telemetry file changes.
-    _history_cache_file = config.data_path("metrics", "history_cache.json")
-    _HISTORY_CACHE_TTL = 30  # seconds
-
-    _history_cache: dict[str, Any] = {
-        "event_count": -1,
-        "telemetry_mtime": 0.0,
-        "issue_rows": None,
-        "pr_to_issue": None,
-        "enriched_issues": set(),
-    }
-    _history_cache_ts: list[float] = [0.0]
-
-    def _save_history_cache() -> None:
-        """Persist in-memory history cache to disk."""
-        import json
-
-        rows = _history_cache.get("issue_rows")
-        if rows is None:
-            return
-        serialisable_rows: dict[str, Any] = {}
-        for k, v in rows.items():
-            entry = dict(v)
-            # Convert sets to lists for JSON serialisation.
-            entry["session_ids"] = sorted(entry.get("session_ids") or [])
-            serialisable_rows[str(k)] = entry
-        payload = {
-            "event_count": _history_cache.get("event_count", -1),
-            "telemetry_mtime": _history_cache.get("telemetry_mtime", 0.0),
-            "issue_rows": serialisable_rows,
-            "pr_to_issue": {
-                str(k): v for k, v in (_history_cache.get("pr_to_issue") or {}).items()
-            },
-            "enriched_issues": sorted(_history_cache.get("enriched_issues") or []),
-        }
-        try:
-            _history_cache_file.parent.mkdir(parents=True, exist_ok=True)
-            tmp = _history_cache_file.with_suffix(".tmp")
-            tmp.write_text(json.dumps(payload))
-            tmp.replace(_history_cache_file)
-        except OSError:
-            logger.debug("Could not persist history cache", exc_info=True)
-
-    def _load_history_cache() -> None:
-        """Load persisted history cache from disk into memory."""
-        import json
-
-        if not _history_cache_file.is_file():
-            return
-        try:
-            raw = json.loads(_history_cache_file.read_text())
-        except (OSError, json.JSONDecodeError, ValueError):
-            logger.debug("Corrupt history cache, ignoring", exc_info=True)
-            return
-        if not isinstance(raw, dict) or "issue_rows" not in raw:
-            return
-        rows: dict[int, dict[str, Any]] = {}
-        for k, v in raw.get("issue_rows", {}).items():
-            if not isinstance(v, dict):
-                continue
-            entry = dict(v)
-            # Restore session_ids to a set.
-            entry["session_ids"] = set(entry.get("session_ids") or [])
-            # JSON keys are always strings — restore int keys for sub-dicts
-            # so enrichment lookups (which use int keys) don't create dupes.
-            if isinstance(entry.get("prs"), dict):
-                entry["prs"] = {int(pk): pv for pk, pv in entry["prs"].items()}
-            if isinstance(entry.get("linked_issues"), dict):
-                entry["linked_issues"] = {
-                    int(lk): lv for lk, lv in entry["linked_issues"].items()
-                }
-            rows[int(k)] = entry
-        _history_cache["issue_rows"] = rows
-        _history_cache["pr_to_issue"] = {
-            int(k): int(v) for k, v in raw.get("pr_to_issue", {}).items()
-        }
-        _history_cache["event_count"] = raw.get("event_count", -1)
-        _history_cache["telemetry_mtime"] = raw.get("telemetry_mtime", 0.0)
-        _history_cache["enriched_issues"] = set(raw.get("enriched_issues") or [])
-        # Set timestamp so TTL check works (treat as "just loaded").
-        _history_cache_ts[0] = time.monotonic()
-
-    # Warm the in-memory cache from disk on startup.
-    try:
-        _load_history_cache()
-    except Exception:
-        logger.debug("History cache warm-up failed", exc_info=True)
+    # --- Issue history ---
+    # Rows are maintained incrementally from the event bus and the telemetry
+    # log; requests only filter and page.  Snapshotted to disk so the first
+    # request after a restart only replays what changed since.
+    history_index = IssueHistoryIndex(config, event_bus)
 
     @router.get("/api/issues/history")
     async def get_issue_history(
@@ -2009,371 +1725,51 @@ def create_router(
         clamped_limit = max(1, min(limit, 1000))
 
         telemetry = PromptTelemetry(config)
-        all_events = event_bus.get_history()
-
-        # Check if we can reuse cached aggregation for the unfiltered case.
-        use_unfiltered = since_dt is None and until_dt is None
-        event_count = len(all_events)
-        telem_mtime = telemetry.get_mtime()
-        now = time.monotonic()
-        cache_hit = (
-            use_unfiltered
-            and _history_cache["issue_rows"] is not None
-            and _history_cache["event_count"] == event_count
-            and _history_cache["telemetry_mtime"] == telem_mtime
-            and (now - _history_cache_ts[0]) < _HISTORY_CACHE_TTL
-        )
-
-        if cache_hit:
-            import copy
-
-            issue_rows: dict[int, dict[str, Any]] = copy.deepcopy(
-                _history_cache["issue_rows"]
+        history_index.sync(telemetry)
+        ranged = since_dt is not None or until_dt is not None
+        if ranged:
+            rows: Mapping[int, dict[str, Any]] = history_index.range_rows(
+                event_bus.get_history(),
+                telemetry.load_inferences_between(since_dt, until_dt, limit=50000),
+                since_dt,
+                until_dt,
             )
-            pr_to_issue: dict[int, int] = dict(_history_cache["pr_to_issue"])
         else:
-            issue_rows = {}
-            pr_to_issue = {}
-
-            # Build PR→issue mapping from all in-memory events first so merge
-            # events in the selected range still resolve when PR creation
-            # happened earlier.
-            for event in all_events:
-                if event.type != EventType.PR_CREATED:
-                    continue
-                mapped_issue = _event_issue_number(event.data)
-                mapped_pr = _coerce_int(event.data.get("pr"))
-                if mapped_issue is not None and mapped_issue > 0 and mapped_pr > 0:
-                    pr_to_issue[mapped_pr] = mapped_issue
-
-        use_issue_rollups = (
-            since_dt is None
-            and until_dt is None
-            and not query_text
-            and not requested_status
-        )
-        if cache_hit:
-            pass  # aggregation already done
-        elif use_issue_rollups:
-            for issue_number, counters in telemetry.get_issue_totals().items():
-                row = issue_rows.setdefault(
-                    issue_number, _new_issue_history_entry(issue_number)
-                )
-                for key in _INFERENCE_COUNTER_KEYS:
-                    row["inference"][key] = _coerce_int(counters.get(key, 0))
-            # Keep metadata (sessions/model/source/pr links) from recent rows
-            # without re-summing counters that already came from rollups.
-            for record in telemetry.load_inferences(limit=5000):
-                issue_number = _coerce_int(record.get("issue_number"))
-                if issue_number <= 0:
-                    continue
-                row = issue_rows.get(issue_number)
-                if row is None:
-                    continue
-                timestamp = record.get("timestamp")
-                _touch_issue_timestamps(
-                    row, timestamp if isinstance(timestamp, str) else None
-                )
-                session_id = str(record.get("session_id", "")).strip()
-                if session_id:
-                    row["session_ids"].add(session_id)
-                source = str(record.get("source", "")).strip()
-                if source:
-                    row["source_calls"][source] = row["source_calls"].get(source, 0) + 1
-                model = str(record.get("model", "")).strip()
-                if model:
-                    row["model_calls"][model] = row["model_calls"].get(model, 0) + 1
-                pr_number = _coerce_int(record.get("pr_number"))
-                if pr_number > 0:
-                    prs: dict[int, dict[str, Any]] = row["prs"]
-                    if pr_number not in prs:
-                        prs[pr_number] = {
-                            "number": pr_number,
-                            "url": "",
-                            "merged": False,
-                        }
-                    pr_to_issue.setdefault(pr_number, issue_number)
-        else:
-            inference_rows = telemetry.load_inferences(limit=50000)
-            for record in inference_rows:
-                timestamp = record.get("timestamp")
-                if not _is_timestamp_in_range(
-                    timestamp if isinstance(timestamp, str) else None,
-                    since_dt,
-                    until_dt,
-                ):
-                    continue
-                issue_number = _coerce_int(record.get("issue_number"))
-                if issue_number <= 0:
-                    continue
-                row = issue_rows.setdefault(
-                    issue_number, _new_issue_history_entry(issue_number)
-                )
-                _touch_issue_timestamps(
-                    row, timestamp if isinstance(timestamp, str) else None
-                )
-
-                session_id = str(record.get("session_id", "")).strip()
-                if session_id:
-                    row["session_ids"].add(session_id)
-
-                source = str(record.get("source", "")).strip()
-                if source:
-                    row["source_calls"][source] = row["source_calls"].get(source, 0) + 1
-
-                model = str(record.get("model", "")).strip()
-                if model:
-                    row["model_calls"][model] = row["model_calls"].get(model, 0) + 1
-
-                for key in _INFERENCE_COUNTER_KEYS:
-                    row["inference"][key] += _coerce_int(record.get(key))
-
-                pr_number = _coerce_int(record.get("pr_number"))
-                if pr_number > 0:
-                    prs: dict[int, dict[str, Any]] = row["prs"]
-                    if pr_number not in prs:
-                        prs[pr_number] = {
-                            "number": pr_number,
-                            "url": "",
-                            "merged": False,
-                        }
-                    pr_to_issue.setdefault(pr_number, issue_number)
-
-        if not cache_hit:
-            for event in all_events:
-                timestamp = event.timestamp
-                if not _is_timestamp_in_range(timestamp, since_dt, until_dt):
-                    continue
-
-                issue_number = _event_issue_number(event.data)
-                if issue_number is None and event.type == EventType.MERGE_UPDATE:
-                    pr_num = _coerce_int(event.data.get("pr"))
-                    issue_number = pr_to_issue.get(pr_num)
+            rows = history_index.rows
 
-                if issue_number is None or issue_number <= 0:
-                    continue
-
-                row = issue_rows.setdefault(
-                    issue_number, _new_issue_history_entry(issue_number)
-                )
-                _touch_issue_timestamps(row, timestamp)
-
-                maybe_title = str(event.data.get("title", "")).strip()
-                if maybe_title:
-                    row["title"] = maybe_title
-
-                maybe_url = str(event.data.get("url", "")).strip()
-                if maybe_url.startswith(("http://", "https://")):
-                    row["issue_url"] = maybe_url
-
-                if event.type == EventType.ISSUE_CREATED:
-                    labels = event.data.get("labels", [])
-                    if isinstance(labels, list) and not row.get("epic"):
-                        for lbl in labels:
-                            s = str(lbl).strip()
-                            if s and "epic" in s.lower():
-                                row["epic"] = s
-                                break
-                    milestone_num = _coerce_int(event.data.get("milestone_number"))
-                    if milestone_num > 0 and not row.get("crate_number"):
-                        row["crate_number"] = milestone_num
-
-                if event.type == EventType.PR_CREATED:
-                    pr_number = _coerce_int(event.data.get("pr"))
-                    if pr_number > 0:
-                        pr_to_issue[pr_number] = issue_number
-                        prs = row["prs"]
-                        payload = prs.get(
-                            pr_number,
-                            {"number": pr_number, "url": "", "merged": False},
-                        )
-                        url = str(event.data.get("url", "")).strip()
-                        if url.startswith(("http://", "https://")):
-                            payload["url"] = url
-                        prs[pr_number] = payload
-
-                if event.type == EventType.MERGE_UPDATE:
-                    pr_number = _coerce_int(event.data.get("pr"))
-                    if pr_number > 0:
-                        prs = row["prs"]
-                        payload = prs.get(
-                            pr_number,
-                            {"number": pr_number, "url": "", "merged": False},
-                        )
-                        if str(event.data.get("status", "")).lower() == "merged":
-                            payload["merged"] = True
-                        prs[pr_number] = payload
-
-                normalised = _normalise_event_status(event.type, event.data)
-                if normalised:
-                    current = str(row.get("status", "unknown"))
-                    current_ts = (
-                        row.get("status_updated_at")
-                        if isinstance(row.get("status_updated_at"), str)
-                        else None
-                    )
-                    if _status_sort_key(normalised, timestamp) >= _status_sort_key(
-                        current, current_ts
-                    ):
-                        row["status"] = normalised
-                        row["status_updated_at"] = timestamp
-
-            # Store in cache if this was an unfiltered aggregation.
-            if use_unfiltered:
-                import copy
-
-                _history_cache["issue_rows"] = copy.deepcopy(issue_rows)
-                _history_cache["pr_to_issue"] = dict(pr_to_issue)
-                _history_cache["event_count"] = event_count
-                _history_cache["telemetry_mtime"] = telem_mtime
-                _history_cache_ts[0] = now
-                _save_history_cache()
-
-        items: list[IssueHistoryEntry] = []
-        for row in issue_rows.values():
-            row_status = str(row.get("status", "unknown")).lower()
-            if requested_status and row_status != requested_status:
-                continue
-
-            issue_number = int(row["issue_number"])
-            title = str(row.get("title", f"Issue #{issue_number}"))
-            if (
-                query_text
-                and query_text not in title.lower()
-                and query_text not in str(issue_number)
-            ):
-                continue
-
-            linked_issues = _build_history_links(row.get("linked_issues", {}))
-            prs_map = row.get("prs", {})
-            if not isinstance(prs_map, dict):
-                prs_map = {}
-            pr_rows = sorted(
-                (
-                    IssueHistoryPR(
-                        number=int(pr_data["number"]),
-                        url=str(pr_data.get("url", "")),
-                        merged=bool(pr_data.get("merged", False)),
-                    )
-                    for pr_data in prs_map.values()
-                    if isinstance(pr_data, dict)
-                    and _coerce_int(pr_data.get("number")) > 0
-                ),
-                key=lambda p: p.number,
-                reverse=True,
-            )
-
-            items.append(
-                IssueHistoryEntry(
-                    issue_number=issue_number,
-                    title=title,
-                    issue_url=str(row.get("issue_url", "")),
-                    status=_coerce_history_status(row_status),
-                    epic=str(row.get("epic", "")),
-                    crate_number=row.get("crate_number"),
-                    crate_title=str(row.get("crate_title", "")),
-                    linked_issues=linked_issues,
-                    prs=pr_rows,
-                    session_ids=sorted(
-                        str(s) for s in row.get("session_ids", set()) if str(s)
-                    ),
-                    source_calls=dict(sorted(row.get("source_calls", {}).items())),
-                    model_calls=dict(sorted(row.get("model_calls", {}).items())),
-                    inference={
-                        k: _coerce_int(v) for k, v in row.get("inference", {}).items()
-                    },
-                    first_seen=row.get("first_seen"),
-                    last_seen=row.get("last_seen"),
-                    outcome=state.get_outcome(issue_number),
-                )
-            )
+        matching = [
+            row
+            for row in rows.values()
+            if row_matches(row, requested_status, query_text)
+        ]
 
         # Keep API fast by enriching only visible rows and only when needed.
         # Skip issues already enriched in a previous request.
-        already_enriched: set[int] = _history_cache.get("enriched_issues", set())
-        issue_lookup = {
-            item.issue_number: issue_rows[item.issue_number] for item in items
-        }
         enrich_candidates = [
-            item.issue_number
-            for item in items
-            if item.issue_number not in already_enriched
+            int(row["issue_number"])
+            for row in matching
+            if not history_index.is_enriched(int(row["issue_number"]))
             and (
-                not item.issue_url
-                or item.title.startswith("Issue #")
-                or (not item.epic and not item.linked_issues)
+                not row.get("issue_url")
+                or str(row.get("title", "")).startswith("Issue #")
+                or (not row.get("epic") and not row.get("linked_issues"))
             )
         ][:40]
         if enrich_candidates:
-            await _enrich_issue_history_with_github(
-                {k: issue_lookup[k] for k in enrich_candidates}
-            )
-            already_enriched.update(enrich_candidates)
-            _history_cache["enriched_issues"] = already_enriched
-            # Update cached issue_rows with enrichment data so future cache
-            # hits include titles/epics/linked_issues from GitHub.
-            if use_unfiltered and _history_cache["issue_rows"] is not None:
-                import copy
-
-                _history_cache["issue_rows"] = copy.deepcopy(issue_rows)
-                _save_history_cache()
-            items = []
-            for row in issue_rows.values():
-                row_status = str(row.get("status", "unknown")).lower()
-                if requested_status and row_status != requested_status:
-                    continue
-                issue_number = int(row["issue_number"])
-                title = str(row.get("title", f"Issue #{issue_number}"))
-                if (
-                    query_text
-                    and query_text not in title.lower()
-                    and query_text not in str(issue_number)
-                ):
-                    continue
-                linked_issues = _build_history_links(row.get("linked_issues", {}))
-                prs_map = row.get("prs", {})
-                if not isinstance(prs_map, dict):
-                    prs_map = {}
-                pr_rows = sorted(
-                    (
-                        IssueHistoryPR(
-                            number=int(pr_data["number"]),
-                            url=str(pr_data.get("url", "")),
-                            merged=bool(pr_data.get("merged", False)),
-                        )
-                        for pr_data in prs_map.values()
-                        if isinstance(pr_data, dict)
-                        and _coerce_int(pr_data.get("number")) > 0
-                    ),
-                    key=lambda p: p.number,
-                    reverse=True,
-                )
-                items.append(
-                    IssueHistoryEntry(
-                        issue_number=issue_number,
-                        title=title,
-                        issue_url=str(row.get("issue_url", "")),
-                        status=_coerce_history_status(row_status),
-                        epic=str(row.get("epic", "")),
-                        crate_number=row.get("crate_number"),
-                        crate_title=str(row.get("crate_title", "")),
-                        linked_issues=linked_issues,
-                        prs=pr_rows,
-                        session_ids=sorted(
-                            str(s) for s in row.get("session_ids", set()) if str(s)
-                        ),
-                        source_calls=dict(sorted(row.get("source_calls", {}).items())),
-                        model_calls=dict(sorted(row.get("model_calls", {}).items())),
-                        inference={
-                            k: _coerce_int(v)
-                            for k, v in row.get("inference", {}).items()
-                        },
-                        first_seen=row.get("first_seen"),
-                        last_seen=row.get("last_seen"),
-                        outcome=state.get_outcome(issue_number),
-                    )
-                )
-
+            await _enrich_issue_history_with_github(enrich_candidates)
+            history_index.mark_enriched(enrich_candidates)
+            if ranged:
+                history_index.copy_enrichment(rows)
+            matching = [
+                row
+                for row in rows.values()
+                if row_matches(row, requested_status, query_text)
+            ]
+
+        items = [
+            build_history_entry(row, state.get_outcome(int(row["issue_number"])))
+            for row in matching
+        ]
         items.sort(
             key=lambda item: (
                 item.last_seen or "",
@@ -2399,23 +1795,10 @@ def create_router(
                     else i
                     for i in items
                 ]
-                # Also backfill into the raw rows so the cache carries titles.
-                backfilled = False
+                # Also backfill into the index so later requests carry titles.
                 for i in items:
                     if i.crate_number and i.crate_title:
-                        raw = issue_rows.get(i.issue_number)
-                        if raw is not None and raw.get("crate_title") != i.crate_title:
-                            raw["crate_title"] = i.crate_title
-                            backfilled = True
-                if (
-                    backfilled
-                    and use_unfiltered
-                    and _history_cache.get("issue_rows") is not None
-                ):
-                    import copy
-
-                    _history_cache["issue_rows"] = copy.deepcopy(issue_rows)
-                    _save_history_cache()
+                        history_index.set_crate_title(i.issue_number, i.crate_title)
             except Exception:
                 logger.debug("Failed to fetch milestones for crate titles")
 
@@ -2537,12 +1920,38 @@ def create_router(
 
     @router.get("/api/runs/{issue_number}/{timestamp}/{filename}")
     async def get_run_artifact(
-        issue_number: int, timestamp: str, filename: str
+        issue_number: int,
+        timestamp: str,
+        filename: str,
+        offset: int | None = None,
+        length: int | None = None,
     ) -> Response:
-        """Return a specific artifact file from a recorded run."""
+        """Return a specific artifact file from a recorded run.
+
+        With *offset* (and optionally *length*) only that byte range of the
+        uncompressed content is returned, as a 206 with ``Content-Range``.
+        """
         orch = get_orchestrator()
         if not orch:
             return JSONResponse({"error": "no orchestrator"}, status_code=400)
+        if offset is not None:
+            ranged = orch.run_recorder.read_run_artifact_range(
+                issue_number, timestamp, filename, offset, length
+            )
+            if ranged is None:
+                return JSONResponse({"error": "artifact not found"}, status_code=404)
+            data, total = ranged
+            start = min(max(0, offset), total)
+            return Response(
+                content=data,
+                status_code=206,
+                media_type="text/plain",
+                headers={
+                    "Content-Range": f"bytes {start}-{start + len(data) - 1}/{total}"
+                    if data
+                    else f"bytes */{total}"
+                },
+            )
         content = orch.run_recorder.get_run_artifact(issue_number, timestamp, filename)
         if content is None:
             return JSONResponse({"error": "artifact not found"}, status_code=404)
@@ -2559,6 +1968,48 @@ def create_router(
         stats["max_size_mb"] = config.artifact_max_size_mb
         return JSONResponse(stats)
 
+    @router.get("/metrics")
+    async def get_runtime_metrics() -> Response:
+        """Return runtime metrics in the Prometheus text exposition format."""
+        return Response(content=REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+    @router.get("/api/traces/{issue_number}")
+    async def get_issue_trace(issue_number: int) -> JSONResponse:
+        """Return the span waterfall and latency breakdown for an issue."""
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.flush()
+        path = config.data_path("traces", SPAN_FILE)
+        spans = await asyncio.to_thread(load_issue_spans, path, issue_number)
+        waterfall = build_waterfall(issue_number, spans)
+        waterfall["tracing_enabled"] = config.tracing_enabled
+        return JSONResponse(waterfall)
+
+    @router.get("/api/scheduler")
+    async def get_scheduler_stats() -> JSONResponse:
+        """Return the agent-slot budget and per-phase queue waits."""
+        scheduler = get_agent_scheduler()
+        if scheduler is None:
+            return JSONResponse({"enabled": False, "budget": 0, "phases": {}})
+        return JSONResponse(scheduler.stats())
+
+    @router.post("/api/control/profile")
+    async def capture_loop_profile(
+        seconds: float = Query(default=10.0, gt=0, le=MAX_CAPTURE_SECONDS),
+    ) -> JSONResponse:
+        """Sample the event loop for *seconds* and return collapsed stacks."""
+        profile = await capture_profile(seconds, config.profiling_sample_hz)
+        return JSONResponse(profile)
+
+    @router.get("/api/workspaces/disk")
+    async def get_workspace_disk_usage() -> JSONResponse:
+        """Return disk usage of issue workspaces and the configured quota."""
+        orch = get_orchestrator()
+        if not orch:
+            return JSONResponse({"error": "no orchestrator"}, status_code=400)
+        stats = await asyncio.to_thread(orch.workspace_disk.get_usage_stats)
+        return JSONResponse(stats)
+
     @router.get("/api/harness-insights")
     async def get_harness_insights() -> JSONResponse:
         """Return recent harness failure patterns and improvement suggestions."""
@@ -2652,12 +2103,9 @@ def create_router(
         from retrospective import RetrospectiveEntry
 
         retro_path = config.data_path("memory", "retrospectives.jsonl")
-        entries: list[RetrospectiveEntry] = []
-        if retro_path.exists():
-            for line in retro_path.read_text().strip().splitlines():
-                with contextlib.suppress(Exception):
-                    entries.append(RetrospectiveEntry.model_validate_json(line))
-        entries = entries[-config.retrospective_window :]
+        entries = JsonlStore(retro_path, RetrospectiveEntry).tail(
+            config.retrospective_window
+        )
 
         if not entries:
             return JSONResponse(
@@ -2753,16 +2201,16 @@ def create_router(
             }
         )
 
+    timeline_builder = TimelineBuilder(event_bus, index=TimelineIndex(event_bus))
+
     @router.get("/api/timeline")
     async def get_timeline() -> JSONResponse:
-        builder = TimelineBuilder(event_bus)
-        timelines = builder.build_all()
+        timelines = timeline_builder.build_all()
         return JSONResponse([t.model_dump() for t in timelines])
 
     @router.get("/api/timeline/issue/{issue_num}")
     async def get_timeline_issue(issue_num: int) -> JSONResponse:
-        builder = TimelineBuilder(event_bus)
-        timeline = builder.build_for_issue(issue_num)
+        timeline = timeline_builder.build_for_issue(issue_num)
         if timeline is None:
             return JSONResponse({"error": "Issue not found"}, status_code=404)
         return JSONResponse(timeline.model_dump())
@@ -3266,6 +2714,13 @@ def create_router(
     @router.websocket("/ws")
     async def websocket_endpoint(ws: WebSocket) -> None:
         await ws.accept()
+        _WS_CLIENTS.inc()
+        try:
+            await _stream_events(ws)
+        finally:
+            _WS_CLIENTS.dec()
+
+    async def _stream_events(ws: WebSocket) -> None:
 
         # Snapshot history BEFORE subscribing to avoid duplicates.
         # Events published between snapshot and subscribe are picked
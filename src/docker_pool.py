@@ -0,0 +1,270 @@
+"""Persistent per-workspace container pool for :class:`DockerRunner`.
+
+Short commands (git, quality gates) used to pay a full container
+create/start/wait/remove cycle each time.  The pool keeps one long-lived
+container per workspace and runs commands inside it with ``docker exec``.
+Containers are evicted when idle for too long (checked by a background
+sweep while the pool holds any), when their workspace is released, when
+they fail a health check, or when a command times out (removing the
+container kills the exec).  A container still running other commands is
+only retired and removed once the last of them finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from execution import CaptureLimits, SimpleResult, clip_output
+
+logger = logging.getLogger("hydraflow.docker_pool")
+
+# Command that keeps a pooled container alive without doing any work.
+KEEPALIVE_CMD: list[str] = ["tail", "-f", "/dev/null"]
+
+# Minimum seconds between health checks of the same container.
+_HEALTH_CHECK_INTERVAL = 30.0
+
+
+@dataclass
+class _PooledContainer:
+    """Book-keeping for one pooled container."""
+
+    container: Any
+    spec: str
+    last_used: float
+    last_checked: float
+    active: int = 0
+    # Set when a command failed; removed once no command is using it.
+    retiring: bool = False
+
+
+ContainerFactory = Callable[[str | None], Awaitable[Any]]
+SpecFactory = Callable[[str | None], str]
+
+
+class ContainerPool:
+    """Keeps at most *max_containers* long-lived containers keyed by workspace.
+
+    *create_container* builds and starts a keep-alive container for a
+    workspace; *container_spec* returns a fingerprint of the env and mounts
+    that container would be created with, so a container is recycled when
+    its isolation settings change.
+    """
+
+    def __init__(
+        self,
+        *,
+        create_container: ContainerFactory,
+        container_spec: SpecFactory,
+        max_containers: int,
+        idle_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._create_container = create_container
+        self._container_spec = container_spec
+        self._max_containers = max_containers
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._entries: dict[str, _PooledContainer] = {}
+        self._lock = asyncio.Lock()
+        self._sweeper: asyncio.Task[None] | None = None
+
+    @property
+    def size(self) -> int:
+        """Number of containers currently held by the pool."""
+        return len(self._entries)
+
+    async def run(
+        self,
+        cmd: Sequence[str],
+        *,
+        cwd: str | None,
+        environment: dict[str, str],
+        timeout: float,
+        capture: CaptureLimits | None = None,
+    ) -> SimpleResult | None:
+        """Run *cmd* in the pooled container for *cwd*.
+
+        ``exec_run`` returns the output whole; *capture* bounds what is
+        kept of it.
+
+        Returns ``None`` when the pool is at capacity with no idle container
+        to evict; the caller should fall back to a one-shot container.
+
+        Raises ``TimeoutError`` when the command exceeds *timeout* seconds.
+        The container is evicted then, or — when other commands are still
+        running in it — as soon as the last of them finishes.
+        """
+        key = cwd or ""
+        entry = await self._acquire(key, cwd)
+        if entry is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        exec_kwargs: dict[str, Any] = {
+            "environment": environment,
+            "demux": True,
+        }
+        if cwd:
+            exec_kwargs["workdir"] = "/workspace"
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(
+                    None,
+                    lambda: entry.container.exec_run(list(cmd), **exec_kwargs),
+                ),
+                timeout=timeout,
+            )
+        except (Exception, asyncio.CancelledError):
+            # Removing the container is the only way to kill a running exec,
+            # but it would also kill the other commands sharing it.
+            entry.retiring = True
+            raise
+        finally:
+            entry.active -= 1
+            entry.last_used = self._clock()
+            if entry.retiring and entry.active == 0:
+                await self._evict(key, entry)
+
+        stdout_bytes, stderr_bytes = result.output or (None, None)
+        if capture is not None:
+            return SimpleResult(
+                stdout=clip_output(stdout_bytes or b"", capture, "stdout").strip(),
+                stderr=clip_output(stderr_bytes or b"", capture, "stderr").strip(),
+                returncode=result.exit_code if result.exit_code is not None else -1,
+            )
+        return SimpleResult(
+            stdout=stdout_bytes.decode(errors="replace").strip()
+            if stdout_bytes
+            else "",
+            stderr=stderr_bytes.decode(errors="replace").strip()
+            if stderr_bytes
+            else "",
+            returncode=result.exit_code if result.exit_code is not None else -1,
+        )
+
+    async def _acquire(self, key: str, cwd: str | None) -> _PooledContainer | None:
+        """Return a healthy container for *key*, creating one if needed."""
+        async with self._lock:
+            await self._evict_idle_locked()
+            now = self._clock()
+            spec = self._container_spec(cwd)
+            entry = self._entries.get(key)
+            if entry is not None and entry.active == 0:
+                stale = entry.spec != spec
+                if not stale and now - entry.last_checked >= _HEALTH_CHECK_INTERVAL:
+                    stale = not await self._is_healthy(entry.container)
+                    entry.last_checked = now
+                if stale:
+                    await self._evict_locked(key, entry)
+                    entry = None
+            elif entry is not None and (entry.spec != spec or entry.retiring):
+                # Still busy under the old env/mounts, or waiting to be
+                # removed after a failed command — don't share it.
+                return None
+            if entry is None:
+                if len(self._entries) >= self._max_containers and not (
+                    await self._evict_lru_locked()
+                ):
+                    return None
+                container = await self._create_container(cwd)
+                entry = _PooledContainer(
+                    container=container, spec=spec, last_used=now, last_checked=now
+                )
+                self._entries[key] = entry
+                logger.debug("Pooled container created for %s", key or "<no cwd>")
+                self._start_sweeper()
+            entry.active += 1
+            return entry
+
+    async def _is_healthy(self, container: Any) -> bool:
+        """Return True when *container* is still running."""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, container.reload)
+        except Exception:
+            logger.debug("Pooled container health check failed", exc_info=True)
+            return False
+        return getattr(container, "status", "") == "running"
+
+    async def _evict_idle_locked(self) -> None:
+        """Remove containers unused for longer than the idle timeout."""
+        now = self._clock()
+        for key, entry in list(self._entries.items()):
+            if entry.active == 0 and now - entry.last_used >= self._idle_timeout:
+                logger.debug("Evicting idle pooled container for %s", key)
+                await self._evict_locked(key, entry)
+
+    def _start_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(
+                self._sweep_idle(), name="hydraflow-docker-pool-sweep"
+            )
+
+    async def _sweep_idle(self) -> None:
+        """Evict idle containers periodically until the pool is empty."""
+        while self._entries:
+            await asyncio.sleep(self._idle_timeout)
+            try:
+                await self.evict_idle()
+            except Exception:
+                logger.warning("Pooled container idle sweep failed", exc_info=True)
+
+    async def evict_idle(self) -> None:
+        """Remove containers unused for longer than the idle timeout."""
+        async with self._lock:
+            await self._evict_idle_locked()
+
+    async def release(self, path: str) -> None:
+        """Evict the containers bound to workspace *path* or a directory in it.
+
+        A container still running commands is retired instead and removed
+        when the last of them finishes.
+        """
+        prefix = path.rstrip(os.sep) + os.sep
+        async with self._lock:
+            for key, entry in list(self._entries.items()):
+                if key != path and not key.startswith(prefix):
+                    continue
+                if entry.active:
+                    entry.retiring = True
+                else:
+                    await self._evict_locked(key, entry)
+
+    async def _evict_lru_locked(self) -> bool:
+        """Evict the least recently used idle container; False if all busy."""
+        idle = [(e.last_used, k, e) for k, e in self._entries.items() if not e.active]
+        if not idle:
+            return False
+        _, key, entry = min(idle, key=lambda item: item[0])
+        await self._evict_locked(key, entry)
+        return True
+
+    async def _evict(self, key: str, entry: _PooledContainer) -> None:
+        async with self._lock:
+            await self._evict_locked(key, entry)
+
+    async def _evict_locked(self, key: str, entry: _PooledContainer) -> None:
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+        loop = asyncio.get_running_loop()
+        with contextlib.suppress(Exception):
+            await loop.run_in_executor(None, lambda: entry.container.remove(force=True))
+
+    async def close(self) -> None:
+        """Stop the idle sweep and remove every pooled container."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+        async with self._lock:
+            for key, entry in list(self._entries.items()):
+                await self._evict_locked(key, entry)
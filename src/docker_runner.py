@@ -8,15 +8,26 @@ environment isolation, and stream handling. Implements the
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
+import json
 import logging
 import os
 import struct
+import threading
+from collections import deque
 from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
-from execution import SimpleResult, SubprocessRunner, get_default_runner
+from docker_pool import KEEPALIVE_CMD, ContainerPool
+from execution import (
+    BoundedOutput,
+    CaptureLimits,
+    SimpleResult,
+    SubprocessRunner,
+    get_default_runner,
+)
 
 if TYPE_CHECKING:
     from config import HydraFlowConfig
@@ -50,6 +61,13 @@ _HEADER_SIZE = 8
 _STDOUT_STREAM = 1
 _STDERR_STREAM = 2
 
+# Stdout frames buffered between the reader thread and the event loop;
+# the thread blocks when the consumer falls this far behind.
+_READER_QUEUE_SIZE = 64
+
+# Seconds a blocked put waits before re-checking whether the reader was closed.
+_READER_PUT_POLL = 0.5
+
 _CONTAINER_HOME = "/home/hydraflow"
 _CONTAINER_PI_HOME = f"{_CONTAINER_HOME}/.pi"
 _CONTAINER_CODEX_HOME = f"{_CONTAINER_HOME}/.codex"
@@ -138,9 +156,13 @@ class DockerStdoutReader:
     """Async iterator that demultiplexes a Docker attach stream.
 
     Docker non-TTY attach sockets use a multiplexed format with 8-byte
-    headers per frame.  This reader parses those headers, extracts only
-    stdout payloads for line iteration, and collects stderr payloads
-    separately.
+    headers per frame.  A dedicated daemon thread reads those frames with
+    ``recv_into`` into preallocated buffers, hands stdout payloads to the
+    event loop through a bounded :class:`asyncio.Queue` (blocking while
+    the consumer is behind, so unread output stays in the socket), and
+    collects stderr payloads separately.  Line splitting works on ``memoryview`` slices so
+    each byte is copied once regardless of line length.  :meth:`close`
+    stops the thread even when nobody consumes the queue any more.
 
     Compatible with the ``async for raw in stdout_stream:`` pattern
     used in :func:`stream_claude_process`.
@@ -149,70 +171,162 @@ class DockerStdoutReader:
     def __init__(self, socket: DockerSocket, loop: asyncio.AbstractEventLoop) -> None:
         self._socket = socket
         self._loop = loop
-        self._buffer = b""  # Line buffer for yielding complete lines
+        self._queue: asyncio.Queue[bytearray | None] = asyncio.Queue(
+            maxsize=_READER_QUEUE_SIZE
+        )
+        self._lines: deque[bytes] = deque()
+        self._partial = bytearray()  # Trailing bytes of an unfinished line
         self._eof = False
-        self._stderr_chunks: list[bytes] = []
+        self._stderr_chunks: list[bytearray] = []
+        self._thread: threading.Thread | None = None
+        self._closed = threading.Event()
 
     def __aiter__(self) -> DockerStdoutReader:
         return self
 
     async def __anext__(self) -> bytes:
+        if self._thread is None:
+            self._start()
         while True:
-            if b"\n" in self._buffer:
-                line, self._buffer = self._buffer.split(b"\n", 1)
-                return line + b"\n"
+            if self._lines:
+                return self._lines.popleft()
             if self._eof:
-                if self._buffer:
-                    remaining = self._buffer
-                    self._buffer = b""
+                if self._partial:
+                    remaining = bytes(self._partial)
+                    self._partial.clear()
                     return remaining
                 raise StopAsyncIteration
 
-            chunk = await self._loop.run_in_executor(None, self._read_next_stdout_frame)
-            if not chunk:
+            chunk = await self._queue.get()
+            if chunk is None:
                 self._eof = True
             else:
-                self._buffer += chunk
+                self._split_lines(chunk)
+
+    def _start(self) -> None:
+        """Start the reader thread that feeds ``self._queue``."""
+        self._thread = threading.Thread(
+            target=self._reader_loop, name="docker-stdout-demux", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the reader thread and unblock any pending socket read.
+
+        Output not yet consumed is dropped.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        # Shutting down the read side makes a blocked ``recv_into`` return.
+        import socket as _socket  # noqa: PLC0415
 
-    def _read_exact(self, n: int) -> bytes:
+        sock: Any = getattr(self._socket, "_sock", self._socket)
+        with contextlib.suppress(OSError, AttributeError):
+            sock.shutdown(_socket.SHUT_RD)
+
+    def _split_lines(self, chunk: bytearray) -> None:
+        """Append complete lines in *chunk* to ``self._lines``."""
+        view = memoryview(chunk)
+        start = 0
+        while True:
+            idx = chunk.find(b"\n", start)
+            if idx < 0:
+                break
+            if self._partial:
+                self._partial += view[start : idx + 1]
+                self._lines.append(bytes(self._partial))
+                self._partial.clear()
+            else:
+                self._lines.append(bytes(view[start : idx + 1]))
+            start = idx + 1
+        if start < len(chunk):
+            self._partial += view[start:]
+        view.release()
+
+    def _reader_loop(self) -> None:
+        """Thread body: push stdout payloads to the loop until EOF or close."""
+        try:
+            while not self._closed.is_set():
+                payload = self._read_next_stdout_frame()
+                if payload is None or not self._put(payload):
+                    break
+        finally:
+            if not self._closed.is_set():
+                self._put(None)
+
+    def _put(self, item: bytearray | None) -> bool:
+        """Queue *item*, blocking while the queue is full.
+
+        Returns False once the event loop is gone or the reader is closed.
+        """
+        put = self._queue.put(item)
+        try:
+            future = asyncio.run_coroutine_threadsafe(put, self._loop)
+        except RuntimeError:  # loop already closed
+            put.close()
+            return False
+        while True:
+            try:
+                future.result(timeout=_READER_PUT_POLL)
+            except concurrent.futures.TimeoutError:
+                if self._closed.is_set():
+                    future.cancel()
+                    return False
+                continue
+            except (concurrent.futures.CancelledError, RuntimeError):
+                return False
+            return True
+
+    def _read_exact(self, n: int) -> bytearray:
         """Read exactly *n* bytes from the socket, or fewer on EOF."""
         sock = getattr(self._socket, "_sock", self._socket)
-        data = b""
-        while len(data) < n:
+        buf = bytearray(n)
+        view = memoryview(buf)
+        recv_into = getattr(sock, "recv_into", None)
+        got = 0
+        while got < n:
             try:
-                chunk = sock.recv(n - len(data))
+                if recv_into is not None:
+                    count = recv_into(view[got:], n - got)
+                else:
+                    chunk = sock.recv(n - got)
+                    count = len(chunk)
+                    view[got : got + count] = chunk
             except OSError:
                 break
-            if not chunk:
+            if not count:
                 break
-            data += chunk
-        return data
+            got += count
+        view.release()
+        # Short reads only happen at EOF, so the copy here is rare.
+        return buf if got == n else buf[:got]
 
-    def _read_next_stdout_frame(self) -> bytes:
+    def _read_next_stdout_frame(self) -> bytearray | None:
         """Read frames until a stdout frame is found or EOF is reached.
 
         Each Docker multiplexed frame starts with an 8-byte header::
 
             [stream_type: 1B][padding: 3B][payload_size: 4B big-endian]
 
-        Stdout frames (type 1) are returned as payload bytes.
-        Stderr frames (type 2) are collected in ``_stderr_chunks``.
-        Other frame types are skipped.
+        Stdout frames (type 1) are returned as payload bytes; ``None``
+        signals EOF.  Stderr frames (type 2) are collected in
+        ``_stderr_chunks``.  Other frame types are skipped.
         """
         while True:
             header = self._read_exact(_HEADER_SIZE)
             if len(header) < _HEADER_SIZE:
-                return b""  # EOF or truncated header
+                return None  # EOF or truncated header
 
             stream_type = header[0]
-            payload_size = struct.unpack(">I", header[4:8])[0]
+            payload_size = struct.unpack_from(">I", header, 4)[0]
 
             if payload_size == 0:
                 continue
 
             payload = self._read_exact(payload_size)
             if not payload:
-                return b""  # EOF during payload read
+                return None  # EOF during payload read
 
             if stream_type == _STDOUT_STREAM:
                 return payload
@@ -262,11 +376,13 @@ class DockerProcess:
     def kill(self) -> None:
         with contextlib.suppress(OSError, RuntimeError):
             self._container.kill()
+        self.stdout.close()
 
     async def wait(self) -> int:
         result = await self._loop.run_in_executor(None, self._container.wait)
         code = int(result.get("StatusCode", 1))
         self.returncode = code
+        self.stdout.close()
         return code
 
 
@@ -289,6 +405,8 @@ class DockerRunner:
         network: str = "",
         extra_mounts: list[str] | None = None,
         config: HydraFlowConfig | None = None,
+        pool_max_containers: int = 0,
+        pool_idle_timeout: float = 300.0,
     ) -> None:
         import docker  # noqa: PLC0415
 
@@ -308,6 +426,15 @@ class DockerRunner:
         self._containers: set[Any] = set()
         self._user_tool_mounts_cache: dict[str, dict[str, str]] | None = None
         self._user_tool_mounts_cache_key: tuple[str, str, str, str] | None = None
+        # Long-lived per-workspace containers for run_simple (0 = disabled).
+        self._pool: ContainerPool | None = None
+        if pool_max_containers > 0:
+            self._pool = ContainerPool(
+                create_container=self._create_pooled_container,
+                container_spec=self._pool_spec,
+                max_containers=pool_max_containers,
+                idle_timeout=pool_idle_timeout,
+            )
 
     async def __aenter__(self) -> DockerRunner:
         return self
@@ -517,6 +644,47 @@ class DockerRunner:
             self._containers.discard(container)
             raise
 
+    def _build_container_kwargs(
+        self, cmd: Sequence[str], cwd: str | None
+    ) -> dict[str, Any]:
+        """Build ``containers.create`` kwargs for a non-streaming container."""
+        container_kwargs: dict[str, Any] = {
+            "image": self._image,
+            "command": list(cmd),
+            "environment": self._build_env(),
+            "volumes": self._build_mounts(cwd),
+            "detach": True,
+        }
+        if cwd:
+            container_kwargs["working_dir"] = "/workspace"
+        if self._network:
+            container_kwargs["network"] = self._network
+
+        # Apply resource limits and security settings from config
+        container_kwargs.update(self._get_resource_kwargs())
+        return container_kwargs
+
+    def _pool_spec(self, cwd: str | None) -> str:
+        """Fingerprint the env and mounts a pooled container for *cwd* uses."""
+        return json.dumps([self._build_env(), self._build_mounts(cwd)], sort_keys=True)
+
+    async def _create_pooled_container(self, cwd: str | None) -> Any:
+        """Create and start a keep-alive container for the pool."""
+        await self._enforce_spawn_delay()
+        loop = asyncio.get_running_loop()
+        container_kwargs = self._build_container_kwargs(KEEPALIVE_CMD, cwd)
+        container = await loop.run_in_executor(
+            None,
+            lambda: self._client.containers.create(**container_kwargs),
+        )
+        try:
+            await loop.run_in_executor(None, container.start)
+        except Exception:
+            with contextlib.suppress(Exception):
+                await loop.run_in_executor(None, lambda: container.remove(force=True))
+            raise
+        return container
+
     async def run_simple(
         self,
         cmd: Sequence[str],
@@ -525,9 +693,16 @@ class DockerRunner:
         env: dict[str, str] | None = None,  # noqa: ARG002
         timeout: float = 120.0,
         input: bytes | None = None,  # noqa: A002
+        capture: CaptureLimits | None = None,
     ) -> SimpleResult:
         """Run a command in a Docker container and return the result.
 
+        When the container pool is enabled the command runs via ``exec``
+        in the workspace's long-lived container; otherwise (or when the
+        pool is saturated) a one-shot container is created and removed.
+        With *capture*, one-shot container logs are streamed into bounded
+        buffers; pooled ``exec`` output is bounded after it is collected.
+
         .. note::
             The ``env`` parameter is intentionally ignored — see
             :meth:`create_streaming_process` for the rationale.
@@ -535,27 +710,22 @@ class DockerRunner:
         if input is not None:
             msg = "stdin input not supported in Docker mode"
             raise NotImplementedError(msg)
-        await self._enforce_spawn_delay()
 
-        loop = asyncio.get_running_loop()
-        mounts = self._build_mounts(cwd)
-        container_env = self._build_env()
-        working_dir = "/workspace" if cwd else None
+        if self._pool is not None:
+            result = await self._pool.run(
+                cmd,
+                cwd=cwd,
+                environment=self._build_env(),
+                timeout=timeout,
+                capture=capture,
+            )
+            if result is not None:
+                return result
 
-        container_kwargs: dict[str, Any] = {
-            "image": self._image,
-            "command": list(cmd),
-            "environment": container_env,
-            "volumes": mounts,
-            "detach": True,
-        }
-        if working_dir:
-            container_kwargs["working_dir"] = working_dir
-        if self._network:
-            container_kwargs["network"] = self._network
+        await self._enforce_spawn_delay()
 
-        # Apply resource limits and security settings from config
-        container_kwargs.update(self._get_resource_kwargs())
+        loop = asyncio.get_running_loop()
+        container_kwargs = self._build_container_kwargs(cmd, cwd)
 
         container = await loop.run_in_executor(
             None,
@@ -571,18 +741,26 @@ class DockerRunner:
                 timeout=timeout,
             )
 
-            logs_stdout = await loop.run_in_executor(
-                None,
-                lambda: container.logs(stdout=True, stderr=False).decode(
-                    errors="replace"
-                ),
-            )
-            logs_stderr = await loop.run_in_executor(
-                None,
-                lambda: container.logs(stdout=False, stderr=True).decode(
-                    errors="replace"
-                ),
-            )
+            if capture is not None:
+                logs_stdout = await loop.run_in_executor(
+                    None, lambda: _stream_logs(container, "stdout", capture)
+                )
+                logs_stderr = await loop.run_in_executor(
+                    None, lambda: _stream_logs(container, "stderr", capture)
+                )
+            else:
+                logs_stdout = await loop.run_in_executor(
+                    None,
+                    lambda: container.logs(stdout=True, stderr=False).decode(
+                        errors="replace"
+                    ),
+                )
+                logs_stderr = await loop.run_in_executor(
+                    None,
+                    lambda: container.logs(stdout=False, stderr=True).decode(
+                        errors="replace"
+                    ),
+                )
 
             return SimpleResult(
                 stdout=logs_stdout.strip(),
@@ -598,8 +776,15 @@ class DockerRunner:
                 await loop.run_in_executor(None, lambda: container.remove(force=True))
             self._containers.discard(container)
 
+    async def release_workspace(self, path: str) -> None:
+        """Evict the pooled container bound to the workspace at *path*."""
+        if self._pool is not None:
+            await self._pool.release(path)
+
     async def cleanup(self) -> None:
-        """Remove all tracked containers."""
+        """Remove all tracked and pooled containers."""
+        if self._pool is not None:
+            await self._pool.close()
         loop = asyncio.get_running_loop()
         for container in list(self._containers):
             with contextlib.suppress(Exception):
@@ -609,6 +794,19 @@ class DockerRunner:
         self._containers.clear()
 
 
+def _stream_logs(container: Any, stream: str, capture: CaptureLimits) -> str:
+    """Read one log stream of *container* chunk by chunk within *capture*."""
+    out = BoundedOutput(capture, stream)
+    try:
+        for chunk in container.logs(
+            stdout=stream == "stdout", stderr=stream == "stderr", stream=True
+        ):
+            out.feed(chunk)
+    finally:
+        text = out.finish()
+    return text
+
+
 def _check_docker_available() -> bool:
     """Check if Docker daemon is accessible."""
     try:
@@ -658,4 +856,6 @@ def get_docker_runner(config: HydraFlowConfig) -> SubprocessRunner:
         network=config.docker_network,
         extra_mounts=config.docker_extra_mounts,
         config=config,
+        pool_max_containers=config.docker_pool_max_containers,
+        pool_idle_timeout=float(config.docker_pool_idle_timeout),
     )
@@ -6,7 +6,7 @@ import asyncio
 import contextlib
 import itertools
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 from pathlib import Path
@@ -15,6 +15,7 @@ from typing import Any
 from pydantic import BaseModel, Field, ValidationError
 
 from file_util import atomic_write
+from runtime_metrics import REGISTRY
 
 
 class _Counter:
@@ -40,6 +41,14 @@ _event_counter = _Counter()
 
 logger = logging.getLogger("hydraflow.events")
 
+_EVENTS_PUBLISHED = REGISTRY.counter(
+    "hydraflow_event_bus_published_total", "Events published on the event bus"
+)
+_EVENTS_DROPPED = REGISTRY.counter(
+    "hydraflow_event_bus_dropped_total",
+    "Events dropped from full subscriber queues (oldest event evicted)",
+)
+
 
 def _log_persist_failure(task: asyncio.Future[None]) -> None:
     """Log unhandled exceptions from fire-and-forget persist tasks."""
@@ -251,6 +260,9 @@ class EventBus:
         self._active_session_id: str | None = None
         self._active_repo: str = ""
         self._pending_persists: set[asyncio.Task[None]] = set()
+        self._listeners: list[Callable[[HydraFlowEvent], None]] = []
+        # Bumped whenever history is replaced wholesale rather than appended.
+        self._history_generation = 0
 
     def set_session_id(self, session_id: str | None) -> None:
         """Set the active session ID to auto-inject into published events."""
@@ -275,14 +287,21 @@ class EventBus:
             and "repo" not in event.data
         ):
             event.data["repo"] = self._active_repo
+        _EVENTS_PUBLISHED.inc()
         self._history.append(event)
         if len(self._history) > self._max_history:
             self._history = self._history[-self._max_history :]
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                logger.warning("Event listener failed", exc_info=True)
         for queue in list(self._subscribers):
             try:
                 queue.put_nowait(event)
             except asyncio.QueueFull:
                 # Drop oldest if subscriber is slow
+                _EVENTS_DROPPED.inc()
                 with contextlib.suppress(asyncio.QueueEmpty):
                     queue.get_nowait()
                 queue.put_nowait(event)
@@ -321,6 +340,7 @@ class EventBus:
             return
         events = await self._event_log.load(max_events=self._max_history)
         self._history = events
+        self._history_generation += 1
         if events:
             max_id = max(e.id for e in events)
             _event_counter.advance(max_id + 1)
@@ -341,6 +361,16 @@ class EventBus:
             return
         await self._event_log.rotate(max_size_bytes, max_age_days)
 
+    @property
+    def subscriber_count(self) -> int:
+        """Number of live subscriber queues."""
+        return len(self._subscribers)
+
+    @property
+    def max_queue_depth(self) -> int:
+        """Largest number of undelivered events in any subscriber queue."""
+        return max((q.qsize() for q in self._subscribers), default=0)
+
     def subscribe(self, max_queue: int = 500) -> asyncio.Queue[HydraFlowEvent]:
         """Return a new queue that will receive future events."""
         queue: asyncio.Queue[HydraFlowEvent] = asyncio.Queue(maxsize=max_queue)
@@ -363,6 +393,31 @@ class EventBus:
         finally:
             self.unsubscribe(queue)
 
+    def add_listener(self, listener: Callable[[HydraFlowEvent], None]) -> None:
+        """Call *listener* synchronously with every event as it is published.
+
+        Listeners back in-memory indexes over the history; they must be
+        cheap and must not raise.  Use :attr:`history_generation` to detect
+        history being replaced by :meth:`load_history_from_disk` or
+        :meth:`clear`.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[HydraFlowEvent], None]) -> None:
+        """Stop calling *listener* on publish."""
+        with contextlib.suppress(ValueError):
+            self._listeners.remove(listener)
+
+    @property
+    def history_generation(self) -> int:
+        """Counter bumped each time the history is replaced or cleared."""
+        return self._history_generation
+
+    @property
+    def max_history(self) -> int:
+        """Number of most recent events kept in :meth:`get_history`."""
+        return self._max_history
+
     def get_history(self) -> list[HydraFlowEvent]:
         """Return a copy of all recorded events."""
         return list(self._history)
@@ -370,6 +425,7 @@ class EventBus:
     def clear(self) -> None:
         """Remove all history and subscribers."""
         self._history.clear()
+        self._history_generation += 1
         self._subscribers.clear()
         self._active_session_id = None
         self._active_repo = ""
@@ -3,9 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import re
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Protocol, runtime_checkable
+from pathlib import Path
+from typing import BinaryIO, Protocol, runtime_checkable
+
+# Bytes read per pipe read when streaming captured output.
+_READ_CHUNK = 64 * 1024
+
+# Marker :class:`BoundedOutput` puts where it dropped output.
+_OMITTED_MARKER_RE = re.compile(r"\[\.\.\. [\d,]+ bytes omitted[^\]\n]* \.\.\.\]")
 
 
 @dataclass
@@ -17,6 +26,121 @@ class SimpleResult:
     returncode: int = 0
 
 
+@dataclass(frozen=True)
+class CaptureLimits:
+    """Per-stream bounds on the output :meth:`run_simple` keeps in memory.
+
+    The first *head_bytes* and last *tail_bytes* of each stream are kept;
+    anything in between is dropped and replaced by a marker.  With
+    *spill_path* set the complete stream is also written to
+    ``<spill_path>.<stream>.log`` as it is read, and the file is kept only
+    when something was dropped.
+    """
+
+    head_bytes: int = 0
+    tail_bytes: int = 64 * 1024
+    spill_path: Path | None = None
+
+    @classmethod
+    def tail_chars(cls, chars: int, spill_path: Path | None = None) -> CaptureLimits:
+        """Keep enough bytes for the last *chars* characters of UTF-8 text."""
+        return cls(head_bytes=0, tail_bytes=chars * 4, spill_path=spill_path)
+
+    @classmethod
+    def head_chars(cls, chars: int) -> CaptureLimits:
+        """Keep enough bytes for the first *chars* characters of UTF-8 text."""
+        return cls(head_bytes=chars * 4, tail_bytes=0)
+
+
+class BoundedOutput:
+    """Accumulates one stream within :class:`CaptureLimits`.
+
+    The tail is a ring buffer trimmed once it holds twice its bound, so
+    memory stays within ``head_bytes + 2 * tail_bytes`` plus one chunk.
+    """
+
+    def __init__(self, limits: CaptureLimits, stream: str) -> None:
+        self._limits = limits
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._dropped = 0
+        self._spill_file: Path | None = None
+        self._spill: BinaryIO | None = None
+        if limits.spill_path is not None:
+            self._spill_file = limits.spill_path.with_name(
+                f"{limits.spill_path.name}.{stream}.log"
+            )
+            try:
+                self._spill_file.parent.mkdir(parents=True, exist_ok=True)
+                self._spill = self._spill_file.open("wb")
+            except OSError:
+                self._spill_file = None
+
+    def feed(self, chunk: bytes) -> None:
+        if self._spill is not None:
+            try:
+                self._spill.write(chunk)
+            except OSError:
+                self._spill.close()
+                self._spill = None
+        room = self._limits.head_bytes - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk = chunk[room:]
+        if not chunk:
+            return
+        self._tail += chunk
+        bound = self._limits.tail_bytes
+        if len(self._tail) > 2 * bound:
+            self._trim()
+
+    def _trim(self) -> None:
+        excess = len(self._tail) - self._limits.tail_bytes
+        if excess > 0:
+            del self._tail[:excess]
+            self._dropped += excess
+
+    def finish(self) -> str:
+        """Close the spill file and return the kept text, marker included."""
+        self._trim()
+        spilled = ""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+            if self._dropped and self._spill_file is not None:
+                spilled = f"; full output in {self._spill_file}"
+            elif self._spill_file is not None:
+                with contextlib.suppress(OSError):
+                    self._spill_file.unlink()
+        head = self._head.decode(errors="replace")
+        tail = self._tail.decode(errors="replace")
+        if not self._dropped:
+            return head + tail
+        return f"{head}\n[... {self._dropped:,} bytes omitted{spilled} ...]\n{tail}"
+
+
+def tail_with_markers(text: str, chars: int) -> str:
+    """Return the last *chars* characters of *text*, keeping omission markers.
+
+    Slicing bounded output can cut off the ``[... N bytes omitted; full
+    output in <file> ...]`` marker; markers outside the slice are
+    prepended so the spill file is still named.
+    """
+    cut = len(text) - chars
+    if cut <= 0:
+        return text
+    lost = [m.group(0) for m in _OMITTED_MARKER_RE.finditer(text) if m.start() < cut]
+    tail = text[cut:]
+    return "\n".join([*lost, tail]) if lost else tail
+
+
+def clip_output(data: bytes, limits: CaptureLimits, stream: str) -> str:
+    """Apply *limits* to already-collected *data*."""
+    buffer = BoundedOutput(limits, stream)
+    buffer.feed(data)
+    return buffer.finish()
+
+
 @runtime_checkable
 class SubprocessRunner(Protocol):
     """Protocol for executing subprocesses.
@@ -53,10 +177,13 @@ class SubprocessRunner(Protocol):
         env: dict[str, str] | None = None,
         timeout: float = 120.0,
         input: bytes | None = None,  # noqa: A002
+        capture: CaptureLimits | None = None,
     ) -> SimpleResult:
         """Run a command and return its output.
 
         When *input* is provided, it is written to the process's stdin.
+        When *capture* is provided, only the bounded head and tail of each
+        stream are kept (see :class:`CaptureLimits`).
 
         Raises ``TimeoutError`` if the command exceeds *timeout* seconds
         (the process is killed before re-raising).
@@ -65,6 +192,10 @@ class SubprocessRunner(Protocol):
         """
         ...
 
+    async def release_workspace(self, path: str) -> None:
+        """Release resources tied to the workspace at *path* before it is removed."""
+        ...
+
     async def cleanup(self) -> None:
         """Clean up any resources (containers, connections, etc.)."""
         ...
@@ -105,10 +236,13 @@ class HostRunner:
         env: dict[str, str] | None = None,
         timeout: float = 120.0,
         input: bytes | None = None,  # noqa: A002
+        capture: CaptureLimits | None = None,
     ) -> SimpleResult:
         """Run a command on the host and return its output.
 
         When *input* is provided, it is written to the process's stdin.
+        With *capture*, stdout and stderr are streamed into bounded
+        buffers instead of being read whole.
 
         Raises ``TimeoutError`` if the command exceeds *timeout* seconds.
         """
@@ -121,6 +255,8 @@ class HostRunner:
             stderr=asyncio.subprocess.PIPE,
             env=env,
         )
+        if capture is not None:
+            return await self._run_captured(proc, input, timeout, capture)
         try:
             stdout_bytes, stderr_bytes = await asyncio.wait_for(
                 proc.communicate(input=input), timeout=timeout
@@ -139,6 +275,56 @@ class HostRunner:
             returncode=proc.returncode if proc.returncode is not None else -1,
         )
 
+    async def _run_captured(
+        self,
+        proc: asyncio.subprocess.Process,
+        input: bytes | None,  # noqa: A002
+        timeout: float,
+        capture: CaptureLimits,
+    ) -> SimpleResult:
+        stdout = BoundedOutput(capture, "stdout")
+        stderr = BoundedOutput(capture, "stderr")
+
+        async def drain(
+            reader: asyncio.StreamReader | None, out: BoundedOutput
+        ) -> None:
+            if reader is None:
+                return
+            while chunk := await reader.read(_READ_CHUNK):
+                out.feed(chunk)
+
+        async def feed_stdin() -> None:
+            if input is None or proc.stdin is None:
+                return
+            with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                proc.stdin.write(input)
+                await proc.stdin.drain()
+            proc.stdin.close()
+
+        async def communicate() -> None:
+            await asyncio.gather(
+                feed_stdin(), drain(proc.stdout, stdout), drain(proc.stderr, stderr)
+            )
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(communicate(), timeout=timeout)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        finally:
+            out_text = stdout.finish()
+            err_text = stderr.finish()
+        return SimpleResult(
+            stdout=out_text.strip(),
+            stderr=err_text.strip(),
+            returncode=proc.returncode if proc.returncode is not None else -1,
+        )
+
+    async def release_workspace(self, path: str) -> None:
+        """No-op for host runner."""
+
     async def cleanup(self) -> None:
         """No-op for host runner."""
 
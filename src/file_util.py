@@ -6,8 +6,11 @@ import contextlib
 import fcntl
 import os
 import tempfile
-from collections.abc import Iterator
+import threading
+import time
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -49,6 +52,21 @@ def append_jsonl(path: Path, data: str) -> None:
         os.fsync(f.fileno())
 
 
+def append_jsonl_batch(path: Path, lines: list[str]) -> None:
+    """Append *lines* to *path* with a single write and one ``fsync``.
+
+    The batch is written in one call on an append-mode handle, so
+    concurrent readers see either none or all of it.
+    """
+    if not lines:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.write("".join(line + "\n" for line in lines))
+        f.flush()
+        os.fsync(f.fileno())
+
+
 @contextmanager
 def file_lock(path: Path) -> Iterator[None]:
     """Acquire an exclusive advisory lock for *path* until context exit."""
@@ -59,3 +77,125 @@ def file_lock(path: Path) -> Iterator[None]:
             yield
         finally:
             fcntl.flock(lock_f.fileno(), fcntl.LOCK_UN)
+
+
+# (st_dev, st_ino, st_nlink, bytes) for each non-directory entry.
+_FileEntry = tuple[int, int, int, int]
+
+
+def _list_dir(path: str) -> tuple[list[_FileEntry], list[str]] | None:
+    """List *path* with one ``os.scandir`` pass, or ``None`` if unreadable."""
+    files: list[_FileEntry] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                size = st.st_blocks * 512 if hasattr(st, "st_blocks") else st.st_size
+                files.append((st.st_dev, st.st_ino, st.st_nlink, size))
+    except OSError:
+        return None
+    return files, subdirs
+
+
+@dataclass(slots=True)
+class _DirRecord:
+    """Cached listing of one directory."""
+
+    mtime_ns: int
+    scanned_at: float
+    files: list[_FileEntry]
+    subdirs: list[str]
+
+
+class DirListingCache:
+    """Per-directory listings for :func:`dir_size_bytes`, keyed by path.
+
+    A listing is reused while the directory's mtime is unchanged, so a
+    rescan only re-lists directories whose entries changed.  Listings
+    older than *rescan_after* seconds are re-read anyway so in-place file
+    growth is picked up.  Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        rescan_after: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rescan_after = rescan_after
+        self._clock = clock
+        self._dirs: dict[str, _DirRecord] = {}
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+
+    def listing(self, path: str) -> tuple[list[_FileEntry], list[str]] | None:
+        """Return ``(files, subdirs)`` of *path*, listing it only when stale."""
+        try:
+            mtime_ns = os.stat(path, follow_symlinks=False).st_mtime_ns
+        except OSError:
+            return None
+        now = self._clock()
+        with self._lock:
+            record = self._dirs.get(path)
+            self._used.add(path)
+        if (
+            record is not None
+            and record.mtime_ns == mtime_ns
+            and now - record.scanned_at < self._rescan_after
+        ):
+            return record.files, record.subdirs
+        listed = _list_dir(path)
+        if listed is None:
+            return None
+        with self._lock:
+            self._dirs[path] = _DirRecord(mtime_ns, now, *listed)
+        return listed
+
+    def prune(self) -> None:
+        """Drop listings not requested since the previous :meth:`prune`."""
+        with self._lock:
+            self._dirs = {k: v for k, v in self._dirs.items() if k in self._used}
+            self._used = set()
+
+
+def dir_size_bytes(
+    path: Path,
+    *,
+    linked: dict[tuple[int, int], int] | None = None,
+    cache: DirListingCache | None = None,
+) -> int:
+    """Return the on-disk size of the tree under *path* (0 if missing).
+
+    Walks with :func:`os.scandir` without following symlinks and counts
+    each inode once, so hardlinked files are not double counted.  When
+    *linked* is given, every hardlinked file counted is recorded there as
+    ``{(st_dev, st_ino): bytes}`` so callers can dedupe across trees.
+    With *cache*, unchanged directories are not re-listed.
+    """
+    total = 0
+    seen: set[tuple[int, int]] = set()
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        listed = cache.listing(current) if cache is not None else _list_dir(current)
+        if listed is None:
+            continue
+        files, subdirs = listed
+        stack.extend(subdirs)
+        for dev, ino, nlink, size in files:
+            if nlink > 1:
+                key = (dev, ino)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if linked is not None:
+                    linked[key] = size
+            total += size
+    return total
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel, Field
 
+from jsonl_store import JsonlStore
 from models import IsoTimestamp, PipelineStage
 
 if TYPE_CHECKING:
@@ -139,14 +140,15 @@ class HarnessInsightStore:
     def __init__(self, memory_dir: Path) -> None:
         self._memory_dir = memory_dir
         self._failures_path = memory_dir / "harness_failures.jsonl"
+        self._failures = JsonlStore(
+            self._failures_path, FailureRecord, label="harness record"
+        )
         self._proposed_path = memory_dir / "harness_proposed.json"
 
     def append_failure(self, record: FailureRecord) -> None:
         """Append *record* as a JSON line to ``harness_failures.jsonl``."""
         try:
-            from file_util import append_jsonl  # noqa: PLC0415
-
-            append_jsonl(self._failures_path, record.model_dump_json())
+            self._failures.append(record)
         except OSError:
             logger.warning(
                 "Could not append failure to %s",
@@ -156,20 +158,7 @@ class HarnessInsightStore:
 
     def load_recent(self, n: int = 20) -> list[FailureRecord]:
         """Load the last *n* failure records from disk."""
-        if not self._failures_path.exists():
-            return []
-        try:
-            lines = self._failures_path.read_text().strip().splitlines()
-        except OSError:
-            return []
-        tail = lines[-n:] if len(lines) > n else lines
-        records: list[FailureRecord] = []
-        for line in tail:
-            try:
-                records.append(FailureRecord.model_validate_json(line))
-            except Exception:  # noqa: BLE001
-                logger.warning("Skipping malformed harness record: %s", line[:80])
-        return records
+        return self._failures.tail(n)
 
     def get_proposed_patterns(self) -> set[str]:
         """Return the set of pattern keys that already have filed proposals."""
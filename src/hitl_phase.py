@@ -6,6 +6,7 @@ import asyncio
 import logging
 from collections.abc import Callable
 
+from agent_scheduler import agent_slot
 from config import HydraFlowConfig
 from events import EventBus, EventType, HydraFlowEvent
 from hitl_runner import HITLRunner
@@ -179,7 +180,7 @@ class HITLPhase:
         semaphore: asyncio.Semaphore,
     ) -> None:
         """Process a single HITL correction for *issue_number*."""
-        async with semaphore:
+        async with semaphore, agent_slot("hitl"):
             if self._stop_event.is_set():
                 return
 
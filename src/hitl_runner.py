@@ -11,6 +11,7 @@ from typing import Literal
 from base_runner import BaseRunner
 from events import EventType, HydraFlowEvent
 from models import GitHubIssue, HITLResult
+from prompt_layers import PromptLayers
 from prompt_stats import build_prompt_stats, truncate_with_notice
 from runner_constants import MEMORY_SUGGESTION_PROMPT
 from subprocess_util import CreditExhaustedError
@@ -26,7 +27,7 @@ _CAUSE_INSTRUCTIONS: dict[HITLCauseKey, str] = {
         "1. Run `make quality` to see current failures.\n"
         "2. Fix the root causes — do NOT skip or disable tests.\n"
         "3. Run `make quality` again to verify your fixes.\n"
-        '4. Commit fixes with message: "hitl-fix: <description> (#{issue})".'
+        '4. Commit fixes with message: "hitl-fix: <description> (#<issue number>)".'
     ),
     "merge_conflict": (
         "The branch has merge conflicts with main.\n"
@@ -34,7 +35,7 @@ _CAUSE_INSTRUCTIONS: dict[HITLCauseKey, str] = {
         "2. Resolve all conflicts, keeping both the PR intent and upstream changes.\n"
         "3. Stage and commit the resolved files.\n"
         "4. Run `make quality` to verify everything passes.\n"
-        '5. Commit with message: "hitl-fix: resolve merge conflicts (#{issue})".'
+        '5. Commit with message: "hitl-fix: resolve merge conflicts (#<issue number>)".'
     ),
     "needs_info": (
         "This issue was escalated because it lacked sufficient detail.\n"
@@ -44,17 +45,17 @@ _CAUSE_INSTRUCTIONS: dict[HITLCauseKey, str] = {
         "3. Write comprehensive tests for new and changed code.\n"
         "4. Implement the solution.\n"
         "5. Run `make quality` to verify.\n"
-        '6. Commit with message: "hitl-fix: <description> (#{issue})".'
+        '6. Commit with message: "hitl-fix: <description> (#<issue number>)".'
     ),
     "visual": (
         "This issue was escalated due to visual validation failure.\n"
         "Screenshot diffs exceeded the allowed threshold.\n"
-        "1. Review the escalation reason above for affected screen names and diff percentages.\n"
+        "1. Review the escalation reason below for affected screen names and diff percentages.\n"
         "2. Check the HITL dashboard for artifact links (baseline/actual/diff images).\n"
         "3. Compare baseline vs actual screenshots to identify the regression.\n"
         "4. Fix the UI code causing the visual difference.\n"
         "5. Run `make quality` to verify.\n"
-        '6. Commit with message: "hitl-fix: resolve visual regression (#{issue})".'
+        '6. Commit with message: "hitl-fix: resolve visual regression (#<issue number>)".'
     ),
     "default": (
         "This issue was escalated to human review.\n"
@@ -62,7 +63,7 @@ _CAUSE_INSTRUCTIONS: dict[HITLCauseKey, str] = {
         "1. Read the issue and the guidance carefully.\n"
         "2. Fix the issues described.\n"
         "3. Run `make quality` to verify.\n"
-        '4. Commit with message: "hitl-fix: <description> (#{issue})".'
+        '4. Commit with message: "hitl-fix: <description> (#<issue number>)".'
     ),
 }
 
@@ -181,9 +182,7 @@ class HITLRunner(BaseRunner):
     ) -> tuple[str, dict[str, object]]:
         """Build the HITL prompt with pruning stats."""
         cause_key = _classify_cause(cause)
-        instructions = _CAUSE_INSTRUCTIONS[cause_key].replace(
-            "#{issue}", f"#{issue.number}"
-        )
+        instructions = _CAUSE_INSTRUCTIONS[cause_key]
         issue_body, body_before, body_after = truncate_with_notice(
             issue.body or "", self._config.max_issue_body_chars, label="Issue body"
         )
@@ -194,23 +193,7 @@ class HITLRunner(BaseRunner):
             correction or "", _MAX_HITL_CORRECTION_CHARS, label="Human guidance"
         )
 
-        manifest_section, memory_section = self._inject_manifest_and_memory()
-
-        prompt = f"""You are applying a human-in-the-loop correction for GitHub issue #{issue.number}.
-
-## Issue: {issue.title}
-
-{issue_body}{manifest_section}{memory_section}
-
-## Escalation Reason
-
-{cause_text}
-
-## Human Guidance
-
-{correction_text}
-
-## Instructions
+        phase = f"""## Instructions
 
 {instructions}
 
@@ -223,6 +206,26 @@ class HITLRunner(BaseRunner):
 - Ensure `make quality` passes before committing.
 
 {MEMORY_SUGGESTION_PROMPT.format(context="correction")}"""
+        learnings_section = self._relevant_learnings_section(
+            issue.title, issue.body or "", cause or "", correction or ""
+        )
+        issue_layer = f"""You are applying a human-in-the-loop correction for GitHub issue #{issue.number}. Use #{issue.number} as the issue number in commit messages.
+
+## Issue: {issue.title}
+
+{issue_body}{learnings_section}
+
+## Escalation Reason
+
+{cause_text}
+
+## Human Guidance
+
+{correction_text}"""
+        layers = PromptLayers(
+            repo=self._repo_context_layer(), phase=phase, issue=issue_layer
+        )
+        prompt = layers.render()
         stats = build_prompt_stats(
             history_before=cause_before + correction_before,
             history_after=cause_after + correction_after,
@@ -237,6 +240,7 @@ class HITLRunner(BaseRunner):
                 "guidance_after": correction_after,
             },
         )
+        stats.update(layers.stats())
         return prompt, stats
 
     def _build_prompt(self, issue: GitHubIssue, correction: str, cause: str) -> str:
@@ -5,13 +5,16 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections.abc import Callable
 from pathlib import Path
 
 from agent import AgentRunner
+from agent_scheduler import agent_slot
 from config import HydraFlowConfig
 from harness_insights import FailureCategory, HarnessInsightStore
 from issue_store import IssueStore
 from models import GitHubIssue, PipelineStage, Task, WorkerResult, WorkerResultMeta
+from overlap_scheduler import OverlapScheduler
 from phase_utils import (
     escalate_to_hitl,
     is_adr_issue_title,
@@ -23,7 +26,7 @@ from phase_utils import (
     store_lifecycle,
 )
 from pr_manager import PRManager
-from run_recorder import RunRecorder
+from run_recorder import RunContext, RunRecorder
 from state import StateTracker
 from subprocess_util import AuthenticationError, CreditExhaustedError, run_subprocess
 from task_source import TaskTransitioner
@@ -46,6 +49,7 @@ class ImplementPhase:
         stop_event: asyncio.Event,
         run_recorder: RunRecorder | None = None,
         harness_insights: HarnessInsightStore | None = None,
+        overlap_scheduler: OverlapScheduler | None = None,
     ) -> None:
         self._config = config
         self._state = state
@@ -57,6 +61,7 @@ class ImplementPhase:
         self._stop_event = stop_event
         self._run_recorder = run_recorder
         self._harness_insights = harness_insights
+        self._overlap_scheduler = overlap_scheduler
         self._active_issues: set[int] = set()
         self._active_issues_lock = asyncio.Lock()
 
@@ -105,6 +110,13 @@ class ImplementPhase:
                 return batch
 
         async def _worker(idx: int, issue: Task) -> WorkerResult:
+            try:
+                async with agent_slot("implement", issue):
+                    return await _run_worker(idx, issue)
+            finally:
+                release_batch_in_flight(self._store, {issue.id})
+
+        async def _run_worker(idx: int, issue: Task) -> WorkerResult:
             if self._stop_event.is_set():
                 return WorkerResult(
                     issue_number=issue.id,
@@ -217,14 +229,17 @@ class ImplementPhase:
                 logger.debug("Run recording setup failed", exc_info=True)
                 ctx = None
 
-        result = await self._run_implementation(issue, branch, idx, review_feedback)
+        result = await self._run_implementation(
+            issue,
+            branch,
+            idx,
+            review_feedback,
+            on_output=self._transcript_streamer(ctx) if ctx is not None else None,
+        )
 
         # Finalize the recording
         if ctx is not None:
             try:
-                if result.transcript:
-                    for line in result.transcript.splitlines():
-                        ctx.append_transcript(line)
                 outcome = "success" if result.success else "failed"
                 ctx.finalize(outcome, error=result.error)
             except Exception:
@@ -233,6 +248,35 @@ class ImplementPhase:
         is_retry = bool(review_feedback)
         return await self._handle_implementation_result(issue, result, is_retry)
 
+    @staticmethod
+    def _transcript_streamer(ctx: RunContext) -> Callable[[str], bool]:
+        """Return an ``on_output`` callback appending new lines to *ctx*.
+
+        The callback receives the accumulated display text and writes only
+        the lines added since its previous call.  It never stops the agent;
+        a failed write disables further recording for this run.
+        """
+        written = 0
+        broken = False
+
+        def _on_output(text: str) -> bool:
+            nonlocal written, broken
+            if broken:
+                return False
+            end = text.rfind("\n") + 1
+            if end <= written:
+                return False
+            try:
+                for line in text[written:end].splitlines():
+                    ctx.append_transcript(line)
+            except Exception:
+                broken = True
+                logger.debug("Run recording transcript append failed", exc_info=True)
+            written = end
+            return False
+
+        return _on_output
+
     def _read_plan_for_recording(self, issue_number: int) -> str:
         """Read the plan file for *issue_number*, returning empty string on failure."""
         plan_path = self._config.plans_dir / f"issue-{issue_number}.md"
@@ -371,21 +415,34 @@ class ImplementPhase:
         branch: str,
         worker_id: int,
         review_feedback: str,
+        on_output: Callable[[str], bool] | None = None,
     ) -> WorkerResult:
-        """Set up worktree, push branch, run agent, record metrics."""
-        wt_path = await self._setup_worktree_and_branch(
-            issue, branch, reset_to_main=bool(review_feedback)
-        )
+        """Set up worktree, push branch, run agent, record metrics.
 
-        result = await self._agents.run(
-            issue,
-            wt_path,
-            branch,
-            worker_id=worker_id,
-            review_feedback=review_feedback,
-        )
+        *on_output* is forwarded to the agent to stream its transcript.
+        """
+        wt_path: Path | None = None
+        try:
+            wt_path = await self._setup_worktree_and_branch(
+                issue, branch, reset_to_main=bool(review_feedback)
+            )
 
-        await self._record_impl_metrics(issue, result, review_feedback)
+            result = await self._agents.run(
+                issue,
+                wt_path,
+                branch,
+                worker_id=worker_id,
+                review_feedback=review_feedback,
+                on_output=on_output,
+            )
+
+            await self._record_impl_metrics(issue, result, review_feedback)
+        finally:
+            if self._overlap_scheduler is not None:
+                if wt_path is None:
+                    self._overlap_scheduler.discard(issue.id)
+                else:
+                    await self._overlap_scheduler.record_outcome(issue.id, wt_path)
 
         return result
 
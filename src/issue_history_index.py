@@ -0,0 +1,679 @@
+"""Incrementally maintained per-issue rows behind ``/api/issues/history``.
+
+The endpoint used to rebuild every row from the full event history and
+telemetry log whenever either changed, then deep-copy the result on each
+cache hit.  :class:`IssueHistoryIndex` instead folds new events (drained
+from an :class:`~events.EventBus` subscription) and new inference records
+(read from a byte offset into ``inferences.jsonl``) into rows that live
+for the lifetime of the dashboard, so a request only filters and pages.
+
+Rows and the telemetry offset they cover are snapshotted to
+``metrics/history_cache.json`` so a restart resumes from the offset
+instead of replaying the whole log.  Event application is idempotent, so
+the event bus history is simply replayed on top of the snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from config import HydraFlowConfig
+from events import EventBus, EventType, HydraFlowEvent
+from file_util import atomic_write
+from models import (
+    IssueHistoryEntry,
+    IssueHistoryLink,
+    IssueHistoryPR,
+    IssueOutcome,
+    parse_task_links,
+)
+from prompt_telemetry import PromptTelemetry
+
+logger = logging.getLogger("hydraflow.issue_history_index")
+
+INFERENCE_COUNTER_KEYS: tuple[str, ...] = (
+    "inference_calls",
+    "prompt_est_tokens",
+    "total_est_tokens",
+    "total_tokens",
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+    "history_chars_saved",
+    "context_chars_saved",
+    "pruned_chars_total",
+    "cache_hits",
+    "cache_misses",
+)
+
+# Row fields owned by GitHub enrichment and milestone lookups; copied onto
+# date-range views so they show the same titles as the full view.
+_ENRICHED_FIELDS: tuple[str, ...] = (
+    "title",
+    "issue_url",
+    "epic",
+    "crate_number",
+    "crate_title",
+    "linked_issues",
+)
+
+# Matches the default EventBus history size; an overflowing queue falls
+# back to replaying the bus history.
+_EVENT_QUEUE_SIZE = 5000
+
+# Minimum seconds between snapshot writes while rows keep changing.
+_SNAPSHOT_INTERVAL_SECONDS = 30.0
+
+_HISTORY_STATUSES = {
+    "unknown",
+    "triaged",
+    "planned",
+    "implemented",
+    "in_review",
+    "reviewed",
+    "hitl",
+    "active",
+    "failed",
+    "merged",
+}
+
+
+def _parse_timestamp(raw: str | None) -> datetime | None:
+    if not raw:
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _coerce_int(value: object) -> int:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return 0
+    return 0
+
+
+def _event_issue_number(data: dict[str, Any]) -> int | None:
+    value = data.get("issue")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+def _normalise_event_status(event_type: EventType, data: dict[str, Any]) -> str | None:
+    status = str(data.get("status", "")).lower()
+    result: str | None = None
+    if event_type == EventType.MERGE_UPDATE:
+        result = "merged" if status == "merged" else None
+    elif event_type == EventType.HITL_ESCALATION:
+        result = "hitl"
+    elif event_type == EventType.HITL_UPDATE:
+        result = "reviewed" if status == "resolved" else "hitl"
+    elif event_type == EventType.REVIEW_UPDATE:
+        if status == "done":
+            result = "reviewed"
+        elif status == "failed":
+            result = "failed"
+        else:
+            result = "active"
+    elif event_type in {
+        EventType.WORKER_UPDATE,
+        EventType.PLANNER_UPDATE,
+        EventType.TRIAGE_UPDATE,
+    }:
+        if status == "done":
+            done_map = {
+                EventType.WORKER_UPDATE: "implemented",
+                EventType.PLANNER_UPDATE: "planned",
+                EventType.TRIAGE_UPDATE: "triaged",
+            }
+            result = done_map.get(event_type, "active")
+        elif status == "failed":
+            result = "failed"
+        else:
+            result = "active"
+    elif event_type == EventType.PR_CREATED:
+        result = "in_review"
+    return result
+
+
+def _coerce_history_status(value: str) -> str:
+    """Normalize dashboard history statuses and default to ``unknown``."""
+    cleaned = str(value).strip().lower()
+    if cleaned in _HISTORY_STATUSES:
+        return cleaned
+    logger.warning("Unknown history status %r; falling back to 'unknown'", value)
+    return "unknown"
+
+
+def _status_rank(status: str) -> int:
+    ranks = {
+        "unknown": 0,
+        "triaged": 1,
+        "planned": 2,
+        "implemented": 3,
+        "in_review": 4,
+        "reviewed": 5,
+        "hitl": 6,
+        "active": 7,
+        "failed": 8,
+        "merged": 9,
+    }
+    return ranks.get(status, 0)
+
+
+def _is_timestamp_in_range(
+    raw: str | None, since: datetime | None, until: datetime | None
+) -> bool:
+    if raw is None:
+        return since is None and until is None
+    parsed = _parse_timestamp(raw)
+    if parsed is None:
+        return since is None and until is None
+    if since is not None and parsed < since:
+        return False
+    return not (until is not None and parsed > until)
+
+
+def _status_sort_key(status: str, timestamp: str | None) -> tuple[datetime, int]:
+    parsed = _parse_timestamp(timestamp)
+    if parsed is None:
+        parsed = datetime.min.replace(tzinfo=UTC)
+    return (parsed, _status_rank(status))
+
+
+def _touch_issue_timestamps(row: dict[str, Any], timestamp: str | None) -> None:
+    if not timestamp:
+        return
+    current_first = row.get("first_seen")
+    current_last = row.get("last_seen")
+    if not isinstance(current_first, str) or timestamp < current_first:
+        row["first_seen"] = timestamp
+    if not isinstance(current_last, str) or timestamp > current_last:
+        row["last_seen"] = timestamp
+
+
+def _build_history_links(
+    raw: dict[int, dict[str, Any]] | Iterable[Any],
+) -> list[IssueHistoryLink]:
+    """Convert the internal linked_issues accumulator to a sorted list."""
+    if isinstance(raw, dict):
+        return sorted(
+            (
+                IssueHistoryLink(
+                    target_id=int(v["target_id"]),
+                    kind=v.get("kind", "relates_to"),
+                    target_url=v.get("target_url"),
+                )
+                for v in raw.values()
+                if isinstance(v, dict) and _coerce_int(v.get("target_id")) > 0
+            ),
+            key=lambda lnk: lnk.target_id,
+        )
+    # Legacy fallback: bare set of ints
+    return sorted(
+        (IssueHistoryLink(target_id=int(v)) for v in raw if _coerce_int(v) > 0),
+        key=lambda lnk: lnk.target_id,
+    )
+
+
+def row_matches(row: Mapping[str, Any], status: str, query: str) -> bool:
+    """Return True when *row* passes the lower-cased status and query filters."""
+    if status and str(row.get("status", "unknown")).lower() != status:
+        return False
+    if not query:
+        return True
+    issue_number = int(row["issue_number"])
+    title = str(row.get("title", f"Issue #{issue_number}"))
+    return query in title.lower() or query in str(issue_number)
+
+
+def build_history_entry(
+    row: Mapping[str, Any], outcome: IssueOutcome | None
+) -> IssueHistoryEntry:
+    """Render one index row as an API entry without mutating the row."""
+    issue_number = int(row["issue_number"])
+    prs_map = row.get("prs", {})
+    if not isinstance(prs_map, dict):
+        prs_map = {}
+    pr_rows = sorted(
+        (
+            IssueHistoryPR(
+                number=int(pr_data["number"]),
+                url=str(pr_data.get("url", "")),
+                merged=bool(pr_data.get("merged", False)),
+            )
+            for pr_data in prs_map.values()
+            if isinstance(pr_data, dict) and _coerce_int(pr_data.get("number")) > 0
+        ),
+        key=lambda p: p.number,
+        reverse=True,
+    )
+    return IssueHistoryEntry(
+        issue_number=issue_number,
+        title=str(row.get("title", f"Issue #{issue_number}")),
+        issue_url=str(row.get("issue_url", "")),
+        status=_coerce_history_status(str(row.get("status", "unknown")).lower()),
+        epic=str(row.get("epic", "")),
+        crate_number=row.get("crate_number"),
+        crate_title=str(row.get("crate_title", "")),
+        linked_issues=_build_history_links(row.get("linked_issues", {})),
+        prs=pr_rows,
+        session_ids=sorted(str(s) for s in row.get("session_ids", set()) if str(s)),
+        source_calls=dict(sorted(row.get("source_calls", {}).items())),
+        model_calls=dict(sorted(row.get("model_calls", {}).items())),
+        inference={k: _coerce_int(v) for k, v in row.get("inference", {}).items()},
+        first_seen=row.get("first_seen"),
+        last_seen=row.get("last_seen"),
+        outcome=outcome,
+    )
+
+
+class IssueHistoryIndex:
+    """Per-issue history rows kept current from events and telemetry.
+
+    Rows are plain dicts in the same shape the endpoint has always cached;
+    callers must treat :attr:`rows` as read-only and go through the
+    ``apply_*``/``set_*`` methods for enrichment so changes are snapshotted.
+    All methods run on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        config: HydraFlowConfig,
+        event_bus: EventBus,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config
+        self._event_bus = event_bus
+        self._clock = clock
+        self._snapshot_file = config.data_path("metrics", "history_cache.json")
+        self._rows: dict[int, dict[str, Any]] = {}
+        self._pr_to_issue: dict[int, int] = {}
+        self._enriched: set[int] = set()
+        self._telemetry_offset = 0
+        self._queue: asyncio.Queue[HydraFlowEvent] | None = None
+        self._dirty = False
+        self._last_saved: float | None = None
+        try:
+            self._load_snapshot()
+        except Exception:
+            logger.debug("History snapshot warm-up failed", exc_info=True)
+
+    @property
+    def rows(self) -> Mapping[int, dict[str, Any]]:
+        """Current rows keyed by issue number."""
+        return self._rows
+
+    @property
+    def pr_to_issue(self) -> Mapping[int, int]:
+        """PR number to issue number, as learned from events and telemetry."""
+        return self._pr_to_issue
+
+    def is_enriched(self, issue_number: int) -> bool:
+        """Return True when GitHub enrichment already ran for *issue_number*."""
+        return issue_number in self._enriched
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def sync(self, telemetry: PromptTelemetry) -> None:
+        """Fold events and inference records that arrived since the last call."""
+        if self._queue is None:
+            # Subscribe before reading the history so nothing published in
+            # between is missed; overlap is harmless since events are
+            # applied idempotently.
+            self._queue = self._event_bus.subscribe(max_queue=_EVENT_QUEUE_SIZE)
+            self._replay_bus_history()
+        else:
+            overflowed = self._queue.full()
+            while not self._queue.empty():
+                self._apply_event(
+                    self._rows, self._pr_to_issue, self._queue.get_nowait()
+                )
+                self._dirty = True
+            if overflowed:
+                self._replay_bus_history()
+
+        records, offset = telemetry.load_inferences_from(self._telemetry_offset)
+        if offset < self._telemetry_offset:
+            logger.warning("Prompt telemetry log shrank; rebuilding issue history")
+            self._reset_inference()
+            records, offset = telemetry.load_inferences_from(0)
+        for record in records:
+            self._apply_inference(self._rows, self._pr_to_issue, record)
+        if offset != self._telemetry_offset:
+            self._telemetry_offset = offset
+            self._dirty = True
+        self._maybe_save()
+
+    def _replay_bus_history(self) -> None:
+        for event in self._event_bus.get_history():
+            self._apply_event(self._rows, self._pr_to_issue, event)
+        self._dirty = True
+
+    def _reset_inference(self) -> None:
+        """Drop inference-derived fields so the log can be replayed."""
+        for row in self._rows.values():
+            row["session_ids"] = set()
+            row["source_calls"] = {}
+            row["model_calls"] = {}
+            row["inference"] = dict.fromkeys(INFERENCE_COUNTER_KEYS, 0)
+        self._telemetry_offset = 0
+        self._dirty = True
+
+    def range_rows(
+        self,
+        events: Iterable[HydraFlowEvent],
+        records: Iterable[dict[str, Any]],
+        since: datetime | None,
+        until: datetime | None,
+    ) -> dict[int, dict[str, Any]]:
+        """Build throwaway rows from the events and records in a time range.
+
+        PR links come from the index so merges inside the range resolve
+        even when the PR was opened before it.  Enrichment fields are
+        copied from the index rows.
+        """
+        rows: dict[int, dict[str, Any]] = {}
+        pr_to_issue = dict(self._pr_to_issue)
+        for record in records:
+            timestamp = record.get("timestamp")
+            if _is_timestamp_in_range(
+                timestamp if isinstance(timestamp, str) else None, since, until
+            ):
+                self._apply_inference(rows, pr_to_issue, record)
+        for event in events:
+            if _is_timestamp_in_range(event.timestamp, since, until):
+                self._apply_event(rows, pr_to_issue, event)
+        self.copy_enrichment(rows)
+        return rows
+
+    def copy_enrichment(self, rows: Mapping[int, dict[str, Any]]) -> None:
+        """Overwrite enrichment-owned fields in *rows* from the index rows."""
+        for issue_number, row in rows.items():
+            source = self._rows.get(issue_number)
+            if source is not None:
+                for key in _ENRICHED_FIELDS:
+                    if key in source:
+                        row[key] = source[key]
+
+    # ------------------------------------------------------------------
+    # Enrichment
+    # ------------------------------------------------------------------
+
+    def apply_github_issue(self, issue_number: int, issue: Any) -> None:
+        """Merge title, URL, epic, milestone and task links from a GitHub issue."""
+        row = self._rows.get(issue_number)
+        if row is None:
+            return
+        row["title"] = issue.title or row.get("title") or f"Issue #{issue_number}"
+        row["issue_url"] = issue.url or row.get("issue_url", "")
+        labels = [str(lbl).strip() for lbl in issue.labels if str(lbl).strip()]
+        if not row.get("epic"):
+            epic = next((lbl for lbl in labels if "epic" in lbl.lower()), "")
+            row["epic"] = epic
+        ms_num = _coerce_int(getattr(issue, "milestone_number", None))
+        if ms_num > 0 and not row.get("crate_number"):
+            row["crate_number"] = ms_num
+        for link in parse_task_links(issue.body or ""):
+            tid = int(link.target_id)
+            row["linked_issues"][tid] = {
+                "target_id": tid,
+                "kind": str(link.kind),
+                "target_url": link.target_url or None,
+            }
+        self._dirty = True
+
+    def mark_enriched(self, issue_numbers: Iterable[int]) -> None:
+        """Record that enrichment ran for *issue_numbers* and snapshot."""
+        self._enriched.update(issue_numbers)
+        self._dirty = True
+        self.save()
+
+    def set_crate_title(self, issue_number: int, title: str) -> None:
+        """Store a milestone title looked up for *issue_number*'s crate."""
+        row = self._rows.get(issue_number)
+        if row is not None and row.get("crate_title") != title:
+            row["crate_title"] = title
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Row construction
+    # ------------------------------------------------------------------
+
+    def _new_row(self, issue_number: int) -> dict[str, Any]:
+        repo_slug = (self._config.repo or "").strip()
+        if repo_slug.startswith("https://github.com/"):
+            repo_slug = repo_slug[len("https://github.com/") :]
+        elif repo_slug.startswith("http://github.com/"):
+            repo_slug = repo_slug[len("http://github.com/") :]
+        repo_slug = repo_slug.strip("/")
+        issue_url = (
+            f"https://github.com/{repo_slug}/issues/{issue_number}" if repo_slug else ""
+        )
+        return {
+            "issue_number": issue_number,
+            "title": f"Issue #{issue_number}",
+            "issue_url": issue_url,
+            "status": "unknown",
+            "epic": "",
+            "crate_number": None,
+            "crate_title": "",
+            "linked_issues": {},
+            "prs": {},
+            "session_ids": set(),
+            "source_calls": {},
+            "model_calls": {},
+            "inference": dict.fromkeys(INFERENCE_COUNTER_KEYS, 0),
+            "first_seen": None,
+            "last_seen": None,
+            "status_updated_at": None,
+        }
+
+    def _apply_inference(
+        self,
+        rows: dict[int, dict[str, Any]],
+        pr_to_issue: dict[int, int],
+        record: dict[str, Any],
+    ) -> None:
+        issue_number = _coerce_int(record.get("issue_number"))
+        if issue_number <= 0:
+            return
+        row = rows.get(issue_number)
+        if row is None:
+            row = rows[issue_number] = self._new_row(issue_number)
+        timestamp = record.get("timestamp")
+        _touch_issue_timestamps(row, timestamp if isinstance(timestamp, str) else None)
+
+        session_id = str(record.get("session_id", "")).strip()
+        if session_id:
+            row["session_ids"].add(session_id)
+        source = str(record.get("source", "")).strip()
+        if source:
+            row["source_calls"][source] = row["source_calls"].get(source, 0) + 1
+        model = str(record.get("model", "")).strip()
+        if model:
+            row["model_calls"][model] = row["model_calls"].get(model, 0) + 1
+
+        inference = row["inference"]
+        inference["inference_calls"] = inference.get("inference_calls", 0) + 1
+        for key in INFERENCE_COUNTER_KEYS[1:]:
+            inference[key] = inference.get(key, 0) + _coerce_int(record.get(key))
+
+        pr_number = _coerce_int(record.get("pr_number"))
+        if pr_number > 0:
+            prs: dict[int, dict[str, Any]] = row["prs"]
+            if pr_number not in prs:
+                prs[pr_number] = {"number": pr_number, "url": "", "merged": False}
+            pr_to_issue.setdefault(pr_number, issue_number)
+
+    def _apply_event(
+        self,
+        rows: dict[int, dict[str, Any]],
+        pr_to_issue: dict[int, int],
+        event: HydraFlowEvent,
+    ) -> None:
+        timestamp = event.timestamp
+        issue_number = _event_issue_number(event.data)
+        if issue_number is None and event.type == EventType.MERGE_UPDATE:
+            issue_number = pr_to_issue.get(_coerce_int(event.data.get("pr")))
+        if issue_number is None or issue_number <= 0:
+            return
+
+        row = rows.get(issue_number)
+        if row is None:
+            row = rows[issue_number] = self._new_row(issue_number)
+        _touch_issue_timestamps(row, timestamp)
+
+        maybe_title = str(event.data.get("title", "")).strip()
+        if maybe_title:
+            row["title"] = maybe_title
+
+        maybe_url = str(event.data.get("url", "")).strip()
+        if maybe_url.startswith(("http://", "https://")):
+            row["issue_url"] = maybe_url
+
+        if event.type == EventType.ISSUE_CREATED:
+            labels = event.data.get("labels", [])
+            if isinstance(labels, list) and not row.get("epic"):
+                for lbl in labels:
+                    s = str(lbl).strip()
+                    if s and "epic" in s.lower():
+                        row["epic"] = s
+                        break
+            milestone_num = _coerce_int(event.data.get("milestone_number"))
+            if milestone_num > 0 and not row.get("crate_number"):
+                row["crate_number"] = milestone_num
+
+        if event.type in (EventType.PR_CREATED, EventType.MERGE_UPDATE):
+            pr_number = _coerce_int(event.data.get("pr"))
+            if pr_number > 0:
+                prs = row["prs"]
+                payload = prs.get(
+                    pr_number, {"number": pr_number, "url": "", "merged": False}
+                )
+                if event.type == EventType.PR_CREATED:
+                    pr_to_issue[pr_number] = issue_number
+                    url = str(event.data.get("url", "")).strip()
+                    if url.startswith(("http://", "https://")):
+                        payload["url"] = url
+                elif str(event.data.get("status", "")).lower() == "merged":
+                    payload["merged"] = True
+                prs[pr_number] = payload
+
+        normalised = _normalise_event_status(event.type, event.data)
+        if normalised:
+            current = str(row.get("status", "unknown"))
+            current_ts = (
+                row.get("status_updated_at")
+                if isinstance(row.get("status_updated_at"), str)
+                else None
+            )
+            if _status_sort_key(normalised, timestamp) >= _status_sort_key(
+                current, current_ts
+            ):
+                row["status"] = normalised
+                row["status_updated_at"] = timestamp
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    def _maybe_save(self) -> None:
+        if not self._dirty:
+            return
+        if (
+            self._last_saved is None
+            or self._clock() - self._last_saved >= _SNAPSHOT_INTERVAL_SECONDS
+        ):
+            self.save()
+
+    def save(self) -> None:
+        """Write rows, PR links and the telemetry offset to the snapshot file."""
+        serialisable_rows: dict[str, Any] = {}
+        for k, v in self._rows.items():
+            entry = dict(v)
+            # Convert sets to lists for JSON serialisation.
+            entry["session_ids"] = sorted(entry.get("session_ids") or [])
+            serialisable_rows[str(k)] = entry
+        payload = {
+            "telemetry_offset": self._telemetry_offset,
+            "issue_rows": serialisable_rows,
+            "pr_to_issue": {str(k): v for k, v in self._pr_to_issue.items()},
+            "enriched_issues": sorted(self._enriched),
+        }
+        try:
+            atomic_write(self._snapshot_file, json.dumps(payload))
+        except OSError:
+            logger.debug("Could not persist history snapshot", exc_info=True)
+            return
+        self._dirty = False
+        self._last_saved = self._clock()
+
+    def _load_snapshot(self) -> None:
+        """Restore rows from the snapshot file, ignoring corrupt files.
+
+        Snapshots written before the telemetry offset was stored carry
+        counters that cannot be matched to a log position, so their
+        inference fields are dropped and the log is replayed.
+        """
+        if not self._snapshot_file.is_file():
+            return
+        try:
+            raw = json.loads(self._snapshot_file.read_text())
+        except (OSError, json.JSONDecodeError, ValueError):
+            logger.debug("Corrupt history snapshot, ignoring", exc_info=True)
+            return
+        if not isinstance(raw, dict) or not isinstance(raw.get("issue_rows"), dict):
+            return
+        rows: dict[int, dict[str, Any]] = {}
+        for k, v in raw["issue_rows"].items():
+            if not isinstance(v, dict):
+                continue
+            entry = dict(v)
+            # Restore session_ids to a set.
+            entry["session_ids"] = set(entry.get("session_ids") or [])
+            # JSON keys are always strings — restore int keys for sub-dicts
+            # so enrichment lookups (which use int keys) don't create dupes.
+            entry["prs"] = {int(pk): pv for pk, pv in (entry.get("prs") or {}).items()}
+            entry["linked_issues"] = {
+                int(lk): lv for lk, lv in (entry.get("linked_issues") or {}).items()
+            }
+            entry.setdefault("source_calls", {})
+            entry.setdefault("model_calls", {})
+            entry.setdefault("inference", dict.fromkeys(INFERENCE_COUNTER_KEYS, 0))
+            rows[int(k)] = entry
+        self._rows = rows
+        self._pr_to_issue = {
+            int(k): int(v) for k, v in (raw.get("pr_to_issue") or {}).items()
+        }
+        self._enriched = {int(n) for n in raw.get("enriched_issues") or []}
+        offset = raw.get("telemetry_offset")
+        if isinstance(offset, int) and offset >= 0:
+            self._telemetry_offset = offset
+        else:
+            self._reset_inference()
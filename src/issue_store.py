@@ -18,6 +18,7 @@ from task_source import TaskFetcher
 
 if TYPE_CHECKING:
     from crate_manager import CrateManager
+    from overlap_scheduler import OverlapScheduler
 
 logger = logging.getLogger("hydraflow.issue_store")
 
@@ -122,11 +123,16 @@ class IssueStore:
         self._last_poll_ts: str | None = None
         self._lock = asyncio.Lock()
         self._crate_manager: CrateManager | None = None
+        self._overlap_scheduler: OverlapScheduler | None = None
 
     def set_crate_manager(self, cm: CrateManager) -> None:
         """Inject the crate manager after construction (avoids circular init)."""
         self._crate_manager = cm
 
+    def set_overlap_scheduler(self, scheduler: OverlapScheduler) -> None:
+        """Order the ready queue by planned-file overlap with in-flight work."""
+        self._overlap_scheduler = scheduler
+
     def get_uncrated_issues(self) -> list[Task]:
         """Return queued tasks that have no ``milestone_number`` in metadata."""
         uncrated: list[Task] = []
@@ -408,23 +414,30 @@ class IssueStore:
         skipped: list[Task] = []
         q = self._queues[stage]
 
-        while q and len(result) < max_count:
-            task = q.popleft()
-            self._queue_members[stage].discard(task.id)
-            if task.id in self._active or (
-                stage != STAGE_FIND
-                and self._crate_manager is not None
-                and self._crate_manager.active_crate_number is not None
-                and not self._crate_manager.is_in_active_crate(task)
-            ):
-                skipped.append(task)
-            else:
-                result.append(task)
-
-        # Put skipped tasks back at the front
-        for task in reversed(skipped):
-            q.appendleft(task)
-            self._queue_members[stage].add(task.id)
+        if stage == STAGE_READY and self._overlap_scheduler is not None:
+            result = self._overlap_scheduler.choose(
+                [t for t in q if not self._is_held(t, stage)],
+                self._implementing_ids(),
+                max_count,
+            )
+            taken = {t.id for t in result}
+            remaining = [t for t in q if t.id not in taken]
+            q.clear()
+            q.extend(remaining)
+            self._queue_members[stage].difference_update(taken)
+        else:
+            while q and len(result) < max_count:
+                task = q.popleft()
+                self._queue_members[stage].discard(task.id)
+                if self._is_held(task, stage):
+                    skipped.append(task)
+                else:
+                    result.append(task)
+
+            # Put skipped tasks back at the front
+            for task in reversed(skipped):
+                q.appendleft(task)
+                self._queue_members[stage].add(task.id)
 
         if result:
             for t in result:
@@ -432,6 +445,21 @@ class IssueStore:
             self._publish_queue_update_nowait()
         return result
 
+    def _is_held(self, task: Task, stage: IssueStoreStage) -> bool:
+        """Return True if *task* must stay queued (active or outside the crate)."""
+        return task.id in self._active or (
+            stage != STAGE_FIND
+            and self._crate_manager is not None
+            and self._crate_manager.active_crate_number is not None
+            and not self._crate_manager.is_in_active_crate(task)
+        )
+
+    def _implementing_ids(self) -> set[int]:
+        """Return issues taken from the ready queue that are still running."""
+        running = {n for n, s in self._active.items() if s == "implement"}
+        running.update(n for n, s in self._in_flight.items() if s == STAGE_READY)
+        return running
+
     # ------------------------------------------------------------------
     # Active issue tracking
     # ------------------------------------------------------------------
@@ -0,0 +1,249 @@
+"""Append-only JSONL store shared by the insight and learning files.
+
+The memory stores (harness failures, review records, troubleshooting
+patterns, retrospectives) are append-mostly logs that are read either for
+their last few records or, for keyed stores, for the latest record per key.
+:class:`JsonlStore` serves both without re-reading and re-parsing the whole
+file on every call:
+
+* :meth:`JsonlStore.tail` reads fixed blocks backwards from the end of the
+  file, so the cost is proportional to the records returned, not the log.
+* Parsed records are kept in a bounded LRU keyed by their raw line, so
+  repeated tail reads of an unchanged window skip validation entirely.
+* :meth:`JsonlStore.append` writes a batch of records with a single
+  ``write`` + ``fsync`` (:func:`file_util.append_jsonl_batch`).
+* Keyed stores record updates by appending the new version of a record;
+  once superseded lines outnumber live ones the log is compacted on a
+  background thread via :func:`file_util.atomic_write`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+from file_util import append_jsonl_batch, atomic_write
+
+logger = logging.getLogger("hydraflow.jsonl_store")
+
+_TAIL_BLOCK_SIZE = 64 * 1024
+_DEFAULT_CACHE_SIZE = 512
+# Superseded lines tolerated before a keyed store is compacted.
+_COMPACT_SLACK = 200
+# Stamp of a log file that does not exist yet.
+_MISSING = (-1, 0, 0)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def iter_lines_reversed(
+    path: Path, block_size: int = _TAIL_BLOCK_SIZE
+) -> Iterator[bytes]:
+    """Yield the lines of *path* from last to first, reading fixed blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + remainder).split(b"\n")
+            remainder = lines[0]
+            yield from reversed(lines[1:])
+        yield remainder
+
+
+class JsonlStore(Generic[T]):
+    """JSONL log of *model* records with tail reads and keyed folding.
+
+    Pass *key* for stores where a later record replaces an earlier one
+    with the same key; :meth:`latest` then returns one record per key in
+    first-seen order and the log is compacted as it accumulates
+    superseded lines.  *label* names records in malformed-line warnings.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        model: type[T],
+        *,
+        key: Callable[[T], Hashable] | None = None,
+        label: str = "record",
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self._path = path
+        self._model = model
+        self._key = key
+        self._label = label
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, T] = OrderedDict()
+        self._lock = threading.RLock()
+        # Keyed view: latest record per key plus the line count it was
+        # folded from, valid while the file matches ``_stamp`` (None until
+        # the first fold).
+        self._latest: dict[Hashable, T] = {}
+        self._line_count = 0
+        self._stamp: tuple[int, int, int] | None = None
+        self._compactor: threading.Thread | None = None
+
+    @property
+    def path(self) -> Path:
+        """The JSONL file backing this store."""
+        return self._path
+
+    # -- writes -----------------------------------------------------------
+
+    def append(self, *records: T) -> None:
+        """Append *records* with one write and ``fsync``.
+
+        Raises :class:`OSError` when the file cannot be written; callers
+        decide whether a lost record is worth more than a warning.
+        """
+        if not records:
+            return
+        lines = [r.model_dump_json() for r in records]
+        with self._lock:
+            fresh = self._stamp is not None and self._stamp == self._file_stamp()
+            append_jsonl_batch(self._path, lines)
+            for line, record in zip(lines, records, strict=True):
+                self._remember(line.encode(), record.model_copy())
+            if self._key is None:
+                return
+            if fresh:
+                for record in records:
+                    self._latest[self._key(record)] = record.model_copy()
+                self._line_count += len(records)
+                self._stamp = self._file_stamp()
+            else:
+                self._stamp = None
+        self._maybe_compact()
+
+    def compact(self) -> None:
+        """Rewrite a keyed store so it holds only the latest record per key."""
+        if self._key is None:
+            return
+        with self._lock:
+            latest = self._load_latest()
+            if self._line_count <= len(latest):
+                return
+            data = "".join(r.model_dump_json() + "\n" for r in latest.values())
+            try:
+                atomic_write(self._path, data)
+            except OSError:
+                logger.warning("Could not compact %s", self._path, exc_info=True)
+                return
+            self._line_count = len(latest)
+            self._stamp = self._file_stamp()
+
+    def wait_for_compaction(self, timeout: float | None = None) -> None:
+        """Block until a background compaction, if any, has finished."""
+        thread = self._compactor
+        if thread is not None:
+            thread.join(timeout)
+
+    # -- reads ------------------------------------------------------------
+
+    def tail(self, n: int) -> list[T]:
+        """Return the last *n* valid records, oldest first."""
+        if n <= 0:
+            return []
+        records: list[T] = []
+        with self._lock:
+            try:
+                for raw in iter_lines_reversed(self._path):
+                    record = self._parse(raw)
+                    if record is None:
+                        continue
+                    records.append(record.model_copy())
+                    if len(records) >= n:
+                        break
+            except OSError:
+                return []
+        records.reverse()
+        return records
+
+    def latest(self) -> list[T]:
+        """Return the latest record per key, in first-seen key order."""
+        if self._key is None:
+            raise TypeError("latest() requires a keyed store")
+        with self._lock:
+            return [r.model_copy() for r in self._load_latest().values()]
+
+    # -- internal ---------------------------------------------------------
+
+    def _file_stamp(self) -> tuple[int, int, int]:
+        try:
+            st = self._path.stat()
+        except OSError:
+            return _MISSING
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _load_latest(self) -> dict[Hashable, T]:
+        assert self._key is not None
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return self._latest
+        latest: dict[Hashable, T] = {}
+        count = 0
+        if stamp != _MISSING:
+            try:
+                with open(self._path, "rb") as f:
+                    for raw in f:
+                        record = self._parse(raw.rstrip(b"\n"))
+                        if record is None:
+                            continue
+                        count += 1
+                        latest[self._key(record)] = record
+            except OSError:
+                latest, count = {}, 0
+        self._latest = latest
+        self._line_count = count
+        self._stamp = stamp
+        return latest
+
+    def _parse(self, raw: bytes) -> T | None:
+        line = raw.strip()
+        if not line:
+            return None
+        cached = self._cache.get(line)
+        if cached is not None:
+            self._cache.move_to_end(line)
+            return cached
+        try:
+            record = self._model.model_validate_json(line)
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "Skipping malformed %s: %s",
+                self._label,
+                line[:80].decode(errors="replace"),
+            )
+            return None
+        self._remember(line, record)
+        return record
+
+    def _remember(self, line: bytes, record: T) -> None:
+        self._cache[line] = record
+        self._cache.move_to_end(line)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            stale = self._line_count - len(self._latest)
+            if self._stamp is None or stale <= max(len(self._latest), _COMPACT_SLACK):
+                return
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(
+                target=self.compact,
+                name=f"compact-{self._path.name}",
+                daemon=True,
+            )
+            self._compactor.start()
@@ -0,0 +1,218 @@
+"""Load-adaptive concurrency for the agent pools.
+
+Agents and their ``make quality`` runs share one machine; when too many
+overlap the box thrashes.  :class:`LoadController` samples the load
+average per core, available memory and Linux pressure-stall information
+(``/proc/pressure/{cpu,io,memory}`` where present) and scales the
+configured pool sizes by a fraction between ``load_control_min_fraction``
+and 1.
+
+Hysteresis keeps the fraction from flapping: one overloaded sample steps
+it down, but it only steps back up after several consecutive samples
+that sit comfortably below every limit, and it holds steady in between.
+Pools consult :func:`effective_concurrency` each time they refill, so a
+lower limit takes effect as running work drains rather than by
+cancelling it.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from runtime_metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+
+logger = logging.getLogger("hydraflow.load_controller")
+
+_PRESSURE_DIR = Path("/proc/pressure")
+_MEMINFO = Path("/proc/meminfo")
+_STEP = 0.25
+# Recover only below this share of each limit...
+_RELIEF_RATIO = 0.7
+# ...for this many consecutive samples.
+_CALM_SAMPLES = 3
+
+_FRACTION = REGISTRY.gauge(
+    "hydraflow_load_concurrency_fraction",
+    "Share of configured pool sizes currently allowed by the load controller",
+)
+_LOAD_PER_CORE = REGISTRY.gauge(
+    "hydraflow_load_per_core", "One-minute load average divided by CPU count"
+)
+_PRESSURE = REGISTRY.gauge(
+    "hydraflow_load_pressure_avg10",
+    "Highest 10s pressure-stall percentage across cpu, io and memory",
+)
+
+
+@dataclass(frozen=True)
+class LoadSample:
+    """One reading of system load."""
+
+    load_per_core: float
+    free_memory_ratio: float
+    pressure: float
+
+
+def _read_pressure(resource: str) -> float:
+    """Return the ``some avg10`` stall percentage for *resource*, or 0."""
+    try:
+        text = (_PRESSURE_DIR / resource).read_text()
+    except OSError:
+        return 0.0
+    for line in text.splitlines():
+        if line.startswith("some "):
+            for field in line.split()[1:]:
+                key, _, value = field.partition("=")
+                if key == "avg10":
+                    try:
+                        return float(value)
+                    except ValueError:
+                        return 0.0
+    return 0.0
+
+
+def _read_free_memory_ratio() -> float:
+    """Return MemAvailable / MemTotal, or 1.0 when unknown."""
+    try:
+        text = _MEMINFO.read_text()
+    except OSError:
+        return 1.0
+    values: dict[str, int] = {}
+    for line in text.splitlines():
+        key, _, rest = line.partition(":")
+        if key in ("MemTotal", "MemAvailable"):
+            try:
+                values[key] = int(rest.split()[0])
+            except (IndexError, ValueError):
+                continue
+    total = values.get("MemTotal", 0)
+    if total <= 0 or "MemAvailable" not in values:
+        return 1.0
+    return values["MemAvailable"] / total
+
+
+def sample_system_load() -> LoadSample:
+    """Read the current load average, free memory and stall pressure."""
+    try:
+        load1 = os.getloadavg()[0]
+    except OSError:
+        load1 = 0.0
+    return LoadSample(
+        load_per_core=load1 / (os.cpu_count() or 1),
+        free_memory_ratio=_read_free_memory_ratio(),
+        pressure=max(_read_pressure(r) for r in ("cpu", "io", "memory")),
+    )
+
+
+class LoadController:
+    """Scales pool sizes down under load and back up once it subsides."""
+
+    def __init__(
+        self,
+        config: HydraFlowConfig,
+        *,
+        sampler: Callable[[], LoadSample] = sample_system_load,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config
+        self._sampler = sampler
+        self._clock = clock
+        self._fraction = 1.0
+        self._calm = 0
+        self._last_sample_at: float | None = None
+        self._last: LoadSample | None = None
+
+    @property
+    def fraction(self) -> float:
+        return self._fraction
+
+    @property
+    def last_sample(self) -> LoadSample | None:
+        return self._last
+
+    def limit(self, configured: int) -> int:
+        """Return the allowed concurrency for a pool sized *configured*."""
+        self._maybe_sample()
+        if configured <= 1:
+            return configured
+        return max(1, math.floor(configured * self._fraction))
+
+    def _maybe_sample(self) -> None:
+        now = self._clock()
+        interval = self._config.load_control_interval
+        if self._last_sample_at is not None and now - self._last_sample_at < interval:
+            return
+        self._last_sample_at = now
+        try:
+            sample = self._sampler()
+        except Exception:  # noqa: BLE001
+            logger.debug("Load sampling failed", exc_info=True)
+            return
+        self.observe(sample)
+
+    def observe(self, sample: LoadSample) -> None:
+        """Fold *sample* into the current fraction."""
+        self._last = sample
+        _LOAD_PER_CORE.set(round(sample.load_per_core, 3))
+        _PRESSURE.set(sample.pressure)
+        cfg = self._config
+        overloaded = (
+            sample.load_per_core > cfg.load_control_max_load_per_core
+            or sample.free_memory_ratio < cfg.load_control_min_free_memory_ratio
+            or sample.pressure > cfg.load_control_max_pressure
+        )
+        calm = (
+            sample.load_per_core < cfg.load_control_max_load_per_core * _RELIEF_RATIO
+            and sample.free_memory_ratio
+            > cfg.load_control_min_free_memory_ratio / _RELIEF_RATIO
+            and sample.pressure < cfg.load_control_max_pressure * _RELIEF_RATIO
+        )
+        previous = self._fraction
+        if overloaded:
+            self._calm = 0
+            self._fraction = max(cfg.load_control_min_fraction, previous - _STEP)
+        elif calm:
+            self._calm += 1
+            if self._calm >= _CALM_SAMPLES:
+                self._calm = 0
+                self._fraction = min(1.0, previous + _STEP)
+        else:
+            self._calm = 0
+        _FRACTION.set(self._fraction)
+        if self._fraction != previous:
+            logger.info(
+                "Load controller %s concurrency to %.0f%% "
+                "(load/core=%.2f free_mem=%.0f%% pressure=%.1f)",
+                "lowered" if self._fraction < previous else "raised",
+                self._fraction * 100,
+                sample.load_per_core,
+                sample.free_memory_ratio * 100,
+                sample.pressure,
+            )
+
+
+_controller: LoadController | None = None
+
+
+def configure_load_controller(config: HydraFlowConfig) -> None:
+    """Install the process-wide controller when ``load_control_enabled``."""
+    global _controller  # noqa: PLW0603
+    _controller = LoadController(config) if config.load_control_enabled else None
+
+
+def effective_concurrency(configured: int) -> int:
+    """Return *configured* scaled by the process-wide controller, if any."""
+    controller = _controller
+    if controller is None:
+        return configured
+    return controller.limit(configured)
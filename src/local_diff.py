@@ -0,0 +1,168 @@
+"""Local-git diff source for the review phase.
+
+The review phase already has the PR branch checked out in a worktree
+(see ``ReviewPhase._prepare_review_worktree``), so the diff against the
+base branch can be computed locally instead of through ``gh pr diff``.
+This avoids an API round-trip per diff and GitHub's truncation of very
+large diffs.  Callers fall back to the API when the local diff is empty.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from config import HydraFlowConfig
+from models import DiffFileStat
+from subprocess_util import run_subprocess
+
+logger = logging.getLogger("hydraflow.local_diff")
+
+
+def parse_numstat_z(output: str) -> list[DiffFileStat]:
+    """Parse ``git diff --numstat -z`` output into :class:`DiffFileStat` entries.
+
+    With ``-z`` each record is ``added<TAB>removed<TAB>path<NUL>`` or, for
+    renames and copies, ``added<TAB>removed<TAB><NUL>old<NUL>new<NUL>``.
+    Binary files report ``-`` for both counts.
+    """
+    stats: list[DiffFileStat] = []
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields):
+        record = fields[i]
+        i += 1
+        if not record.strip():
+            continue
+        parts = record.split("\t", 2)
+        if len(parts) != 3:
+            continue
+        added_raw, removed_raw, path = parts
+        old_path = ""
+        if not path:
+            if i + 1 >= len(fields):
+                break
+            old_path, path = fields[i], fields[i + 1]
+            i += 2
+        binary = added_raw == "-" and removed_raw == "-"
+        stats.append(
+            DiffFileStat(
+                path=path,
+                old_path=old_path,
+                added=0 if binary else int(added_raw or 0),
+                removed=0 if binary else int(removed_raw or 0),
+                binary=binary,
+            )
+        )
+    return stats
+
+
+class LocalDiffProvider:
+    """Computes ``git diff origin/<main>...HEAD`` inside a review worktree."""
+
+    def __init__(self, config: HydraFlowConfig) -> None:
+        self._config = config
+
+    @property
+    def _range(self) -> str:
+        return f"origin/{self._config.main_branch}...HEAD"
+
+    @staticmethod
+    def is_available(worktree_path: Path) -> bool:
+        """Return True when *worktree_path* is a git checkout."""
+        return (worktree_path / ".git").exists()
+
+    async def _git(self, worktree_path: Path, *args: str) -> str:
+        return await run_subprocess(
+            "git",
+            *args,
+            cwd=worktree_path,
+            gh_token=self._config.gh_token,
+            timeout=self._config.git_command_timeout,
+        )
+
+    async def get_diff(self, worktree_path: Path | None) -> str:
+        """Return the unified diff of the branch against main, or ``""`` on failure."""
+        if worktree_path is None or not self.is_available(worktree_path):
+            return ""
+        try:
+            return await self._git(
+                worktree_path, "diff", "-M", "--no-color", "--no-ext-diff", self._range
+            )
+        except (RuntimeError, OSError):
+            logger.warning(
+                "Local diff failed in %s — falling back to API",
+                worktree_path,
+                exc_info=True,
+            )
+            return ""
+
+    async def get_file_stats(self, worktree_path: Path | None) -> list[DiffFileStat]:
+        """Return per-file added/removed counts, or ``[]`` on failure."""
+        if worktree_path is None or not self.is_available(worktree_path):
+            return []
+        try:
+            output = await self._git(
+                worktree_path, "diff", "-M", "--numstat", "-z", self._range
+            )
+        except (RuntimeError, OSError):
+            logger.warning(
+                "Local diff stats failed in %s — falling back to API",
+                worktree_path,
+                exc_info=True,
+            )
+            return []
+        return parse_numstat_z(output)
+
+    async def get_diff_names(self, worktree_path: Path | None) -> list[str]:
+        """Return the paths changed on the branch (new names for renames)."""
+        return [stat.path for stat in await self.get_file_stats(worktree_path)]
+
+    async def head_sha(self, worktree_path: Path | None) -> str:
+        """Return the worktree's HEAD commit, or ``""`` on failure."""
+        if worktree_path is None or not self.is_available(worktree_path):
+            return ""
+        try:
+            return await self._git(worktree_path, "rev-parse", "HEAD")
+        except (RuntimeError, OSError):
+            logger.warning("Could not resolve HEAD in %s", worktree_path, exc_info=True)
+            return ""
+
+    async def get_diff_since(
+        self, worktree_path: Path | None, since_sha: str, paths: list[str]
+    ) -> str | None:
+        """Return the diff of *paths* from *since_sha* to HEAD.
+
+        Returns ``None`` when *since_sha* is not an ancestor of HEAD (the
+        branch was rebased or force-pushed) or git fails, so callers can
+        fall back to the full diff.  Limiting the diff to the branch's own
+        *paths* keeps unrelated changes merged in from main out of it.
+        """
+        if worktree_path is None or not self.is_available(worktree_path):
+            return None
+        try:
+            await self._git(
+                worktree_path, "merge-base", "--is-ancestor", since_sha, "HEAD"
+            )
+        except (RuntimeError, OSError):
+            return None
+        try:
+            return await self._git(
+                worktree_path,
+                "diff",
+                "-M",
+                "--no-color",
+                "--no-ext-diff",
+                since_sha,
+                "HEAD",
+                "--",
+                *paths,
+            )
+        except (RuntimeError, OSError):
+            logger.warning(
+                "Diff since %s failed in %s",
+                since_sha[:12],
+                worktree_path,
+                exc_info=True,
+            )
+            return None
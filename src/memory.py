@@ -18,6 +18,7 @@ from file_util import atomic_write
 from manifest import ProjectManifestManager
 from manifest_curator import CuratedLearning, CuratedManifestStore
 from manifest_issue_syncer import ManifestIssueSyncer
+from memory_index import write_learnings_index
 from models import (
     MEMORY_TYPE_DISPLAY_ORDER,
     MemoryIssueData,
@@ -256,6 +257,7 @@ class MemorySyncWorker:
             if self._config.memory_prune_stale_items:
                 pruned = self._prune_stale_items([])
             self._state.update_memory_state([], prev_hash)
+            write_learnings_index(self._config, [])
             self._manifest_store.update_from_learnings([])
             await self._refresh_manifest("memory-sync-empty")
             return {
@@ -294,7 +296,13 @@ class MemorySyncWorker:
         digest = self._build_digest(learnings)
         max_chars = self._config.max_memory_chars
         if len(digest) > max_chars:
-            digest = await self._compact_digest(learnings, max_chars)
+            # With relevance retrieval the digest is only a fallback, so
+            # dedupe and truncate instead of paying for a model summary.
+            digest = await self._compact_digest(
+                learnings,
+                max_chars,
+                summarise=self._config.memory_retrieval_top_k == 0,
+            )
             compacted = True
 
         # Write individual items
@@ -304,6 +312,7 @@ class MemorySyncWorker:
             num, learning, _, _ = self._coerce_learning_tuple(record)
             item_path = items_dir / f"{num}.md"
             item_path.write_text(learning)
+        write_learnings_index(self._config, learnings)
 
         # Prune stale item files
         pruned = 0
@@ -676,14 +685,18 @@ class MemorySyncWorker:
         return header + "\n" + "\n---\n".join(sections) + "\n"
 
     async def _compact_digest(
-        self, learnings: Sequence[_LearningRecord], max_chars: int
+        self,
+        learnings: Sequence[_LearningRecord],
+        max_chars: int,
+        *,
+        summarise: bool = True,
     ) -> str:
         """Deduplicate and optionally summarise learnings to fit within *max_chars*.
 
         Pipeline:
         1. Keyword-overlap deduplication (>70% overlap → drop duplicate).
         2. Rebuild digest from unique items (grouped by type).
-        3. If still over *max_chars*: call a cheap model to summarise.
+        3. If still over *max_chars* and *summarise*: call a cheap model.
         4. Final truncation safety-net in case the model returns too much.
         """
         # --- Step 1: Deduplicate by keyword overlap ---
@@ -731,7 +744,7 @@ class MemorySyncWorker:
         digest = header + "\n" + "\n---\n".join(sections) + "\n"
 
         # --- Step 3: Model-based summarisation if still over limit ---
-        if len(digest) > max_chars:
+        if summarise and len(digest) > max_chars:
             summarised = await self._summarise_with_model(digest, max_chars)
             if summarised:
                 digest = summarised
@@ -0,0 +1,235 @@
+"""Relevance-ranked retrieval over synced memory learnings.
+
+``MemorySyncWorker`` writes every learning it extracts to
+``memory/learnings.json``.  Runners query that file with the issue at
+hand (title, body, planned files) and inject only the best matches,
+instead of the whole digest, so prompts stay small without model-based
+digest compaction.
+
+Ranking is Okapi BM25 over each learning's title and text, multiplied by
+a per-type boost (actionable instructions and config outweigh passive
+knowledge) and a recency boost that halves every
+:data:`_RECENCY_HALF_LIFE_DAYS`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from file_util import atomic_write
+from models import MemoryType
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+    from manifest_curator import CuratedLearning
+
+logger = logging.getLogger("hydraflow.memory_index")
+
+_K1 = 1.2
+_B = 0.75
+_TYPE_BOOST: dict[MemoryType, float] = {
+    MemoryType.INSTRUCTION: 1.3,
+    MemoryType.CONFIG: 1.15,
+    MemoryType.CODE: 1.15,
+    MemoryType.KNOWLEDGE: 1.0,
+}
+_RECENCY_HALF_LIFE_DAYS = 90.0
+# A learning synced today scores up to this much more than an ancient one.
+_RECENCY_WEIGHT = 0.5
+
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "should",
+        "that",
+        "the",
+        "this",
+        "to",
+        "when",
+        "with",
+    }
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lowercase terms, breaking up identifiers and paths."""
+    spaced = _CAMEL_RE.sub(r"\1 \2", text).lower()
+    return [t for t in _TOKEN_RE.findall(spaced) if len(t) > 1 and t not in _STOPWORDS]
+
+
+@dataclass(frozen=True)
+class LearningDoc:
+    """One synced learning as stored in ``learnings.json``."""
+
+    number: int
+    title: str
+    learning: str
+    memory_type: MemoryType
+    created_at: str = ""
+
+
+class LearningIndex:
+    """In-memory BM25 index over a set of learnings."""
+
+    def __init__(
+        self, docs: Sequence[LearningDoc], *, now: datetime | None = None
+    ) -> None:
+        self._docs = list(docs)
+        self._now = now or datetime.now(UTC)
+        self._tfs = [Counter(tokenize(f"{d.title} {d.learning}")) for d in self._docs]
+        lengths = [sum(tf.values()) for tf in self._tfs]
+        self._lengths = lengths
+        self._avg_len = (sum(lengths) / len(lengths)) if lengths else 0.0
+        df: Counter[str] = Counter()
+        for tf in self._tfs:
+            df.update(tf.keys())
+        n = len(self._docs)
+        self._idf = {
+            term: math.log(1 + (n - freq + 0.5) / (freq + 0.5))
+            for term, freq in df.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def search(self, query: str, k: int) -> list[tuple[float, LearningDoc]]:
+        """Return up to *k* ``(score, doc)`` pairs matching *query*, best first."""
+        terms = set(tokenize(query))
+        if k <= 0 or not terms or not self._docs:
+            return []
+        scored: list[tuple[float, LearningDoc]] = []
+        for doc, tf, length in zip(self._docs, self._tfs, self._lengths, strict=True):
+            score = 0.0
+            norm = _K1 * (1 - _B + _B * length / self._avg_len) if self._avg_len else 0
+            for term in terms:
+                freq = tf.get(term, 0)
+                if freq:
+                    score += self._idf[term] * freq * (_K1 + 1) / (freq + norm)
+            if score > 0:
+                scored.append((score * self._boost(doc), doc))
+        scored.sort(key=lambda pair: (-pair[0], -pair[1].number))
+        return scored[:k]
+
+    def _boost(self, doc: LearningDoc) -> float:
+        boost = _TYPE_BOOST.get(doc.memory_type, 1.0)
+        created = _parse_created(doc.created_at)
+        if created is None:
+            return boost
+        age_days = max(0.0, (self._now - created).total_seconds() / 86400)
+        return boost * (
+            1 + _RECENCY_WEIGHT * 0.5 ** (age_days / _RECENCY_HALF_LIFE_DAYS)
+        )
+
+
+def _parse_created(value: str) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def write_learnings_index(
+    config: HydraFlowConfig, learnings: Sequence[CuratedLearning]
+) -> None:
+    """Persist *learnings* for retrieval by the runners."""
+    payload = [
+        {
+            "number": item.number,
+            "title": item.title,
+            "learning": item.learning,
+            "type": item.memory_type.value,
+            "created_at": item.created_at,
+        }
+        for item in learnings
+    ]
+    path = config.data_path("memory", "learnings.json")
+    try:
+        atomic_write(path, json.dumps(payload, indent=2))
+    except OSError:
+        logger.warning("Could not write learnings index %s", path, exc_info=True)
+
+
+# Parsed index per file with the (mtime_ns, size) it was read at.
+_index_cache: dict[str, tuple[tuple[int, int], LearningIndex]] = {}
+
+
+def load_learning_index(config: HydraFlowConfig) -> LearningIndex | None:
+    """Return the index of synced learnings, or ``None`` if never synced."""
+    path = config.data_path("memory", "learnings.json")
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _index_cache.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        raw = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Could not read learnings index %s", path, exc_info=True)
+        return None
+    docs: list[LearningDoc] = []
+    for item in raw if isinstance(raw, list) else []:
+        if not isinstance(item, dict) or not item.get("learning"):
+            continue
+        try:
+            memory_type = MemoryType(str(item.get("type", "knowledge")))
+        except ValueError:
+            memory_type = MemoryType.KNOWLEDGE
+        docs.append(
+            LearningDoc(
+                number=int(item.get("number", 0)),
+                title=str(item.get("title", "")),
+                learning=str(item["learning"]),
+                memory_type=memory_type,
+                created_at=str(item.get("created_at", "")),
+            )
+        )
+    index = LearningIndex(docs)
+    _index_cache[str(path)] = (stamp, index)
+    return index
+
+
+def format_learnings(
+    results: Sequence[tuple[float, LearningDoc]], max_chars: int
+) -> str:
+    """Render ranked learnings as a markdown list within *max_chars*."""
+    lines: list[str] = []
+    used = 0
+    for _score, doc in results:
+        line = f"- **#{doc.number}** ({doc.memory_type.value}): {doc.learning}"
+        if lines and used + len(line) + 1 > max_chars:
+            break
+        lines.append(line[:max_chars])
+        used += len(line) + 1
+    return "\n".join(lines)
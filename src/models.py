@@ -404,6 +404,19 @@ class EpicGapReview(BaseModel):
     guidance: str = ""
 
 
+# --- Local Diff ---
+
+
+class DiffFileStat(BaseModel):
+    """Per-file change counts from ``git diff --numstat`` with rename detection."""
+
+    path: str
+    old_path: str = ""  # Source path when the file was renamed or copied
+    added: int = 0
+    removed: int = 0
+    binary: bool = False
+
+
 # --- Delta Verification ---
 
 
@@ -610,6 +623,28 @@ class ReviewResult(BaseModel):
     ci_fix_attempts: int = 0
     duration_seconds: float = 0.0
     visual_passed: bool | None = None  # None = not checked, True/False = outcome
+    findings: list[str] = Field(default_factory=list)
+    # Consecutive incremental reviews ending with this one (0 = full review).
+    incremental_streak: int = 0
+
+
+class ReviewCheckpoint(BaseModel):
+    """What the last review of a PR concluded, for incremental re-reviews."""
+
+    verdict: ReviewVerdict
+    summary: str = ""
+    findings: list[str] = Field(default_factory=list)
+    incremental_streak: int = 0
+
+
+class IncrementalReview(BaseModel):
+    """The delta an incremental re-review covers and the findings it carries."""
+
+    since_sha: str
+    delta_diff: str
+    changed_files: list[str] = Field(default_factory=list)
+    prior: ReviewCheckpoint
+    streak: int = 1
 
 
 # --- Visual Validation ---
@@ -861,6 +896,8 @@ class StageStats(BaseModel):
     completed_lifetime: int = 0
     worker_count: int = 0
     worker_cap: int | None = None
+    slot_waiting: int = 0
+    slot_wait_seconds: float = 0.0
 
 
 class ThroughputStats(BaseModel):
@@ -1084,6 +1121,7 @@ class StateData(BaseModel):
     disabled_workers: list[str] = Field(default_factory=list)
     interrupted_issues: dict[str, str] = Field(default_factory=dict)
     last_reviewed_shas: dict[str, str] = Field(default_factory=dict)
+    review_checkpoints: dict[str, ReviewCheckpoint] = Field(default_factory=dict)
     pending_reports: list[PendingReport] = Field(default_factory=list)
     issue_outcomes: dict[str, IssueOutcome] = Field(default_factory=dict)
     hook_failures: dict[str, list[HookFailureRecord]] = Field(default_factory=dict)
@@ -9,8 +9,10 @@ from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+from agent_scheduler import agent_slot, configure_agent_scheduler
 from config import HydraFlowConfig
 from events import EventBus, EventType, HydraFlowEvent
+from load_controller import configure_load_controller, effective_concurrency
 from models import (
     BackgroundWorkerState,
     GitHubIssue,
@@ -29,6 +31,7 @@ from phase_utils import (
     release_batch_in_flight,
     safe_file_memory_suggestion,
 )
+from profiling import start_loop_profiling, stop_loop_profiling
 from service_registry import OrchestratorCallbacks, build_services
 from state import StateTracker
 from subprocess_util import (
@@ -37,12 +40,14 @@ from subprocess_util import (
     configure_gh_concurrency,
     run_subprocess,
 )
+from tracing import configure_tracing
 
 if TYPE_CHECKING:
     from crate_manager import CrateManager
     from issue_store import IssueStore
     from metrics_manager import MetricsManager
     from run_recorder import RunRecorder
+    from workspace_disk import WorkspaceDiskAccountant
 
 logger = logging.getLogger("hydraflow.orchestrator")
 
@@ -100,6 +105,9 @@ class HydraFlowOrchestrator:
 
         # Configure global GitHub API concurrency limiter
         configure_gh_concurrency(config.gh_api_concurrency)
+        configure_tracing(config)
+        configure_load_controller(config)
+        self._scheduler = configure_agent_scheduler(config)
 
         # Build all services via the factory
         svc = build_services(
@@ -118,6 +126,7 @@ class HydraFlowOrchestrator:
 
         # Expose services as instance attributes for backward compatibility
         self._worktrees = svc.worktrees
+        self._workspace_disk = svc.workspace_disk
         self._subprocess_runner = svc.subprocess_runner
         self._agents = svc.agents
         self._planners = svc.planners
@@ -179,6 +188,11 @@ class HydraFlowOrchestrator:
         """Expose run recorder for dashboard API."""
         return self._run_recorder
 
+    @property
+    def workspace_disk(self) -> WorkspaceDiskAccountant:
+        """Expose workspace disk accounting for dashboard API."""
+        return self._workspace_disk
+
     @property
     def metrics_manager(self) -> MetricsManager:
         """Expose metrics manager for dashboard API."""
@@ -470,6 +484,8 @@ class HydraFlowOrchestrator:
             "hitl": "",  # HITL has no dedicated counter; shows 0
         }
 
+        slot_stats = self._scheduler.stats()["phases"]
+
         stages: dict[str, StageStats] = {}
         for stage_key in ("triage", "plan", "implement", "review", "hitl"):
             # Find the IssueStore stage name for queue/active lookups
@@ -491,6 +507,8 @@ class HydraFlowOrchestrator:
                 completed_lifetime=completed_lt,
                 worker_count=stage_runners.get(stage_key, 0),
                 worker_cap=stage_caps.get(stage_key),
+                slot_waiting=slot_stats[stage_key]["waiting"],
+                slot_wait_seconds=slot_stats[stage_key]["avg_wait_seconds"],
             )
 
         # Add a merged pseudo-stage from session counters and lifetime stats
@@ -791,15 +809,19 @@ class HydraFlowOrchestrator:
         await self._enable_rerere()
         self._warn_if_agents_md_missing()
         await self._start_session()
+        start_loop_profiling(self._config)
 
         try:
             await self._supervise_loops()
         finally:
+            stop_loop_profiling()
             await self._end_session()
             self._planners.terminate()
             self._agents.terminate()
             self._reviewers.terminate()
             self._hitl_runner.terminate()
+            with contextlib.suppress(Exception):
+                await self._subprocess_runner.cleanup()
             with contextlib.suppress(Exception):
                 await self._worktrees.sanitize_repo()
             await asyncio.sleep(0)
@@ -1236,10 +1258,9 @@ class HydraFlowOrchestrator:
         """
         did_work = False
         pending: set[asyncio.Task[bool]] = set()
-        max_slots = self._config.max_reviewers
-
         while not self._stop_event.is_set():
-            # Fill empty slots from the queue
+            # Fill empty slots from the queue, scaled to current system load
+            max_slots = effective_concurrency(self._config.max_reviewers)
             free_slots = max_slots - len(pending)
             if free_slots > 0:
                 new_issues = self._store.get_reviewable(free_slots)
@@ -1298,7 +1319,8 @@ class HydraFlowOrchestrator:
         """
         try:
             if is_adr_issue_title(issue.title):
-                await self._reviewer.review_adrs([issue])
+                async with agent_slot("review", issue):
+                    await self._reviewer.review_adrs([issue])
                 return True
 
             active_in_store = set(self._store.get_active_issues().keys())
@@ -1311,9 +1333,10 @@ class HydraFlowOrchestrator:
                 self._store.enqueue_transition(issue, "review")
                 return False
 
-            review_results = await self._reviewer.review_prs(
-                prs, [i.to_task() for i in gh_issues]
-            )
+            async with agent_slot("review", issue):
+                review_results = await self._reviewer.review_prs(
+                    prs, [i.to_task() for i in gh_issues]
+                )
             for result in review_results:
                 if result.transcript:
                     if result.merged:
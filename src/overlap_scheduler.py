@@ -0,0 +1,212 @@
+"""File-overlap-aware ordering of the implement queue.
+
+Issues implemented in parallel that edit the same files end in merge
+conflicts.  Before a ready issue is handed to an implementer,
+:class:`OverlapScheduler` compares the files its saved plan expects to
+touch (parsed with :func:`retrospective.parse_planned_files`) with the
+planned files of the issues already being implemented:
+
+* the queued issue sharing the fewest files with in-flight work starts
+  first, with queue order breaking ties;
+* an issue sharing more than ``max_planned_file_overlap`` of its planned
+  files is left queued until the conflicting work finishes;
+* an issue held back or passed over ``max_overlap_deferrals`` times starts
+  next regardless, so nothing starves;
+* issues without a plan never count as overlapping.
+
+When an implementation finishes, the files it actually changed are
+compared with the prediction and appended to
+``metrics/file_overlap.jsonl`` so the threshold can be tuned.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Collection, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from jsonl_store import JsonlStore
+from local_diff import LocalDiffProvider
+from models import IsoTimestamp
+from retrospective import parse_planned_files
+from runtime_metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+    from models import Task
+
+logger = logging.getLogger("hydraflow.overlap_scheduler")
+
+_DEFERRALS = REGISTRY.counter(
+    "hydraflow_file_overlap_deferrals_total",
+    "Ready issues held back or passed over for less-overlapping work",
+)
+_PREDICTIONS = REGISTRY.counter(
+    "hydraflow_file_overlap_predictions_total",
+    "Concurrent issue pairs by predicted vs actual file overlap",
+    ("outcome",),
+)
+
+# Actual changed files of finished issues, kept for peers still running.
+_MAX_REMEMBERED = 256
+
+
+class FileOverlapRecord(BaseModel):
+    """Predicted and actual file overlap of one implementation."""
+
+    issue_number: int
+    timestamp: IsoTimestamp = Field(
+        default_factory=lambda: datetime.now(UTC).isoformat(),
+    )
+    planned_files: list[str] = Field(default_factory=list)
+    actual_files: list[str] = Field(default_factory=list)
+    # Issues being implemented when this one started.
+    peers: list[int] = Field(default_factory=list)
+    # Peer issue number -> shared files, for peers that share any.
+    predicted_overlaps: dict[int, list[str]] = Field(default_factory=dict)
+    actual_overlaps: dict[int, list[str]] = Field(default_factory=dict)
+
+
+class OverlapScheduler:
+    """Picks ready issues that are least likely to conflict with running ones."""
+
+    def __init__(self, config: HydraFlowConfig) -> None:
+        self._config = config
+        self._diffs = LocalDiffProvider(config)
+        self._records = JsonlStore(
+            config.data_path("metrics", "file_overlap.jsonl"),
+            FileOverlapRecord,
+            label="file overlap record",
+        )
+        self._plans: dict[int, tuple[tuple[int, int], frozenset[str]]] = {}
+        self._deferrals: dict[int, int] = {}
+        # Issue number -> {peer: predicted shared files} captured at start.
+        self._predicted: dict[int, dict[int, frozenset[str]]] = {}
+        self._actual: OrderedDict[int, frozenset[str]] = OrderedDict()
+
+    def planned_files(self, issue_number: int) -> frozenset[str]:
+        """Return the files the saved plan for *issue_number* expects to touch."""
+        path = self._config.plans_dir / f"issue-{issue_number}.md"
+        try:
+            st = path.stat()
+        except OSError:
+            return frozenset()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._plans.get(issue_number)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            files = frozenset(parse_planned_files(path.read_text()))
+        except OSError:
+            return frozenset()
+        self._plans[issue_number] = (stamp, files)
+        return files
+
+    def choose(
+        self, candidates: Sequence[Task], running: Collection[int], max_count: int
+    ) -> list[Task]:
+        """Return up to *max_count* of *candidates* to start next.
+
+        *candidates* are in queue order and *running* holds the issue
+        numbers being implemented.  Candidates not returned stay queued.
+        """
+        max_deferrals = self._config.max_overlap_deferrals
+        threshold = self._config.max_planned_file_overlap
+        busy = {peer: self.planned_files(peer) for peer in running}
+        pool = list(enumerate(candidates))
+        chosen: list[tuple[int, Task]] = []
+        held: set[int] = set()
+        while pool and len(chosen) < max_count:
+            busy_files = frozenset().union(*busy.values())
+            best: tuple[tuple[int, int, int], int, Task] | None = None
+            for pos, task in pool:
+                files = self.planned_files(task.id)
+                shared = len(files & busy_files)
+                if self._deferrals.get(task.id, 0) >= max_deferrals:
+                    key = (0, 0, pos)
+                elif files and shared / len(files) > threshold:
+                    held.add(task.id)
+                    continue
+                else:
+                    key = (1, shared, pos)
+                if best is None or key < best[0]:
+                    best = (key, pos, task)
+            if best is None:
+                break
+            _key, pos, task = best
+            pool.remove((pos, task))
+            chosen.append((pos, task))
+            held.discard(task.id)
+            files = self.planned_files(task.id)
+            self._predicted[task.id] = {peer: files & p for peer, p in busy.items()}
+            self._deferrals.pop(task.id, None)
+            busy[task.id] = files
+
+        last_pos = max((pos for pos, _task in chosen), default=-1)
+        for pos, task in pool:
+            if task.id in held or pos < last_pos:
+                self._deferrals[task.id] = self._deferrals.get(task.id, 0) + 1
+                _DEFERRALS.inc()
+                logger.debug(
+                    "Issue #%d deferred (%d/%d) — planned files overlap in-flight work",
+                    task.id,
+                    self._deferrals[task.id],
+                    max_deferrals,
+                )
+        return [task for _pos, task in chosen]
+
+    def discard(self, issue_number: int) -> None:
+        """Forget the prediction for *issue_number* without recording an outcome."""
+        self._predicted.pop(issue_number, None)
+
+    async def record_outcome(self, issue_number: int, worktree_path: Path) -> None:
+        """Compare the files *issue_number* changed with the prediction and log it."""
+        predicted = self._predicted.pop(issue_number, None)
+        if predicted is None:
+            return
+        actual = frozenset(await self._diffs.get_diff_names(worktree_path))
+        if not actual:
+            return
+        self._actual[issue_number] = actual
+        self._actual.move_to_end(issue_number)
+        while len(self._actual) > _MAX_REMEMBERED:
+            self._actual.popitem(last=False)
+
+        actual_overlaps: dict[int, list[str]] = {}
+        for peer, predicted_files in predicted.items():
+            peer_files = self._actual.get(peer) or self.planned_files(peer)
+            shared = actual & peer_files
+            if shared:
+                actual_overlaps[peer] = sorted(shared)
+            if predicted_files and shared:
+                _PREDICTIONS.inc("confirmed")
+            elif predicted_files:
+                _PREDICTIONS.inc("false_alarm")
+            elif shared:
+                _PREDICTIONS.inc("missed")
+            else:
+                _PREDICTIONS.inc("disjoint")
+
+        record = FileOverlapRecord(
+            issue_number=issue_number,
+            planned_files=sorted(self.planned_files(issue_number)),
+            actual_files=sorted(actual),
+            peers=sorted(predicted),
+            predicted_overlaps={
+                peer: sorted(files) for peer, files in predicted.items() if files
+            },
+            actual_overlaps=actual_overlaps,
+        )
+        try:
+            self._records.append(record)
+        except OSError:
+            logger.warning(
+                "Could not append file overlap record to %s",
+                self._records.path,
+                exc_info=True,
+            )
@@ -14,10 +14,12 @@ from config import HydraFlowConfig
 from events import EventBus, EventType, HydraFlowEvent
 from harness_insights import FailureCategory, FailureRecord, HarnessInsightStore
 from issue_store import IssueStore
+from load_controller import effective_concurrency
 from memory import file_memory_suggestion
 from models import PipelineStage, PRInfo
 from ports import PRPort
 from state import StateTracker
+from tracing import span
 
 logger = logging.getLogger("hydraflow.phase_utils")
 
@@ -72,6 +74,9 @@ async def run_refilling_pool(
 
     *supply_fn* should return up to N available items (non-blocking).
     It is called each time a slot frees up to refill the pool.
+
+    *max_concurrent* is scaled by the load controller on every refill, so
+    the pool shrinks under system load and grows back when it subsides.
     """
     results: list[T_Result] = []
     pending: dict[asyncio.Task[T_Result], int] = {}  # task -> issue id placeholder
@@ -80,11 +85,12 @@ async def run_refilling_pool(
     try:
         while not stop_event.is_set():
             # Fill all empty slots — call supply repeatedly until full or dry
-            while len(pending) < max_concurrent:
+            limit = effective_concurrency(max_concurrent)
+            while len(pending) < limit:
                 new_items = supply_fn()
                 if not new_items:
                     break
-                free = max_concurrent - len(pending)
+                free = limit - len(pending)
                 for item in new_items[:free]:
                     task = asyncio.create_task(worker_fn(worker_id_counter, item))
                     pending[task] = worker_id_counter
@@ -227,6 +233,8 @@ async def store_lifecycle(
 ):
     """Mark an issue active on enter and complete on exit.
 
+    The block is traced as a ``phase.<stage>`` span for the issue.
+
     Usage::
 
         async with store_lifecycle(store, issue.number, "plan"):
@@ -234,7 +242,8 @@ async def store_lifecycle(
     """
     store.mark_active(issue_number, stage)
     try:
-        yield
+        with span(f"phase.{stage}", issue=issue_number):
+            yield
     finally:
         store.mark_complete(issue_number)
 
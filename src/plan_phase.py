@@ -7,6 +7,7 @@ import logging
 import re
 from typing import TYPE_CHECKING
 
+from agent_scheduler import agent_slot
 from analysis import PlanAnalyzer
 from config import HydraFlowConfig
 from events import EventBus
@@ -344,7 +345,7 @@ class PlanPhase:
         if self._stop_event.is_set():
             return PlanResult(issue_number=issue.id, error="stopped")
 
-        async with semaphore:
+        async with semaphore, agent_slot("plan", issue):
             if self._stop_event.is_set():
                 return PlanResult(issue_number=issue.id, error="stopped")
 
@@ -12,6 +12,7 @@ from agent_cli import build_agent_command
 from base_runner import BaseRunner
 from events import EventType, HydraFlowEvent
 from models import NewIssueSpec, PlannerStatus, PlanResult, Task
+from prompt_layers import PromptLayers
 from runner_constants import MEMORY_SUGGESTION_PROMPT
 from subprocess_util import CreditExhaustedError
 
@@ -376,8 +377,6 @@ class PlannerRunner(BaseRunner):
                 "the surrounding text describes what they show."
             )
 
-        manifest_section, memory_section = self._inject_manifest_and_memory()
-
         find_label = self._config.find_label[0]
 
         # --- Scale-adaptive schema section ---
@@ -412,13 +411,7 @@ class PlannerRunner(BaseRunner):
                 "`## Key Considerations` section."
             )
 
-        prompt = f"""You are a planning agent for GitHub issue #{issue.id}.
-
-## Issue: {issue.title}
-
-{body}{image_note}{comments_section}{manifest_section}{memory_section}
-
-## Instructions
+        phase = f"""## Instructions
 
 {mode_note}You are in READ-ONLY mode. Do NOT create, modify, or delete any files.
 Do NOT run any commands that change state (no git commit, no file writes, no installs).
@@ -514,6 +507,16 @@ ALREADY_SATISFIED_END
 This closes the issue automatically. False positives waste significant human time.
 
 {MEMORY_SUGGESTION_PROMPT.format(context="planning")}"""
+        learnings_section = self._relevant_learnings_section(issue.title, body_raw)
+        issue_layer = f"""You are a planning agent for GitHub issue #{issue.id}.
+
+## Issue: {issue.title}
+
+{body}{image_note}{comments_section}{learnings_section}"""
+        layers = PromptLayers(
+            repo=self._repo_context_layer(), phase=phase, issue=issue_layer
+        )
+        prompt = layers.render()
         stats = {
             "history_chars_before": history_before,
             "history_chars_after": history_after,
@@ -527,6 +530,7 @@ This closes the issue automatically. False positives waste significant human tim
                 "discussion_before": history_before,
                 "discussion_after": history_after,
             },
+            **layers.stats(),
         }
         return prompt, stats
 
@@ -18,6 +18,7 @@ from urllib.parse import quote
 
 from config import HydraFlowConfig
 from events import EventBus, EventType, HydraFlowEvent
+from execution import CaptureLimits
 from models import (
     Crate,
     GitHubIssue,
@@ -29,6 +30,7 @@ from models import (
 )
 from prep import HYDRAFLOW_LABELS
 from subprocess_util import run_subprocess, run_subprocess_with_retry
+from tracing import span
 
 logger = logging.getLogger("hydraflow.pr_manager")
 
@@ -115,13 +117,19 @@ class PRManager:
             msg = f"PRManager: repo is not configured or invalid ({self._repo!r}) — refusing to mutate GitHub"
             raise RuntimeError(msg)
 
-    async def _run_gh(self, *cmd: str, cwd: Path | None = None) -> str:
+    async def _run_gh(
+        self,
+        *cmd: str,
+        cwd: Path | None = None,
+        capture: CaptureLimits | None = None,
+    ) -> str:
         """Run a gh/git command with retry logic."""
         return await run_subprocess_with_retry(
             *cmd,
             cwd=cwd or self._config.repo_root,
             gh_token=self._config.gh_token,
             max_retries=self._max_retries,
+            capture=capture,
         )
 
     async def _gh_json_query(
@@ -976,6 +984,8 @@ class PRManager:
                 "--repo",
                 self._repo,
                 "--log-failed",
+                # Callers keep only the tail of each log.
+                capture=CaptureLimits.tail_chars(self._config.max_ci_log_chars),
             )
             if log_output.strip():
                 return f"### {name} (run {run_id})\n\n{log_output}"
@@ -1091,6 +1101,21 @@ class PRManager:
 
         Returns ``(passed, summary_message)``.
         """
+        with span("ci.wait", pr=pr_number) as sp:
+            passed, msg = await self._poll_ci(
+                pr_number, timeout, poll_interval, stop_event
+            )
+            if sp is not None:
+                sp.set_attribute("passed", passed)
+            return passed, msg
+
+    async def _poll_ci(
+        self,
+        pr_number: int,
+        timeout: int,
+        poll_interval: int,
+        stop_event: asyncio.Event,
+    ) -> tuple[bool, str]:
         if self._config.dry_run:
             logger.info("[dry-run] Would wait for CI on PR #%d", pr_number)
             return True, "Dry-run: CI skipped"
@@ -8,6 +8,7 @@ from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from execution import CaptureLimits
 from models import ConflictResolutionResult
 from phase_utils import safe_file_memory_suggestion
 from prompt_stats import build_prompt_stats, truncate_with_notice
@@ -827,6 +828,7 @@ If nothing novel, output exactly: NO_NEW_PATTERN"""
                 cwd=str(wt_path),
                 timeout=120.0,
                 env=env,
+                capture=CaptureLimits.tail_chars(2000),
             )
             return (
                 f"Test command `{test_cmd}` completed (rc={result.returncode}):\n"
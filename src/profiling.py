@@ -0,0 +1,275 @@
+"""Event-loop profiling: stack sampling, stall detection and task dumps.
+
+Everything here observes the asyncio loop thread from the outside, so a
+stalled loop can still be diagnosed while it is stalled:
+
+* :class:`StackSampler` is a daemon thread that periodically reads the
+  loop thread's frame from :func:`sys._current_frames` and counts each
+  stack in collapsed (flamegraph-ready) form.
+* :class:`SlowCallbackMonitor` has the loop stamp a heartbeat and a
+  watchdog thread log the loop thread's stack whenever a single callback
+  keeps the heartbeat from advancing for longer than the threshold.
+* :func:`task_stacks` lists the running tasks with their coroutine stacks.
+
+:func:`start_loop_profiling` installs the opt-in continuous sampler and
+the monitor for the orchestrator's loop according to the config;
+:func:`capture_profile` records a profile on demand for the dashboard.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import TYPE_CHECKING, Any
+
+from runtime_metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+
+logger = logging.getLogger("hydraflow.profiling")
+
+# Longest on-demand capture the dashboard may request.
+MAX_CAPTURE_SECONDS = 60
+# Frames kept per stack; deeper frames nearest the root are dropped.
+_MAX_STACK_DEPTH = 128
+_TASK_STACK_LIMIT = 32
+
+_LOOP_STALLS = REGISTRY.counter(
+    "hydraflow_event_loop_stalls_total",
+    "Callbacks that blocked the event loop beyond the slow-callback threshold",
+)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{Path(code.co_filename).name}:{code.co_name}"
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Return *frame*'s stack root-first as ``file:func;file:func``."""
+    labels: list[str] = []
+    while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def format_collapsed(counts: Counter[str]) -> str:
+    """Render stack counts in the collapsed format flamegraph tools read."""
+    return "".join(f"{stack} {n}\n" for stack, n in counts.most_common())
+
+
+class StackSampler:
+    """Samples one thread's stack at a fixed rate on a daemon thread."""
+
+    def __init__(self, thread_id: int, sample_hz: int) -> None:
+        self._thread_id = thread_id
+        self._interval = 1.0 / max(1, sample_hz)
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="hydraflow-stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def snapshot(self) -> Counter[str]:
+        """Return a copy of the stack counts sampled so far."""
+        with self._lock:
+            return Counter(self._counts)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack = collapse_stack(frame)
+            del frame
+            with self._lock:
+                self._counts[stack] += 1
+
+
+class SlowCallbackMonitor:
+    """Logs the loop thread's stack when one callback blocks the loop.
+
+    The loop re-arms a heartbeat callback every quarter threshold; a
+    watchdog thread checks how long ago it last ran and reports each
+    stall once, with the stack of whatever is still holding the loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold_ms: int) -> None:
+        self._loop = loop
+        self._threshold = threshold_ms / 1000
+        self._interval = self._threshold / 4
+        self._thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._handle: asyncio.TimerHandle | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start monitoring; must be called from the loop thread."""
+        self._thread_id = threading.get_ident()
+        self._beat()
+        self._thread = threading.Thread(
+            target=self._watch, name="hydraflow-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _beat(self) -> None:
+        self._last_beat = time.monotonic()
+        if not self._stop.is_set():
+            self._handle = self._loop.call_later(self._interval, self._beat)
+
+    def _watch(self) -> None:
+        reported_beat = 0.0
+        while not self._stop.wait(self._interval):
+            beat = self._last_beat
+            # The heartbeat is due every interval; anything beyond that is lag
+            blocked = time.monotonic() - beat - self._interval
+            if blocked < self._threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            frame = sys._current_frames().get(self._thread_id)
+            stack = collapse_stack(frame).replace(";", "\n  ")
+            del frame
+            _LOOP_STALLS.inc()
+            logger.warning(
+                "Event loop blocked for %.0f ms (threshold %.0f ms):\n  %s",
+                blocked * 1000,
+                self._threshold * 1000,
+                stack,
+            )
+
+
+def task_stacks() -> list[dict[str, Any]]:
+    """Return the running loop's tasks with their coroutine stacks."""
+    tasks: list[dict[str, Any]] = []
+    for task in asyncio.all_tasks():
+        coro = task.get_coro()
+        stack = [
+            f"{Path(f.f_code.co_filename).name}:{f.f_lineno} in {f.f_code.co_name}"
+            for f in task.get_stack(limit=_TASK_STACK_LIMIT)
+        ]
+        tasks.append(
+            {
+                "name": task.get_name(),
+                "coro": getattr(coro, "__qualname__", repr(coro)),
+                "done": task.done(),
+                "stack": stack,
+            }
+        )
+    tasks.sort(key=lambda t: t["name"])
+    return tasks
+
+
+class LoopProfiler:
+    """The continuous sampler and slow-callback monitor for one loop."""
+
+    def __init__(
+        self,
+        sampler: StackSampler | None,
+        monitor: SlowCallbackMonitor | None,
+    ) -> None:
+        self.sampler = sampler
+        self.monitor = monitor
+
+    def stop(self) -> None:
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.monitor is not None:
+            self.monitor.stop()
+
+
+_profiler: LoopProfiler | None = None
+
+
+def start_loop_profiling(config: HydraFlowConfig) -> LoopProfiler:
+    """Profile the running loop as *config* requests; call from the loop.
+
+    Continuous sampling runs only with ``profiling_enabled``; the
+    slow-callback monitor runs when ``slow_callback_threshold_ms`` is set.
+    """
+    global _profiler  # noqa: PLW0603
+    if _profiler is not None:
+        _profiler.stop()
+    sampler = None
+    if config.profiling_enabled:
+        sampler = StackSampler(threading.get_ident(), config.profiling_sample_hz)
+        sampler.start()
+    monitor = None
+    if config.slow_callback_threshold_ms > 0:
+        monitor = SlowCallbackMonitor(
+            asyncio.get_running_loop(), config.slow_callback_threshold_ms
+        )
+        monitor.start()
+    _profiler = LoopProfiler(sampler, monitor)
+    return _profiler
+
+
+def stop_loop_profiling() -> None:
+    """Stop the profiler installed by :func:`start_loop_profiling`."""
+    global _profiler  # noqa: PLW0603
+    if _profiler is not None:
+        _profiler.stop()
+        _profiler = None
+
+
+async def capture_profile(seconds: float, sample_hz: int) -> dict[str, Any]:
+    """Sample the calling loop's thread for *seconds*.
+
+    Reuses the continuous sampler when it is running (reporting only the
+    samples taken during the window), otherwise samples with a temporary
+    one at *sample_hz*.  Returns collapsed stacks and the current tasks.
+    """
+    continuous = _profiler.sampler if _profiler is not None else None
+    if continuous is not None and continuous.running:
+        before = continuous.snapshot()
+        await asyncio.sleep(seconds)
+        counts = continuous.snapshot() - before
+    else:
+        sampler = StackSampler(threading.get_ident(), sample_hz)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+        counts = sampler.snapshot()
+    return {
+        "seconds": seconds,
+        "samples": sum(counts.values()),
+        "collapsed": format_collapsed(counts),
+        "tasks": task_stacks(),
+    }
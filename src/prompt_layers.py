@@ -0,0 +1,77 @@
+"""Layered prompt assembly for provider prompt-cache reuse.
+
+Provider prompt caches only reuse the longest *identical* prefix of a
+prompt, so every runner assembles its prompt from four layers ordered
+from most to least stable:
+
+1. **system** — :data:`SYSTEM_PREFIX`, byte-identical for every runner;
+2. **repo** — the project manifest and memory digest, shared by every
+   agent until the manifest is refreshed or memory is synced;
+3. **phase** — the runner's instructions, which depend only on config
+   and long-lived learnings (review feedback, escalations);
+4. **issue** — the issue, plan, diff, discussion and anything else that
+   is specific to one run.
+
+Nothing that varies per issue or PR — not even its number — may appear
+before the issue layer.  :meth:`PromptLayers.stats` reports the size and
+digest of the shared prefix so ``PromptTelemetry`` can relate it to the
+cache-read tokens the provider reports.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from hashlib import sha256
+
+SYSTEM_PREFIX = """\
+You are a HydraFlow agent working autonomously on a checkout of this repository.
+There is no TTY and no human watching this session: never wait for input and
+never run interactive commands.
+
+This prompt runs from general to specific: shared project context first, then
+the instructions for your current phase, then the issue or pull request this
+run is about."""
+
+_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class PromptLayers:
+    """The sections of one prompt, grouped by how often they change."""
+
+    phase: str
+    issue: str
+    repo: str = ""
+    system: str = SYSTEM_PREFIX
+
+    def _parts(self) -> list[str]:
+        return [
+            part.strip("\n")
+            for part in (self.system, self.repo, self.phase, self.issue)
+            if part.strip()
+        ]
+
+    def prefix(self) -> str:
+        """Return the rendered layers that precede the issue layer."""
+        parts = self._parts()
+        if self.issue.strip():
+            parts = parts[:-1]
+        return _SEPARATOR.join(parts) + _SEPARATOR if parts else ""
+
+    def render(self) -> str:
+        """Return the full prompt."""
+        return _SEPARATOR.join(self._parts())
+
+    def stats(self) -> dict[str, object]:
+        """Return per-layer sizes and the digest of the shared prefix."""
+        prefix = self.prefix()
+        return {
+            "prompt_prefix_chars": len(prefix),
+            "prompt_prefix_hash": sha256(prefix.encode()).hexdigest()[:16],
+            "layer_chars": {
+                "system": len(self.system.strip("\n")),
+                "repo": len(self.repo.strip("\n")),
+                "phase": len(self.phase.strip("\n")),
+                "issue": len(self.issue.strip("\n")),
+            },
+        }
@@ -1,14 +1,29 @@
-"""Prompt/inference telemetry for ROI tracking and token-efficiency analysis."""
+"""Prompt/inference telemetry for ROI tracking and token-efficiency analysis.
+
+``inferences.jsonl`` is the source of truth.  Aggregates (lifetime,
+session, PR, issue and source counters) are held in memory once per
+process and folded forward from the byte offset where they were last up
+to date, so each record costs O(1) instead of a full re-read and rewrite
+of the rollup.
+``pr_stats.json`` is a periodic checkpoint of that aggregate plus its
+offset; deleting it only forces a replay of ``inferences.jsonl``.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
 from config import HydraFlowConfig
 from file_util import append_jsonl, atomic_write, file_lock
+from jsonl_store import iter_lines_reversed
 from model_pricing import ModelPricingTable, load_pricing
 
 logger = logging.getLogger("hydraflow.prompt_telemetry")
@@ -35,6 +50,53 @@ def _estimate_tokens(chars: int, model: str) -> tuple[int, float, str]:
     return max(1, round(chars / chars_per_token)), chars_per_token, confidence
 
 
+# Block size for reading inferences.jsonl backwards from the end.
+_TAIL_BLOCK_SIZE = 64 * 1024
+# Distance between probes in the sparse timestamp -> offset index.
+_TIME_INDEX_STRIDE = 256 * 1024
+
+
+@dataclass
+class _TimeIndex:
+    """Sparse ``(timestamp, line offset)`` samples of one inferences file."""
+
+    file_id: tuple[int, int]
+    entries: list[tuple[datetime, int]] = field(default_factory=list)
+    next_probe: int = 0
+
+
+# Shared by all PromptTelemetry instances; dashboard routes build a new
+# instance per request.  Keyed by file path.
+_TIME_INDEXES: dict[str, _TimeIndex] = {}
+_TIME_INDEX_LOCK = threading.Lock()
+
+
+@dataclass
+class _SharedAggregate:
+    """In-memory aggregate of one ``pr_stats.json`` and the JSONL offset it covers."""
+
+    data: dict[str, object] | None = None
+    offset: int = 0
+    pending_records: int = 0
+    last_checkpoint: float | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# One aggregate per pr_stats.json path for the whole process, shared by
+# the per-runner and per-request PromptTelemetry instances.
+_AGGREGATES: dict[str, _SharedAggregate] = {}
+_AGGREGATES_LOCK = threading.Lock()
+
+
+# Checkpoint the in-memory aggregate after this many records ...
+_CHECKPOINT_EVERY_RECORDS = 100
+# ... or after this many seconds, whichever comes first.
+_CHECKPOINT_INTERVAL_SECONDS = 30.0
+# Oldest sessions (by last update) beyond this count are expired at
+# checkpoint time; lifetime/PR/issue/source totals are unaffected.
+_MAX_SESSIONS = 500
+
+
 class PromptTelemetry:
     """Writes prompt/inference metrics to filesystem-backed JSON artifacts."""
 
@@ -42,6 +104,8 @@ class PromptTelemetry:
         self,
         config: HydraFlowConfig,
         pricing: ModelPricingTable | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._config = config
         self._dir = config.data_path("metrics", "prompt")
@@ -49,6 +113,13 @@ class PromptTelemetry:
         self._pr_stats_file = self._dir / "pr_stats.json"
         self._lock_file = self._dir / ".lock"
         self._pricing = pricing or load_pricing()
+        self._clock = clock
+        # In-memory aggregate shared by every instance on this pr_stats.json.
+        with _AGGREGATES_LOCK:
+            self._shared = _AGGREGATES.setdefault(
+                str(self._pr_stats_file), _SharedAggregate()
+            )
+        self._mem_lock = self._shared.lock
 
     def record(
         self,
@@ -106,6 +177,11 @@ class PromptTelemetry:
         effective_total_tokens = (
             actual_total_tokens if actual_total_tokens > 0 else estimated_total_tokens
         )
+        prompt_input_tokens = (
+            actual_input_tokens
+            + actual_cache_creation_tokens
+            + actual_cache_read_tokens
+        )
 
         record = {
             "timestamp": datetime.now(UTC).isoformat(),
@@ -124,6 +200,11 @@ class PromptTelemetry:
             "output_tokens": actual_output_tokens,
             "cache_creation_input_tokens": actual_cache_creation_tokens,
             "cache_read_input_tokens": actual_cache_read_tokens,
+            "prefix_cache_hit_rate": (
+                round(actual_cache_read_tokens / prompt_input_tokens, 4)
+                if prompt_input_tokens
+                else 0.0
+            ),
             "total_tokens": effective_total_tokens,
             "token_source": token_source,
             "usage_status": usage_status,
@@ -179,6 +260,17 @@ class PromptTelemetry:
                 clean_sections[key] = max(0, _as_int(v))
             if clean_sections:
                 record["section_chars"] = clean_sections
+        layer_chars = st.get("layer_chars")
+        if isinstance(layer_chars, dict):
+            record["layer_chars"] = {
+                str(k): max(0, _as_int(v)) for k, v in layer_chars.items() if str(k)
+            }
+        prefix_hash = st.get("prompt_prefix_hash")
+        if isinstance(prefix_hash, str) and prefix_hash:
+            record["prompt_prefix_hash"] = prefix_hash
+            record["prompt_prefix_chars"] = max(
+                0, _as_int(st.get("prompt_prefix_chars", 0))
+            )
         raw_usage = st.get("raw_usage")
         if isinstance(raw_usage, list):
             cleaned_raw: list[dict[str, object]] = []
@@ -200,9 +292,14 @@ class PromptTelemetry:
 
         try:
             self._dir.mkdir(parents=True, exist_ok=True)
-            with file_lock(self._lock_file):
+            with file_lock(self._lock_file), self._mem_lock:
+                # Fold in other writers' lines first so a legacy checkpoint
+                # is matched to the log size it was written against.
+                self._catch_up()
                 append_jsonl(self._inferences_file, json.dumps(record, sort_keys=True))
-                self._update_pr_stats(record)
+                self._catch_up()
+                if self._checkpoint_due():
+                    self._write_checkpoint()
         except OSError:
             logger.warning(
                 "Could not write prompt telemetry to %s",
@@ -210,8 +307,67 @@ class PromptTelemetry:
                 exc_info=True,
             )
 
-    def _update_pr_stats(self, record: dict[str, object]) -> None:
-        data = self._load_pr_stats()
+    # ------------------------------------------------------------------
+    # In-memory aggregate
+    # ------------------------------------------------------------------
+
+    def _section(self, key: str) -> dict[str, object]:
+        """Return one aggregate section, folded forward to the end of the JSONL.
+
+        Must be called with ``_mem_lock`` held.
+        """
+        self._catch_up()
+        section = (self._shared.data or {}).get(key)
+        return section if isinstance(section, dict) else {}
+
+    def _catch_up(self) -> None:
+        """Fold complete JSONL lines past the shared offset into the aggregate.
+
+        Loads the checkpoint on first use.  Replays from the start when
+        there is no usable checkpoint or the JSONL shrank below its
+        offset.  Must be called with ``_mem_lock`` held.
+        """
+        try:
+            size = (
+                self._inferences_file.stat().st_size
+                if self._inferences_file.is_file()
+                else 0
+            )
+        except OSError:
+            size = 0
+        if self._shared.data is None:
+            self._shared.data, self._shared.offset = self._load_checkpoint(size)
+        if self._shared.offset > size:
+            logger.warning("Prompt telemetry log shrank; rebuilding aggregates")
+            self._shared.data, self._shared.offset = {}, 0
+        if self._shared.offset == size:
+            return
+        try:
+            with open(self._inferences_file, "rb") as f:
+                f.seek(self._shared.offset)
+                for raw_line in f:
+                    # A line without its newline is still being written.
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    self._shared.offset += len(raw_line)
+                    self._shared.pending_records += 1
+                    try:
+                        parsed = json.loads(raw_line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(parsed, dict):
+                        self._apply(parsed)
+        except OSError:
+            logger.warning(
+                "Could not read prompt telemetry from %s",
+                self._inferences_file,
+                exc_info=True,
+            )
+
+    def _apply(self, record: dict[str, object]) -> None:
+        """Add one inference record to every matching counter bucket."""
+        data = self._shared.data if self._shared.data is not None else {}
+        self._shared.data = data
         lifetime = _get_or_init_dict(data, "lifetime", _new_counter())
         self._accumulate_counter(lifetime, record)
 
@@ -241,16 +397,62 @@ class PromptTelemetry:
 
         data["updated_at"] = str(record.get("timestamp", ""))
 
+    def _expire_sessions(self) -> None:
+        """Drop the least recently updated sessions beyond ``_MAX_SESSIONS``."""
+        if self._shared.data is None:
+            return
+        sessions = self._shared.data.get("sessions")
+        if not isinstance(sessions, dict) or len(sessions) <= _MAX_SESSIONS:
+            return
+        by_age = sorted(
+            sessions,
+            key=lambda sid: str(
+                (sessions[sid] if isinstance(sessions[sid], dict) else {}).get(
+                    "last_updated", ""
+                )
+            ),
+        )
+        for sid in by_age[: len(sessions) - _MAX_SESSIONS]:
+            del sessions[sid]
+
+    # ------------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------------
+
+    def _checkpoint_due(self) -> bool:
+        if self._shared.pending_records <= 0:
+            return False
+        if self._shared.last_checkpoint is None:
+            return True
+        return (
+            self._shared.pending_records >= _CHECKPOINT_EVERY_RECORDS
+            or self._clock() - self._shared.last_checkpoint
+            >= _CHECKPOINT_INTERVAL_SECONDS
+        )
+
+    def checkpoint(self) -> None:
+        """Persist the aggregate and its JSONL offset to ``pr_stats.json``."""
+        with self._mem_lock:
+            self._catch_up()
+            if self._shared.pending_records > 0:
+                self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        """Write the aggregate.  Must be called with ``_mem_lock`` held."""
+        self._expire_sessions()
+        data = dict(self._shared.data or {})
+        data["inferences_offset"] = self._shared.offset
         try:
-            atomic_write(
-                self._pr_stats_file, json.dumps(data, indent=2, sort_keys=True)
-            )
+            atomic_write(self._pr_stats_file, json.dumps(data, sort_keys=True))
         except OSError:
             logger.warning(
                 "Could not write per-PR prompt stats to %s",
                 self._pr_stats_file,
                 exc_info=True,
             )
+            return
+        self._shared.pending_records = 0
+        self._shared.last_checkpoint = self._clock()
 
     def _load_pr_stats(self) -> dict[str, object]:
         if not self._pr_stats_file.is_file():
@@ -268,6 +470,24 @@ class PromptTelemetry:
             return {}
         return parsed if isinstance(parsed, dict) else {}
 
+    def _load_checkpoint(self, log_size: int) -> tuple[dict[str, object], int]:
+        """Return ``(aggregate, offset)`` from ``pr_stats.json``.
+
+        A missing or corrupt checkpoint yields an empty aggregate at offset
+        0 so the whole JSONL is replayed.  Checkpoints written before
+        offsets were tracked were rewritten on every record, so they cover
+        the whole log as it stands.
+        """
+        data = self._load_pr_stats()
+        if not data:
+            return {}, 0
+        offset = data.pop("inferences_offset", None)
+        if offset is None:
+            return data, log_size
+        if not isinstance(offset, int) or offset < 0:
+            return {}, 0
+        return data, offset
+
     def get_mtime(self) -> float:
         """Return the modification time of the inferences file, or 0.0."""
         try:
@@ -284,28 +504,71 @@ class PromptTelemetry:
         *,
         limit: int = 5000,
     ) -> list[dict[str, Any]]:
-        """Load recent inference rows from JSONL, newest last."""
+        """Load recent inference rows from JSONL, newest last.
+
+        Reads the file backwards in blocks and decodes only the newest
+        *limit* rows.
+        """
         if limit <= 0:
             return []
         if not self._inferences_file.is_file():
             return []
         rows: list[dict[str, Any]] = []
         try:
-            with open(self._inferences_file) as f:
+            for raw_line in iter_lines_reversed(
+                self._inferences_file, _TAIL_BLOCK_SIZE
+            ):
+                parsed = self._decode_line(raw_line)
+                if parsed is not None:
+                    rows.append(parsed)
+                    if len(rows) >= limit:
+                        break
+        except OSError:
+            logger.warning(
+                "Could not read prompt telemetry from %s",
+                self._inferences_file,
+                exc_info=True,
+            )
+            return []
+        rows.reverse()
+        return rows
+
+    def load_inferences_between(
+        self,
+        since: datetime | None,
+        until: datetime | None,
+        *,
+        limit: int = 50000,
+    ) -> list[dict[str, Any]]:
+        """Load rows with ``since <= timestamp <= until``, newest last.
+
+        A sparse timestamp index narrows the byte range that is decoded.
+        Rows without a parseable timestamp are skipped when a bound is
+        given.  At most the newest *limit* matching rows are returned.
+        """
+        if since is None and until is None:
+            return self.load_inferences(limit=limit)
+        if limit <= 0 or not self._inferences_file.is_file():
+            return []
+        rows: deque[dict[str, Any]] = deque(maxlen=limit)
+        try:
+            start, end = self._indexed_range(since, until)
+            with open(self._inferences_file, "rb") as f:
+                f.seek(start)
+                pos = start
                 for raw_line in f:
-                    stripped = raw_line.strip()
-                    if not stripped:
+                    if pos >= end:
+                        break
+                    pos += len(raw_line)
+                    parsed = self._decode_line(raw_line)
+                    if parsed is None:
                         continue
-                    try:
-                        parsed = json.loads(stripped)
-                    except json.JSONDecodeError:
-                        logger.debug(
-                            "Skipping corrupt inference line in %s",
-                            self._inferences_file,
-                            exc_info=True,
-                        )
+                    ts = _parse_timestamp(parsed.get("timestamp"))
+                    if ts is None:
                         continue
-                    if isinstance(parsed, dict):
+                    if (since is None or ts >= since) and (
+                        until is None or ts <= until
+                    ):
                         rows.append(parsed)
         except OSError:
             logger.warning(
@@ -314,9 +577,123 @@ class PromptTelemetry:
                 exc_info=True,
             )
             return []
-        if len(rows) > limit:
-            return rows[-limit:]
-        return rows
+        return list(rows)
+
+    def load_inferences_from(self, offset: int) -> tuple[list[dict[str, Any]], int]:
+        """Return rows appended after byte *offset* and the offset reached.
+
+        Only newline-terminated lines are consumed, so a row still being
+        written is picked up by the next call.  Returns ``([], 0)`` when
+        the file shrank below *offset*; callers should treat that as a
+        rewrite and replay from the start.
+        """
+        try:
+            size = (
+                self._inferences_file.stat().st_size
+                if self._inferences_file.is_file()
+                else 0
+            )
+        except OSError:
+            return [], offset
+        if offset > size:
+            return [], 0
+        rows: list[dict[str, Any]] = []
+        if offset == size:
+            return rows, offset
+        try:
+            with open(self._inferences_file, "rb") as f:
+                f.seek(offset)
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    offset += len(raw_line)
+                    parsed = self._decode_line(raw_line)
+                    if parsed is not None:
+                        rows.append(parsed)
+        except OSError:
+            logger.warning(
+                "Could not read prompt telemetry from %s",
+                self._inferences_file,
+                exc_info=True,
+            )
+        return rows, offset
+
+    def _decode_line(self, raw_line: bytes) -> dict[str, Any] | None:
+        """Decode one JSONL line, skipping blank and corrupt lines."""
+        stripped = raw_line.strip()
+        if not stripped:
+            return None
+        try:
+            parsed = json.loads(stripped)
+        except json.JSONDecodeError:
+            logger.debug(
+                "Skipping corrupt inference line in %s",
+                self._inferences_file,
+                exc_info=True,
+            )
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    def _indexed_range(
+        self, since: datetime | None, until: datetime | None
+    ) -> tuple[int, int]:
+        """Return the ``[start, end)`` byte range that can hold matching rows.
+
+        Writers stamp rows before taking the file lock, so timestamps are
+        only nearly sorted; the range is widened by one index stride on
+        each side to absorb that.
+        """
+        entries = self._time_index()
+        size = self._inferences_file.stat().st_size
+        start_idx = 0
+        if since is not None:
+            for i, (ts, _off) in enumerate(entries):
+                if ts >= since:
+                    break
+                start_idx = i
+            start_idx = max(0, start_idx - 1)
+        end = size
+        if until is not None:
+            for i, (ts, _off) in enumerate(entries):
+                if ts > until:
+                    if i + 1 < len(entries):
+                        end = entries[i + 1][1]
+                    break
+        start = entries[start_idx][1] if entries else 0
+        return start, end
+
+    def _time_index(self) -> list[tuple[datetime, int]]:
+        """Return the sparse time index, extending it to the end of the file."""
+        st = self._inferences_file.stat()
+        file_id = (st.st_dev, st.st_ino)
+        key = str(self._inferences_file)
+        with _TIME_INDEX_LOCK:
+            index = _TIME_INDEXES.get(key)
+            if (
+                index is None
+                or index.file_id != file_id
+                or index.next_probe > st.st_size + _TIME_INDEX_STRIDE
+                or (index.entries and index.entries[-1][1] >= st.st_size)
+            ):
+                index = _TimeIndex(file_id=file_id)
+                _TIME_INDEXES[key] = index
+            with open(self._inferences_file, "rb") as f:
+                while index.next_probe < st.st_size:
+                    f.seek(index.next_probe)
+                    if index.next_probe > 0:
+                        f.readline()  # skip to the next line start
+                    offset = f.tell()
+                    line = f.readline()
+                    if not line.endswith(b"\n"):
+                        break
+                    index.next_probe += _TIME_INDEX_STRIDE
+                    parsed = self._decode_line(line)
+                    ts = _parse_timestamp(parsed.get("timestamp")) if parsed else None
+                    if ts is not None and (
+                        not index.entries or offset > index.entries[-1][1]
+                    ):
+                        index.entries.append((ts, offset))
+            return list(index.entries)
 
     @staticmethod
     def _accumulate_counter(
@@ -344,6 +721,12 @@ class PromptTelemetry:
         target["cache_misses"] = _as_int(target.get("cache_misses", 0)) + _as_int(
             record.get("cache_misses", 0)
         )
+        for key in (
+            "input_tokens",
+            "cache_creation_input_tokens",
+            "cache_read_input_tokens",
+        ):
+            target[key] = _as_int(target.get(key, 0)) + _as_int(record.get(key, 0))
         target["actual_usage_calls"] = _as_int(target.get("actual_usage_calls", 0))
         if record.get("token_source") == "actual":
             target["actual_usage_calls"] = _as_int(target["actual_usage_calls"]) + 1
@@ -367,69 +750,69 @@ class PromptTelemetry:
 
     def get_pr_totals(self, pr_number: int) -> dict[str, int] | None:
         """Return aggregate telemetry totals for a PR, or None if missing."""
-        data = self._load_pr_stats()
-        prs = data.get("prs", {})
-        if not isinstance(prs, dict):
-            return None
-        entry = prs.get(str(pr_number))
-        if not isinstance(entry, dict):
-            return None
-        return {k: int(v) for k, v in entry.items() if isinstance(v, int)}
+        with self._mem_lock:
+            entry = self._section("prs").get(str(pr_number))
+            if not isinstance(entry, dict):
+                return None
+            return _int_counters(entry)
 
     def get_lifetime_totals(self) -> dict[str, int]:
         """Return aggregate telemetry totals across all sessions."""
-        data = self._load_pr_stats()
-        lifetime = data.get("lifetime", {})
-        if not isinstance(lifetime, dict):
-            return {}
-        return {k: int(v) for k, v in lifetime.items() if isinstance(v, int)}
+        with self._mem_lock:
+            return _int_counters(self._section("lifetime"))
 
     def get_session_totals(self, session_id: str) -> dict[str, int]:
         """Return aggregate telemetry totals for a single session ID."""
         if not session_id:
             return {}
-        data = self._load_pr_stats()
-        sessions = data.get("sessions", {})
-        if not isinstance(sessions, dict):
-            return {}
-        entry = sessions.get(session_id, {})
-        if not isinstance(entry, dict):
-            return {}
-        return {k: int(v) for k, v in entry.items() if isinstance(v, int)}
+        with self._mem_lock:
+            entry = self._section("sessions").get(session_id, {})
+            if not isinstance(entry, dict):
+                return {}
+            return _int_counters(entry)
 
     def get_issue_totals(self) -> dict[int, dict[str, int]]:
         """Return aggregate telemetry totals keyed by issue number."""
-        data = self._load_pr_stats()
-        issues = data.get("issues", {})
-        if not isinstance(issues, dict):
-            return {}
         result: dict[int, dict[str, int]] = {}
-        for key, payload in issues.items():
-            if not isinstance(payload, dict):
-                continue
-            try:
-                issue_number = int(key)
-            except (TypeError, ValueError):
-                continue
-            result[issue_number] = {
-                k: int(v) for k, v in payload.items() if isinstance(v, int)
-            }
+        with self._mem_lock:
+            for key, payload in self._section("issues").items():
+                if not isinstance(payload, dict):
+                    continue
+                try:
+                    issue_number = int(key)
+                except (TypeError, ValueError):
+                    continue
+                result[issue_number] = _int_counters(payload)
         return result
 
     def get_source_totals(self) -> dict[str, dict[str, int]]:
         """Return aggregate telemetry totals keyed by source."""
-        data = self._load_pr_stats()
-        sources = data.get("sources", {})
-        if not isinstance(sources, dict):
-            return {}
         result: dict[str, dict[str, int]] = {}
-        for key, payload in sources.items():
-            source = str(key).strip()
-            if not source or not isinstance(payload, dict):
-                continue
-            result[source] = {
-                k: int(v) for k, v in payload.items() if isinstance(v, int)
-            }
+        with self._mem_lock:
+            for key, payload in self._section("sources").items():
+                source = str(key).strip()
+                if not source or not isinstance(payload, dict):
+                    continue
+                result[source] = _int_counters(payload)
+        return result
+
+    def get_prefix_cache_hit_rates(self) -> dict[str, float]:
+        """Return the provider prompt-cache hit rate keyed by source (phase).
+
+        The rate is cache-read tokens over all prompt tokens (uncached,
+        cache-write and cache-read); sources without reported usage are
+        omitted.
+        """
+        result: dict[str, float] = {}
+        for source, totals in self.get_source_totals().items():
+            read = totals.get("cache_read_input_tokens", 0)
+            prompt_tokens = (
+                totals.get("input_tokens", 0)
+                + totals.get("cache_creation_input_tokens", 0)
+                + read
+            )
+            if prompt_tokens > 0:
+                result[source] = round(read / prompt_tokens, 4)
         return result
 
 
@@ -455,6 +838,9 @@ def _new_counter() -> dict[str, object]:
         "context_chars_saved": 0,
         "cache_hits": 0,
         "cache_misses": 0,
+        "input_tokens": 0,
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": 0,
         "actual_usage_calls": 0,
         "usage_unavailable_calls": 0,
         "pruned_chars_total": 0,
@@ -492,6 +878,22 @@ def _as_float(value: object) -> float:
     return 0.0
 
 
+def _parse_timestamp(value: object) -> datetime | None:
+    """Parse an ISO timestamp, treating naive values as UTC."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _int_counters(entry: dict[str, object]) -> dict[str, int]:
+    """Return the integer-valued counters of an aggregate entry."""
+    return {k: int(v) for k, v in entry.items() if isinstance(v, int)}
+
+
 def _get_or_init_dict(
     parent: dict[str, object], key: str, default: dict[str, object]
 ) -> dict[str, object]:
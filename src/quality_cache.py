@@ -0,0 +1,185 @@
+"""Content-addressed cache of quality gate results.
+
+Several loops re-run ``make quality`` on trees that have not changed since
+the last run (a fix attempt that edited nothing, a re-review without new
+commits).  :class:`QualityGateCache` records each gate outcome and its
+trimmed output under a key built from:
+
+* the git tree SHA of the worktree *including* uncommitted and untracked
+  (non-ignored) files, computed with ``git add -A`` + ``git write-tree``
+  against a throwaway copy of the index so the real index is untouched.
+  Hashing always runs on the host: it relies on ``GIT_INDEX_FILE``, which
+  :class:`~docker_runner.DockerRunner` does not pass into containers;
+* the Makefile target; and
+* a toolchain fingerprint — interpreter version, execution mode and the
+  resolved path, size and mtime of the tools the gate shells out to.
+
+Anything that prevents computing the tree SHA (not a git checkout, git
+failure) simply disables caching for that call.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import sys
+import tempfile
+from datetime import UTC, datetime
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from execution import get_default_runner
+from file_util import atomic_write
+from runtime_metrics import REGISTRY
+from subprocess_util import make_clean_env
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+
+logger = logging.getLogger("hydraflow.quality_cache")
+
+# Executables whose upgrade can change a gate's verdict on the same tree.
+_TOOLCHAIN = ("make", "python3", "uv", "ruff", "pyright", "node", "npm")
+
+_CACHE_REQUESTS = REGISTRY.counter(
+    "hydraflow_quality_cache_requests_total",
+    "Quality gate cache lookups by Makefile target and hit/miss",
+    ("target", "result"),
+)
+
+
+def toolchain_fingerprint(config: HydraFlowConfig) -> str:
+    """Return a digest of the interpreter, execution mode and gate tools."""
+    parts = [sys.version, config.execution_mode]
+    if config.execution_mode == "docker":
+        parts.append(config.docker_image)
+    for tool in _TOOLCHAIN:
+        resolved = shutil.which(tool)
+        if resolved is None:
+            parts.append(f"{tool}:-")
+            continue
+        try:
+            st = Path(resolved).stat()
+        except OSError:
+            parts.append(f"{tool}:{resolved}")
+            continue
+        parts.append(f"{tool}:{resolved}:{st.st_size}:{st.st_mtime_ns}")
+    return sha256("\n".join(parts).encode()).hexdigest()
+
+
+class QualityGateCache:
+    """Persists quality gate results keyed by tree, target and toolchain."""
+
+    def __init__(self, config: HydraFlowConfig) -> None:
+        self._config = config
+        self._path = config.data_path("cache", "quality_gate.json")
+
+    async def key(self, worktree_path: Path, target: str) -> str | None:
+        """Return the cache key for *target* in *worktree_path*.
+
+        Returns ``None`` when caching is disabled or the tree SHA cannot be
+        computed.
+        """
+        if not self._config.quality_cache_enabled:
+            return None
+        if not (worktree_path / ".git").exists():
+            return None
+        tree = await self._tree_sha(worktree_path)
+        if tree is None:
+            return None
+        toolchain = toolchain_fingerprint(self._config)
+        return sha256(f"{tree}\n{target}\n{toolchain}".encode()).hexdigest()
+
+    async def _tree_sha(self, worktree_path: Path) -> str | None:
+        """Hash the working tree, uncommitted changes included."""
+        runner = get_default_runner()
+        cwd = str(worktree_path)
+        timeout = self._config.git_command_timeout
+        try:
+            index = await runner.run_simple(
+                ["git", "rev-parse", "--git-path", "index"],
+                cwd=cwd,
+                timeout=timeout,
+            )
+            if index.returncode != 0:
+                return None
+            with tempfile.TemporaryDirectory(prefix="hydraflow-qc-") as tmp:
+                scratch = Path(tmp) / "index"
+                real_index = worktree_path / index.stdout
+                if real_index.is_file():
+                    # Seed with the real index so unchanged files keep their
+                    # stat info and ``git add`` does not rehash them.  copy2
+                    # keeps the index mtime, which git's racily-clean check
+                    # needs to catch same-size edits made in the same tick.
+                    shutil.copy2(real_index, scratch)
+                env = {**make_clean_env(), "GIT_INDEX_FILE": str(scratch)}
+                added = await runner.run_simple(
+                    ["git", "add", "-A"], cwd=cwd, env=env, timeout=timeout
+                )
+                if added.returncode != 0:
+                    return None
+                tree = await runner.run_simple(
+                    ["git", "write-tree"], cwd=cwd, env=env, timeout=timeout
+                )
+        except (OSError, TimeoutError):
+            logger.debug("Could not hash worktree %s", worktree_path, exc_info=True)
+            return None
+        if tree.returncode != 0 or not tree.stdout:
+            return None
+        return tree.stdout
+
+    def get(self, key: str, target: str) -> tuple[bool, str] | None:
+        """Return the cached ``(success, output)`` for *key*, if any."""
+        entry = self._load_cache_data().get(key)
+        if (
+            isinstance(entry, dict)
+            and isinstance(entry.get("success"), bool)
+            and isinstance(entry.get("output"), str)
+        ):
+            _CACHE_REQUESTS.inc(target, "hit")
+            return entry["success"], entry["output"]
+        _CACHE_REQUESTS.inc(target, "miss")
+        return None
+
+    def put(self, key: str, target: str, success: bool, output: str) -> None:
+        """Record the result of running *target* for *key*."""
+        data = self._load_cache_data()
+        data.pop(key, None)
+        data[key] = {
+            "target": target,
+            "success": success,
+            "output": output,
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        overflow = len(data) - self._config.quality_cache_max_entries
+        if overflow > 0:
+            # Insertion order is oldest-first because hits never reorder.
+            for stale in list(data)[:overflow]:
+                del data[stale]
+        self._write_cache_data(data)
+
+    def _load_cache_data(self) -> dict[str, dict[str, object]]:
+        if not self._path.is_file():
+            return {}
+        try:
+            raw = self._path.read_text()
+        except OSError:
+            return {}
+        if not raw.strip():
+            return {}
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("Quality cache is corrupt, rebuilding: %s", self._path)
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def _write_cache_data(self, data: dict[str, dict[str, object]]) -> None:
+        try:
+            atomic_write(self._path, json.dumps(data, indent=2))
+        except OSError:
+            logger.warning(
+                "Could not persist quality cache to %s", self._path, exc_info=True
+            )
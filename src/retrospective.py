@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel, Field
 
+from delta_verifier import parse_file_delta
+from jsonl_store import JsonlStore
 from models import IsoTimestamp, PlanAccuracyResult, ReviewVerdict
 
 if TYPE_CHECKING:
@@ -22,6 +24,66 @@ if TYPE_CHECKING:
 logger = logging.getLogger("hydraflow.retrospective")
 
 
+def parse_planned_files(plan_text: str) -> list[str]:
+    """Extract file paths from plan text.
+
+    Prefers the structured ``## File Delta`` section if present,
+    falling back to heuristic extraction from ``## Files to Modify``
+    and ``## New Files``.
+    """
+    if not plan_text:
+        return []
+
+    # Try structured delta first
+    delta_files = parse_file_delta(plan_text)
+    if delta_files:
+        return delta_files
+
+    # Fallback: heuristic extraction from prose sections
+    files: list[str] = []
+    in_section = False
+
+    for line in plan_text.splitlines():
+        stripped = line.strip()
+
+        # Detect start of relevant sections
+        if re.match(r"^##\s+(Files to Modify|New Files)", stripped):
+            in_section = True
+            continue
+
+        # End section on next heading
+        if in_section and re.match(r"^##\s+", stripped):
+            in_section = False
+            continue
+
+        if not in_section:
+            continue
+
+        # Extract file paths from list items:
+        #   - `src/foo.py`
+        #   - **src/foo.py**
+        #   - src/foo.py
+        #   ### 1. `src/foo.py` (NEW)
+        # Match backtick-delimited paths
+        backtick_matches = re.findall(r"`([^`]+\.\w+)`", stripped)
+        if backtick_matches:
+            files.extend(backtick_matches)
+            continue
+
+        # Match bold paths: **path/to/file.py**
+        bold_matches = re.findall(r"\*\*([^*]+\.\w+)\*\*", stripped)
+        if bold_matches:
+            files.extend(bold_matches)
+            continue
+
+        # Match bare paths on list items: - path/to/file.py
+        bare_match = re.match(r"^[-*]\s+(\S+\.\w+)", stripped)
+        if bare_match:
+            files.append(bare_match.group(1))
+
+    return sorted(set(files))
+
+
 class RetrospectiveEntry(BaseModel):
     """A single retrospective record appended to the JSONL log."""
 
@@ -53,6 +115,9 @@ class RetrospectiveCollector:
         self._state = state
         self._prs = prs
         self._retro_path = config.data_path("memory", "retrospectives.jsonl")
+        self._retros = JsonlStore(
+            self._retro_path, RetrospectiveEntry, label="retrospective entry"
+        )
         self._filed_patterns_path = config.data_path("memory", "filed_patterns.json")
 
     async def record(
@@ -122,65 +187,7 @@ class RetrospectiveCollector:
             return ""
 
     def _parse_planned_files(self, plan_text: str) -> list[str]:
-        """Extract file paths from plan text.
-
-        Prefers the structured ``## File Delta`` section if present,
-        falling back to heuristic extraction from ``## Files to Modify``
-        and ``## New Files``.
-        """
-        if not plan_text:
-            return []
-
-        # Try structured delta first
-        from delta_verifier import parse_file_delta
-
-        delta_files = parse_file_delta(plan_text)
-        if delta_files:
-            return delta_files
-
-        # Fallback: heuristic extraction from prose sections
-        files: list[str] = []
-        in_section = False
-
-        for line in plan_text.splitlines():
-            stripped = line.strip()
-
-            # Detect start of relevant sections
-            if re.match(r"^##\s+(Files to Modify|New Files)", stripped):
-                in_section = True
-                continue
-
-            # End section on next heading
-            if in_section and re.match(r"^##\s+", stripped):
-                in_section = False
-                continue
-
-            if not in_section:
-                continue
-
-            # Extract file paths from list items:
-            #   - `src/foo.py`
-            #   - **src/foo.py**
-            #   - src/foo.py
-            #   ### 1. `src/foo.py` (NEW)
-            # Match backtick-delimited paths
-            backtick_matches = re.findall(r"`([^`]+\.\w+)`", stripped)
-            if backtick_matches:
-                files.extend(backtick_matches)
-                continue
-
-            # Match bold paths: **path/to/file.py**
-            bold_matches = re.findall(r"\*\*([^*]+\.\w+)\*\*", stripped)
-            if bold_matches:
-                files.extend(bold_matches)
-                continue
-
-            # Match bare paths on list items: - path/to/file.py
-            bare_match = re.match(r"^[-*]\s+(\S+\.\w+)", stripped)
-            if bare_match:
-                files.append(bare_match.group(1))
-
-        return sorted(set(files))
+        return parse_planned_files(plan_text)
 
     async def _get_actual_files(self, pr_number: int) -> list[str]:
         """Get the list of files actually changed in the PR."""
@@ -205,9 +212,7 @@ class RetrospectiveCollector:
     def _append_entry(self, entry: RetrospectiveEntry) -> None:
         """Append a JSON line to the retrospective log."""
         try:
-            from file_util import append_jsonl  # noqa: PLC0415
-
-            append_jsonl(self._retro_path, entry.model_dump_json())
+            self._retros.append(entry)
         except OSError:
             logger.warning(
                 "Could not append to retrospective log %s",
@@ -217,18 +222,7 @@ class RetrospectiveCollector:
 
     def _load_recent(self, n: int) -> list[RetrospectiveEntry]:
         """Load the last *n* entries from the retrospective log."""
-        if not self._retro_path.exists():
-            return []
-        try:
-            lines = self._retro_path.read_text().strip().splitlines()
-            entries: list[RetrospectiveEntry] = []
-            for line in lines[-n:]:
-                if line.strip():
-                    entries.append(RetrospectiveEntry.model_validate_json(line))
-            return entries
-        except (OSError, json.JSONDecodeError):
-            logger.warning("Could not load retrospective log", exc_info=True)
-            return []
+        return self._retros.tail(n)
 
     async def _detect_patterns(self, entries: list[RetrospectiveEntry]) -> None:
         """Scan recent entries for patterns and file improvement proposals."""
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from pydantic import BaseModel
 
+from jsonl_store import JsonlStore
 from models import IsoTimestamp, ReviewVerdict
 
 logger = logging.getLogger("hydraflow.review_insights")
@@ -173,14 +174,15 @@ class ReviewInsightStore:
     def __init__(self, memory_dir: Path) -> None:
         self._memory_dir = memory_dir
         self._reviews_path = memory_dir / "reviews.jsonl"
+        self._reviews = JsonlStore(
+            self._reviews_path, ReviewRecord, label="review record"
+        )
         self._proposed_path = memory_dir / "proposed_categories.json"
 
     def append_review(self, record: ReviewRecord) -> None:
         """Append *record* as a JSON line to ``reviews.jsonl``."""
         try:
-            from file_util import append_jsonl  # noqa: PLC0415
-
-            append_jsonl(self._reviews_path, record.model_dump_json())
+            self._reviews.append(record)
         except OSError:
             logger.warning(
                 "Could not append review to %s",
@@ -190,17 +192,7 @@ class ReviewInsightStore:
 
     def load_recent(self, n: int = 10) -> list[ReviewRecord]:
         """Load the last *n* review records from disk."""
-        if not self._reviews_path.exists():
-            return []
-        lines = self._reviews_path.read_text().strip().splitlines()
-        tail = lines[-n:] if len(lines) > n else lines
-        records: list[ReviewRecord] = []
-        for line in tail:
-            try:
-                records.append(ReviewRecord.model_validate_json(line))
-            except Exception:  # noqa: BLE001
-                logger.warning("Skipping malformed review record: %s", line[:80])
-        return records
+        return self._reviews.tail(n)
 
     def get_proposed_categories(self) -> set[str]:
         """Return the set of categories that already have filed proposals."""
@@ -20,13 +20,16 @@ from config import HydraFlowConfig
 from events import EventBus, EventType, HydraFlowEvent
 from harness_insights import FailureCategory, HarnessInsightStore
 from issue_store import IssueStore
+from local_diff import LocalDiffProvider
 from merge_conflict_resolver import MergeConflictResolver
 from models import (
     BaselineApprovalResult,
     ConflictResolutionResult,
+    IncrementalReview,
     JudgeResult,
     PipelineStage,
     PRInfo,
+    ReviewCheckpoint,
     ReviewResult,
     ReviewVerdict,
     StatusCallback,
@@ -103,6 +106,7 @@ class ReviewPhase:
         post_merge: PostMergeHandler | None = None,
         update_bg_worker_status: StatusCallback | None = None,
         baseline_policy: BaselinePolicy | None = None,
+        diff_provider: LocalDiffProvider | None = None,
     ) -> None:
         self._config = config
         self._state = state
@@ -115,6 +119,7 @@ class ReviewPhase:
         self._bus = event_bus or EventBus()
         self._update_bg_worker_status = update_bg_worker_status
         self._harness_insights = harness_insights
+        self._diff_provider = diff_provider
         self._insights = ReviewInsightStore(config.memory_dir)
         self._active_issues: set[int] = set()
         self._active_issues_lock = asyncio.Lock()
@@ -326,6 +331,101 @@ class ReviewPhase:
             return None
         return wt_path
 
+    async def _get_pr_diff(self, pr: PRInfo, wt_path: Path | None) -> str:
+        """Return the PR diff, preferring the local worktree over the API."""
+        if self._diff_provider is not None:
+            diff = await self._diff_provider.get_diff(wt_path)
+            if diff:
+                return diff
+        return await self._prs.get_pr_diff(pr.number)
+
+    async def _get_pr_diff_names(self, pr: PRInfo, wt_path: Path | None) -> list[str]:
+        """Return the PR's changed files, preferring the local worktree."""
+        if self._diff_provider is not None:
+            names = await self._diff_provider.get_diff_names(wt_path)
+            if names:
+                return names
+        return await self._prs.get_pr_diff_names(pr.number)
+
+    async def _plan_incremental_review(
+        self,
+        pr: PRInfo,
+        wt_path: Path | None,
+        since_sha: str | None,
+        prior: ReviewCheckpoint | None,
+    ) -> IncrementalReview | None:
+        """Return the delta to re-review since *since_sha*, or ``None`` for a full review.
+
+        A full review is used when incremental review is disabled, there is
+        no prior review to build on, the branch no longer contains
+        *since_sha*, the delta is empty or larger than
+        ``incremental_review_max_delta_lines``, or the last
+        ``full_review_interval`` reviews were all incremental.
+        """
+        max_lines = self._config.incremental_review_max_delta_lines
+        if (
+            max_lines == 0
+            or self._diff_provider is None
+            or not since_sha
+            or prior is None
+        ):
+            return None
+        if prior.incremental_streak >= self._config.full_review_interval:
+            logger.info(
+                "PR #%d: forcing a full review after %d incremental reviews",
+                pr.number,
+                prior.incremental_streak,
+            )
+            return None
+        stats = await self._diff_provider.get_file_stats(wt_path)
+        # Old names of renamed files keep the rename intact in the delta.
+        paths = sorted(
+            {stat.path for stat in stats}
+            | {stat.old_path for stat in stats if stat.old_path}
+        )
+        if not paths:
+            return None
+        delta = await self._diff_provider.get_diff_since(wt_path, since_sha, paths)
+        if not delta:
+            return None
+        changed_lines = sum(
+            1
+            for line in delta.splitlines()
+            if line[:1] in ("+", "-") and not line.startswith(("+++", "---"))
+        )
+        if changed_lines > max_lines:
+            logger.info(
+                "PR #%d: %d lines changed since %s (max %d) — running a full review",
+                pr.number,
+                changed_lines,
+                since_sha[:12],
+                max_lines,
+            )
+            return None
+        logger.info(
+            "PR #%d: incremental review of %d changed lines since %s",
+            pr.number,
+            changed_lines,
+            since_sha[:12],
+        )
+        return IncrementalReview(
+            since_sha=since_sha,
+            delta_diff=delta,
+            changed_files=[stat.path for stat in stats],
+            prior=prior,
+            streak=prior.incremental_streak + 1,
+        )
+
+    @staticmethod
+    def _checkpoint_from(result: ReviewResult) -> ReviewCheckpoint:
+        """Return what a later incremental review needs to know about *result*."""
+        return ReviewCheckpoint(
+            verdict=result.verdict,
+            summary=result.summary,
+            findings=result.findings,
+            incremental_streak=result.incremental_streak,
+        )
+
     async def _fetch_code_scanning_alerts(self, pr: PRInfo) -> list[dict] | None:
         """Fetch code scanning alerts if the feature is enabled.
 
@@ -351,7 +451,7 @@ class ReviewPhase:
             return None
 
     async def _check_baseline_policy(
-        self, pr: PRInfo, task: Task
+        self, pr: PRInfo, task: Task, wt_path: Path | None = None
     ) -> BaselineApprovalResult | None:
         """Run baseline policy check if a policy is configured.
 
@@ -360,7 +460,7 @@ class ReviewPhase:
         if self._baseline_policy is None:
             return None
         try:
-            changed_files = await self._prs.get_pr_diff_names(pr.number)
+            changed_files = await self._get_pr_diff_names(pr, wt_path)
             if not changed_files:
                 return None
             pr_approvers = await self._prs.get_pr_approvers(pr.number)
@@ -397,7 +497,9 @@ class ReviewPhase:
         if isinstance(guards, ReviewResult):
             return guards
 
-        pre_review = await self._run_pre_review_checks(pr, guards.task)
+        pre_review = await self._run_pre_review_checks(
+            pr, guards.task, guards.worktree_path
+        )
         if isinstance(pre_review, ReviewResult):
             return pre_review
 
@@ -448,11 +550,12 @@ class ReviewPhase:
         self,
         pr: PRInfo,
         task: Task,
+        wt_path: Path | None = None,
     ) -> ReviewResult | PreReviewContext:
         """Run baseline, visual, and delta checks before invoking reviewer."""
-        diff = await self._prs.get_pr_diff(pr.number)
+        diff = await self._get_pr_diff(pr, wt_path)
 
-        baseline_result = await self._check_baseline_policy(pr, task)
+        baseline_result = await self._check_baseline_policy(pr, task, wt_path)
         if (
             baseline_result
             and baseline_result.requires_approval
@@ -492,7 +595,7 @@ class ReviewPhase:
             )
 
         code_scanning_alerts = await self._fetch_code_scanning_alerts(pr)
-        await self._run_delta_verification(pr, diff)
+        await self._run_delta_verification(pr, diff, wt_path=wt_path)
 
         return PreReviewContext(
             diff=diff,
@@ -700,6 +803,13 @@ class ReviewPhase:
         post_review_sha = await self._prs.get_pr_head_sha(pr.number)
         if isinstance(post_review_sha, str) and post_review_sha:
             self._state.set_last_reviewed_sha(pr.issue_number, post_review_sha)
+        # Only a review the agent actually ran can seed an incremental one.
+        if result.transcript:
+            self._state.set_review_checkpoint(
+                pr.issue_number, self._checkpoint_from(result)
+            )
+        else:
+            self._state.clear_review_checkpoint(pr.issue_number)
 
         if result.duration_seconds > 0:
             self._state.record_review_duration(result.duration_seconds)
@@ -764,6 +874,12 @@ class ReviewPhase:
         code_scanning_alerts: list[dict] | None = None,
     ) -> ReviewResult:
         """Run the reviewer, push fixes, post summary, submit formal review."""
+        incremental = await self._plan_incremental_review(
+            pr,
+            wt_path,
+            self._state.get_last_reviewed_sha(pr.issue_number),
+            self._state.get_review_checkpoint(pr.issue_number),
+        )
         result = await self._reviewers.review(
             pr,
             issue,
@@ -771,6 +887,7 @@ class ReviewPhase:
             diff,
             worker_id=worker_id,
             code_scanning_alerts=code_scanning_alerts,
+            incremental=incremental,
         )
 
         if result.fixes_made:
@@ -826,7 +943,7 @@ class ReviewPhase:
         )
         try:
             await self._publish_review_status(pr, worker_id, "re_reviewing")
-            updated_diff = await self._prs.get_pr_diff(pr.number)
+            updated_diff = await self._get_pr_diff(pr, wt_path)
             re_result = await self._reviewers.review(
                 pr,
                 issue,
@@ -897,6 +1014,11 @@ class ReviewPhase:
             try:
                 await self._publish_review_status(pr, worker_id, "fixing_review")
 
+                reviewed_sha = (
+                    await self._diff_provider.head_sha(wt_path)
+                    if self._diff_provider is not None
+                    else ""
+                )
                 fix_result = await self._reviewers.fix_review_findings(
                     pr,
                     task,
@@ -918,7 +1040,13 @@ class ReviewPhase:
 
                 # Re-review
                 await self._publish_review_status(pr, worker_id, "re_reviewing")
-                updated_diff = await self._prs.get_pr_diff(pr.number)
+                updated_diff = await self._get_pr_diff(pr, wt_path)
+                incremental = await self._plan_incremental_review(
+                    pr,
+                    wt_path,
+                    reviewed_sha,
+                    self._checkpoint_from(result) if result.transcript else None,
+                )
                 re_result = await self._reviewers.review(
                     pr,
                     task,
@@ -926,6 +1054,7 @@ class ReviewPhase:
                     updated_diff,
                     worker_id=worker_id,
                     code_scanning_alerts=code_scanning_alerts,
+                    incremental=incremental,
                 )
 
                 if re_result.fixes_made:
@@ -973,7 +1102,9 @@ class ReviewPhase:
 
         return result, diff
 
-    async def _run_delta_verification(self, pr: PRInfo, diff: str) -> str:
+    async def _run_delta_verification(
+        self, pr: PRInfo, diff: str, wt_path: Path | None = None
+    ) -> str:
         """Run delta verification comparing plan's File Delta section to actual diff.
 
         Returns a summary string (empty if no plan or no delta section).
@@ -994,7 +1125,7 @@ class ReviewPhase:
             return ""
 
         # Extract actual changed files from the diff
-        actual_files = await self._prs.get_pr_diff_names(pr.number)
+        actual_files = await self._get_pr_diff_names(pr, wt_path)
         report = verify_delta(planned_files, actual_files)
 
         if report.has_drift:
@@ -11,6 +11,7 @@ from agent_cli import build_agent_command
 from base_runner import BaseRunner
 from events import EventType, HydraFlowEvent
 from models import (
+    IncrementalReview,
     PRInfo,
     ReviewerStatus,
     ReviewResult,
@@ -18,6 +19,7 @@ from models import (
     Task,
 )
 from precheck import run_precheck_context
+from prompt_layers import PromptLayers
 from runner_constants import MEMORY_SUGGESTION_PROMPT
 from subprocess_util import CreditExhaustedError
 
@@ -36,6 +38,22 @@ _JUNK_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"^(tokens|cost|duration)\s*:", re.IGNORECASE),  # Metric labels
 ]
 
+# Findings in the compact schema the review prompt asks for.
+_FINDING_RE = re.compile(r"^\s*(?:[-*]\s+)?`?(\[(?:HIGH|MEDIUM|LOW)\][^`\n]*)`?\s*$")
+_MAX_CARRIED_FINDINGS = 20
+
+
+def extract_findings(transcript: str) -> list[str]:
+    """Return the distinct ``[SEVERITY] …`` findings in *transcript*, in order."""
+    findings: list[str] = []
+    for line in transcript.splitlines():
+        match = _FINDING_RE.match(line)
+        if match:
+            finding = match.group(1).strip()
+            if finding not in findings:
+                findings.append(finding)
+    return findings[:_MAX_CARRIED_FINDINGS]
+
 
 class ReviewRunner(BaseRunner):
     """Launches a ``claude -p`` process to review a pull request.
@@ -105,9 +123,13 @@ class ReviewRunner(BaseRunner):
         diff: str,
         worker_id: int = 0,
         code_scanning_alerts: list[dict] | None = None,
+        incremental: IncrementalReview | None = None,
     ) -> ReviewResult:
         """Run the review agent for *pr*.
 
+        With *incremental*, the agent reviews only the changes since the
+        last review and re-checks that review's findings.
+
         Returns a :class:`ReviewResult` with the verdict and summary.
         """
         start = time.monotonic()
@@ -138,7 +160,10 @@ class ReviewRunner(BaseRunner):
 
         try:
             precheck_context = await self._run_precheck_context(
-                pr, issue, diff, worktree_path
+                pr,
+                issue,
+                incremental.delta_diff if incremental else diff,
+                worktree_path,
             )
             cmd = self._build_command(worktree_path)
             prompt, prompt_stats = self._build_review_prompt_with_stats(
@@ -147,6 +172,7 @@ class ReviewRunner(BaseRunner):
                 diff,
                 precheck_context=precheck_context,
                 code_scanning_alerts=code_scanning_alerts,
+                incremental=incremental,
             )
             before_sha = await self._get_head_sha(worktree_path)
             transcript = await self._execute(
@@ -161,6 +187,8 @@ class ReviewRunner(BaseRunner):
             # Parse the verdict from the transcript
             result.verdict = self._parse_verdict(transcript)
             result.summary = self._extract_summary(transcript)
+            result.findings = extract_findings(transcript)
+            result.incremental_streak = incremental.streak if incremental else 0
 
             # Check if the reviewer made any commits or left uncommitted changes
             result.fixes_made = await self._has_changes(worktree_path, before_sha)
@@ -595,6 +623,7 @@ Then a brief summary on the next line starting with "SUMMARY: ".
         diff: str,
         precheck_context: str = "",
         code_scanning_alerts: list[dict] | None = None,
+        incremental: IncrementalReview | None = None,
     ) -> str:
         """Build the review prompt for the agent."""
         prompt, _stats = self._build_review_prompt_with_stats(
@@ -603,6 +632,7 @@ Then a brief summary on the next line starting with "SUMMARY: ".
             diff,
             precheck_context=precheck_context,
             code_scanning_alerts=code_scanning_alerts,
+            incremental=incremental,
         )
         return prompt
 
@@ -613,6 +643,7 @@ Then a brief summary on the next line starting with "SUMMARY: ".
         diff: str,
         precheck_context: str = "",
         code_scanning_alerts: list[dict] | None = None,
+        incremental: IncrementalReview | None = None,
     ) -> tuple[str, dict[str, object]]:
         """Build the review prompt and pruning stats."""
         ci_enabled = self._config.max_ci_fix_attempts > 0
@@ -620,13 +651,15 @@ Then a brief summary on the next line starting with "SUMMARY: ".
         ui_criteria = ""
         if "ui/" in diff:
             ui_criteria = """
-7. **UI-specific checks** (PR modifies frontend code):
-   - DRY: No duplicated constants, types, or styles — import from `constants.js`, `types.js`, `theme.js`.
-   - Responsive: Layout containers set `minWidth`; flex items handle shrinking (`minWidth: 0` or `overflow: hidden`).
-   - Style consistency: Spacing uses 4px grid multiples; colors come from `theme.js`, not hardcoded values.
-   - Component reuse: No new component that duplicates an existing one in `src/ui/src/components/`.
-   - Shared code: New constants/types belong in centralized files, not inline.
-"""
+
+## UI Review Criteria
+
+This PR modifies frontend code, so also check:
+- DRY: No duplicated constants, types, or styles — import from `constants.js`, `types.js`, `theme.js`.
+- Responsive: Layout containers set `minWidth`; flex items handle shrinking (`minWidth: 0` or `overflow: hidden`).
+- Style consistency: Spacing uses 4px grid multiples; colors come from `theme.js`, not hardcoded values.
+- Component reuse: No new component that duplicates an existing one in `src/ui/src/components/`.
+- Shared code: New constants/types belong in centralized files, not inline."""
 
         if ci_enabled:
             verify_step = (
@@ -640,12 +673,18 @@ Then a brief summary on the next line starting with "SUMMARY: ".
             )
             fix_verify = f"2. Run `make lint` and `{test_cmd}`."
 
-        diff_context = self._summarize_diff(pr.number, diff)
+        reviewed_diff = incremental.delta_diff if incremental else diff
+        diff_context = self._summarize_diff(pr.number, reviewed_diff)
+        diff_heading = "## PR Diff"
+        incremental_section = ""
+        if incremental is not None:
+            diff_heading = (
+                f"## Changes Since Last Review (`{incremental.since_sha[:12]}..HEAD`)"
+            )
+            incremental_section = self._format_incremental_section(incremental)
 
         min_findings = self._config.min_review_findings
 
-        manifest_section, memory_section = self._inject_manifest_and_memory()
-
         # Runtime log injection (opt-in)
         log_section = ""
         if self._config.inject_runtime_logs:
@@ -668,22 +707,12 @@ Then a brief summary on the next line starting with "SUMMARY: ".
                 scanning_section = f"\n\n## Code Scanning Alerts\n\n{formatted}"
 
         issue_body = self._summarize_issue_body(issue.body)
+        changed_paths = re.findall(r"^diff --git a/(\S+)", diff, re.MULTILINE)
+        learnings_section = self._relevant_learnings_section(
+            issue.title, issue.body or "", *changed_paths
+        )
 
-        prompt = f"""You are reviewing PR #{pr.number} which implements issue #{issue.id}.
-
-## Issue: {issue.title}
-
-{issue_body}{manifest_section}{memory_section}{log_section}{scanning_section}
-
-## Precheck Context
-
-{precheck_context or "No low-tier precheck context provided."}
-
-## PR Diff
-
-{diff_context}
-
-## Review Instructions
+        phase = f"""## Review Instructions
 
 1. Evaluate four dimensions: **scope**, correctness, completeness, and quality.
 2. **Scope check (mandatory first step):** Compare every changed file against the issue title and description. Flag any file or change that is unrelated to the stated goal. Unrelated test files, docs, or config changes are scope creep — reject them. Follow CLAUDE.md rules strictly (e.g., never add tests for ADR markdown content).
@@ -703,13 +732,13 @@ Quality: No issues — <justification>
    - Review test quality (3As structure, factories, edge cases)
    - Check for security issues (injection, crypto, auth)
    - Merge-artifact check: look for duplicate Pydantic Field definitions, duplicate function parameters, or duplicate keyword arguments — these arise when concurrent PRs add the same field and get merged sequentially
-{ui_criteria}
+
 ## If Issues Found
 
 If you find issues that you can fix:
 1. Make the fixes directly.
 {fix_verify}
-3. Commit with message: "review: fix <description> (PR #{pr.number})"
+3. Commit with message: "review: fix <description> (PR #<PR number>)"
 
 ## Findings Format
 
@@ -731,6 +760,23 @@ VERDICT: APPROVE
 SUMMARY: Implementation looks good, tests are comprehensive, all checks pass.
 
 {MEMORY_SUGGESTION_PROMPT.format(context="review")}"""
+        issue_layer = f"""You are reviewing PR #{pr.number} which implements issue #{issue.id}. Commit fixes with: "review: fix <description> (PR #{pr.number})"{incremental_section}
+
+## Issue: {issue.title}
+
+{issue_body}{learnings_section}{log_section}{scanning_section}
+
+## Precheck Context
+
+{precheck_context or "No low-tier precheck context provided."}
+
+{diff_heading}
+
+{diff_context}{ui_criteria}"""
+        layers = PromptLayers(
+            repo=self._repo_context_layer(), phase=phase, issue=issue_layer
+        )
+        prompt = layers.render()
         stats = {
             "context_chars_before": len(issue.body or "") + len(diff),
             "context_chars_after": len(issue_body) + len(diff_context),
@@ -745,9 +791,38 @@ SUMMARY: Implementation looks good, tests are comprehensive, all checks pass.
                 "diff_before": len(diff),
                 "diff_after": len(diff_context),
             },
+            "review_mode": "incremental" if incremental else "full",
+            **layers.stats(),
         }
         return prompt, stats
 
+    @staticmethod
+    def _format_incremental_section(incremental: IncrementalReview) -> str:
+        """Render the prior review and the delta-only instructions."""
+        prior = incremental.prior
+        findings = "\n".join(f"- {f}" for f in prior.findings) or "None recorded."
+        files = ", ".join(f"`{f}`" for f in incremental.changed_files) or "none"
+        return f"""
+
+## Incremental Re-review
+
+This PR was already reviewed at `{incremental.since_sha[:12]}`; that review returned **{prior.verdict.value}**. Only the changes since then are shown below. Review just those changes:
+- For each prior finding, decide whether it is now resolved, still open, or made worse.
+- Check the new changes for new issues, reading surrounding code only where the changes need it.
+- Do not re-review code the changes do not touch.
+
+Prior findings that are still open count toward the findings minimum. Base your verdict on the open prior findings plus any new ones.
+
+Files changed by the PR overall: {files}
+
+### Prior Review Summary
+
+{prior.summary or "No summary recorded."}
+
+### Prior Findings
+
+{findings}"""
+
     def _build_subskill_command(self) -> list[str]:
         return build_agent_command(
             tool=self._config.subskill_tool,
@@ -1,23 +1,179 @@
-"""Per-issue run recording for replay and debugging."""
+"""Per-issue run recording for replay and debugging.
+
+Transcript lines are written through to ``transcript.log`` as they are
+appended rather than held in memory until :meth:`RunContext.finalize`,
+so a crash loses no output the process already handed over.  With
+``artifact_compress_transcripts`` enabled the transcript is written as
+``transcript.log.gz``: a sequence of independent gzip members, one per
+buffered frame (so a crash can lose the frame being filled), with a ``transcript.log.gz.idx`` sidecar recording each
+member's uncompressed and compressed offsets so byte ranges can be served
+by decompressing only the overlapping members.
+
+Run directories, their sizes and manifests are tracked in an append-only
+``catalog.jsonl`` at the root of the runs directory, so listing runs,
+storage stats and retention never walk the tree.  The catalog is rebuilt
+from disk when it is missing and compacted once superseded lines pile up.
+"""
 
 from __future__ import annotations
 
 import contextlib
+import gzip
+import io
 import json
 import logging
+import os
 import shutil
+import threading
 import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import IO, TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field
 
+from file_util import atomic_write
+
 if TYPE_CHECKING:
     from config import HydraFlowConfig
 
 logger = logging.getLogger("hydraflow.run_recorder")
 
+TRANSCRIPT_FILE = "transcript.log"
+_GZ_SUFFIX = ".gz"
+_INDEX_SUFFIX = ".idx"
+CATALOG_FILE = "catalog.jsonl"
+_RUN_TS_FORMAT = "%Y%m%dT%H%M%SZ"
+# Rewrite the catalog once superseded lines outnumber live entries by this many.
+_CATALOG_COMPACT_SLACK = 1000
+
+# Uncompressed bytes buffered before a gzip frame is written to disk ...
+_FRAME_BYTES = 256 * 1024
+# ... or seconds since the last write, whichever comes first.
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class _Frame:
+    """One gzip member of a compressed transcript."""
+
+    raw_start: int
+    gz_start: int
+    raw_len: int
+    gz_len: int
+
+
+class _TranscriptWriter:
+    """Appends transcript text to disk.
+
+    Plain text goes straight to the OS on every write.  Compressed
+    transcripts buffer text into gzip frames, since tiny members compress
+    poorly.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        compress: bool,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._compress = compress
+        self._clock = clock
+        self._buffer = io.BytesIO()
+        self._raw_offset = 0
+        self._gz_offset = 0
+        self._last_flush = clock()
+        self._index: IO[str] | None = None
+        if compress:
+            self._file = open(path.with_name(path.name + _GZ_SUFFIX), "ab")  # noqa: SIM115
+            self._index = open(  # noqa: SIM115
+                path.with_name(path.name + _GZ_SUFFIX + _INDEX_SUFFIX), "a"
+            )
+        else:
+            self._file = open(path, "ab")  # noqa: SIM115
+
+    def write(self, text: str) -> None:
+        if self._index is None:
+            self._file.write(text.encode())
+            self._file.flush()
+            return
+        self._buffer.write(text.encode())
+        if (
+            self._buffer.tell() >= _FRAME_BYTES
+            or self._clock() - self._last_flush >= _FLUSH_INTERVAL_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered text as one frame and push it to the OS."""
+        self._last_flush = self._clock()
+        data = self._buffer.getvalue()
+        if not data:
+            return
+        self._buffer = io.BytesIO()
+        if self._index is None:
+            self._file.write(data)
+            self._file.flush()
+            return
+        member = gzip.compress(data, mtime=0)
+        self._file.write(member)
+        self._file.flush()
+        # Index after the member is on disk so readers never trust a
+        # frame that was only partly written.
+        self._index.write(
+            f"{self._raw_offset} {self._gz_offset} {len(data)} {len(member)}\n"
+        )
+        self._index.flush()
+        self._raw_offset += len(data)
+        self._gz_offset += len(member)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+            if self._index is not None:
+                self._index.close()
+
+
+def _read_frames(gz_path: Path) -> list[_Frame]:
+    """Return the frames of *gz_path* that are fully written."""
+    index_path = gz_path.with_name(gz_path.name + _INDEX_SUFFIX)
+    try:
+        gz_size = gz_path.stat().st_size
+        lines = index_path.read_text().splitlines()
+    except OSError:
+        return []
+    frames: list[_Frame] = []
+    for line in lines:
+        try:
+            raw_start, gz_start, raw_len, gz_len = (int(p) for p in line.split())
+        except ValueError:
+            break
+        if gz_start + gz_len > gz_size:
+            break
+        frames.append(_Frame(raw_start, gz_start, raw_len, gz_len))
+    return frames
+
+
+def _decompress_members(data: bytes) -> bytes:
+    """Decompress concatenated gzip members, stopping at a truncated tail."""
+    out = bytearray()
+    while data:
+        decomp = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        try:
+            out += decomp.decompress(data)
+        except zlib.error:
+            break
+        if not decomp.eof:
+            break
+        data = decomp.unused_data
+    return bytes(out)
+
 
 class RunManifest(BaseModel):
     """Metadata for a single recorded run."""
@@ -30,6 +186,239 @@ class RunManifest(BaseModel):
     files: list[str] = Field(default_factory=list)
 
 
+@dataclass
+class _CatalogEntry:
+    """Catalogued size and manifest of one run directory.
+
+    ``manifest`` is None while the run is in progress (or if it never
+    finished).
+    """
+
+    size_bytes: int = 0
+    gz_bytes: int = 0
+    raw_bytes: int = 0
+    manifest: RunManifest | None = None
+
+    def to_record(self, issue_number: int, timestamp: str) -> dict[str, Any]:
+        return {
+            "op": "put",
+            "issue": issue_number,
+            "ts": timestamp,
+            "size_bytes": self.size_bytes,
+            "gz_bytes": self.gz_bytes,
+            "raw_bytes": self.raw_bytes,
+            "manifest": self.manifest.model_dump() if self.manifest else None,
+        }
+
+
+def _measure_run(run_dir: Path) -> tuple[int, int, int]:
+    """Return ``(size_bytes, gz_bytes, raw_bytes)`` for *run_dir*.
+
+    The last two cover the compressed transcript, if there is one.
+    """
+    size = 0
+    for f in run_dir.rglob("*"):
+        with contextlib.suppress(OSError):
+            if f.is_file():
+                size += f.stat().st_size
+    frames = _read_frames(run_dir / (TRANSCRIPT_FILE + _GZ_SUFFIX))
+    return (
+        size,
+        sum(frame.gz_len for frame in frames),
+        sum(frame.raw_len for frame in frames),
+    )
+
+
+def _read_manifest(run_dir: Path) -> RunManifest | None:
+    try:
+        return RunManifest.model_validate_json((run_dir / "manifest.json").read_text())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug("Skipping corrupt manifest in %s", run_dir, exc_info=True)
+        return None
+
+
+class _RunCatalog:
+    """Append-only index of run directories keyed by ``(issue, timestamp)``.
+
+    Each line is a ``put`` or ``del`` record.  Lines appended by other
+    recorders sharing the directory are picked up by tailing the file from
+    the last read offset; a rewritten (compacted) file is detected by its
+    inode or a shrunken size and reloaded from the start.
+    """
+
+    def __init__(self, runs_dir: Path) -> None:
+        self._runs_dir = runs_dir
+        self._path = runs_dir / CATALOG_FILE
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[int, str], _CatalogEntry] = {}
+        self._loaded = False
+        self._offset = 0
+        self._inode: int | None = None
+        self._lines = 0
+
+    def entries(self) -> dict[tuple[int, str], _CatalogEntry]:
+        """Return a snapshot of all catalogued runs."""
+        with self._lock:
+            self._sync()
+            return dict(self._entries)
+
+    def put(self, issue_number: int, timestamp: str, entry: _CatalogEntry) -> None:
+        with self._lock:
+            self._sync()
+            self._entries[(issue_number, timestamp)] = entry
+            self._append([entry.to_record(issue_number, timestamp)])
+
+    def remove(self, keys: list[tuple[int, str]]) -> None:
+        if not keys:
+            return
+        with self._lock:
+            self._sync()
+            for key in keys:
+                self._entries.pop(key, None)
+            self._append([{"op": "del", "issue": i, "ts": ts} for i, ts in keys])
+            if self._should_compact():
+                self._write_snapshot()
+
+    def reset(self) -> None:
+        """Forget every entry (after all run directories were deleted)."""
+        with self._lock:
+            self._entries = {}
+            self._loaded = True
+            self._write_snapshot()
+
+    # -- internals (call with the lock held) ---------------------------------
+
+    def _sync(self) -> None:
+        if self._loaded:
+            self._tail()
+        else:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            self._inode = self._path.stat().st_ino
+        except OSError:
+            self._rebuild()
+            return
+        self._entries = {}
+        self._offset = 0
+        self._lines = 0
+        self._loaded = True
+        self._tail()
+        # Runs left without a manifest were unfinished when last recorded;
+        # measure them now so crashed runs still count toward the size cap.
+        for (issue, ts), entry in list(self._entries.items()):
+            if entry.manifest is not None:
+                continue
+            run_dir = self._runs_dir / str(issue) / ts
+            if not run_dir.is_dir():
+                del self._entries[(issue, ts)]
+                continue
+            size, gz, raw = _measure_run(run_dir)
+            self._entries[(issue, ts)] = _CatalogEntry(
+                size, gz, raw, _read_manifest(run_dir)
+            )
+        if self._should_compact():
+            self._write_snapshot()
+
+    def _tail(self) -> None:
+        try:
+            with open(self._path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self._inode or st.st_size < self._offset:
+                    # Rewritten by another recorder — read it from the start
+                    self._entries = {}
+                    self._offset = 0
+                    self._lines = 0
+                    self._inode = st.st_ino
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            self._rebuild()
+            return
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._apply(line)
+            self._lines += 1
+        self._offset += end
+
+    def _apply(self, line: bytes) -> None:
+        try:
+            record = json.loads(line)
+            key = (int(record["issue"]), str(record["ts"]))
+            if record["op"] == "del":
+                self._entries.pop(key, None)
+                return
+            manifest = record.get("manifest")
+            self._entries[key] = _CatalogEntry(
+                size_bytes=int(record.get("size_bytes", 0)),
+                gz_bytes=int(record.get("gz_bytes", 0)),
+                raw_bytes=int(record.get("raw_bytes", 0)),
+                manifest=RunManifest.model_validate(manifest) if manifest else None,
+            )
+        except Exception:
+            logger.debug("Skipping malformed run catalog line", exc_info=True)
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        payload = "".join(json.dumps(r) + "\n" for r in records).encode()
+        self._runs_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "ab") as f:
+            st = os.fstat(f.fileno())
+            if self._inode is None and st.st_size == 0:
+                self._inode = st.st_ino
+            in_sync = st.st_ino == self._inode and st.st_size == self._offset
+            f.write(payload)
+        # Lines written by others in between are picked up (harmlessly
+        # together with ours) by the next tail.
+        if in_sync:
+            self._offset += len(payload)
+            self._lines += len(records)
+
+    def _rebuild(self) -> None:
+        entries: dict[tuple[int, str], _CatalogEntry] = {}
+        if self._runs_dir.is_dir():
+            for issue_dir in self._runs_dir.iterdir():
+                if not issue_dir.is_dir() or not issue_dir.name.isdigit():
+                    continue
+                for run_dir in issue_dir.iterdir():
+                    if not run_dir.is_dir():
+                        continue
+                    size, gz, raw = _measure_run(run_dir)
+                    entries[(int(issue_dir.name), run_dir.name)] = _CatalogEntry(
+                        size, gz, raw, _read_manifest(run_dir)
+                    )
+        self._entries = entries
+        self._loaded = True
+        self._write_snapshot()
+
+    def _should_compact(self) -> bool:
+        return self._lines - len(self._entries) > (
+            len(self._entries) + _CATALOG_COMPACT_SLACK
+        )
+
+    def _write_snapshot(self) -> None:
+        self._offset = 0
+        self._inode = None
+        self._lines = 0
+        if not self._runs_dir.is_dir():
+            return
+        lines = [
+            json.dumps(entry.to_record(issue, ts)) + "\n"
+            for (issue, ts), entry in sorted(self._entries.items())
+        ]
+        try:
+            atomic_write(self._path, "".join(lines))
+            st = self._path.stat()
+        except OSError:
+            logger.warning("Could not write run catalog %s", self._path, exc_info=True)
+            return
+        self._inode = st.st_ino
+        self._offset = st.st_size
+        self._lines = len(lines)
+
+
 class RunContext:
     """Active recording session for a single issue run.
 
@@ -38,11 +427,22 @@ class RunContext:
     :meth:`finalize` when the run completes or fails.
     """
 
-    def __init__(self, run_dir: Path, issue_number: int, timestamp: str) -> None:
+    def __init__(
+        self,
+        run_dir: Path,
+        issue_number: int,
+        timestamp: str,
+        *,
+        compress_transcript: bool = False,
+        on_finalize: Callable[[RunManifest], None] | None = None,
+    ) -> None:
         self._run_dir = run_dir
         self._issue_number = issue_number
         self._timestamp = timestamp
-        self._transcript_lines: list[str] = []
+        self._compress_transcript = compress_transcript
+        self._transcript: _TranscriptWriter | None = None
+        self._transcript_started = False
+        self._on_finalize = on_finalize
         self._start_time = time.monotonic()
 
     @property
@@ -61,8 +461,17 @@ class RunContext:
         )
 
     def append_transcript(self, line: str) -> None:
-        """Buffer a transcript line for later writing."""
-        self._transcript_lines.append(line)
+        """Stream a transcript line to disk."""
+        writer = self._open_transcript()
+        writer.write(f"\n{line}" if self._transcript_started else line)
+        self._transcript_started = True
+
+    def _open_transcript(self) -> _TranscriptWriter:
+        if self._transcript is None:
+            self._transcript = _TranscriptWriter(
+                self._run_dir / TRANSCRIPT_FILE, compress=self._compress_transcript
+            )
+        return self._transcript
 
     def save_diff(self, diff_text: str) -> None:
         """Write the git diff produced by this run."""
@@ -79,9 +488,8 @@ class RunContext:
         """
         elapsed = time.monotonic() - self._start_time
 
-        # Write transcript
-        transcript_path = self._run_dir / "transcript.log"
-        transcript_path.write_text("\n".join(self._transcript_lines))
+        # Flush the streamed transcript (creating it if nothing was appended)
+        self._open_transcript().close()
 
         # Collect file names
         artifact_files = sorted(f.name for f in self._run_dir.iterdir() if f.is_file())
@@ -103,6 +511,8 @@ class RunContext:
         manifest.files = sorted(f.name for f in self._run_dir.iterdir() if f.is_file())
         manifest_path.write_text(manifest.model_dump_json(indent=2))
 
+        if self._on_finalize is not None:
+            self._on_finalize(manifest)
         return manifest
 
 
@@ -111,6 +521,8 @@ class RunRecorder:
 
     def __init__(self, config: HydraFlowConfig) -> None:
         self._runs_dir = config.data_path("runs")
+        self._compress_transcripts = config.artifact_compress_transcripts
+        self._catalog = _RunCatalog(self._runs_dir)
 
     @property
     def runs_dir(self) -> Path:
@@ -123,185 +535,239 @@ class RunRecorder:
         Creates a timestamped directory under
         ``.hydraflow/runs/{issue_number}/{timestamp}/``.
         """
-        timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        timestamp = datetime.now(UTC).strftime(_RUN_TS_FORMAT)
         run_dir = self._runs_dir / str(issue_number) / timestamp
         run_dir.mkdir(parents=True, exist_ok=True)
+        self._catalog_run(issue_number, timestamp, _CatalogEntry())
         logger.info(
             "Started recording run for issue #%d at %s",
             issue_number,
             run_dir,
         )
-        return RunContext(run_dir, issue_number, timestamp)
+        return RunContext(
+            run_dir,
+            issue_number,
+            timestamp,
+            compress_transcript=self._compress_transcripts,
+            on_finalize=self._on_run_finalized,
+        )
+
+    def _on_run_finalized(self, manifest: RunManifest) -> None:
+        run_dir = self._runs_dir / str(manifest.issue_number) / manifest.timestamp
+        size, gz, raw = _measure_run(run_dir)
+        self._catalog_run(
+            manifest.issue_number,
+            manifest.timestamp,
+            _CatalogEntry(size, gz, raw, manifest.model_copy()),
+        )
+
+    def _catalog_run(
+        self, issue_number: int, timestamp: str, entry: _CatalogEntry
+    ) -> None:
+        """Record a run in the catalog; failures never break a run."""
+        try:
+            self._catalog.put(issue_number, timestamp, entry)
+        except OSError:
+            logger.warning(
+                "Could not catalog run %s/%s", issue_number, timestamp, exc_info=True
+            )
 
     def list_runs(self, issue_number: int) -> list[RunManifest]:
         """Return all recorded runs for *issue_number*, oldest first."""
-        issue_dir = self._runs_dir / str(issue_number)
-        if not issue_dir.is_dir():
-            return []
-
-        manifests: list[RunManifest] = []
-        for run_dir in sorted(issue_dir.iterdir()):
-            manifest_path = run_dir / "manifest.json"
-            if manifest_path.is_file():
-                try:
-                    manifests.append(
-                        RunManifest.model_validate_json(manifest_path.read_text())
-                    )
-                except Exception:
-                    logger.debug(
-                        "Skipping corrupt manifest in %s", run_dir, exc_info=True
-                    )
-        return manifests
+        return [
+            entry.manifest.model_copy()
+            for (issue, _ts), entry in sorted(self._catalog.entries().items())
+            if issue == issue_number and entry.manifest is not None
+        ]
 
     def get_latest(self, issue_number: int) -> RunManifest | None:
         """Return the most recent run for *issue_number*, or None."""
         runs = self.list_runs(issue_number)
         return runs[-1] if runs else None
 
-    def get_run_artifact(
+    def _resolve_artifact(
         self, issue_number: int, timestamp: str, filename: str
-    ) -> str | None:
-        """Read a specific artifact file from a recorded run."""
+    ) -> Path | None:
+        """Return the on-disk path of an artifact, preferring the plain file.
+
+        Falls back to the ``.gz`` variant so callers can ask for
+        ``transcript.log`` regardless of how it was recorded.
+        """
         artifact_path = self._runs_dir / str(issue_number) / timestamp / filename
         try:
-            resolved = artifact_path.resolve()
             runs_root = self._runs_dir.resolve()
+            candidates = [artifact_path.resolve()]
+            if not filename.endswith(_GZ_SUFFIX):
+                candidates.append(
+                    artifact_path.with_name(artifact_path.name + _GZ_SUFFIX).resolve()
+                )
         except OSError:
             return None
-        if not resolved.is_relative_to(runs_root) or not resolved.is_file():
+        for resolved in candidates:
+            if resolved.is_relative_to(runs_root) and resolved.is_file():
+                return resolved
+        return None
+
+    def get_run_artifact(
+        self, issue_number: int, timestamp: str, filename: str
+    ) -> str | None:
+        """Read a specific artifact file from a recorded run.
+
+        Compressed transcripts are decompressed transparently.
+        """
+        resolved = self._resolve_artifact(issue_number, timestamp, filename)
+        if resolved is None:
             return None
         try:
+            if resolved.suffix == _GZ_SUFFIX:
+                return _decompress_members(resolved.read_bytes()).decode()
             return resolved.read_text()
         except (OSError, UnicodeDecodeError):
             return None
 
+    def read_run_artifact_range(
+        self,
+        issue_number: int,
+        timestamp: str,
+        filename: str,
+        offset: int,
+        length: int | None = None,
+    ) -> tuple[bytes, int] | None:
+        """Return ``(data, total_size)`` for a byte range of an artifact.
+
+        Offsets refer to the uncompressed content.  For compressed
+        transcripts only the gzip members overlapping the range are read.
+        Returns None when the artifact does not exist.
+        """
+        resolved = self._resolve_artifact(issue_number, timestamp, filename)
+        if resolved is None:
+            return None
+        offset = max(0, offset)
+        try:
+            if resolved.suffix != _GZ_SUFFIX:
+                total = resolved.stat().st_size
+                with open(resolved, "rb") as f:
+                    f.seek(offset)
+                    data = f.read(-1 if length is None else max(0, length))
+                return data, total
+            frames = _read_frames(resolved)
+            if not frames:
+                content = _decompress_members(resolved.read_bytes())
+                end = len(content) if length is None else offset + max(0, length)
+                return content[offset:end], len(content)
+            total = frames[-1].raw_start + frames[-1].raw_len
+            end = total if length is None else min(total, offset + max(0, length))
+            chunks: list[bytes] = []
+            with open(resolved, "rb") as f:
+                for frame in frames:
+                    if frame.raw_start + frame.raw_len <= offset:
+                        continue
+                    if frame.raw_start >= end:
+                        break
+                    f.seek(frame.gz_start)
+                    raw = gzip.decompress(f.read(frame.gz_len))
+                    lo = max(0, offset - frame.raw_start)
+                    hi = min(frame.raw_len, end - frame.raw_start)
+                    chunks.append(raw[lo:hi])
+            return b"".join(chunks), total
+        except (OSError, EOFError, gzip.BadGzipFile, zlib.error):
+            return None
+
     def list_issues(self) -> list[int]:
         """Return issue numbers that have recorded runs."""
-        if not self._runs_dir.is_dir():
-            return []
-        issues: list[int] = []
-        for d in sorted(self._runs_dir.iterdir()):
-            if d.is_dir() and d.name.isdigit():
-                issues.append(int(d.name))
-        return issues
+        return sorted({issue for issue, _ts in self._catalog.entries()})
 
     def get_storage_stats(self) -> dict[str, Any]:
         """Compute total storage size and run counts across all issues.
 
-        Returns a dict with ``total_bytes``, ``total_runs``, and
-        ``issues`` (count of distinct issue directories).
+        Returns a dict with ``total_bytes``, ``total_runs``, ``issues``
+        (count of distinct issue directories) and, for compressed
+        transcripts, ``transcript_compressed_bytes``,
+        ``transcript_uncompressed_bytes`` and ``transcript_compression_ratio``
+        (uncompressed / compressed; 1.0 when nothing is compressed).
         """
-        total_bytes = 0
-        total_runs = 0
-        issue_count = 0
-        if self._runs_dir.is_dir():
-            for issue_dir in self._runs_dir.iterdir():
-                if not issue_dir.is_dir() or not issue_dir.name.isdigit():
-                    continue
-                issue_count += 1
-                for run_dir in issue_dir.iterdir():
-                    if not run_dir.is_dir():
-                        continue
-                    total_runs += 1
-                    for f in run_dir.rglob("*"):
-                        if f.is_file():
-                            total_bytes += f.stat().st_size
+        entries = self._catalog.entries()
+        total_bytes = sum(e.size_bytes for e in entries.values())
+        total_runs = len(entries)
+        issue_count = len({issue for issue, _ts in entries})
+        gz_bytes = sum(e.gz_bytes for e in entries.values())
+        raw_bytes = sum(e.raw_bytes for e in entries.values())
         return {
             "total_bytes": total_bytes,
             "total_mb": round(total_bytes / (1024 * 1024), 2),
             "total_runs": total_runs,
             "issues": issue_count,
+            "transcript_compressed_bytes": gz_bytes,
+            "transcript_uncompressed_bytes": raw_bytes,
+            "transcript_compression_ratio": (
+                round(raw_bytes / gz_bytes, 2) if gz_bytes else 1.0
+            ),
         }
 
+    def _dated_runs(self) -> list[tuple[datetime, tuple[int, str], _CatalogEntry]]:
+        """Return catalogued runs with a timestamp directory name, oldest first."""
+        runs: list[tuple[datetime, tuple[int, str], _CatalogEntry]] = []
+        for key, entry in self._catalog.entries().items():
+            try:
+                ts = datetime.strptime(key[1], _RUN_TS_FORMAT).replace(tzinfo=UTC)
+            except ValueError:
+                continue
+            runs.append((ts, key, entry))
+        runs.sort(key=lambda r: r[0])
+        return runs
+
+    def _remove_run(self, issue_number: int, timestamp: str) -> bool:
+        """Delete a run directory and its issue dir if left empty."""
+        run_dir = self._runs_dir / str(issue_number) / timestamp
+        shutil.rmtree(run_dir, ignore_errors=True)
+        if run_dir.exists():
+            return False
+        # Remove empty issue dirs
+        issue_dir = run_dir.parent
+        if issue_dir.is_dir() and not any(issue_dir.iterdir()):
+            with contextlib.suppress(OSError):
+                issue_dir.rmdir()
+        return True
+
     def purge_expired(self, retention_days: int) -> int:
         """Delete run directories older than *retention_days*.
 
         Returns the number of run directories removed.
         """
-        if not self._runs_dir.is_dir():
-            return 0
         cutoff = datetime.now(UTC) - timedelta(days=retention_days)
-        removed = 0
-        for issue_dir in list(self._runs_dir.iterdir()):
-            if not issue_dir.is_dir() or not issue_dir.name.isdigit():
-                continue
-            for run_dir in list(issue_dir.iterdir()):
-                if not run_dir.is_dir():
-                    continue
-                try:
-                    ts = datetime.strptime(run_dir.name, "%Y%m%dT%H%M%SZ").replace(
-                        tzinfo=UTC
-                    )
-                except ValueError:
-                    continue
-                if ts < cutoff:
-                    shutil.rmtree(run_dir, ignore_errors=True)
-                    removed += 1
-                    logger.info("Purged expired run %s", run_dir)
-            # Remove empty issue dirs
-            if issue_dir.is_dir() and not any(issue_dir.iterdir()):
-                with contextlib.suppress(OSError):
-                    issue_dir.rmdir()
-        return removed
+        removed: list[tuple[int, str]] = []
+        for ts, key, _entry in self._dated_runs():
+            if ts >= cutoff:
+                break
+            if self._remove_run(*key):
+                removed.append(key)
+                logger.info("Purged expired run %s/%s", *key)
+        self._catalog.remove(removed)
+        return len(removed)
 
     def purge_oversized(self, max_size_mb: int) -> int:
         """Delete oldest runs until total storage is under *max_size_mb*.
 
         Returns the number of run directories removed.
         """
-        if not self._runs_dir.is_dir():
-            return 0
-
-        # Collect all runs with their timestamps and paths
-        runs: list[tuple[str, Path]] = []
-        for issue_dir in self._runs_dir.iterdir():
-            if not issue_dir.is_dir() or not issue_dir.name.isdigit():
-                continue
-            for run_dir in issue_dir.iterdir():
-                if not run_dir.is_dir():
-                    continue
-                try:
-                    datetime.strptime(run_dir.name, "%Y%m%dT%H%M%SZ")
-                except ValueError:
-                    continue
-                runs.append((run_dir.name, run_dir))
-
-        # Sort descending so pop() removes the oldest (O(1) vs pop(0) O(n))
-        runs.sort(key=lambda r: r[0], reverse=True)
         max_bytes = max_size_mb * 1024 * 1024
-        removed = 0
         current_bytes = self._compute_total_bytes()
-
-        while runs and current_bytes > max_bytes:
-            _, oldest_run = runs.pop()
-            parent = oldest_run.parent
-            run_bytes = sum(
-                f.stat().st_size for f in oldest_run.rglob("*") if f.is_file()
-            )
-            shutil.rmtree(oldest_run, ignore_errors=True)
-            if oldest_run.exists():
-                logger.warning(
-                    "Failed to remove oversized run %s, skipping", oldest_run
-                )
+        removed: list[tuple[int, str]] = []
+        for _ts, key, entry in self._dated_runs():
+            if current_bytes <= max_bytes:
+                break
+            if not self._remove_run(*key):
+                logger.warning("Failed to remove oversized run %s/%s, skipping", *key)
                 continue
-            current_bytes -= run_bytes
-            removed += 1
-            logger.info("Purged oversized run %s", oldest_run)
-            # Remove empty issue dirs
-            if parent.is_dir() and not any(parent.iterdir()):
-                with contextlib.suppress(OSError):
-                    parent.rmdir()
-
-        return removed
+            current_bytes -= entry.size_bytes
+            removed.append(key)
+            logger.info("Purged oversized run %s/%s", *key)
+        self._catalog.remove(removed)
+        return len(removed)
 
     def _compute_total_bytes(self) -> int:
         """Return total bytes across all run artifacts."""
-        total = 0
-        if self._runs_dir.is_dir():
-            for f in self._runs_dir.rglob("*"):
-                if f.is_file():
-                    total += f.stat().st_size
-        return total
+        return sum(e.size_bytes for e in self._catalog.entries().values())
 
     def purge_all(self) -> int:
         """Delete all recorded runs. Returns the number removed."""
@@ -317,4 +783,5 @@ class RunRecorder:
                     removed += 1
             if issue_dir.is_dir() and not any(issue_dir.iterdir()):
                 issue_dir.rmdir()
+        self._catalog.reset()
         return removed
@@ -20,6 +20,7 @@ from subprocess_util import (
     make_clean_env,
     parse_credit_resume_time,
 )
+from tracing import span
 
 logger = logging.getLogger("hydraflow.runner_utils")
 
@@ -79,6 +80,45 @@ async def stream_claude_process(
         The transcript string, using the fallback chain:
         result_text → accumulated_text → raw_lines.
     """
+    with span(
+        "agent",
+        tool=cmd[0] if cmd else None,
+        source=event_data.get("source"),
+        issue=event_data.get("issue"),
+        pr=event_data.get("pr"),
+    ):
+        return await _stream_claude_process(
+            cmd=cmd,
+            prompt=prompt,
+            cwd=cwd,
+            active_procs=active_procs,
+            event_bus=event_bus,
+            event_data=event_data,
+            logger=logger,
+            on_output=on_output,
+            timeout=timeout,
+            runner=runner,
+            usage_stats=usage_stats,
+            gh_token=gh_token,
+        )
+
+
+async def _stream_claude_process(
+    *,
+    cmd: list[str],
+    prompt: str,
+    cwd: Path,
+    active_procs: set[asyncio.subprocess.Process],
+    event_bus: EventBus,
+    event_data: TranscriptEventData,
+    logger: logging.Logger,
+    on_output: Callable[[str], bool] | None = None,
+    timeout: float = 3600.0,
+    runner: SubprocessRunner | None = None,
+    usage_stats: dict[str, object] | None = None,
+    gh_token: str = "",
+) -> str:
+    """Body of :func:`stream_claude_process`, run inside its ``agent`` span."""
     env = make_clean_env(gh_token)
 
     if runner is None:
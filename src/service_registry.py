@@ -26,6 +26,7 @@ from hitl_runner import HITLRunner
 from implement_phase import ImplementPhase
 from issue_fetcher import GitHubTaskFetcher, IssueFetcher
 from issue_store import IssueStore
+from local_diff import LocalDiffProvider
 from manifest import ProjectManifestManager
 from manifest_issue_syncer import ManifestIssueSyncer
 from manifest_refresh_loop import ManifestRefreshLoop
@@ -34,6 +35,7 @@ from memory_sync_loop import MemorySyncLoop
 from merge_conflict_resolver import MergeConflictResolver
 from metrics_sync_loop import MetricsSyncLoop
 from models import StatusCallback
+from overlap_scheduler import OverlapScheduler
 from plan_phase import PlanPhase
 from planner import PlannerRunner
 from post_merge_handler import PostMergeHandler
@@ -53,6 +55,7 @@ from triage_phase import TriagePhase
 from troubleshooting_store import TroubleshootingPatternStore
 from verification_judge import VerificationJudge
 from workspace import WorkspaceManager
+from workspace_disk import WorkspaceDiskAccountant
 from workspace_gc_loop import WorkspaceGCLoop
 
 if TYPE_CHECKING:
@@ -65,6 +68,7 @@ class ServiceRegistry:
 
     # Core infrastructure
     worktrees: WorkspaceManager
+    workspace_disk: WorkspaceDiskAccountant
     subprocess_runner: SubprocessRunner
     agents: AgentRunner
     planners: PlannerRunner
@@ -150,10 +154,20 @@ def build_services(
     fetcher = IssueFetcher(config)
     store = IssueStore(config, GitHubTaskFetcher(fetcher), event_bus)
 
+    # Workspace disk accounting (quota enforced on workspace create)
+    workspace_disk = WorkspaceDiskAccountant(config, state, store.is_in_pipeline)
+    worktrees.set_disk_accountant(workspace_disk)
+    # Pooled containers go with their workspace
+    worktrees.set_subprocess_runner(subprocess_runner)
+
     # Crate management
     crate_manager = CrateManager(config, state, prs, event_bus)
     store.set_crate_manager(crate_manager)
 
+    # Ready-queue ordering by planned-file overlap with in-flight work
+    overlap_scheduler = OverlapScheduler(config)
+    store.set_overlap_scheduler(overlap_scheduler)
+
     # Harness insight store (shared across phases)
     harness_insights = HarnessInsightStore(config.data_path("memory"))
 
@@ -210,6 +224,7 @@ def build_services(
         stop_event,
         run_recorder=run_recorder,
         harness_insights=harness_insights,
+        overlap_scheduler=overlap_scheduler,
     )
 
     from metrics_manager import MetricsManager
@@ -281,6 +296,9 @@ def build_services(
         post_merge=post_merge_handler,
         update_bg_worker_status=callbacks.update_bg_worker_status,
         baseline_policy=baseline_policy,
+        diff_provider=(
+            LocalDiffProvider(config) if config.review_diff_source == "local" else None
+        ),
     )
 
     # Background loops
@@ -406,6 +424,7 @@ def build_services(
 
     return ServiceRegistry(
         worktrees=worktrees,
+        workspace_disk=workspace_disk,
         subprocess_runner=subprocess_runner,
         agents=agents,
         planners=planners,
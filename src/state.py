@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -25,6 +26,7 @@ from models import (
     PendingReport,
     PersistedWorkerHeartbeat,
     Release,
+    ReviewCheckpoint,
     SessionCounters,
     SessionLog,
     SessionStatus,
@@ -33,9 +35,15 @@ from models import (
     VisualEvidence,
     WorkerResultMeta,
 )
+from runtime_metrics import REGISTRY
 
 logger = logging.getLogger("hydraflow.state")
 
+_STATE_SAVE_SECONDS = REGISTRY.histogram(
+    "hydraflow_state_save_seconds",
+    "Time to serialize and atomically write the state file",
+)
+
 
 class StateTracker:
     """JSON-file backed state for crash recovery.
@@ -118,9 +126,11 @@ class StateTracker:
 
     def save(self) -> None:
         """Flush current state to disk atomically."""
+        started = time.perf_counter()
         self._data.last_updated = datetime.now(UTC).isoformat()
         data = self._data.model_dump_json(indent=2)
         atomic_write(self._path, data)
+        _STATE_SAVE_SECONDS.observe(time.perf_counter() - started)
 
     # --- issue tracking ---
 
@@ -376,6 +386,22 @@ class StateTracker:
         self._data.last_reviewed_shas.pop(str(issue_number), None)
         self.save()
 
+    def set_review_checkpoint(
+        self, issue_number: int, checkpoint: ReviewCheckpoint
+    ) -> None:
+        """Record the outcome of the last review for *issue_number*."""
+        self._data.review_checkpoints[str(issue_number)] = checkpoint
+        self.save()
+
+    def get_review_checkpoint(self, issue_number: int) -> ReviewCheckpoint | None:
+        """Return the last review outcome for *issue_number*, or *None*."""
+        return self._data.review_checkpoints.get(str(issue_number))
+
+    def clear_review_checkpoint(self, issue_number: int) -> None:
+        """Clear the last review outcome for *issue_number*."""
+        self._data.review_checkpoints.pop(str(issue_number), None)
+        self.save()
+
     # --- worker result metadata ---
 
     def set_worker_result_meta(self, issue_number: int, meta: WorkerResultMeta) -> None:
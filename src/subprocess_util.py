@@ -8,13 +8,17 @@ import os
 import random
 import re
 import subprocess
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
+from runtime_metrics import REGISTRY
+from tracing import child_span
+
 if TYPE_CHECKING:
-    from execution import SubprocessRunner
+    from execution import CaptureLimits, SubprocessRunner
 
 logger = logging.getLogger("hydraflow.subprocess")
 
@@ -294,6 +298,21 @@ def make_docker_env(
 
 _GH_COMMANDS = frozenset({"gh", "git"})
 
+_SUBPROCESS_SECONDS = REGISTRY.histogram(
+    "hydraflow_subprocess_duration_seconds",
+    "Wall time of run_subprocess calls by command",
+    ("command",),
+)
+_SUBPROCESS_FAILURES = REGISTRY.counter(
+    "hydraflow_subprocess_failures_total",
+    "run_subprocess calls that timed out or exited non-zero",
+    ("command", "reason"),
+)
+_GH_SEMAPHORE_WAIT = REGISTRY.histogram(
+    "hydraflow_gh_semaphore_wait_seconds",
+    "Time gh/git calls spent waiting for the rate-limit cooldown and semaphore",
+)
+
 
 async def run_subprocess(
     *cmd: str,
@@ -301,6 +320,7 @@ async def run_subprocess(
     gh_token: str = "",
     timeout: float = 120.0,
     runner: SubprocessRunner | None = None,
+    capture: CaptureLimits | None = None,
 ) -> str:
     """Run a subprocess and return stripped stdout.
 
@@ -311,6 +331,9 @@ async def run_subprocess(
     For ``gh`` and ``git`` commands, execution is gated through a global
     semaphore to prevent GitHub API rate limiting from concurrent calls.
 
+    Pass *capture* when only a bounded head/tail of the output is needed
+    so large outputs are never held in memory whole.
+
     Raises :class:`SubprocessTimeoutError` if the command exceeds *timeout* seconds.
     Raises :class:`RuntimeError` on non-zero exit.
     """
@@ -321,20 +344,27 @@ async def run_subprocess(
     resolved_runner = runner if runner is not None else get_default_runner()
 
     use_semaphore = bool(cmd) and cmd[0] in _GH_COMMANDS
+    command = Path(cmd[0]).name if cmd else ""
 
     async def _exec() -> str:
+        started = time.monotonic()
         try:
             result = await resolved_runner.run_simple(
                 list(cmd),
                 cwd=str(cwd) if cwd is not None else None,
                 env=env,
                 timeout=timeout,
+                capture=capture,
             )
         except TimeoutError:
+            _SUBPROCESS_FAILURES.inc(command, "timeout")
             raise SubprocessTimeoutError(
                 f"Command {cmd!r} timed out after {timeout}s"
             ) from None
+        finally:
+            _SUBPROCESS_SECONDS.observe(time.monotonic() - started, command)
         if result.returncode != 0:
+            _SUBPROCESS_FAILURES.inc(command, "exit")
             msg = f"Command {cmd!r} failed (rc={result.returncode}): {result.stderr}"
             cause = subprocess.CalledProcessError(
                 result.returncode,
@@ -349,11 +379,17 @@ async def run_subprocess(
             raise RuntimeError(msg) from cause
         return result.stdout
 
-    if use_semaphore:
-        await _wait_for_rate_limit_cooldown()
-        async with _get_gh_semaphore():
-            return await _exec()
-    return await _exec()
+    with child_span("subprocess", cmd=" ".join(cmd[:2])) as sp:
+        if use_semaphore:
+            queued_at = time.monotonic()
+            await _wait_for_rate_limit_cooldown()
+            async with _get_gh_semaphore():
+                queued = time.monotonic() - queued_at
+                _GH_SEMAPHORE_WAIT.observe(queued)
+                if sp is not None:
+                    sp.set_attribute("queued_ms", round(queued * 1000, 1))
+                return await _exec()
+        return await _exec()
 
 
 _RETRYABLE_PATTERNS = (
@@ -391,6 +427,7 @@ async def run_subprocess_with_retry(
     max_delay_seconds: float = 30.0,
     timeout: float = 120.0,
     runner: SubprocessRunner | None = None,
+    capture: CaptureLimits | None = None,
 ) -> str:
     """Run a subprocess with exponential backoff retry on transient errors.
 
@@ -403,7 +440,12 @@ async def run_subprocess_with_retry(
     for attempt in range(max_retries + 1):
         try:
             return await run_subprocess(
-                *cmd, cwd=cwd, gh_token=gh_token, timeout=timeout, runner=runner
+                *cmd,
+                cwd=cwd,
+                gh_token=gh_token,
+                timeout=timeout,
+                runner=runner,
+                capture=capture,
             )
         except RuntimeError as exc:
             if isinstance(exc, AuthenticationError | CreditExhaustedError):
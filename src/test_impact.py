@@ -0,0 +1,348 @@
+"""Select the tests affected by a worktree's changes.
+
+Backs the incremental quality gate: during the quality-fix loop the tests
+touched by the agent's changes run first as a quick pre-check, and the
+full ``make quality`` only runs once they pass.
+
+* Python tests are selected from the import graph: a test is affected
+  when it imports a changed module directly or transitively.
+* Other stacks (as detected by :func:`polyglot_prep.detect_prep_stack`)
+  use regex mapping rules from source paths to test paths; extra rules
+  come from ``test_impact_rules``.
+
+Selection errs towards running more tests — unresolvable imports match
+every module of the same name — and returns nothing when it cannot say
+which tests are affected, in which case callers go straight to the full
+gate.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import os
+import re
+import shlex
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from polyglot_prep import detect_prep_stack
+from subprocess_util import make_clean_env
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+    from execution import SubprocessRunner
+
+logger = logging.getLogger("hydraflow.test_impact")
+
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "dist",
+        "build",
+        "target",
+        "__pycache__",
+        ".hydraflow",
+    }
+)
+_PY_TEST_RE = re.compile(r"(^|/)(test_[^/]*|[^/]*_test)\.py$")
+
+
+@dataclass(frozen=True)
+class StackImpactRules:
+    """How to pick and run the affected tests of one stack.
+
+    *mappings* are ``(source_regex, test_template)`` pairs; templates use
+    ``{1}``, ``{2}``… for the regex groups, and only targets that exist
+    in the worktree are kept.
+
+    Only *failure_returncodes* mean the tests ran and some failed; other
+    nonzero exits (usage errors, nothing collected, runner not found) and
+    output containing one of *unavailable_markers* are not a verdict.
+    """
+
+    command: tuple[str, ...]
+    test_pattern: str
+    mappings: tuple[tuple[str, str], ...] = ()
+    failure_returncodes: frozenset[int] = frozenset({1})
+    unavailable_markers: tuple[str, ...] = ()
+
+
+STACK_IMPACT_RULES: dict[str, StackImpactRules] = {
+    "python": StackImpactRules(
+        command=("python", "-m", "pytest", "-q"),
+        test_pattern=_PY_TEST_RE.pattern,
+        # pytest: 1 = tests failed; 2-5 = interrupted, internal/usage
+        # error, no tests collected.  A missing pytest also exits 1.
+        unavailable_markers=("No module named pytest",),
+    ),
+    "node": StackImpactRules(
+        command=("npx", "vitest", "run"),
+        test_pattern=r"\.(test|spec)\.[cm]?[jt]sx?$",
+        mappings=(
+            (r"^(.*)\.([cm]?[jt]sx?)$", "{1}.test.{2}"),
+            (r"^(.*)\.([cm]?[jt]sx?)$", "{1}.spec.{2}"),
+            (r"^(.*/)?([^/]+)\.([cm]?[jt]sx?)$", "{1}__tests__/{2}.test.{3}"),
+        ),
+        unavailable_markers=("could not determine executable to run",),
+    ),
+    "go": StackImpactRules(
+        command=("go", "test"),
+        test_pattern=r"_test\.go$",
+        mappings=((r"^(.*/)?[^/]+\.go$", "./{1}"),),
+    ),
+    "ruby": StackImpactRules(
+        command=("bundle", "exec", "rspec"),
+        test_pattern=r"_spec\.rb$",
+        mappings=((r"^(?:app|lib)/(.*)\.rb$", "spec/{1}_spec.rb"),),
+        unavailable_markers=("command not found: rspec",),
+    ),
+}
+STACK_IMPACT_RULES["rails"] = STACK_IMPACT_RULES["ruby"]
+
+
+@dataclass
+class ImpactedTests:
+    """The affected tests of one stack and the command that runs them."""
+
+    stack: str
+    command: list[str]
+    targets: list[str] = field(default_factory=list)
+    failure_returncodes: frozenset[int] = frozenset({1})
+    unavailable_markers: tuple[str, ...] = ()
+
+    @property
+    def argv(self) -> list[str]:
+        return [*self.command, *self.targets]
+
+    def is_test_failure(self, returncode: int, output: str) -> bool:
+        """Return True when a run exiting with *returncode* had failing tests."""
+        return returncode in self.failure_returncodes and not any(
+            marker in output for marker in self.unavailable_markers
+        )
+
+
+async def changed_files(
+    worktree_path: Path,
+    base_ref: str,
+    runner: SubprocessRunner,
+    timeout: float,
+) -> list[str] | None:
+    """Return paths changed since the merge base with *base_ref*.
+
+    Includes committed, uncommitted and untracked (non-ignored) files.
+    Returns ``None`` if git cannot answer.
+    """
+    cwd = str(worktree_path)
+    env = make_clean_env()
+    try:
+        base = await runner.run_simple(
+            ["git", "merge-base", base_ref, "HEAD"],
+            cwd=cwd,
+            env=env,
+            timeout=timeout,
+        )
+        if base.returncode != 0 or not base.stdout:
+            return None
+        diff = await runner.run_simple(
+            ["git", "diff", "--name-only", base.stdout],
+            cwd=cwd,
+            env=env,
+            timeout=timeout,
+        )
+        untracked = await runner.run_simple(
+            ["git", "ls-files", "--others", "--exclude-standard"],
+            cwd=cwd,
+            env=env,
+            timeout=timeout,
+        )
+    except (OSError, TimeoutError):
+        logger.debug("Could not list changes in %s", worktree_path, exc_info=True)
+        return None
+    if diff.returncode != 0 or untracked.returncode != 0:
+        return None
+    paths = {*diff.stdout.splitlines(), *untracked.stdout.splitlines()}
+    return sorted(p for p in paths if p)
+
+
+def _walk_files(root: Path, suffix: str) -> list[str]:
+    found: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        rel_dir = Path(dirpath).relative_to(root)
+        found.extend(
+            (rel_dir / name).as_posix() for name in filenames if name.endswith(suffix)
+        )
+    return sorted(found)
+
+
+def _module_names(rel_path: str) -> list[str]:
+    """Return every dotted name *rel_path* may be imported as.
+
+    ``src/pkg/mod.py`` may be ``src.pkg.mod``, ``pkg.mod`` or ``mod``
+    depending on ``sys.path``; a package's ``__init__.py`` is the package.
+    """
+    parts = rel_path.removesuffix(".py").split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return [".".join(parts[i:]) for i in range(len(parts))]
+
+
+# Parsed imports per file with the (mtime_ns, size) they were read at; the
+# graph is rebuilt each call but unchanged files are not re-parsed.
+_import_cache: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
+
+def _imports(path: Path, rel_path: str) -> list[str]:
+    """Return the absolute dotted names imported by the file at *path*."""
+    try:
+        st = path.stat()
+    except OSError:
+        return []
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _import_cache.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return []
+    package = rel_path.removesuffix(".py").split("/")[:-1]
+    names: list[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                anchor = package[: len(package) - node.level + 1]
+                base = ".".join([*anchor, *(node.module or "").split(".")]).strip(".")
+            else:
+                base = node.module or ""
+            if base:
+                names.append(base)
+            # ``from pkg import mod`` may import a submodule.
+            names.extend(
+                f"{base}.{alias.name}" if base else alias.name
+                for alias in node.names
+                if alias.name != "*"
+            )
+    _import_cache[str(path)] = (stamp, names)
+    return names
+
+
+def python_impacted_tests(root: Path, changed: list[str]) -> list[str]:
+    """Return the Python tests affected by *changed* files.
+
+    A test is affected when it imports a changed module, directly or
+    through other modules.  A changed ``conftest.py`` affects its whole
+    directory, which is returned as the target.
+    """
+    changed_py = [p for p in changed if p.endswith(".py")]
+    if not changed_py:
+        return []
+    importers: dict[str, set[str]] = {}
+    for rel in _walk_files(root, ".py"):
+        for name in _imports(root / rel, rel):
+            importers.setdefault(name, set()).add(rel)
+    # Keyed by name, so importers of deleted modules are still found.
+    affected = set(changed_py)
+    frontier = list(changed_py)
+    while frontier:
+        rel = frontier.pop()
+        for name in _module_names(rel):
+            for importer in importers.get(name, ()):
+                if importer not in affected:
+                    affected.add(importer)
+                    frontier.append(importer)
+    targets = {p for p in affected if _PY_TEST_RE.search(p) and (root / p).is_file()}
+    for rel in changed_py:
+        if Path(rel).name == "conftest.py" and (root / rel).is_file():
+            targets.add(Path(rel).parent.as_posix())
+    return sorted(targets)
+
+
+def _expand(template: str, match: re.Match[str]) -> str:
+    return re.sub(r"\{(\d+)\}", lambda m: match.group(int(m.group(1))) or "", template)
+
+
+def mapped_tests(
+    root: Path,
+    changed: list[str],
+    rules: StackImpactRules,
+    extra: list[tuple[str, str]] | None = None,
+) -> list[str]:
+    """Return existing test targets that *rules* map *changed* files to."""
+    test_re = re.compile(rules.test_pattern)
+    mappings = [
+        (re.compile(src), tpl) for src, tpl in [*(extra or []), *rules.mappings]
+    ]
+    targets: set[str] = set()
+    for rel in changed:
+        if test_re.search(rel):
+            if (root / rel).exists():
+                targets.add(rel)
+            continue
+        for pattern, template in mappings:
+            match = pattern.search(rel)
+            if match is None:
+                continue
+            target = _expand(template, match)
+            if (root / target).exists():
+                targets.add(target)
+    return sorted(targets)
+
+
+def parse_impact_rules(raw: list[str]) -> list[tuple[str, str]]:
+    """Parse ``"SOURCE_REGEX => TEST_TEMPLATE"`` entries, skipping bad ones."""
+    rules: list[tuple[str, str]] = []
+    for entry in raw:
+        source, sep, template = entry.partition("=>")
+        source, template = source.strip(), template.strip()
+        if not sep or not source or not template:
+            logger.warning("Ignoring malformed test impact rule: %r", entry)
+            continue
+        try:
+            re.compile(source)
+        except re.error:
+            logger.warning("Ignoring test impact rule with bad regex: %r", entry)
+            continue
+        rules.append((source, template))
+    return rules
+
+
+def select_impacted_tests(
+    config: HydraFlowConfig, root: Path, changed: list[str]
+) -> list[ImpactedTests]:
+    """Return the affected tests per stack for *changed* files in *root*.
+
+    Mixed repos select Python and Node tests separately; the configured
+    extra rules and command override apply to the primary stack only.
+    """
+    stack = detect_prep_stack(root)
+    stacks = ["python", "node"] if stack == "mixed" else [stack]
+    extra = parse_impact_rules(config.test_impact_rules)
+    override = shlex.split(config.incremental_test_command)
+    selections: list[ImpactedTests] = []
+    for index, name in enumerate(stacks):
+        rules = STACK_IMPACT_RULES.get(name)
+        if rules is None:
+            continue
+        primary = index == 0
+        targets = set(mapped_tests(root, changed, rules, extra if primary else None))
+        if name == "python":
+            targets.update(python_impacted_tests(root, changed))
+        if targets:
+            selections.append(
+                ImpactedTests(
+                    stack=name,
+                    command=(override if primary and override else list(rules.command)),
+                    targets=sorted(targets),
+                    failure_returncodes=rules.failure_returncodes,
+                    unavailable_markers=rules.unavailable_markers,
+                )
+            )
+    return selections
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 from datetime import datetime
 
 from events import EventBus, EventType, HydraFlowEvent
@@ -50,14 +51,155 @@ TERMINAL_STATUSES = {"done", "merged", "passed", "failed"}
 DONE_STATUSES = {"done", "merged", "passed"}
 
 
-class TimelineBuilder:
-    """Builds structured lifecycle timelines from flat EventBus history."""
+def _direct_issue_number(event: HydraFlowEvent) -> int | None:
+    """Return the issue an event names itself, ignoring PR correlation."""
+    issue = event.data.get("issue")
+    if isinstance(issue, int):
+        return issue
+    # ISSUE_CREATED uses "number"
+    number = event.data.get("number")
+    if isinstance(number, int):
+        return number
+    return None
+
+
+class TimelineIndex:
+    """Per-issue event lists kept current from :meth:`EventBus.publish`.
+
+    Events that only carry a PR number are filed under that PR and joined
+    to an issue at lookup time, so a ``PR_CREATED`` arriving after them
+    still claims them, matching the two-pass grouping over the history.
+    Events that have aged out of the bus history window are dropped;
+    PR links outlive them.  The index rebuilds itself from the bus
+    history whenever the bus replaces it (e.g. on load from disk).
+    """
+
+    def __init__(self, event_bus: EventBus) -> None:
+        self._bus = event_bus
+        self._generation = -1
+        self._seq = 0
+        self._by_issue: dict[int, list[tuple[int, HydraFlowEvent]]] = {}
+        self._by_pr: dict[int, list[tuple[int, HydraFlowEvent]]] = {}
+        self._pr_to_issue: dict[int, int] = {}
+        self._issue_prs: dict[int, set[int]] = {}
+        self._sync_generation()
+        event_bus.add_listener(self._observe)
+
+    def close(self) -> None:
+        """Detach from the event bus."""
+        self._bus.remove_listener(self._observe)
+
+    def issue_numbers(self) -> list[int]:
+        """Return every issue with at least one event in the history window."""
+        self._sync_generation()
+        self._prune()
+        issues = set(self._by_issue)
+        issues.update(
+            self._pr_to_issue[pr] for pr in self._by_pr if pr in self._pr_to_issue
+        )
+        return sorted(issues)
+
+    def events_for(self, issue_number: int) -> list[HydraFlowEvent]:
+        """Return the events for *issue_number* in publish order."""
+        self._sync_generation()
+        cutoff = self._cutoff()
+        sources = [self._by_issue.get(issue_number, [])]
+        sources.extend(
+            self._by_pr.get(pr, []) for pr in self._issue_prs.get(issue_number, ())
+        )
+        return [
+            event
+            for seq, event in heapq.merge(*sources, key=lambda item: item[0])
+            if seq > cutoff
+        ]
 
-    def __init__(self, event_bus: EventBus, max_transcript_lines: int = 5) -> None:
+    def _cutoff(self) -> int:
+        """Return the highest sequence number that has left the bus history."""
+        return self._seq - self._bus.max_history
+
+    def _sync_generation(self) -> None:
+        generation = self._bus.history_generation
+        if generation == self._generation:
+            return
+        self._generation = generation
+        self._seq = 0
+        self._by_issue.clear()
+        self._by_pr.clear()
+        self._pr_to_issue.clear()
+        self._issue_prs.clear()
+        for event in self._bus.get_history():
+            self._add(event)
+
+    def _observe(self, event: HydraFlowEvent) -> None:
+        if self._bus.history_generation != self._generation:
+            # Rebuilt from the bus history, which already holds *event*.
+            self._sync_generation()
+            return
+        self._add(event)
+        # Amortised sweep so issues nobody looks up don't pin old events.
+        if self._seq % self._bus.max_history == 0:
+            self._prune()
+
+    def _add(self, event: HydraFlowEvent) -> None:
+        self._seq += 1
+        if event.type == EventType.PR_CREATED:
+            pr_num = event.data.get("pr")
+            issue_num = event.data.get("issue")
+            if isinstance(pr_num, int) and isinstance(issue_num, int):
+                previous = self._pr_to_issue.get(pr_num)
+                if previous is not None and previous != issue_num:
+                    self._issue_prs[previous].discard(pr_num)
+                self._pr_to_issue[pr_num] = issue_num
+                self._issue_prs.setdefault(issue_num, set()).add(pr_num)
+        issue = _direct_issue_number(event)
+        if issue is not None:
+            self._by_issue.setdefault(issue, []).append((self._seq, event))
+            return
+        pr = event.data.get("pr")
+        if isinstance(pr, int):
+            self._by_pr.setdefault(pr, []).append((self._seq, event))
+
+    def _prune(self) -> None:
+        """Drop events that have left the bus history window."""
+        cutoff = self._cutoff()
+        if cutoff <= 0:
+            return
+        for buckets in (self._by_issue, self._by_pr):
+            for key in list(buckets):
+                entries = buckets[key]
+                if entries[0][0] > cutoff:
+                    continue
+                kept = [item for item in entries if item[0] > cutoff]
+                if kept:
+                    buckets[key] = kept
+                else:
+                    del buckets[key]
+
+
+class TimelineBuilder:
+    """Builds structured lifecycle timelines from flat EventBus history.
+
+    With a :class:`TimelineIndex`, events are read from the index instead
+    of regrouping the full history on every call.
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        max_transcript_lines: int = 5,
+        index: TimelineIndex | None = None,
+    ) -> None:
         self._bus = event_bus
         self._max_transcript_lines = max_transcript_lines
+        self._index = index
 
     def build_all(self) -> list[IssueTimeline]:
+        if self._index is not None:
+            index = self._index
+            return [
+                self._build_timeline(issue_num, index.events_for(issue_num))
+                for issue_num in index.issue_numbers()
+            ]
         events = self._bus.get_history()
         grouped = self._group_events_by_issue(events)
         timelines = [
@@ -67,6 +209,11 @@ class TimelineBuilder:
         return timelines
 
     def build_for_issue(self, issue_number: int) -> IssueTimeline | None:
+        if self._index is not None:
+            indexed = self._index.events_for(issue_number)
+            if not indexed:
+                return None
+            return self._build_timeline(issue_number, indexed)
         events = self._bus.get_history()
         grouped = self._group_events_by_issue(events)
         if issue_number not in grouped:
@@ -97,17 +244,11 @@ class TimelineBuilder:
     def _extract_issue_number(
         self, event: HydraFlowEvent, pr_to_issue: dict[int, int]
     ) -> int | None:
-        data = event.data
-        # Direct issue field
-        issue = data.get("issue")
-        if isinstance(issue, int):
+        issue = _direct_issue_number(event)
+        if issue is not None:
             return issue
-        # ISSUE_CREATED uses "number"
-        number = data.get("number")
-        if isinstance(number, int):
-            return number
         # Correlate via PR number
-        pr = data.get("pr")
+        pr = event.data.get("pr")
         if isinstance(pr, int) and pr in pr_to_issue:
             return pr_to_issue[pr]
         return None
@@ -0,0 +1,305 @@
+"""Lightweight in-process span tracing of the issue lifecycle.
+
+Spans are opened with :func:`span` around units of work — phases,
+workspace setup, agent runs, subprocesses and CI waits.  Parent/child
+links follow the asyncio task tree through a :class:`~contextvars.ContextVar`,
+and the ``issue`` / ``pr`` attributes are inherited from the parent so
+every span of an issue's lifecycle can be found by issue number.
+Finished spans are appended to ``traces/spans.jsonl`` under the data root.
+
+Tracing is off until :func:`configure_tracing` is called with
+``tracing_enabled``.  Sampling is decided once per trace at its root span;
+spans of unsampled traces cost a context-var lookup and nothing else.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import random
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from config import HydraFlowConfig
+
+logger = logging.getLogger("hydraflow.tracing")
+
+SPAN_FILE = "spans.jsonl"
+# Rotate the span file to ``spans.jsonl.1`` beyond this size.
+_MAX_FILE_BYTES = 50 * 1024 * 1024
+# Buffered spans written at once (root spans always flush).
+_FLUSH_BATCH = 64
+_INHERITED_ATTRS = ("issue", "pr")
+
+
+@dataclass(frozen=True)
+class _SpanContext:
+    trace_id: str
+    span_id: str
+    sampled: bool
+    inherited: dict[str, Any] = field(default_factory=dict)
+
+
+_current: ContextVar[_SpanContext | None] = ContextVar(
+    "hydraflow_current_span", default=None
+)
+
+
+class Span:
+    """Handle for adding attributes to an open span."""
+
+    __slots__ = ("name", "attrs")
+
+    def __init__(self, name: str, attrs: dict[str, Any]) -> None:
+        self.name = name
+        self.attrs = attrs
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attrs[key] = value
+
+
+class Tracer:
+    """Records spans and exports them to a JSONL file."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        sample_rate: float = 1.0,
+        min_duration_ms: float = 0.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._path = path
+        self._sample_rate = sample_rate
+        self._min_duration_ms = min_duration_ms
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._buffer: list[str] = []
+
+    @property
+    def path(self) -> Path:
+        """The JSONL file spans are exported to."""
+        return self._path
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span | None]:
+        """Time the enclosed block as a child of the current span.
+
+        Yields a :class:`Span` for adding attributes, or None when the
+        trace is not sampled.  ``None``-valued attributes are dropped.
+        """
+        parent = _current.get()
+        if parent is not None and not parent.sampled:
+            yield None
+            return
+        trace_id = parent.trace_id if parent else secrets.token_hex(8)
+        if parent is None and self._rng() >= self._sample_rate:
+            token = _current.set(_SpanContext(trace_id, "", sampled=False))
+            try:
+                yield None
+            finally:
+                _current.reset(token)
+            return
+        attrs = {k: v for k, v in attrs.items() if v is not None}
+        inherited = dict(parent.inherited) if parent else {}
+        inherited.update({k: attrs[k] for k in _INHERITED_ATTRS if k in attrs})
+        ctx = _SpanContext(
+            trace_id,
+            secrets.token_hex(8),
+            sampled=True,
+            inherited=inherited,
+        )
+        handle = Span(name, attrs)
+        status = "ok"
+        token = _current.set(ctx)
+        start_wall = time.time()
+        start = time.perf_counter()
+        try:
+            yield handle
+        except BaseException as exc:
+            status = "error"
+            handle.attrs.setdefault("error", type(exc).__name__)
+            raise
+        finally:
+            _current.reset(token)
+            duration_ms = (time.perf_counter() - start) * 1000
+            if duration_ms >= self._min_duration_ms or parent is None:
+                extra = {k: v for k, v in handle.attrs.items() if k not in inherited}
+                self._record(
+                    {
+                        # issue first so readers can filter lines by prefix
+                        "issue": inherited.get("issue"),
+                        "pr": inherited.get("pr"),
+                        "name": name,
+                        "trace_id": ctx.trace_id,
+                        "span_id": ctx.span_id,
+                        "parent_id": parent.span_id if parent else None,
+                        "start": round(start_wall, 3),
+                        "duration_ms": round(duration_ms, 1),
+                        "status": status,
+                        "attrs": extra,
+                    },
+                    flush=parent is None,
+                )
+
+    def _record(self, record: dict[str, Any], *, flush: bool) -> None:
+        try:
+            line = json.dumps(record, default=str)
+        except (TypeError, ValueError):
+            logger.debug("Dropping unserializable span %s", record.get("name"))
+            return
+        with self._lock:
+            self._buffer.append(line)
+            if flush or len(self._buffer) >= _FLUSH_BATCH:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write buffered spans to the span file."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        payload = "".join(line + "\n" for line in self._buffer)
+        self._buffer.clear()
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with contextlib.suppress(FileNotFoundError):
+                if self._path.stat().st_size >= _MAX_FILE_BYTES:
+                    self._path.replace(self._path.with_name(SPAN_FILE + ".1"))
+            with open(self._path, "a") as f:
+                f.write(payload)
+        except OSError:
+            logger.warning("Could not write spans to %s", self._path, exc_info=True)
+
+
+_tracer: Tracer | None = None
+
+
+def configure_tracing(config: HydraFlowConfig) -> None:
+    """Install the process-wide tracer according to *config*.
+
+    Tracing stays disabled unless ``config.tracing_enabled`` is set.
+    """
+    global _tracer  # noqa: PLW0603
+    if not config.tracing_enabled:
+        _tracer = None
+        return
+    _tracer = Tracer(
+        config.data_path("traces", SPAN_FILE),
+        sample_rate=config.tracing_sample_rate,
+        min_duration_ms=config.tracing_min_span_ms,
+    )
+
+
+def get_tracer() -> Tracer | None:
+    """Return the process-wide tracer, or None when tracing is disabled."""
+    return _tracer
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """Open a span on the process-wide tracer (no-op when disabled)."""
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, **attrs) as handle:
+        yield handle
+
+
+@contextmanager
+def child_span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """Like :func:`span`, but a no-op unless a parent span is active.
+
+    For frequent operations (subprocess calls) that are only worth
+    recording inside a traced unit of work, not as traces of their own.
+    """
+    if _tracer is None or _current.get() is None:
+        yield None
+        return
+    with span(name, **attrs) as handle:
+        yield handle
+
+
+def load_issue_spans(path: Path, issue_number: int) -> list[dict[str, Any]]:
+    """Return exported spans tagged with *issue_number*, oldest file first."""
+    needle = f'{{"issue": {issue_number},'
+    spans: list[dict[str, Any]] = []
+    for candidate in (path.with_name(path.name + ".1"), path):
+        try:
+            with open(candidate) as f:
+                for line in f:
+                    if not line.startswith(needle):
+                        continue
+                    try:
+                        spans.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except OSError:
+            continue
+    return spans
+
+
+def build_waterfall(issue_number: int, spans: list[dict[str, Any]]) -> dict[str, Any]:
+    """Arrange *spans* into a waterfall with a per-name latency breakdown.
+
+    Each span gets ``offset_ms`` (from the first span's start), ``depth``
+    and ``self_ms`` — its duration minus that of its direct children — so
+    the breakdown attributes nested time once.
+    """
+    if not spans:
+        return {"issue": issue_number, "total_ms": 0.0, "spans": [], "breakdown": []}
+    by_id = {s.get("span_id"): s for s in spans}
+    child_ms: dict[str, float] = {}
+    depths: dict[int, int] = {}
+    for s in spans:
+        parent_id = s.get("parent_id")
+        if parent_id in by_id:
+            child_ms[parent_id] = child_ms.get(parent_id, 0.0) + s["duration_ms"]
+        depth = 0
+        while parent_id in by_id and depth < 64:
+            depth += 1
+            parent_id = by_id[parent_id].get("parent_id")
+        depths[id(s)] = depth
+    # Parents before children when starts tie at millisecond resolution
+    ordered = sorted(spans, key=lambda s: (s["start"], depths[id(s)]))
+
+    t0 = ordered[0]["start"]
+    end = t0
+    rows: list[dict[str, Any]] = []
+    breakdown: dict[str, dict[str, Any]] = {}
+    for s in ordered:
+        self_ms = max(0.0, s["duration_ms"] - child_ms.get(s.get("span_id"), 0.0))
+        end = max(end, s["start"] + s["duration_ms"] / 1000)
+        rows.append(
+            {
+                **s,
+                "offset_ms": round((s["start"] - t0) * 1000, 1),
+                "depth": depths[id(s)],
+                "self_ms": round(self_ms, 1),
+            }
+        )
+        agg = breakdown.setdefault(
+            s["name"], {"name": s["name"], "count": 0, "total_ms": 0.0, "self_ms": 0.0}
+        )
+        agg["count"] += 1
+        agg["total_ms"] = round(agg["total_ms"] + s["duration_ms"], 1)
+        agg["self_ms"] = round(agg["self_ms"] + self_ms, 1)
+
+    return {
+        "issue": issue_number,
+        "total_ms": round((end - t0) * 1000, 1),
+        "spans": rows,
+        "breakdown": sorted(breakdown.values(), key=lambda a: -a["self_ms"]),
+    }
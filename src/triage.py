@@ -18,6 +18,7 @@ from models import (
     TriageResult,
     TriageStatus,
 )
+from prompt_layers import PromptLayers
 from prompt_stats import build_prompt_stats, truncate_with_notice
 from subprocess_util import CreditExhaustedError
 
@@ -194,14 +195,7 @@ class TriageRunner(BaseRunner):
         body, body_before, body_after = truncate_with_notice(
             issue.body or "", max_body, label="Issue body"
         )
-        prompt = f"""You are a triage agent evaluating a GitHub issue and enriching it if needed so a planning agent can succeed.
-
-## Issue #{issue.id}
-
-**Title:** {issue.title}
-
-**Body:**
-{body}
+        phase = """You are a triage agent evaluating the GitHub issue at the end of this prompt and enriching it if needed so a planning agent can succeed.
 
 ## Evaluation Criteria
 
@@ -229,15 +223,24 @@ Also classify the issue as one of:
 Return ONLY a JSON object in this exact format, with no other text:
 
 ```json
-{{"ready": true, "reasons": [], "issue_type": "feature", "enrichment": "## Triage Enrichment\\n\\n**Interpreted intent:** ...\\n**Affected area:** ...\\n**Acceptance criteria:**\\n- ..."}}
+{"ready": true, "reasons": [], "issue_type": "feature", "enrichment": "## Triage Enrichment\\n\\n**Interpreted intent:** ...\\n**Affected area:** ...\\n**Acceptance criteria:**\\n- ..."}
 ```
 
 or for truly insufficient issues:
 
 ```json
-{{"ready": false, "reasons": ["Specific reason why this cannot proceed"], "issue_type": "bug", "enrichment": ""}}
+{"ready": false, "reasons": ["Specific reason why this cannot proceed"], "issue_type": "bug", "enrichment": ""}
 ```
 """
+        issue_layer = f"""## Issue #{issue.id}
+
+**Title:** {issue.title}
+
+**Body:**
+{body}
+"""
+        layers = PromptLayers(phase=phase, issue=issue_layer)
+        prompt = layers.render()
         stats = build_prompt_stats(
             context_before=body_before,
             context_after=body_after,
@@ -246,6 +249,7 @@ or for truly insufficient issues:
                 "issue_body_after": body_after,
             },
         )
+        stats.update(layers.stats())
         return prompt, stats
 
     @staticmethod
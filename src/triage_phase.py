@@ -6,6 +6,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from agent_scheduler import agent_slot
 from config import HydraFlowConfig
 from events import EventBus, EventType, HydraFlowEvent
 from issue_store import IssueStore
@@ -76,11 +77,14 @@ class TriagePhase:
 
             self._enrich_parent_epic(issue)
 
-            async with store_lifecycle(self._store, issue.id, "find"):
-                try:
+            try:
+                async with (
+                    agent_slot("triage", issue),
+                    store_lifecycle(self._store, issue.id, "find"),
+                ):
                     return await self._triage_single(issue)
-                finally:
-                    release_batch_in_flight(self._store, {issue.id})
+            finally:
+                release_batch_in_flight(self._store, {issue.id})
 
         results = await run_refilling_pool(
             supply_fn=lambda: self._store.get_triageable(1),
@@ -15,6 +15,7 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from jsonl_store import JsonlStore
 from models import IsoTimestamp
 
 logger = logging.getLogger("hydraflow.troubleshooting_store")
@@ -50,12 +51,27 @@ class TroubleshootingPattern(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+def _pattern_key(pattern: TroubleshootingPattern) -> tuple[str, str]:
+    return (pattern.language.lower(), pattern.pattern_name.lower())
+
+
 class TroubleshootingPatternStore:
-    """JSONL-backed store for learned troubleshooting patterns."""
+    """JSONL-backed store for learned troubleshooting patterns.
+
+    Updates append the merged record rather than rewriting the file; the
+    latest line per ``(language, pattern_name)`` wins and superseded lines
+    are compacted away in the background.
+    """
 
     def __init__(self, memory_dir: Path) -> None:
         self._memory_dir = memory_dir
         self._path = memory_dir / "troubleshooting_patterns.jsonl"
+        self._store = JsonlStore(
+            self._path,
+            TroubleshootingPattern,
+            key=_pattern_key,
+            label="troubleshooting pattern",
+        )
 
     def append_pattern(self, pattern: TroubleshootingPattern) -> None:
         """Append or merge *pattern* into the store.
@@ -63,24 +79,16 @@ class TroubleshootingPatternStore:
         Deduplicates by ``(language, pattern_name)`` — on collision the
         existing record's frequency and source_issues are merged.
         """
-        all_patterns = self._load_all()
-        key = (pattern.language.lower(), pattern.pattern_name.lower())
-        merged = False
-
-        for i, existing in enumerate(all_patterns):
-            if (existing.language.lower(), existing.pattern_name.lower()) == key:
+        key = _pattern_key(pattern)
+        for existing in self._load_all():
+            if _pattern_key(existing) == key:
                 existing.frequency += pattern.frequency
                 existing.source_issues = sorted(
                     set(existing.source_issues) | set(pattern.source_issues)
                 )
-                all_patterns[i] = existing
-                merged = True
-                break
-
-        if not merged:
-            all_patterns.append(pattern)
-
-        self._write_all(all_patterns)
+                self._append(existing)
+                return
+        self._append(pattern)
 
     def load_patterns(
         self, *, language: str | None = None, limit: int | None = 10
@@ -103,46 +111,24 @@ class TroubleshootingPatternStore:
 
     def increment_frequency(self, language: str, pattern_name: str) -> None:
         """Bump the frequency counter for an existing pattern."""
-        all_patterns = self._load_all()
         key = (language.lower(), pattern_name.lower())
-        for i, existing in enumerate(all_patterns):
-            if (existing.language.lower(), existing.pattern_name.lower()) == key:
+        for existing in self._load_all():
+            if _pattern_key(existing) == key:
                 existing.frequency += 1
-                all_patterns[i] = existing
-                self._write_all(all_patterns)
+                self._append(existing)
                 return
 
     # -- internal ---------------------------------------------------------
 
     def _load_all(self) -> list[TroubleshootingPattern]:
-        if not self._path.exists():
-            return []
         try:
-            lines = self._path.read_text().strip().splitlines()
+            return self._store.latest()
         except OSError:
             return []
-        patterns: list[TroubleshootingPattern] = []
-        for line in lines:
-            if not line.strip():
-                continue
-            try:
-                patterns.append(TroubleshootingPattern.model_validate_json(line))
-            except Exception:  # noqa: BLE001
-                logger.warning(
-                    "Skipping malformed troubleshooting pattern: %s", line[:80]
-                )
-        return patterns
 
-    def _write_all(self, patterns: list[TroubleshootingPattern]) -> None:
+    def _append(self, pattern: TroubleshootingPattern) -> None:
         try:
-            import os  # noqa: PLC0415
-
-            self._memory_dir.mkdir(parents=True, exist_ok=True)
-            with self._path.open("w") as f:
-                for p in patterns:
-                    f.write(p.model_dump_json() + "\n")
-                f.flush()
-                os.fsync(f.fileno())
+            self._store.append(pattern)
         except OSError:
             logger.warning(
                 "Could not write troubleshooting patterns to %s",
@@ -98,7 +98,7 @@ function EpicContainer({ epicNumber, issues, children }) {
   )
 }
 
-function StageSection({ stage, issues, workerCount, workerCap, queuedCount, intentMap, onRequestChanges, open, onToggle, enabled, dotColor, workers, prs }) {
+function StageSection({ stage, issues, workerCount, workerCap, slotWait, queuedCount, intentMap, onRequestChanges, open, onToggle, enabled, dotColor, workers, prs }) {
   const failedCount = issues.filter(i => i.overallStatus === 'failed').length
   const hitlCount = issues.filter(i => i.overallStatus === 'hitl').length
   const hasRole = !!stage.role
@@ -129,6 +129,11 @@ function StageSection({ stage, issues, workerCount, workerCap, queuedCount, inte
                   ? ` · ${workerCount}/${workerCap} workers`
                   : ` · ${workerCount} ${workerCount === 1 ? 'worker' : 'workers'}`}
               </span>
+              {slotWait > 0 && (
+                <span data-testid={`stage-slot-wait-${stage.key}`}>
+                  {` · ~${slotWait < 10 ? slotWait.toFixed(1) : Math.round(slotWait)}s slot wait`}
+                </span>
+              )}
             </>
           ) : (
             <span>{issues.length} merged</span>
@@ -474,6 +479,7 @@ export function StreamView({ intents, expandedStages, onToggleStage, onRequestCh
         const enabled = status.enabled !== false
         const workerCount = status.workerCount || 0
         const workerCap = stage.role ? (stageStatus.workerCaps?.[stage.key] ?? null) : null
+        const slotWait = stage.role ? (stageStatus.slotWaits?.[stage.key] ?? 0) : 0
         let dotColor
         if (!stage.role) {
           dotColor = theme.green
@@ -491,6 +497,7 @@ export function StreamView({ intents, expandedStages, onToggleStage, onRequestCh
             issues={stageIssues}
             workerCount={workerCount}
             workerCap={workerCap}
+            slotWait={slotWait}
             queuedCount={status.queuedCount || 0}
             intentMap={intentMap}
             onRequestChanges={stage.role ? onRequestChanges : undefined}
@@ -110,6 +110,21 @@ describe('deriveStageStatus', () => {
     })
   })
 
+  it('exposes per-phase slot waits from pipelineStats', () => {
+    const stats = makePipelineStats({
+      implement: { queued: 3, active: 2, completed_session: 0, completed_lifetime: 0, worker_count: 2, worker_cap: 4, slot_wait_seconds: 12.5 },
+    })
+
+    const result = deriveStageStatus(emptyPipeline, {}, [], stats)
+
+    expect(result.slotWaits).toEqual({
+      triage: 0,
+      plan: 0,
+      implement: 12.5,
+      review: 0,
+    })
+  })
+
   it('gets issueCount from pipelineIssues (for card rendering)', () => {
     const pipeline = {
       ...emptyPipeline,
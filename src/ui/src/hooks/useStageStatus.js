@@ -11,7 +11,7 @@ const LOOP_KEYS = new Set(PIPELINE_LOOPS.map(l => l.key))
  * Returns an object keyed by stage key with per-stage metrics, plus a `workload` aggregate.
  *
  * pipelineStats (from backend) is the single source of truth for all aggregate numbers:
- * sessionCount, activeCount, queuedCount, workerCount, workerCaps, and merged done count.
+ * sessionCount, activeCount, queuedCount, workerCount, workerCaps, slotWaits and merged done count.
  * pipelineIssues is only used for issueCount (card rendering) and workload open-issue totals.
  *
  * @param {Object} pipelineIssues - Issues per stage { triage: [...], plan: [...], ... }
@@ -34,6 +34,14 @@ export function deriveStageStatus(pipelineIssues, workers, backgroundWorkers, pi
     review: stages.review?.worker_cap ?? null,
   }
 
+  // Average wait (seconds) for a global agent slot, per phase
+  const slotWaits = {
+    triage: stages.triage?.slot_wait_seconds ?? 0,
+    plan: stages.plan?.slot_wait_seconds ?? 0,
+    implement: stages.implement?.slot_wait_seconds ?? 0,
+    review: stages.review?.slot_wait_seconds ?? 0,
+  }
+
   for (const stage of PIPELINE_STAGES) {
     const stageIssues = issues[stage.key] || []
     const ss = stages[stage.key]
@@ -76,6 +84,7 @@ export function deriveStageStatus(pipelineIssues, workers, backgroundWorkers, pi
 
   stageStatus.workload = workload
   stageStatus.workerCaps = workerCaps
+  stageStatus.slotWaits = slotWaits
 
   return stageStatus
 }
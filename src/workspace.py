@@ -18,7 +18,10 @@ import stat
 from pathlib import Path
 
 from config import HydraFlowConfig
+from execution import SubprocessRunner
 from subprocess_util import run_subprocess
+from tracing import span
+from workspace_disk import WorkspaceDiskAccountant
 
 logger = logging.getLogger("hydraflow.workspace")
 
@@ -43,6 +46,16 @@ class WorkspaceManager:
         self._repo_root = config.repo_root
         self._base = config.worktree_base
         self._ui_dirs = self._detect_ui_dirs()
+        self._disk: WorkspaceDiskAccountant | None = None
+        self._runner: SubprocessRunner | None = None
+
+    def set_disk_accountant(self, accountant: WorkspaceDiskAccountant) -> None:
+        """Enforce the workspace disk quota through *accountant* on create."""
+        self._disk = accountant
+
+    def set_subprocess_runner(self, runner: SubprocessRunner) -> None:
+        """Release *runner*'s per-workspace resources when a workspace is destroyed."""
+        self._runner = runner
 
     def _detect_ui_dirs(self) -> list[str]:
         """Auto-detect UI directories by scanning for ``package.json`` files.
@@ -391,8 +404,9 @@ class WorkspaceManager:
 
         Returns the absolute path to the new workspace.
         """
-        async with self._repo_workspace_lock():
-            return await self._create_unlocked(issue_number, branch)
+        with span("workspace.create", issue=issue_number):
+            async with self._repo_workspace_lock():
+                return await self._create_unlocked(issue_number, branch)
 
     async def _create_unlocked(self, issue_number: int, branch: str) -> Path:
         """Inner create logic — must be called under ``_repo_workspace_lock``."""
@@ -408,6 +422,9 @@ class WorkspaceManager:
             logger.info("[dry-run] Would create workspace at %s", wt_path)
             return wt_path
 
+        # Make room under the disk quota before adding another workspace
+        await self._enforce_disk_quota(issue_number)
+
         # Pre-work hygiene: fetch latest main
         await self.pre_work_check()
 
@@ -506,6 +523,26 @@ class WorkspaceManager:
         )
         return wt_path
 
+    async def _enforce_disk_quota(self, issue_number: int) -> None:
+        """Evict oldest idle workspaces until usage is under the disk quota.
+
+        Must be called under ``_repo_workspace_lock``.  Failures are logged
+        and never block workspace creation.
+        """
+        if self._disk is None:
+            return
+        try:
+            victims = await asyncio.to_thread(self._disk.plan_evictions, {issue_number})
+            for victim in victims:
+                logger.warning(
+                    "Workspace disk quota exceeded — evicting idle workspace for issue #%d",
+                    victim,
+                )
+                await self._destroy_unlocked(victim)
+                self._disk.record_eviction(victim)
+        except Exception:
+            logger.warning("Workspace disk quota enforcement failed", exc_info=True)
+
     async def destroy(self, issue_number: int) -> None:
         """Remove the workspace for *issue_number*."""
         async with self._repo_workspace_lock():
@@ -518,6 +555,13 @@ class WorkspaceManager:
             logger.info("[dry-run] Would destroy workspace %s", wt_path)
             return
 
+        if self._runner is not None:
+            try:
+                await self._runner.release_workspace(str(wt_path))
+            except Exception:
+                logger.warning(
+                    "Could not release runner resources for %s", wt_path, exc_info=True
+                )
         if wt_path.exists():
             shutil.rmtree(wt_path, ignore_errors=True)
             logger.info(
@@ -525,6 +569,16 @@ class WorkspaceManager:
                 wt_path,
                 extra={"issue": issue_number},
             )
+        self._remove_quality_spills(wt_path)
+
+    def _remove_quality_spills(self, wt_path: Path) -> None:
+        """Delete spilled ``make quality`` output kept for *wt_path*."""
+        prefix = self._config.quality_spill_path(wt_path)
+        if not prefix.parent.is_dir():
+            return
+        for spill in prefix.parent.glob(f"{prefix.name}.*.log"):
+            with contextlib.suppress(OSError):
+                spill.unlink()
 
     async def destroy_all(self) -> None:
         """Remove every workspace under this repo's scoped base directory."""
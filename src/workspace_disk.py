@@ -0,0 +1,215 @@
+"""Disk accounting and quota enforcement for issue workspaces.
+
+Each workspace carries a venv, ``node_modules`` copies and build outputs,
+so a busy repo can fill the disk.  :class:`WorkspaceDiskAccountant` sizes
+each ``issue-*`` workspace with :func:`file_util.dir_size_bytes` through a
+:class:`file_util.DirListingCache`, so a rescan only re-lists directories
+whose entries changed.  Hardlinked files are counted once in the total,
+which keeps objects hardlinked by ``git clone --local`` from being counted
+per workspace.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable, Collection
+from pathlib import Path
+from typing import Any
+
+from config import HydraFlowConfig
+from file_util import DirListingCache, dir_size_bytes
+from state import StateTracker
+
+logger = logging.getLogger("hydraflow.workspace_disk")
+
+_MB = 1024 * 1024
+
+
+def is_workspace_busy(
+    state: StateTracker,
+    issue_number: int,
+    is_in_pipeline: Callable[[int], bool] | None = None,
+) -> bool:
+    """Return True when the issue's workspace may still be in use.
+
+    An issue is busy while it is active, parked in HITL, or queued in the
+    pipeline.  Shared by workspace GC and disk-quota eviction.
+    """
+    return (
+        issue_number in state.get_active_issue_numbers()
+        or state.get_hitl_cause(issue_number) is not None
+        or bool(is_in_pipeline and is_in_pipeline(issue_number))
+    )
+
+
+class WorkspaceDiskAccountant:
+    """Tracks disk usage of ``issue-*`` workspaces and picks eviction victims.
+
+    Scans are blocking; async callers should run them via
+    :func:`asyncio.to_thread`.  The listing cache is thread-safe, so the
+    dashboard and workspace creation can scan concurrently.
+    """
+
+    def __init__(
+        self,
+        config: HydraFlowConfig,
+        state: StateTracker,
+        is_in_pipeline_cb: Callable[[int], bool] | None = None,
+        *,
+        rescan_after: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config
+        self._state = state
+        self._is_in_pipeline = is_in_pipeline_cb
+        self._listings = DirListingCache(rescan_after=rescan_after, clock=clock)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _list_workspaces(self) -> dict[int, Path]:
+        """Return ``{issue_number: path}`` for workspace dirs on disk."""
+        repo_wt_base = self._config.worktree_base / self._config.repo_slug
+        if not repo_wt_base.is_dir():
+            return {}
+        workspaces: dict[int, Path] = {}
+        for child in repo_wt_base.iterdir():
+            if not child.name.startswith("issue-") or not child.is_dir():
+                continue
+            try:
+                workspaces[int(child.name.split("-", 1)[1])] = child
+            except (ValueError, IndexError):
+                continue
+        return workspaces
+
+    def _scan_all(
+        self,
+    ) -> tuple[dict[int, int], dict[int, dict[tuple[int, int], int]], dict[int, Path]]:
+        """Scan every workspace.
+
+        Returns ``(per_issue_bytes, per_issue_linked, paths)`` where
+        *per_issue_linked* maps each workspace's hardlinked inodes to bytes.
+        """
+        workspaces = self._list_workspaces()
+        per_issue: dict[int, int] = {}
+        per_issue_linked: dict[int, dict[tuple[int, int], int]] = {}
+        for issue_number, path in workspaces.items():
+            linked: dict[tuple[int, int], int] = {}
+            per_issue[issue_number] = dir_size_bytes(
+                path, linked=linked, cache=self._listings
+            )
+            per_issue_linked[issue_number] = linked
+        # Forget directories of workspaces that no longer exist.
+        self._listings.prune()
+        return per_issue, per_issue_linked, workspaces
+
+    @staticmethod
+    def _total(
+        per_issue: dict[int, int],
+        per_issue_linked: dict[int, dict[tuple[int, int], int]],
+    ) -> int:
+        """Return the combined size, counting shared hardlinked files once."""
+        all_linked: dict[tuple[int, int], int] = {}
+        unlinked = 0
+        for issue_number, size in per_issue.items():
+            linked = per_issue_linked[issue_number]
+            unlinked += size - sum(linked.values())
+            all_linked.update(linked)
+        return unlinked + sum(all_linked.values())
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_usage_stats(self) -> dict[str, Any]:
+        """Return total and per-workspace usage for the dashboard."""
+        per_issue, per_issue_linked, paths = self._scan_all()
+        total = self._total(per_issue, per_issue_linked)
+        quota_mb = self._config.worktree_disk_quota_mb
+        workspaces = [
+            {
+                "issue_number": issue_number,
+                "bytes": size,
+                "mb": round(size / _MB, 2),
+                "last_used": self._last_used(paths[issue_number]),
+                "idle": not self._is_busy(issue_number),
+            }
+            for issue_number, size in sorted(
+                per_issue.items(), key=lambda item: item[1], reverse=True
+            )
+        ]
+        return {
+            "total_bytes": total,
+            "total_mb": round(total / _MB, 2),
+            "quota_mb": quota_mb,
+            "over_quota": bool(quota_mb) and total > quota_mb * _MB,
+            "workspaces": workspaces,
+        }
+
+    def plan_evictions(self, exclude: Collection[int] = ()) -> list[int]:
+        """Return idle workspaces to evict, oldest first, to get under quota.
+
+        Usage is scanned once; each victim's size is subtracted locally,
+        with hardlinked files freed only once no remaining workspace shares
+        them.  Issues in *exclude* and issues still active, in HITL or
+        queued in the pipeline are never returned.
+        """
+        quota_mb = self._config.worktree_disk_quota_mb
+        if quota_mb <= 0:
+            return []
+        per_issue, per_issue_linked, paths = self._scan_all()
+        total = self._total(per_issue, per_issue_linked)
+        quota = quota_mb * _MB
+        if total <= quota:
+            return []
+        candidates = sorted(
+            (n for n in paths if n not in exclude and not self._is_busy(n)),
+            key=lambda n: self._last_used(paths[n]),
+        )
+        shared = Counter(key for linked in per_issue_linked.values() for key in linked)
+        victims: list[int] = []
+        for issue_number in candidates:
+            if total <= quota:
+                break
+            linked = per_issue_linked[issue_number]
+            freed = per_issue[issue_number] - sum(linked.values())
+            for key, size in linked.items():
+                shared[key] -= 1
+                if not shared[key]:
+                    freed += size
+            total -= freed
+            victims.append(issue_number)
+        if total > quota:
+            logger.warning(
+                "Workspace disk usage %.1f MB exceeds quota %d MB "
+                "but no more idle workspaces can be evicted",
+                total / _MB,
+                quota_mb,
+            )
+        return victims
+
+    def record_eviction(self, issue_number: int) -> None:
+        """Drop the state entry for an evicted workspace."""
+        self._state.remove_worktree(issue_number)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _is_busy(self, issue_number: int) -> bool:
+        """Return True when the issue's workspace may still be in use."""
+        return is_workspace_busy(self._state, issue_number, self._is_in_pipeline)
+
+    @staticmethod
+    def _last_used(path: Path) -> float:
+        """Return the latest mtime of the workspace dir and its git index."""
+        latest = 0.0
+        for candidate in (path, path / ".git" / "index", path / ".git" / "HEAD"):
+            try:
+                latest = max(latest, candidate.stat().st_mtime)
+            except OSError:
+                continue
+        return latest
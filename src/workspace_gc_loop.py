@@ -3,25 +3,49 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import re
+import subprocess
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from typing import Any
 
 from base_background_loop import BaseBackgroundLoop
 from config import HydraFlowConfig
 from events import EventBus
+from file_util import dir_size_bytes
 from models import StatusCallback
 from pr_manager import PRManager
 from state import StateTracker
-from subprocess_util import run_subprocess
+from subprocess_util import AuthenticationError, run_subprocess
 from workspace import WorkspaceManager
+from workspace_disk import is_workspace_busy
 
 logger = logging.getLogger("hydraflow.workspace_gc_loop")
 
 # Maximum worktrees to GC per cycle to avoid long-running passes.
 _MAX_GC_PER_CYCLE = 20
 
+# Per-cycle cap when decisions come from the batched snapshot.  Lookups
+# cost a handful of API calls regardless of count, so the cap only bounds
+# destroy work.
+_MAX_BATCH_GC_PER_CYCLE = 200
+
+# Issues per GraphQL query in the batched snapshot.
+_SNAPSHOT_CHUNK_SIZE = 50
+
+# Concurrent workspace destroys in the batched pass.
+_GC_DESTROY_CONCURRENCY = 4
+
+
+@dataclass(slots=True)
+class _IssueSnapshot:
+    """GitHub state of one issue as seen by the batched GC pass."""
+
+    state: str
+    labels: frozenset[str]
+
 
 class WorkspaceGCLoop(BaseBackgroundLoop):
     """Periodically garbage-collects stale worktrees and orphaned branches.
@@ -63,23 +87,61 @@ class WorkspaceGCLoop(BaseBackgroundLoop):
         return self._config.worktree_gc_interval
 
     async def _do_work(self) -> dict[str, Any] | None:
-        """Run one GC cycle: state workspaces, orphan dirs, orphan branches."""
+        """Run one GC cycle: state workspaces, orphan dirs, orphan branches.
+
+        Decisions are made from one batched GitHub snapshot when it can be
+        fetched; otherwise each issue is checked individually with a
+        smaller per-cycle cap.
+        """
+        active_worktrees = self._state.get_active_worktrees()
+
+        batched = await self._collect_batched(active_worktrees)
+        if batched is not None:
+            collected, skipped, errors, bytes_reclaimed = batched
+            budget = _MAX_BATCH_GC_PER_CYCLE
+        else:
+            collected, skipped, errors, bytes_reclaimed = await self._collect_serial(
+                active_worktrees
+            )
+            budget = _MAX_GC_PER_CYCLE
+
+        # Phase 3: delete orphaned agent/issue-* local branches
+        if not self._stop_event.is_set():
+            branch_count = await self._collect_orphaned_branches(budget - collected)
+            collected += branch_count
+
+        return {
+            "collected": collected,
+            "skipped": skipped,
+            "errors": errors,
+            "bytes_reclaimed": bytes_reclaimed,
+        }
+
+    async def _collect_serial(
+        self, active_worktrees: dict[int, str]
+    ) -> tuple[int, int, int, int]:
+        """Check and collect workspaces one issue at a time.
+
+        Returns ``(collected, skipped, errors, bytes_reclaimed)``.
+        """
         collected = 0
         skipped = 0
         errors = 0
+        bytes_reclaimed = 0
 
         # Phase 1: GC workspaces tracked in state
-        active_worktrees = self._state.get_active_worktrees()
         for issue_number in list(active_worktrees.keys()):
             if self._stop_event.is_set() or collected >= _MAX_GC_PER_CYCLE:
                 break
             try:
                 if await self._is_safe_to_gc(issue_number):
+                    size = await self._workspace_size(issue_number)
                     # Remove from state first so a crash between steps
                     # leaves the entry gone (destroy is idempotent).
                     self._state.remove_worktree(issue_number)
                     await self._worktrees.destroy(issue_number)
                     collected += 1
+                    bytes_reclaimed += size
                     logger.info("GC: collected workspace for issue #%d", issue_number)
                 else:
                     skipped += 1
@@ -98,14 +160,231 @@ class WorkspaceGCLoop(BaseBackgroundLoop):
             )
             collected += orphan_count
 
-        # Phase 3: delete orphaned agent/issue-* local branches
-        if not self._stop_event.is_set():
-            branch_count = await self._collect_orphaned_branches(
-                _MAX_GC_PER_CYCLE - collected
+        return collected, skipped, errors, bytes_reclaimed
+
+    async def _collect_batched(
+        self, active_worktrees: dict[int, str]
+    ) -> tuple[int, int, int, int] | None:
+        """Decide GC eligibility for all candidates from one bulk snapshot.
+
+        Covers tracked workspaces and orphaned ``issue-*`` dirs, then
+        destroys eligible ones concurrently.  Returns
+        ``(collected, skipped, errors, bytes_reclaimed)``, or ``None`` when
+        the snapshot could not be fetched and the serial path should run.
+        """
+        tracked = set(active_worktrees)
+        orphans = [n for n in self._list_orphaned_dirs() if n not in tracked]
+        all_issues = [*active_worktrees.keys(), *orphans]
+        candidates = [n for n in all_issues if not self._is_locally_busy(n)]
+        if not candidates:
+            return 0, len(all_issues), 0, 0
+
+        snapshot = await self._fetch_gc_snapshot(candidates)
+        if snapshot is None:
+            return None
+        issues, open_heads = snapshot
+
+        pipeline_labels = self._pipeline_labels()
+        eligible: list[int] = []
+        for issue_number in candidates:
+            info = issues.get(issue_number)
+            if info is None:
+                continue
+            if info.state == "closed" or (
+                info.state == "open"
+                and not (info.labels & pipeline_labels)
+                and self._config.branch_for_issue(issue_number) not in open_heads
+            ):
+                eligible.append(issue_number)
+        skipped = len(all_issues) - len(eligible)
+        eligible = eligible[:_MAX_BATCH_GC_PER_CYCLE]
+
+        semaphore = asyncio.Semaphore(_GC_DESTROY_CONCURRENCY)
+
+        async def _destroy(issue_number: int) -> int | None:
+            """Destroy one workspace; ``None`` when it was skipped."""
+            async with semaphore:
+                # Re-check: the issue may have been picked up while queued.
+                if self._stop_event.is_set() or self._is_locally_busy(issue_number):
+                    return None
+                size = await self._workspace_size(issue_number)
+                if issue_number in tracked:
+                    self._state.remove_worktree(issue_number)
+                await self._worktrees.destroy(issue_number)
+                logger.info("GC: collected workspace for issue #%d", issue_number)
+                return size
+
+        results = await asyncio.gather(
+            *(_destroy(n) for n in eligible), return_exceptions=True
+        )
+        collected = 0
+        errors = 0
+        bytes_reclaimed = 0
+        for issue_number, outcome in zip(eligible, results, strict=True):
+            if outcome is None:
+                skipped += 1
+            elif isinstance(outcome, BaseException):
+                logger.warning(
+                    "GC: failed to collect workspace for issue #%d",
+                    issue_number,
+                    exc_info=outcome,
+                )
+                errors += 1
+            else:
+                collected += 1
+                bytes_reclaimed += outcome
+        logger.info(
+            "GC: batched pass collected %d workspace(s), reclaimed %d bytes",
+            collected,
+            bytes_reclaimed,
+        )
+        return collected, skipped, errors, bytes_reclaimed
+
+    def _is_locally_busy(self, issue_number: int) -> bool:
+        """Return True when local state says the issue is still being worked."""
+        return is_workspace_busy(self._state, issue_number, self._is_in_pipeline)
+
+    async def _workspace_size(self, issue_number: int) -> int:
+        """Return the on-disk size of the issue's workspace directory."""
+        path = self._config.worktree_path_for_issue(issue_number)
+        return await asyncio.to_thread(dir_size_bytes, path)
+
+    async def _fetch_gc_snapshot(
+        self, issue_numbers: list[int]
+    ) -> tuple[dict[int, _IssueSnapshot], set[str]] | None:
+        """Fetch state/labels for *issue_numbers* and all open PR head branches.
+
+        Returns ``None`` on any failure so the caller falls back to
+        per-issue checks.
+        """
+        try:
+            issues: dict[int, _IssueSnapshot] = {}
+            for start in range(0, len(issue_numbers), _SNAPSHOT_CHUNK_SIZE):
+                chunk = issue_numbers[start : start + _SNAPSHOT_CHUNK_SIZE]
+                issues.update(await self._fetch_issue_chunk(chunk))
+            open_heads = await self._fetch_open_pr_heads()
+        except Exception:
+            logger.debug(
+                "GC: batched snapshot failed — falling back to per-issue checks",
+                exc_info=True,
             )
-            collected += branch_count
+            return None
+        return issues, open_heads
 
-        return {"collected": collected, "skipped": skipped, "errors": errors}
+    async def _fetch_issue_chunk(
+        self, issue_numbers: list[int]
+    ) -> dict[int, _IssueSnapshot]:
+        """Fetch state and labels for up to ``_SNAPSHOT_CHUNK_SIZE`` issues."""
+        owner, _, name = self._config.repo.partition("/")
+        fields = " ".join(
+            f"i{n}: issueOrPullRequest(number: {n}) {{"
+            " ... on Issue { state labels(first: 100) { nodes { name } } }"
+            " ... on PullRequest { state labels(first: 100) { nodes { name } } }"
+            " }"
+            for n in issue_numbers
+        )
+        query = (
+            "query($owner: String!, $name: String!) {"
+            f" repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        )
+        try:
+            output = await run_subprocess(
+                "gh",
+                "api",
+                "graphql",
+                "-f",
+                f"query={query}",
+                "-F",
+                f"owner={owner}",
+                "-F",
+                f"name={name}",
+                cwd=self._config.repo_root,
+                gh_token=self._config.gh_token,
+            )
+            body = json.loads(output)
+        except AuthenticationError:
+            raise
+        except RuntimeError as exc:
+            body = self._partial_graphql_body(exc)
+        repository = (body.get("data") or {}).get("repository") or {}
+        result: dict[int, _IssueSnapshot] = {}
+        for n in issue_numbers:
+            node = repository.get(f"i{n}")
+            if not node:
+                continue
+            labels = frozenset(
+                label["name"].lower()
+                for label in (node.get("labels") or {}).get("nodes", [])
+            )
+            result[n] = _IssueSnapshot(
+                state=str(node.get("state", "")).lower(), labels=labels
+            )
+        return result
+
+    @staticmethod
+    def _partial_graphql_body(exc: RuntimeError) -> dict[str, Any]:
+        """Return the response of a failed ``gh api graphql`` call if it is usable.
+
+        ``gh`` exits non-zero when any alias cannot be resolved (e.g. an
+        orphaned dir for a deleted or transferred issue) but still prints
+        the other aliases.  Re-raises *exc* unless every error is NOT_FOUND.
+        """
+        cause = exc.__cause__
+        output = (
+            cause.output if isinstance(cause, subprocess.CalledProcessError) else ""
+        )
+        try:
+            body = json.loads(output or "")
+        except json.JSONDecodeError:
+            raise exc from None
+        errors = body.get("errors") if isinstance(body, dict) else None
+        if not isinstance(errors, list) or not all(
+            isinstance(err, dict) and err.get("type") == "NOT_FOUND" for err in errors
+        ):
+            raise exc
+        logger.debug(
+            "GC: %d issue number(s) could not be resolved — skipping them",
+            len(errors),
+        )
+        return body
+
+    async def _fetch_open_pr_heads(self) -> set[str]:
+        """Return head branch names of all open PRs in the repo, across pages."""
+        owner, _, name = self._config.repo.partition("/")
+        query = (
+            "query($owner: String!, $name: String!, $endCursor: String) {"
+            " repository(owner: $owner, name: $name) {"
+            " pullRequests(states: OPEN, first: 100, after: $endCursor) {"
+            " nodes { headRefName } pageInfo { hasNextPage endCursor } } } }"
+        )
+        output = await run_subprocess(
+            "gh",
+            "api",
+            "graphql",
+            "--paginate",
+            "-f",
+            f"query={query}",
+            "-F",
+            f"owner={owner}",
+            "-F",
+            f"name={name}",
+            "--jq",
+            ".data.repository.pullRequests.nodes[].headRefName",
+            cwd=self._config.repo_root,
+            gh_token=self._config.gh_token,
+        )
+        return {line for line in output.splitlines() if line}
+
+    def _pipeline_labels(self) -> set[str]:
+        """Return the lower-cased labels that mark an issue as in the pipeline."""
+        return {
+            *(lbl.lower() for lbl in self._config.find_label),
+            *(lbl.lower() for lbl in self._config.planner_label),
+            *(lbl.lower() for lbl in self._config.ready_label),
+            *(lbl.lower() for lbl in self._config.review_label),
+            *(lbl.lower() for lbl in self._config.hitl_label),
+            *(lbl.lower() for lbl in self._config.hitl_active_label),
+        }
 
     async def _is_safe_to_gc(self, issue_number: int) -> bool:
         """Determine whether a worktree for *issue_number* can be safely GC'd.
@@ -116,12 +395,7 @@ class WorkspaceGCLoop(BaseBackgroundLoop):
 
         # Skip if active, HITL, or anywhere in the IssueStore pipeline
         # (queued, in-flight, or being processed).
-        in_pipeline = self._is_in_pipeline and self._is_in_pipeline(issue_number)
-        if (
-            issue_number in self._state.get_active_issue_numbers()
-            or self._state.get_hitl_cause(issue_number) is not None
-            or in_pipeline
-        ):
+        if self._is_locally_busy(issue_number):
             logger.debug("GC: #%d is active/HITL/pipeline — skipping", issue_number)
             return safe_to_gc
 
@@ -161,14 +435,7 @@ class WorkspaceGCLoop(BaseBackgroundLoop):
 
     async def _issue_has_pipeline_label(self, issue_number: int) -> bool:
         """Return True when the issue currently carries any pipeline label."""
-        pipeline_labels = {
-            *(lbl.lower() for lbl in self._config.find_label),
-            *(lbl.lower() for lbl in self._config.planner_label),
-            *(lbl.lower() for lbl in self._config.ready_label),
-            *(lbl.lower() for lbl in self._config.review_label),
-            *(lbl.lower() for lbl in self._config.hitl_label),
-            *(lbl.lower() for lbl in self._config.hitl_active_label),
-        }
+        pipeline_labels = self._pipeline_labels()
         if not pipeline_labels:
             return False
         try:
@@ -232,23 +499,28 @@ class WorkspaceGCLoop(BaseBackgroundLoop):
             )
             return True  # Assume PR exists on error — don't GC
 
-    async def _collect_orphaned_dirs(self, tracked: dict[int, str], budget: int) -> int:
-        """Scan filesystem for orphaned issue-* dirs not tracked in state."""
-        collected = 0
+    def _list_orphaned_dirs(self) -> list[int]:
+        """Return issue numbers of ``issue-*`` dirs under the repo's worktree base."""
         repo_wt_base = self._config.worktree_base / self._config.repo_slug
         if not repo_wt_base.exists():
-            return 0
-
-        tracked_issues = set(tracked.keys())
+            return []
+        issues: list[int] = []
         for child in sorted(repo_wt_base.iterdir()):
-            if collected >= budget or self._stop_event.is_set():
-                break
             if not child.is_dir() or not child.name.startswith("issue-"):
                 continue
             try:
-                issue_num = int(child.name.split("-", 1)[1])
+                issues.append(int(child.name.split("-", 1)[1]))
             except (ValueError, IndexError):
                 continue
+        return issues
+
+    async def _collect_orphaned_dirs(self, tracked: dict[int, str], budget: int) -> int:
+        """Scan filesystem for orphaned issue-* dirs not tracked in state."""
+        collected = 0
+        tracked_issues = set(tracked.keys())
+        for issue_num in self._list_orphaned_dirs():
+            if collected >= budget or self._stop_event.is_set():
+                break
             if issue_num in tracked_issues:
                 continue
             try:
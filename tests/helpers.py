@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import shutil
 from collections.abc import Callable, Coroutine
 from contextlib import ExitStack
@@ -89,11 +90,17 @@ def make_proc(
 
     The process mock's ``communicate()`` resolves to ``(stdout, stderr)`` bytes,
     suitable for code paths that call ``await proc.communicate()`` rather than
-    iterating ``proc.stdout`` line by line.
+    iterating ``proc.stdout`` line by line.  ``proc.stdout.read()`` and
+    ``proc.stderr.read()`` return the same bytes once (then ``b""``) for
+    code paths that stream output through bounded buffers.
     """
     proc = MagicMock()
     proc.returncode = returncode
     proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    proc.wait = AsyncMock(return_value=returncode)
+    for name, data in (("stdout", stdout), ("stderr", stderr)):
+        buffer = io.BytesIO(data)
+        getattr(proc, name).read = AsyncMock(side_effect=buffer.read)
     # kill/terminate are synchronous on asyncio subprocesses.
     proc.kill = MagicMock()
     proc.terminate = MagicMock()
@@ -1021,6 +1028,7 @@ def make_implement_phase(
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResultFactory.create(
                 issue_number=issue.id,
@@ -400,6 +400,7 @@ def build_scripted_services(
 
     services = SimpleNamespace()
     services.worktrees = worktrees
+    services.workspace_disk = MagicMock()
     services.subprocess_runner = MagicMock()
     services.agents = FakeRunner()
     services.planners = FakeRunner()
@@ -394,7 +394,7 @@ class TestBuildPrompt:
     def test_prompt_review_feedback_after_plan_section(
         self, config, event_bus: EventBus
     ) -> None:
-        """Review feedback should appear after the plan section."""
+        """Review feedback should follow the plan, after the shared instructions."""
         issue = Task(
             id=10,
             title="Add feature X",
@@ -411,7 +411,7 @@ class TestBuildPrompt:
         feedback_pos = prompt.index("## Review Feedback")
         instructions_pos = prompt.index("## Instructions")
 
-        assert plan_pos < feedback_pos < instructions_pos
+        assert instructions_pos < plan_pos < feedback_pos
 
     def test_prompt_includes_self_check_checklist(
         self, config, event_bus: EventBus, agent_task
@@ -1785,6 +1785,158 @@ class TestQualityFixLoop:
         assert attempts == 0
         exec_mock.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_failed_impacted_tests_skip_full_gate(
+        self, event_bus: EventBus, agent_task, tmp_path: Path
+    ) -> None:
+        """A failing affected-test pre-check should skip make quality."""
+        cfg = ConfigFactory.create(
+            max_quality_fix_attempts=2,
+            repo_root=tmp_path / "repo",
+            worktree_base=tmp_path / "wt",
+            state_file=tmp_path / "s.json",
+        )
+        cfg.incremental_quality_enabled = True
+        runner = AgentRunner(cfg, event_bus)
+        prechecks = iter([(False, "Affected tests failed"), (True, "OK")])
+
+        with (
+            patch.object(
+                runner, "_execute", new_callable=AsyncMock, return_value="fix output"
+            ),
+            patch.object(
+                runner,
+                "_run_impacted_tests",
+                new_callable=AsyncMock,
+                side_effect=lambda *a: next(prechecks),
+            ),
+            patch.object(
+                runner,
+                "_verify_result",
+                new_callable=AsyncMock,
+                return_value=(True, "OK"),
+            ) as verify_mock,
+        ):
+            success, _msg, attempts = await runner._run_quality_fix_loop(
+                agent_task, tmp_path, "agent/issue-42", "error", worker_id=0
+            )
+
+        assert success is True
+        assert attempts == 2
+        verify_mock.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_impacted_tests_not_run_when_disabled(
+        self, config, event_bus: EventBus, agent_task, tmp_path: Path
+    ) -> None:
+        runner = AgentRunner(config, event_bus)
+
+        with (
+            patch.object(
+                runner, "_execute", new_callable=AsyncMock, return_value="fix output"
+            ),
+            patch.object(
+                runner, "_run_impacted_tests", new_callable=AsyncMock
+            ) as precheck_mock,
+            patch.object(
+                runner,
+                "_verify_result",
+                new_callable=AsyncMock,
+                return_value=(True, "OK"),
+            ),
+        ):
+            await runner._run_quality_fix_loop(
+                agent_task, tmp_path, "agent/issue-42", "error", worker_id=0
+            )
+
+        precheck_mock.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# AgentRunner._run_impacted_tests
+# ---------------------------------------------------------------------------
+
+
+class TestRunImpactedTests:
+    """Tests for AgentRunner._run_impacted_tests."""
+
+    @pytest.mark.asyncio
+    async def test_runs_selected_targets_and_reports_failure(
+        self, config, event_bus: EventBus, agent_task, tmp_path: Path
+    ) -> None:
+        from test_impact import ImpactedTests
+
+        mock_runner = MagicMock()
+        mock_runner.run_simple = AsyncMock(
+            return_value=MagicMock(returncode=1, stdout="FAILED test_a", stderr="")
+        )
+        runner = AgentRunner(config, event_bus, runner=mock_runner)
+        selection = ImpactedTests(
+            stack="python", command=["pytest", "-q"], targets=["tests/test_a.py"]
+        )
+
+        with (
+            patch("agent.changed_files", new=AsyncMock(return_value=["src/a.py"])),
+            patch("agent.select_impacted_tests", return_value=[selection]),
+        ):
+            result = await runner._run_impacted_tests(agent_task, tmp_path)
+
+        assert result is not None
+        assert result[0] is False
+        assert "FAILED test_a" in result[1]
+        assert mock_runner.run_simple.await_args.args[0] == [
+            "pytest",
+            "-q",
+            "tests/test_a.py",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("returncode", "stderr"),
+        [
+            (5, "no tests ran"),
+            (127, "command not found"),
+            (1, "No module named pytest"),
+        ],
+    )
+    async def test_runner_errors_fall_back_to_full_gate(
+        self,
+        config,
+        event_bus: EventBus,
+        agent_task,
+        tmp_path: Path,
+        returncode: int,
+        stderr: str,
+    ) -> None:
+        from test_impact import ImpactedTests
+
+        mock_runner = MagicMock()
+        mock_runner.run_simple = AsyncMock(
+            return_value=MagicMock(returncode=returncode, stdout="", stderr=stderr)
+        )
+        runner = AgentRunner(config, event_bus, runner=mock_runner)
+        selection = ImpactedTests(
+            stack="python",
+            command=["python", "-m", "pytest", "-q"],
+            targets=["tests/test_a.py"],
+            unavailable_markers=("No module named pytest",),
+        )
+
+        with (
+            patch("agent.changed_files", new=AsyncMock(return_value=["src/a.py"])),
+            patch("agent.select_impacted_tests", return_value=[selection]),
+        ):
+            assert await runner._run_impacted_tests(agent_task, tmp_path) is None
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_changes(
+        self, config, event_bus: EventBus, agent_task, tmp_path: Path
+    ) -> None:
+        runner = AgentRunner(config, event_bus)
+
+        with patch("agent.changed_files", new=AsyncMock(return_value=None)):
+            assert await runner._run_impacted_tests(agent_task, tmp_path) is None
+
 
 # ---------------------------------------------------------------------------
 # AgentRunner._save_transcript
@@ -1992,6 +2144,37 @@ class TestEventPublishing:
         statuses = [e.data.get("status") for e in worker_updates]
         assert WorkerStatus.RUNNING.value in statuses
 
+    @pytest.mark.asyncio
+    async def test_run_forwards_on_output_to_execute(
+        self, config, event_bus: EventBus, agent_task, tmp_path: Path
+    ) -> None:
+        """run should stream the implementation output through on_output."""
+        runner = AgentRunner(config, event_bus)
+
+        def on_output(_text: str) -> bool:
+            return False
+
+        with (
+            patch.object(
+                runner, "_execute", new_callable=AsyncMock, return_value=""
+            ) as exec_mock,
+            patch.object(
+                runner,
+                "_verify_result",
+                new_callable=AsyncMock,
+                return_value=(True, "OK"),
+            ),
+            patch.object(
+                runner, "_count_commits", new_callable=AsyncMock, return_value=1
+            ),
+            patch.object(runner, "_save_transcript"),
+        ):
+            await runner.run(
+                agent_task, tmp_path, "agent/issue-42", on_output=on_output
+            )
+
+        assert exec_mock.await_args_list[0].kwargs["on_output"] is on_output
+
     @pytest.mark.asyncio
     async def test_run_emits_done_status_on_success(
         self, config, event_bus: EventBus, agent_task, tmp_path: Path
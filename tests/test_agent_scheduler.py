@@ -0,0 +1,200 @@
+"""Tests for agent_scheduler.py — AgentScheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from agent_scheduler import AgentScheduler
+from tests.conftest import TaskFactory
+from tests.helpers import ConfigFactory
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(
+    tmp_path: Path, budget: int, *, minimum: int = 0, clock: _Clock | None = None
+) -> AgentScheduler:
+    config = ConfigFactory.create(
+        repo_root=tmp_path / "repo",
+        max_workers=4,
+        max_planners=4,
+        max_reviewers=4,
+    )
+    config.agent_slot_budget = budget
+    config.agent_slot_min_per_phase = minimum
+    config.agent_slot_aging_seconds = 60
+    return AgentScheduler(config, clock=clock or _Clock())
+
+
+async def _hold(
+    scheduler: AgentScheduler,
+    phase: str,
+    order: list[str],
+    release: asyncio.Event,
+    **kwargs,
+) -> None:
+    async with scheduler.slot(phase, **kwargs):
+        order.append(phase if "issue" not in kwargs else f"{phase}-epic")
+        await release.wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAgentScheduler:
+    """Tests for slot grants, priorities, aging and stats."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_budget_does_not_block(self, tmp_path: Path) -> None:
+        scheduler = _scheduler(tmp_path, budget=0)
+
+        async with scheduler.slot("implement"), scheduler.slot("implement"):
+            assert scheduler.stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_total_and_review_goes_first(
+        self, tmp_path: Path
+    ) -> None:
+        scheduler = _scheduler(tmp_path, budget=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        first = asyncio.create_task(_hold(scheduler, "plan", order, gate))
+        await _settle()
+        later = [
+            asyncio.create_task(_hold(scheduler, phase, order, gate))
+            for phase in ("implement", "review", "triage")
+        ]
+        await _settle()
+
+        assert order == ["plan"]
+        assert scheduler.stats()["phases"]["implement"]["waiting"] == 1
+
+        gate.set()
+        await asyncio.gather(first, *later)
+
+        assert order == ["plan", "review", "implement", "triage"]
+
+    @pytest.mark.asyncio
+    async def test_idle_phase_capacity_is_borrowed(self, tmp_path: Path) -> None:
+        scheduler = _scheduler(tmp_path, budget=4)
+        order: list[str] = []
+        gate = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_hold(scheduler, "implement", order, gate))
+            for _ in range(4)
+        ]
+        await _settle()
+
+        assert order.count("implement") == 4
+
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_phase_max_is_respected(self, tmp_path: Path) -> None:
+        scheduler = _scheduler(tmp_path, budget=10)
+        scheduler._config.max_workers = 1
+        order: list[str] = []
+        gate = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_hold(scheduler, "implement", order, gate))
+            for _ in range(2)
+        ]
+        await _settle()
+
+        assert order == ["implement"]
+
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_epic_children_first_within_phase(self, tmp_path: Path) -> None:
+        scheduler = _scheduler(tmp_path, budget=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        first = asyncio.create_task(_hold(scheduler, "review", order, gate))
+        await _settle()
+        plain = asyncio.create_task(_hold(scheduler, "implement", order, gate))
+        await _settle()
+        child = TaskFactory.create(id=9)
+        child.parent_epic = 1
+        epic = asyncio.create_task(
+            _hold(scheduler, "implement", order, gate, issue=child)
+        )
+        await _settle()
+
+        gate.set()
+        await asyncio.gather(first, plain, epic)
+
+        assert order == ["review", "implement-epic", "implement"]
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self, tmp_path: Path) -> None:
+        clock = _Clock()
+        scheduler = _scheduler(tmp_path, budget=1, clock=clock)
+        order: list[str] = []
+        gate = asyncio.Event()
+        first = asyncio.create_task(_hold(scheduler, "review", order, gate))
+        await _settle()
+        old = asyncio.create_task(_hold(scheduler, "triage", order, gate))
+        await _settle()
+        clock.now = 600.0  # ten aging intervals
+        fresh = asyncio.create_task(_hold(scheduler, "review", order, gate))
+        await _settle()
+
+        gate.set()
+        await asyncio.gather(first, old, fresh)
+
+        assert order == ["review", "triage", "review"]
+        assert scheduler.stats()["phases"]["triage"]["max_wait_seconds"] == 600.0
+
+    @pytest.mark.asyncio
+    async def test_phase_below_minimum_is_served_first(self, tmp_path: Path) -> None:
+        scheduler = _scheduler(tmp_path, budget=2, minimum=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        held = [
+            asyncio.create_task(_hold(scheduler, "review", order, gate))
+            for _ in range(2)
+        ]
+        await _settle()
+        waiting = [
+            asyncio.create_task(_hold(scheduler, "review", order, gate)),
+            asyncio.create_task(_hold(scheduler, "plan", order, gate)),
+        ]
+        await _settle()
+
+        gate.set()
+        await asyncio.gather(*held, *waiting)
+
+        assert order == ["review", "review", "plan", "review"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self, tmp_path: Path) -> None:
+        scheduler = _scheduler(tmp_path, budget=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        first = asyncio.create_task(_hold(scheduler, "review", order, gate))
+        await _settle()
+        waiter = asyncio.create_task(_hold(scheduler, "plan", order, gate))
+        await _settle()
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        gate.set()
+        await first
+
+        stats = scheduler.stats()
+        assert stats["active"] == 0
+        assert stats["phases"]["plan"]["waiting"] == 0
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,6 +14,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from base_runner import BaseRunner
 from events import EventBus
+from execution import HostRunner
+from manifest_curator import CuratedLearning
+from memory_index import write_learnings_index
+from models import MemoryType
 from runner_utils import AuthenticationRetryError
 
 # ---------------------------------------------------------------------------
@@ -308,6 +313,59 @@ class TestInjectManifestAndMemory:
         assert memory_sec == ""
 
 
+class TestRelevantLearnings:
+    """Tests for relevance-ranked learnings in place of the digest."""
+
+    def _sync(self, config) -> None:
+        write_learnings_index(
+            config,
+            [
+                CuratedLearning(
+                    number=1,
+                    title="Docker tests",
+                    learning="Pin the docker image tag in integration tests",
+                    created_at="2024-06-01T00:00:00Z",
+                    memory_type=MemoryType.KNOWLEDGE,
+                ),
+                CuratedLearning(
+                    number=2,
+                    title="Dashboard",
+                    learning="Use theme tokens for dashboard colours",
+                    created_at="2024-06-01T00:00:00Z",
+                    memory_type=MemoryType.KNOWLEDGE,
+                ),
+            ],
+        )
+
+    def test_ranked_learnings_replace_digest(self, config, event_bus: EventBus) -> None:
+        self._sync(config)
+        runner = _TestRunner(config, event_bus)
+
+        with patch("base_runner.load_memory_digest", return_value="digest text"):
+            _manifest_sec, memory_sec = runner._inject_manifest_and_memory()
+        section = runner._relevant_learnings_section(
+            "Flaky docker integration test", "src/docker_runner.py"
+        )
+
+        assert memory_sec == ""
+        assert "## Relevant Learnings" in section
+        assert "#1" in section
+        assert "dashboard" not in section
+
+    def test_digest_used_when_retrieval_disabled(
+        self, config, event_bus: EventBus
+    ) -> None:
+        self._sync(config)
+        config.memory_retrieval_top_k = 0
+        runner = _TestRunner(config, event_bus)
+
+        with patch("base_runner.load_memory_digest", return_value="digest text"):
+            _manifest_sec, memory_sec = runner._inject_manifest_and_memory()
+
+        assert "digest text" in memory_sec
+        assert runner._relevant_learnings_section("docker") == ""
+
+
 # ---------------------------------------------------------------------------
 # _verify_quality
 # ---------------------------------------------------------------------------
@@ -392,6 +450,92 @@ class TestVerifyQuality:
         # Output should be truncated to last 3000 chars
         assert len(msg) < 5000 + 100  # some overhead for prefix text
 
+    @pytest.mark.asyncio
+    async def test_verify_quality_keeps_spill_marker(
+        self, config, event_bus: EventBus, tmp_path: Path
+    ) -> None:
+        """The omitted-output marker naming the spill file survives the slice."""
+        config.error_output_max_chars = 500
+        worktree = tmp_path / "issue-3"
+        worktree.mkdir()
+        (worktree / "Makefile").write_text(
+            "quality:\n\t@python3 -c \"print('x' * 5000)\"; exit 1\n"
+        )
+        runner = _TestRunner(config, event_bus, runner=HostRunner())
+
+        success, msg = await runner._verify_quality(worktree)
+
+        spill_log = f"{config.quality_spill_path(worktree)}.stdout.log"
+        assert success is False
+        assert f"full output in {spill_log}" in msg
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tree_reuses_cached_result(
+        self, config, event_bus: EventBus, tmp_path: Path
+    ) -> None:
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=worktree, check=True)
+        (worktree / "a.py").write_text("x = 1\n")
+        host = HostRunner()
+        make = AsyncMock(
+            return_value=MagicMock(returncode=1, stdout="FAILED test_a", stderr="")
+        )
+
+        async def run_simple(cmd, **kwargs):
+            if cmd[0] == "make":
+                return await make(cmd, **kwargs)
+            return await host.run_simple(cmd, **kwargs)
+
+        mock_runner = MagicMock()
+        mock_runner.run_simple = run_simple
+        runner = _TestRunner(config, event_bus, runner=mock_runner)
+
+        first = await runner._verify_quality(worktree)
+        second = await runner._verify_quality(worktree)
+        (worktree / "a.py").write_text("x = 2\n")
+        await runner._verify_quality(worktree)
+
+        assert first == second
+        assert "FAILED test_a" in second[1]
+        assert make.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_docker_mode_leaves_real_index_untouched(
+        self, config, event_bus: EventBus, tmp_path: Path
+    ) -> None:
+        """Tree hashing must not go through a runner that drops ``env``."""
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=worktree, check=True)
+        (worktree / "a.py").write_text("x = 1\n")
+        host = HostRunner()
+        calls: list[str] = []
+
+        async def run_simple(cmd, *, env=None, **kwargs):  # noqa: ARG001
+            # Like DockerRunner.run_simple: env (GIT_INDEX_FILE) is ignored.
+            calls.append(cmd[0])
+            if cmd[0] == "make":
+                return MagicMock(returncode=0, stdout="", stderr="")
+            return await host.run_simple(cmd, **kwargs)
+
+        config.execution_mode = "docker"
+        docker_like = MagicMock()
+        docker_like.run_simple = run_simple
+        runner = _TestRunner(config, event_bus, runner=docker_like)
+
+        await runner._verify_quality(worktree)
+
+        assert calls == ["make"]
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--name-only"],
+            cwd=worktree,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert staged == ""
+
 
 # ---------------------------------------------------------------------------
 # _build_command
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
-from context_cache import ContextSectionCache
+from context_cache import ContextSectionCache, clear_memory_tier
 from tests.helpers import ConfigFactory
 
 
@@ -100,3 +102,84 @@ class TestContextSectionCache:
         assert content1 == "payload-1"
         assert content2 == "payload-2"
         assert calls["count"] == 2
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path* out of the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class TestMemoryTier:
+    def _source(self, config, text: str = "manifest v1") -> Path:
+        source = config.data_path("manifest", "manifest.md")
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text(text)
+        _age(source)
+        return source
+
+    def test_warm_hit_reads_no_files(self, tmp_path, monkeypatch):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        source = self._source(config)
+        ContextSectionCache(config).get_or_load(
+            key="manifest", source_path=source, loader=lambda _cfg: "payload"
+        )
+
+        def no_reads(self: Path, *args: object, **kwargs: object):
+            raise AssertionError(f"unexpected read of {self}")
+
+        monkeypatch.setattr(Path, "read_bytes", no_reads)
+        monkeypatch.setattr(Path, "read_text", no_reads)
+        content, hit = ContextSectionCache(config).get_or_load(
+            key="manifest", source_path=source, loader=lambda _cfg: "reloaded"
+        )
+
+        assert (content, hit) == ("payload", True)
+
+    def test_hits_do_not_rewrite_cache_file(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        cache = ContextSectionCache(config)
+        source = self._source(config)
+        cache.get_or_load(key="manifest", source_path=source, loader=lambda _c: "p")
+        cache_file = config.data_path("cache", "context_sections.json")
+        _age(cache_file)
+        written = cache_file.stat().st_mtime_ns
+
+        source.touch()
+        _age(source, 30)
+        _, hit = cache.get_or_load(
+            key="manifest", source_path=source, loader=lambda _c: "p2"
+        )
+
+        assert hit is True
+        assert cache_file.stat().st_mtime_ns == written
+
+    def test_restart_reuses_disk_entry_by_digest(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        source = self._source(config)
+        ContextSectionCache(config).get_or_load(
+            key="manifest", source_path=source, loader=lambda _c: "payload"
+        )
+        clear_memory_tier()
+
+        content, hit = ContextSectionCache(config).get_or_load(
+            key="manifest", source_path=source, loader=lambda _c: "reloaded"
+        )
+
+        assert (content, hit) == ("payload", True)
+
+    def test_missing_source_is_cached(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        cache = ContextSectionCache(config)
+        source = config.data_path("manifest", "absent.md")
+        calls = {"count": 0}
+
+        def loader(_cfg):
+            calls["count"] += 1
+            return ""
+
+        cache.get_or_load(key="manifest", source_path=source, loader=loader)
+        _, hit = cache.get_or_load(key="manifest", source_path=source, loader=loader)
+
+        assert hit is True
+        assert calls["count"] == 1
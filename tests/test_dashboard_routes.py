@@ -4035,6 +4035,35 @@ class TestRunsEndpoints:
         data = json.loads(response.body)
         assert data["error"] == "artifact not found"
 
+    @pytest.mark.asyncio
+    async def test_get_run_artifact_range_returns_partial_content(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        """With an offset, returns 206 and a Content-Range header."""
+        mock_orch = MagicMock()
+        mock_orch.run_recorder = MagicMock()
+        mock_orch.run_recorder.read_run_artifact_range = MagicMock(
+            return_value=(b"world", 11)
+        )
+
+        router = self._make_router(
+            config, event_bus, state, tmp_path, get_orch=lambda: mock_orch
+        )
+        endpoint = self._find_endpoint(
+            router, "/api/runs/{issue_number}/{timestamp}/{filename}"
+        )
+        assert endpoint is not None
+
+        response = await endpoint(
+            42, "2025-01-01T00:00:00", "transcript.log", offset=6, length=5
+        )
+        assert response.status_code == 206
+        assert response.body == b"world"
+        assert response.headers["content-range"] == "bytes 6-10/11"
+        mock_orch.run_recorder.read_run_artifact_range.assert_called_once_with(
+            42, "2025-01-01T00:00:00", "transcript.log", 6, 5
+        )
+
 
 # ---------------------------------------------------------------------------
 # GET /api/state
@@ -8067,3 +8096,253 @@ class TestRuntimeEndpointsWithRegistry:
 
         resp = await endpoint("nonexistent")
         assert resp.status_code == 404
+
+
+class TestWorkspaceDiskEndpoint:
+    """Tests for GET /api/workspaces/disk."""
+
+    def _make_router(self, config, event_bus, state, tmp_path, get_orch=None):
+        from dashboard_routes import create_router
+        from pr_manager import PRManager
+
+        pr_mgr = PRManager(config, event_bus)
+        return create_router(
+            config=config,
+            event_bus=event_bus,
+            state=state,
+            pr_manager=pr_mgr,
+            get_orchestrator=get_orch or (lambda: None),
+            set_orchestrator=lambda o: None,
+            set_run_task=lambda t: None,
+            ui_dist_dir=tmp_path / "no-dist",
+            template_dir=tmp_path / "no-templates",
+        )
+
+    def _find_endpoint(self, router, path):
+        for route in router.routes:
+            if hasattr(route, "path") and route.path == path:
+                return route.endpoint
+        return None
+
+    @pytest.mark.asyncio
+    async def test_returns_error_without_orchestrator(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        router = self._make_router(config, event_bus, state, tmp_path)
+        endpoint = self._find_endpoint(router, "/api/workspaces/disk")
+
+        response = await endpoint()
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_returns_usage_stats(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        import json
+
+        mock_orch = MagicMock()
+        mock_orch.workspace_disk.get_usage_stats.return_value = {
+            "total_bytes": 10,
+            "quota_mb": 0,
+            "workspaces": [],
+        }
+        router = self._make_router(
+            config, event_bus, state, tmp_path, get_orch=lambda: mock_orch
+        )
+        endpoint = self._find_endpoint(router, "/api/workspaces/disk")
+
+        response = await endpoint()
+
+        assert json.loads(response.body)["total_bytes"] == 10
+
+
+class TestIssueTraceEndpoint:
+    """Tests for GET /api/traces/{issue_number}."""
+
+    def _make_router(self, config, event_bus, state, tmp_path):
+        from dashboard_routes import create_router
+        from pr_manager import PRManager
+
+        pr_mgr = PRManager(config, event_bus)
+        return create_router(
+            config=config,
+            event_bus=event_bus,
+            state=state,
+            pr_manager=pr_mgr,
+            get_orchestrator=lambda: None,
+            set_orchestrator=lambda o: None,
+            set_run_task=lambda t: None,
+            ui_dist_dir=tmp_path / "no-dist",
+            template_dir=tmp_path / "no-templates",
+        )
+
+    def _find_endpoint(self, router, path):
+        for route in router.routes:
+            if hasattr(route, "path") and route.path == path:
+                return route.endpoint
+        return None
+
+    @pytest.mark.asyncio
+    async def test_returns_waterfall_for_issue(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        import json
+
+        from tracing import SPAN_FILE, Tracer
+
+        tracer = Tracer(config.data_path("traces", SPAN_FILE))
+        with tracer.span("phase.implement", issue=7), tracer.span("subprocess"):
+            pass
+        with tracer.span("phase.plan", issue=8):
+            pass
+        router = self._make_router(config, event_bus, state, tmp_path)
+        endpoint = self._find_endpoint(router, "/api/traces/{issue_number}")
+
+        response = await endpoint(7)
+
+        data = json.loads(response.body)
+        assert [s["name"] for s in data["spans"]] == ["phase.implement", "subprocess"]
+        assert [s["depth"] for s in data["spans"]] == [0, 1]
+        assert {b["name"] for b in data["breakdown"]} == {
+            "phase.implement",
+            "subprocess",
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_when_no_spans(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        import json
+
+        router = self._make_router(config, event_bus, state, tmp_path)
+        endpoint = self._find_endpoint(router, "/api/traces/{issue_number}")
+
+        response = await endpoint(7)
+
+        data = json.loads(response.body)
+        assert data["spans"] == []
+        assert data["tracing_enabled"] is False
+
+
+class TestRuntimeMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def _find_endpoint(self, router, path):
+        for route in router.routes:
+            if hasattr(route, "path") and route.path == path:
+                return route.endpoint
+        return None
+
+    @pytest.mark.asyncio
+    async def test_returns_text_exposition_with_bus_gauges(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        from dashboard_routes import create_router
+        from pr_manager import PRManager
+
+        router = create_router(
+            config=config,
+            event_bus=event_bus,
+            state=state,
+            pr_manager=PRManager(config, event_bus),
+            get_orchestrator=lambda: None,
+            set_orchestrator=lambda o: None,
+            set_run_task=lambda t: None,
+            ui_dist_dir=tmp_path / "no-dist",
+            template_dir=tmp_path / "no-templates",
+        )
+        event_bus.subscribe()
+        endpoint = self._find_endpoint(router, "/metrics")
+
+        response = await endpoint()
+
+        assert response.media_type.startswith("text/plain; version=0.0.4")
+        body = response.body.decode()
+        assert "# TYPE hydraflow_event_bus_subscribers gauge" in body
+        assert "hydraflow_event_bus_subscribers 1\n" in body
+
+
+class TestLoopProfileEndpoint:
+    """Tests for POST /api/control/profile."""
+
+    def _find_endpoint(self, router, path):
+        for route in router.routes:
+            if hasattr(route, "path") and route.path == path:
+                return route.endpoint
+        return None
+
+    @pytest.mark.asyncio
+    async def test_returns_collapsed_stacks_and_tasks(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        from dashboard_routes import create_router
+        from pr_manager import PRManager
+
+        router = create_router(
+            config=config,
+            event_bus=event_bus,
+            state=state,
+            pr_manager=PRManager(config, event_bus),
+            get_orchestrator=lambda: None,
+            set_orchestrator=lambda o: None,
+            set_run_task=lambda t: None,
+            ui_dist_dir=tmp_path / "no-dist",
+            template_dir=tmp_path / "no-templates",
+        )
+        endpoint = self._find_endpoint(router, "/api/control/profile")
+
+        response = await endpoint(seconds=0.05)
+
+        import json
+
+        data = json.loads(response.body)
+        assert data["seconds"] == 0.05
+        assert data["samples"] > 0
+        assert data["collapsed"]
+        assert any(task["stack"] for task in data["tasks"])
+
+
+class TestSchedulerEndpoint:
+    """Tests for GET /api/scheduler."""
+
+    def _find_endpoint(self, router, path):
+        for route in router.routes:
+            if hasattr(route, "path") and route.path == path:
+                return route.endpoint
+        return None
+
+    @pytest.mark.asyncio
+    async def test_returns_per_phase_slot_stats(
+        self, config, event_bus, state, tmp_path
+    ) -> None:
+        from agent_scheduler import configure_agent_scheduler
+        from dashboard_routes import create_router
+        from pr_manager import PRManager
+
+        config.agent_slot_budget = 3
+        router = create_router(
+            config=config,
+            event_bus=event_bus,
+            state=state,
+            pr_manager=PRManager(config, event_bus),
+            get_orchestrator=lambda: None,
+            set_orchestrator=lambda o: None,
+            set_run_task=lambda t: None,
+            ui_dist_dir=tmp_path / "no-dist",
+            template_dir=tmp_path / "no-templates",
+        )
+        endpoint = self._find_endpoint(router, "/api/scheduler")
+
+        with patch("agent_scheduler._scheduler", None):
+            scheduler = configure_agent_scheduler(config)
+            async with scheduler.slot("review"):
+                response = await endpoint()
+
+        import json
+
+        data = json.loads(response.body)
+        assert data["enabled"] is True
+        assert data["budget"] == 3
+        assert data["phases"]["review"]["active"] == 1
+        assert data["phases"]["implement"]["avg_wait_seconds"] == 0.0
@@ -0,0 +1,306 @@
+"""Tests for docker_pool.py — ContainerPool."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from docker_pool import ContainerPool
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_container(
+    exit_code: int = 0, stdout: bytes = b"out", stderr: bytes = b""
+) -> MagicMock:
+    container = MagicMock()
+    container.status = "running"
+    container.exec_run.return_value = SimpleNamespace(
+        exit_code=exit_code, output=(stdout, stderr)
+    )
+    return container
+
+
+def _make_pool(
+    *,
+    max_containers: int = 2,
+    idle_timeout: float = 300.0,
+    clock: _Clock | None = None,
+    spec: str = "spec",
+) -> tuple[ContainerPool, list[MagicMock]]:
+    created: list[MagicMock] = []
+
+    async def _create(cwd: str | None) -> MagicMock:  # noqa: ARG001
+        container = _make_container()
+        created.append(container)
+        return container
+
+    pool = ContainerPool(
+        create_container=_create,
+        container_spec=lambda _cwd: spec,
+        max_containers=max_containers,
+        idle_timeout=idle_timeout,
+        clock=clock or _Clock(),
+    )
+    return pool, created
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestContainerPoolRun:
+    """Tests for ContainerPool.run."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_container_for_same_workspace(self) -> None:
+        pool, created = _make_pool()
+
+        first = await pool.run(
+            ["git", "status"], cwd="/wt/1", environment={}, timeout=5
+        )
+        second = await pool.run(["git", "log"], cwd="/wt/1", environment={}, timeout=5)
+
+        assert first is not None and first.stdout == "out"
+        assert second is not None
+        assert len(created) == 1
+        assert created[0].exec_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exec_receives_env_and_workdir(self) -> None:
+        pool, created = _make_pool()
+
+        await pool.run(
+            ["make", "quality"], cwd="/wt/1", environment={"A": "1"}, timeout=5
+        )
+
+        kwargs = created[0].exec_run.call_args.kwargs
+        assert kwargs["environment"] == {"A": "1"}
+        assert kwargs["workdir"] == "/workspace"
+        assert kwargs["demux"] is True
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_code_is_returned_without_eviction(self) -> None:
+        pool, created = _make_pool()
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        created[0].exec_run.return_value = SimpleNamespace(
+            exit_code=2, output=(None, b"boom\n")
+        )
+
+        result = await pool.run(["false"], cwd="/wt/1", environment={}, timeout=5)
+
+        assert result is not None
+        assert result.returncode == 2
+        assert result.stderr == "boom"
+        assert pool.size == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_evicts_container(self) -> None:
+        pool, created = _make_pool()
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+
+        def _slow(*_args: object, **_kwargs: object) -> None:
+            import time
+
+            time.sleep(0.2)
+
+        created[0].exec_run.side_effect = _slow
+
+        with pytest.raises(TimeoutError):
+            await pool.run(["sleep", "9"], cwd="/wt/1", environment={}, timeout=0.01)
+
+        created[0].remove.assert_called_once_with(force=True)
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_retires_shared_container_until_idle(self) -> None:
+        pool, created = _make_pool()
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+
+        def _block(*_args: object, **_kwargs: object) -> SimpleNamespace:
+            loop.call_soon_threadsafe(started.set)
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return SimpleNamespace(exit_code=0, output=(b"done", b""))
+
+        created[0].exec_run.side_effect = _block
+        other = asyncio.create_task(
+            pool.run(["make", "test"], cwd="/wt/1", environment={}, timeout=5)
+        )
+        await started.wait()
+
+        with pytest.raises(TimeoutError):
+            await pool.run(["sleep", "9"], cwd="/wt/1", environment={}, timeout=0.01)
+
+        created[0].remove.assert_not_called()
+        assert await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5) is None
+
+        release.set()
+        result = await other
+
+        assert result is not None and result.stdout == "done"
+        created[0].remove.assert_called_once_with(force=True)
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_all_containers_busy(self) -> None:
+        pool, created = _make_pool(max_containers=1)
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        started = asyncio.Event()
+
+        def _block(*_args: object, **_kwargs: object) -> SimpleNamespace:
+            loop.call_soon_threadsafe(started.set)
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return SimpleNamespace(exit_code=0, output=(b"", b""))
+
+        created[0].exec_run.side_effect = _block
+        blocked = asyncio.create_task(
+            pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        )
+        await started.wait()
+
+        result = await pool.run(["true"], cwd="/wt/2", environment={}, timeout=5)
+
+        assert result is None
+        release.set()
+        await blocked
+
+    @pytest.mark.asyncio
+    async def test_evicts_lru_idle_container_at_capacity(self) -> None:
+        clock = _Clock()
+        pool, created = _make_pool(max_containers=1, clock=clock)
+
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        clock.now += 1
+        await pool.run(["true"], cwd="/wt/2", environment={}, timeout=5)
+
+        assert len(created) == 2
+        created[0].remove.assert_called_once_with(force=True)
+        assert pool.size == 1
+
+
+class TestContainerPoolLifecycle:
+    """Tests for idle eviction, health checks and close."""
+
+    @pytest.mark.asyncio
+    async def test_idle_container_is_evicted(self) -> None:
+        clock = _Clock()
+        pool, created = _make_pool(idle_timeout=60, clock=clock)
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+
+        clock.now += 61
+        await pool.run(["true"], cwd="/wt/2", environment={}, timeout=5)
+
+        created[0].remove.assert_called_once_with(force=True)
+        assert pool.size == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_sweep_evicts_without_further_use(self) -> None:
+        clock = _Clock()
+        pool, created = _make_pool(idle_timeout=0.01, clock=clock)
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+
+        clock.now += 1
+        await asyncio.wait_for(pool._sweeper, timeout=1)
+
+        created[0].remove.assert_called_once_with(force=True)
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_release_evicts_only_that_workspace(self) -> None:
+        pool, created = _make_pool()
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        await pool.run(["true"], cwd="/wt/10", environment={}, timeout=5)
+
+        await pool.release("/wt/1")
+
+        created[0].remove.assert_called_once_with(force=True)
+        created[1].remove.assert_not_called()
+        assert pool.size == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_release_retires_busy_container(self) -> None:
+        pool, created = _make_pool()
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+
+        def _block(*_args: object, **_kwargs: object) -> SimpleNamespace:
+            loop.call_soon_threadsafe(started.set)
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return SimpleNamespace(exit_code=0, output=(b"", b""))
+
+        created[0].exec_run.side_effect = _block
+        busy = asyncio.create_task(
+            pool.run(["make", "test"], cwd="/wt/1", environment={}, timeout=5)
+        )
+        await started.wait()
+
+        await pool.release("/wt/1")
+
+        created[0].remove.assert_not_called()
+        release.set()
+        await busy
+        created[0].remove.assert_called_once_with(force=True)
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_container_is_replaced(self) -> None:
+        clock = _Clock()
+        pool, created = _make_pool(clock=clock)
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+
+        created[0].status = "exited"
+        clock.now += 31
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+
+        created[0].reload.assert_called_once()
+        created[0].remove.assert_called_once_with(force=True)
+        assert len(created) == 2
+
+    @pytest.mark.asyncio
+    async def test_spec_change_recreates_container(self) -> None:
+        pool, created = _make_pool()
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+
+        pool._container_spec = lambda _cwd: "new-spec"
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+
+        assert len(created) == 2
+        created[0].remove.assert_called_once_with(force=True)
+
+    @pytest.mark.asyncio
+    async def test_close_removes_all_containers(self) -> None:
+        pool, created = _make_pool()
+        await pool.run(["true"], cwd="/wt/1", environment={}, timeout=5)
+        await pool.run(["true"], cwd="/wt/2", environment={}, timeout=5)
+
+        await pool.close()
+
+        for container in created:
+            container.remove.assert_called_once_with(force=True)
+        assert pool.size == 0
+        assert pool._sweeper is None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import shutil
+import socket
 import struct
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -212,6 +213,62 @@ class TestDockerStdoutReader:
 
         assert lines == []
 
+    @pytest.mark.asyncio
+    async def test_reader_thread_blocks_when_consumer_falls_behind(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("docker_runner._READER_QUEUE_SIZE", 2)
+        frames = [_frame_stdout(f"line{i}\n".encode()) for i in range(10)]
+        sock = _make_mock_socket_from_frames(*frames)
+        loop = asyncio.get_running_loop()
+        reader = DockerStdoutReader(sock, loop)
+
+        first = await reader.__anext__()
+        await asyncio.sleep(0.05)
+
+        assert first == b"line0\n"
+        assert reader._queue.qsize() <= 2
+        assert reader._thread is not None and reader._thread.is_alive()
+
+        rest = [line async for line in reader]
+
+        assert rest == [f"line{i}\n".encode() for i in range(1, 10)]
+
+    @pytest.mark.asyncio
+    async def test_close_stops_thread_blocked_on_full_queue(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("docker_runner._READER_QUEUE_SIZE", 1)
+        monkeypatch.setattr("docker_runner._READER_PUT_POLL", 0.01)
+        frames = [_frame_stdout(f"line{i}\n".encode()) for i in range(10)]
+        sock = _make_mock_socket_from_frames(*frames)
+        reader = DockerStdoutReader(sock, asyncio.get_running_loop())
+        await reader.__anext__()
+        await asyncio.sleep(0.05)
+        assert reader._thread is not None and reader._thread.is_alive()
+
+        reader.close()
+        await asyncio.to_thread(reader._thread.join, 1)
+
+        assert not reader._thread.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_close_unblocks_pending_socket_read(self) -> None:
+        ours, theirs = socket.socketpair()
+        try:
+            reader = DockerStdoutReader(ours, asyncio.get_running_loop())
+            reader._start()
+            await asyncio.sleep(0.05)
+            assert reader._thread is not None and reader._thread.is_alive()
+
+            reader.close()
+            await asyncio.to_thread(reader._thread.join, 1)
+
+            assert not reader._thread.is_alive()
+        finally:
+            ours.close()
+            theirs.close()
+
     @pytest.mark.asyncio
     async def test_demux_strips_8_byte_headers(self) -> None:
         """Binary frame headers must NOT appear in yielded lines."""
@@ -346,6 +403,44 @@ class TestDockerStdoutReader:
 
         assert lines == [b"real data\n"]
 
+    @pytest.mark.asyncio
+    async def test_line_spanning_many_frames_is_reassembled(self) -> None:
+        """A single line split across many small frames is yielded once, intact."""
+        line = b"y" * 10_000 + b"\n"
+        frames = [_frame_stdout(line[i : i + 97]) for i in range(0, len(line), 97)]
+        sock = _make_mock_socket_from_frames(*frames, _frame_stdout(b"tail"))
+        reader = DockerStdoutReader(sock, asyncio.get_running_loop())
+
+        lines = [chunk async for chunk in reader]
+
+        assert lines == [line, b"tail"]
+
+    @pytest.mark.asyncio
+    async def test_uses_recv_into_when_available(self) -> None:
+        """Sockets exposing recv_into are read without intermediate bytes objects."""
+        raw = _frame_stdout(b"a\nb\n") + _frame_stderr(b"warn")
+        buf = _MockSocketBuffer(raw)
+        recv_into_calls: list[int] = []
+
+        def _recv_into(view: memoryview, nbytes: int) -> int:
+            chunk = buf.recv(nbytes)
+            view[: len(chunk)] = chunk
+            recv_into_calls.append(len(chunk))
+            return len(chunk)
+
+        inner = MagicMock()
+        inner.recv_into.side_effect = _recv_into
+        sock = MagicMock()
+        sock._sock = inner
+        reader = DockerStdoutReader(sock, asyncio.get_running_loop())
+
+        lines = [chunk async for chunk in reader]
+
+        assert lines == [b"a\n", b"b\n"]
+        assert reader.get_stderr() == b"warn"
+        assert recv_into_calls
+        inner.recv.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # DockerStderrAdapter tests
@@ -402,6 +497,7 @@ class TestDockerProcess:
 
         proc.kill()
         container.kill.assert_called_once()
+        assert proc.stdout._closed.is_set()
 
     def test_kill_suppresses_exceptions(self) -> None:
         container = _make_mock_container()
@@ -469,6 +565,7 @@ def _make_runner(
     git_user_name: str = "",
     git_user_email: str = "",
     mock_client: MagicMock | None = None,
+    pool_max_containers: int = 0,
 ) -> tuple[DockerRunner, MagicMock]:
     """Create a DockerRunner with mocked Docker client."""
     client = mock_client or _make_mock_docker_client()
@@ -484,6 +581,7 @@ def _make_runner(
             spawn_delay=spawn_delay,
             network=network,
             extra_mounts=extra_mounts,
+            pool_max_containers=pool_max_containers,
         )
     # Swap the real client with the mock
     runner._client = client
@@ -789,6 +887,91 @@ class TestDockerRunnerRunSimple:
             await runner.run_simple(["claude", "-p"], input=b"hello")
 
 
+# ---------------------------------------------------------------------------
+# DockerRunner.run_simple container pool tests
+# ---------------------------------------------------------------------------
+
+
+class TestDockerRunnerRunSimplePool:
+    """Tests for run_simple when the per-workspace container pool is enabled."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_commands_share_one_container(self, tmp_path: Path) -> None:
+        container = _make_mock_container()
+        container.exec_run.return_value = MagicMock(
+            exit_code=0, output=(b"clean\n", None)
+        )
+        client = _make_mock_docker_client(container=container)
+        runner, _ = _make_runner(
+            log_dir=tmp_path / "logs", mock_client=client, pool_max_containers=2
+        )
+        wt = str(tmp_path / "wt")
+
+        first = await runner.run_simple(["git", "status"], cwd=wt)
+        second = await runner.run_simple(["git", "diff"], cwd=wt)
+
+        assert first.stdout == "clean"
+        assert second.returncode == 0
+        client.containers.create.assert_called_once()
+        container.wait.assert_not_called()
+        container.remove.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pooled_container_keeps_isolation_settings(
+        self, tmp_path: Path
+    ) -> None:
+        container = _make_mock_container()
+        container.exec_run.return_value = MagicMock(exit_code=0, output=(b"", b""))
+        client = _make_mock_docker_client(container=container)
+        runner, _ = _make_runner(
+            log_dir=tmp_path / "logs",
+            mock_client=client,
+            gh_token="ghp_test",
+            pool_max_containers=1,
+        )
+        wt = str(tmp_path / "wt")
+
+        await runner.run_simple(["git", "status"], cwd=wt)
+
+        create_kwargs = client.containers.create.call_args.kwargs
+        assert create_kwargs["volumes"] == runner._build_mounts(wt)
+        assert create_kwargs["environment"] == runner._build_env()
+        exec_kwargs = container.exec_run.call_args.kwargs
+        assert exec_kwargs["environment"]["GH_TOKEN"] == "ghp_test"
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_pooled_containers(self, tmp_path: Path) -> None:
+        container = _make_mock_container()
+        container.exec_run.return_value = MagicMock(exit_code=0, output=(b"", b""))
+        client = _make_mock_docker_client(container=container)
+        runner, _ = _make_runner(
+            log_dir=tmp_path / "logs", mock_client=client, pool_max_containers=1
+        )
+
+        await runner.run_simple(["true"], cwd=str(tmp_path / "wt"))
+        await runner.cleanup()
+
+        container.remove.assert_called_once_with(force=True)
+
+    @pytest.mark.asyncio
+    async def test_release_workspace_removes_its_pooled_container(
+        self, tmp_path: Path
+    ) -> None:
+        container = _make_mock_container()
+        container.exec_run.return_value = MagicMock(exit_code=0, output=(b"", b""))
+        client = _make_mock_docker_client(container=container)
+        runner, _ = _make_runner(
+            log_dir=tmp_path / "logs", mock_client=client, pool_max_containers=1
+        )
+        wt = str(tmp_path / "wt")
+
+        await runner.run_simple(["true"], cwd=wt)
+        await runner.release_workspace(wt)
+
+        container.remove.assert_called_once_with(force=True)
+        await runner.cleanup()
+
+
 # ---------------------------------------------------------------------------
 # Staggered spawning tests
 # ---------------------------------------------------------------------------
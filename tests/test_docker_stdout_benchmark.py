@@ -0,0 +1,82 @@
+"""Throughput benchmark for DockerStdoutReader against a fake attach socket.
+
+Streams large stream-json style lines through the demultiplexer and
+reports MB/s.  Excluded from default runs via the ``soak`` marker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+import time
+
+import pytest
+
+from docker_runner import DockerStdoutReader
+
+pytestmark = pytest.mark.soak
+
+_FRAME_PAYLOAD = 16 * 1024  # Docker typically frames output in <=16 KiB chunks
+
+
+class _FakeSocket:
+    """In-memory socket supporting ``recv`` and ``recv_into``."""
+
+    def __init__(self, data: bytes) -> None:
+        self._view = memoryview(data)
+        self._pos = 0
+
+    def recv(self, n: int) -> bytes:
+        chunk = bytes(self._view[self._pos : self._pos + n])
+        self._pos += len(chunk)
+        return chunk
+
+    def recv_into(self, buf: memoryview, nbytes: int) -> int:
+        chunk = self._view[self._pos : self._pos + nbytes]
+        buf[: len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def sendall(self, data: bytes) -> None:  # noqa: ARG002
+        pass
+
+
+def _build_stream(line_size: int, line_count: int) -> tuple[bytes, int]:
+    """Return (framed stream, stdout payload length)."""
+    line = b'{"type":"assistant","text":"' + b"x" * (line_size - 32) + b'"}\n'
+    raw = line * line_count
+    frames = bytearray()
+    for offset in range(0, len(raw), _FRAME_PAYLOAD):
+        payload = raw[offset : offset + _FRAME_PAYLOAD]
+        frames += struct.pack(">BxxxI", 1, len(payload)) + payload
+    return bytes(frames), len(raw)
+
+
+async def _drain(data: bytes) -> tuple[int, float]:
+    reader = DockerStdoutReader(_FakeSocket(data), asyncio.get_running_loop())
+    start = time.perf_counter()
+    total = 0
+    async for line in reader:
+        total += len(line)
+    return total, time.perf_counter() - start
+
+
+@pytest.mark.parametrize(
+    ("line_size", "line_count"),
+    [(1_000_000, 64), (4_096, 16_384), (200, 200_000)],
+    ids=["1MB-lines", "4KB-lines", "200B-lines"],
+)
+@pytest.mark.asyncio
+async def test_demux_throughput(line_size: int, line_count: int) -> None:
+    data, expected = _build_stream(line_size, line_count)
+
+    total, elapsed = await _drain(data)
+
+    mb = total / (1024 * 1024)
+    print(
+        f"\n{line_size}B x {line_count}: {mb:.1f} MB in {elapsed:.3f}s "
+        f"({mb / elapsed:.1f} MB/s)"
+    )
+    assert total == expected
+    # Throughput must stay linear in line size; 1 MB lines used to be quadratic.
+    assert mb / elapsed > 20
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from execution import HostRunner, SimpleResult, SubprocessRunner, get_default_runner
+from execution import (
+    BoundedOutput,
+    CaptureLimits,
+    HostRunner,
+    SimpleResult,
+    SubprocessRunner,
+    clip_output,
+    get_default_runner,
+    tail_with_markers,
+)
 
 # ---------------------------------------------------------------------------
 # Protocol compliance
@@ -283,6 +294,100 @@ class TestHostRunnerRunSimple:
         assert "\ufffd" in result.stderr
 
 
+# ---------------------------------------------------------------------------
+# Bounded output capture
+# ---------------------------------------------------------------------------
+
+
+class TestBoundedOutput:
+    """Tests for BoundedOutput and clip_output."""
+
+    def test_small_output_is_kept_whole(self) -> None:
+        limits = CaptureLimits(head_bytes=4, tail_bytes=4)
+
+        assert clip_output(b"abcdefg", limits, "stdout") == "abcdefg"
+
+    def test_middle_is_dropped_across_chunks(self) -> None:
+        out = BoundedOutput(CaptureLimits(head_bytes=3, tail_bytes=4), "stdout")
+        for chunk in (b"abc", b"defgh", b"ijklmnop", b"qrst"):
+            out.feed(chunk)
+
+        assert out.finish() == "abc\n[... 13 bytes omitted ...]\nqrst"
+
+    def test_tail_only_limits(self) -> None:
+        text = clip_output(b"x" * 100 + b"END", CaptureLimits.tail_chars(1), "stdout")
+
+        assert text.endswith("xEND")
+        assert "99 bytes omitted" in text
+
+    def test_spill_file_kept_only_when_truncated(self, tmp_path: Path) -> None:
+        spill = tmp_path / "logs" / "run"
+        limits = CaptureLimits(head_bytes=0, tail_bytes=2, spill_path=spill)
+
+        truncated = clip_output(b"abcdef", limits, "stdout")
+        whole = clip_output(b"ab", limits, "stderr")
+
+        log = tmp_path / "logs" / "run.stdout.log"
+        assert f"full output in {log}" in truncated
+        assert log.read_bytes() == b"abcdef"
+        assert whole == "ab"
+        assert not (tmp_path / "logs" / "run.stderr.log").exists()
+
+    def test_tail_with_markers_keeps_sliced_off_marker(self, tmp_path: Path) -> None:
+        spill = tmp_path / "logs" / "run"
+        limits = CaptureLimits.tail_chars(10, spill_path=spill)
+        text = clip_output(b"x" * 200 + b"END", limits, "stdout")
+
+        clipped = tail_with_markers(text, 10)
+
+        assert clipped.endswith("xxxxxxxEND")
+        assert clipped.startswith("[... ")
+        assert f"full output in {spill}.stdout.log" in clipped
+        assert tail_with_markers("short", 10) == "short"
+
+
+class TestHostRunnerCapture:
+    """Tests for HostRunner.run_simple with capture limits."""
+
+    @pytest.mark.asyncio
+    async def test_large_output_is_bounded(self) -> None:
+        script = (
+            "import sys\n"
+            "sys.stdout.write('HEAD' + 'x' * 2_000_000 + 'TAIL')\n"
+            "sys.stderr.write('e' * 10)\n"
+            "sys.exit(3)\n"
+        )
+        result = await HostRunner().run_simple(
+            [sys.executable, "-c", script],
+            capture=CaptureLimits(head_bytes=4, tail_bytes=8),
+        )
+
+        assert result.returncode == 3
+        assert result.stdout.startswith("HEAD\n[... ")
+        assert result.stdout.endswith("xxxxTAIL")
+        assert len(result.stdout) < 100
+        assert result.stderr == "e" * 10
+
+    @pytest.mark.asyncio
+    async def test_input_is_written_to_stdin(self) -> None:
+        result = await HostRunner().run_simple(
+            [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+            input=b"hello",
+            capture=CaptureLimits(),
+        )
+
+        assert result.stdout == "HELLO"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self) -> None:
+        with pytest.raises(TimeoutError):
+            await HostRunner().run_simple(
+                [sys.executable, "-c", "import time; time.sleep(10)"],
+                timeout=0.2,
+                capture=CaptureLimits(),
+            )
+
+
 # ---------------------------------------------------------------------------
 # get_default_runner
 # ---------------------------------------------------------------------------
@@ -9,7 +9,13 @@ from unittest.mock import patch
 
 import pytest
 
-from file_util import append_jsonl, atomic_write, file_lock
+from file_util import (
+    DirListingCache,
+    append_jsonl,
+    atomic_write,
+    dir_size_bytes,
+    file_lock,
+)
 
 
 class TestAtomicWrite:
@@ -143,3 +149,72 @@ class TestFileLock:
         assert len(calls) == 2
         assert calls[0][1] == fcntl.LOCK_EX
         assert calls[1][1] == fcntl.LOCK_UN
+
+
+class TestDirSizeBytes:
+    """Tests for dir_size_bytes()."""
+
+    def test_missing_directory_is_zero(self, tmp_path: Path) -> None:
+        assert dir_size_bytes(tmp_path / "nope") == 0
+
+    def test_counts_nested_files(self, tmp_path: Path) -> None:
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.bin").write_bytes(b"x" * 8192)
+
+        assert dir_size_bytes(tmp_path) >= 4096
+
+    def test_hardlinks_counted_once(self, tmp_path: Path) -> None:
+        (tmp_path / "a.bin").write_bytes(b"x" * 8192)
+        single = dir_size_bytes(tmp_path)
+        os.link(tmp_path / "a.bin", tmp_path / "b.bin")
+
+        assert dir_size_bytes(tmp_path) == single
+
+    def test_records_hardlinked_files(self, tmp_path: Path) -> None:
+        (tmp_path / "a.bin").write_bytes(b"x" * 8192)
+        (tmp_path / "solo.bin").write_bytes(b"x" * 8192)
+        os.link(tmp_path / "a.bin", tmp_path / "b.bin")
+        linked: dict[tuple[int, int], int] = {}
+
+        total = dir_size_bytes(tmp_path, linked=linked)
+
+        st = (tmp_path / "a.bin").stat()
+        assert list(linked) == [(st.st_dev, st.st_ino)]
+        assert 0 < linked[(st.st_dev, st.st_ino)] < total
+
+    def test_cache_skips_unchanged_directories(self, tmp_path: Path) -> None:
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.bin").write_bytes(b"x" * 8192)
+        cache = DirListingCache()
+        first = dir_size_bytes(tmp_path, cache=cache)
+
+        with patch("file_util._list_dir") as list_dir:
+            assert dir_size_bytes(tmp_path, cache=cache) == first
+        list_dir.assert_not_called()
+
+        (tmp_path / "sub" / "b.bin").write_bytes(b"x" * 8192)
+
+        assert dir_size_bytes(tmp_path, cache=cache) > first
+
+    def test_cache_prune_drops_unused_listings(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        cache = DirListingCache()
+        dir_size_bytes(tmp_path / "a", cache=cache)
+        dir_size_bytes(tmp_path / "b", cache=cache)
+        cache.prune()
+
+        dir_size_bytes(tmp_path / "a", cache=cache)
+        cache.prune()
+
+        assert list(cache._dirs) == [str(tmp_path / "a")]
+
+    def test_symlinks_not_followed(self, tmp_path: Path) -> None:
+        target = tmp_path / "outside"
+        target.mkdir()
+        (target / "big.bin").write_bytes(b"x" * 65536)
+        tree = tmp_path / "tree"
+        tree.mkdir()
+        (tree / "link").symlink_to(target)
+
+        assert dir_size_bytes(tree) < 65536
@@ -14,6 +14,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from config import HydraFlowConfig
 
 from models import (
@@ -58,6 +60,7 @@ class TestImplementBatch:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return next(r for r in expected if r.issue_number == issue.id)
 
@@ -80,6 +83,7 @@ class TestImplementBatch:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             concurrency_counter["current"] += 1
             concurrency_counter["peak"] = max(
@@ -233,6 +237,7 @@ class TestImplementIncludesPush:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             call_order.append("agent")
             return WorkerResultFactory.create(
@@ -295,6 +300,7 @@ class TestWorkerExceptionIsolation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             raise RuntimeError("agent crashed")
 
@@ -320,6 +326,7 @@ class TestWorkerExceptionIsolation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             raise RuntimeError("agent crashed")
 
@@ -343,6 +350,7 @@ class TestWorkerExceptionIsolation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             raise RuntimeError("agent crashed")
 
@@ -368,6 +376,7 @@ class TestWorkerExceptionIsolation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             nonlocal call_count
             call_count += 1
@@ -497,6 +506,7 @@ class TestWorktreeCreationFailure:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             # Simulate slow execution
             await asyncio.sleep(10)
@@ -540,6 +550,7 @@ class TestImplementLifecycleMetrics:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -568,6 +579,7 @@ class TestImplementLifecycleMetrics:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -596,6 +608,7 @@ class TestImplementLifecycleMetrics:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -637,6 +650,7 @@ class TestImplementLifecycleMetrics:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -677,6 +691,7 @@ class TestReviewFeedbackPassing:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             captured_feedback.append(review_feedback)
             return WorkerResultFactory.create(
@@ -712,6 +727,7 @@ class TestReviewFeedbackPassing:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResultFactory.create(
                 issue_number=issue.id,
@@ -746,6 +762,7 @@ class TestReviewFeedbackPassing:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             captured_feedback.append(review_feedback)
             return WorkerResultFactory.create(
@@ -778,6 +795,7 @@ class TestReviewFeedbackPassing:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResultFactory.create(
                 issue_number=issue.id,
@@ -818,6 +836,7 @@ class TestReviewFeedbackPassing:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResultFactory.create(
                 issue_number=issue.id,
@@ -862,6 +881,7 @@ class TestWorkerResultMetaPersistence:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -897,6 +917,7 @@ class TestWorkerResultMetaPersistence:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -935,6 +956,7 @@ class TestZeroCommitEscalation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -972,6 +994,7 @@ class TestZeroCommitEscalation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1003,6 +1026,7 @@ class TestZeroCommitEscalation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1040,6 +1064,7 @@ class TestZeroCommitEscalation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1081,6 +1106,7 @@ class TestPostMortemMemoryFiling:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1115,6 +1141,7 @@ class TestPostMortemMemoryFiling:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1149,6 +1176,7 @@ class TestPostMortemMemoryFiling:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1227,6 +1255,7 @@ class TestRetryCapEscalation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             nonlocal agent_called
             agent_called = True
@@ -1306,6 +1335,7 @@ class TestCommitsPersistedInMeta:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1509,6 +1539,7 @@ class TestRunImplementation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             captured_feedback.append(review_feedback)
             return WorkerResultFactory.create(
@@ -1550,6 +1581,7 @@ class TestRunImplementation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             return WorkerResult(
                 issue_number=issue.id,
@@ -1570,6 +1602,70 @@ class TestRunImplementation:
         assert stats.total_implementation_seconds == pytest.approx(60.0)
         assert stats.total_quality_fix_rounds == 2
 
+    @pytest.mark.asyncio
+    async def test_records_file_overlap_outcome(self, config: HydraFlowConfig) -> None:
+        """The overlap scheduler should see the worktree the agent changed."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from overlap_scheduler import OverlapScheduler
+
+        issue = TaskFactory.create()
+        phase, _, _ = make_implement_phase(config, [issue])
+        scheduler = MagicMock(spec=OverlapScheduler)
+        scheduler.record_outcome = AsyncMock()
+        phase._overlap_scheduler = scheduler
+
+        await phase._run_implementation(issue, "agent/issue-42", 0, "")
+
+        scheduler.record_outcome.assert_awaited_once_with(
+            42, config.worktree_base / "issue-42"
+        )
+
+    @pytest.mark.asyncio
+    async def test_records_file_overlap_outcome_when_agent_raises(
+        self, config: HydraFlowConfig
+    ) -> None:
+        """A crashed agent run should still settle its overlap prediction."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from overlap_scheduler import OverlapScheduler
+
+        issue = TaskFactory.create()
+        phase, _, _ = make_implement_phase(config, [issue])
+        phase._agents.run = AsyncMock(side_effect=RuntimeError("boom"))
+        scheduler = MagicMock(spec=OverlapScheduler)
+        scheduler.record_outcome = AsyncMock()
+        phase._overlap_scheduler = scheduler
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await phase._run_implementation(issue, "agent/issue-42", 0, "")
+
+        scheduler.record_outcome.assert_awaited_once_with(
+            42, config.worktree_base / "issue-42"
+        )
+
+    @pytest.mark.asyncio
+    async def test_discards_overlap_prediction_when_setup_fails(
+        self, config: HydraFlowConfig
+    ) -> None:
+        """Without a worktree there is nothing to compare, so the prediction is dropped."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from overlap_scheduler import OverlapScheduler
+
+        issue = TaskFactory.create()
+        phase, _, _ = make_implement_phase(config, [issue])
+        phase._setup_worktree_and_branch = AsyncMock(side_effect=RuntimeError("boom"))
+        scheduler = MagicMock(spec=OverlapScheduler)
+        scheduler.record_outcome = AsyncMock()
+        phase._overlap_scheduler = scheduler
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await phase._run_implementation(issue, "agent/issue-42", 0, "")
+
+        scheduler.discard.assert_called_once_with(42)
+        scheduler.record_outcome.assert_not_awaited()
+
 
 class TestHandleImplementationResult:
     """Unit tests for the _handle_implementation_result helper."""
@@ -1751,6 +1847,7 @@ class TestWorkerInner:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             nonlocal agent_called
             agent_called = True
@@ -1798,6 +1895,7 @@ class TestWorkerInner:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             nonlocal agent_called
             agent_called = True
@@ -1836,6 +1934,53 @@ class TestWorkerInner:
         # transition should be called from _handle_implementation_result, not the skip path
         mock_prs.transition.assert_awaited()
 
+    @pytest.mark.asyncio
+    async def test_transcript_streams_to_run_recording(
+        self, config: HydraFlowConfig
+    ) -> None:
+        """Transcript lines reach the run recording while the agent runs."""
+        from unittest.mock import MagicMock
+
+        issue = TaskFactory.create()
+        ctx = MagicMock()
+        streamed_mid_run: list[str] = []
+
+        async def streaming_agent(
+            issue: Task,
+            wt_path: Path,
+            branch: str,
+            worker_id: int = 0,
+            review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
+        ) -> WorkerResult:
+            assert on_output is not None
+            assert on_output("one\ntw") is False
+            streamed_mid_run.extend(
+                c.args[0] for c in ctx.append_transcript.call_args_list
+            )
+            on_output("one\ntwo\nthree\n")
+            return WorkerResultFactory.create(
+                issue_number=issue.id,
+                worktree_path=str(wt_path),
+                transcript="final transcript",
+            )
+
+        phase, _, _ = make_implement_phase(
+            config,
+            [issue],
+            agent_run=streaming_agent,
+            create_pr_return=PRInfoFactory.create(),
+        )
+        phase._run_recorder = MagicMock()
+        phase._run_recorder.start.return_value = ctx
+
+        await phase._worker_inner(0, issue, "agent/issue-42")
+
+        assert streamed_mid_run == ["one"]
+        lines = [c.args[0] for c in ctx.append_transcript.call_args_list]
+        assert lines == ["one", "two", "three"]
+        ctx.finalize.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # _read_plan_for_recording
@@ -1888,6 +2033,7 @@ class TestCriticalExceptionPropagation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             raise AuthenticationError("401 Unauthorized")
 
@@ -1913,6 +2059,7 @@ class TestCriticalExceptionPropagation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             raise CreditExhaustedError("limit reached")
 
@@ -1936,6 +2083,7 @@ class TestCriticalExceptionPropagation:
             branch: str,
             worker_id: int = 0,
             review_feedback: str = "",
+            on_output: Callable[[str], bool] | None = None,
         ) -> WorkerResult:
             raise MemoryError("out of memory")
 
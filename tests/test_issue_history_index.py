@@ -0,0 +1,227 @@
+"""Tests for issue_history_index.py — IssueHistoryIndex."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from events import EventBus, EventType, HydraFlowEvent
+from issue_history_index import IssueHistoryIndex, build_history_entry, row_matches
+from prompt_telemetry import PromptTelemetry
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _record(telemetry: PromptTelemetry, issue_number: int, total_tokens: int) -> None:
+    telemetry.record(
+        source="implementer",
+        tool="claude",
+        model="sonnet",
+        issue_number=issue_number,
+        pr_number=None,
+        session_id="sess-1",
+        prompt_chars=100,
+        transcript_chars=50,
+        duration_seconds=1.0,
+        success=True,
+        stats={"total_tokens": total_tokens},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Incremental maintenance
+# ---------------------------------------------------------------------------
+
+
+class TestIssueHistoryIndexSync:
+    """Tests for folding events and telemetry into rows."""
+
+    @pytest.mark.asyncio
+    async def test_new_records_and_events_are_folded_in(
+        self, config, event_bus: EventBus
+    ) -> None:
+        telemetry = PromptTelemetry(config)
+        _record(telemetry, 7, 100)
+        index = IssueHistoryIndex(config, event_bus)
+        index.sync(telemetry)
+
+        _record(telemetry, 7, 50)
+        await event_bus.publish(
+            HydraFlowEvent(
+                type=EventType.ISSUE_CREATED, data={"issue": 7, "title": "Add cache"}
+            )
+        )
+        index.sync(telemetry)
+
+        row = index.rows[7]
+        assert row["inference"]["inference_calls"] == 2
+        assert row["inference"]["total_tokens"] == 150
+        assert row["title"] == "Add cache"
+        assert row["session_ids"] == {"sess-1"}
+
+    @pytest.mark.asyncio
+    async def test_merge_resolves_issue_through_pr_link(
+        self, config, event_bus: EventBus
+    ) -> None:
+        index = IssueHistoryIndex(config, event_bus)
+        index.sync(PromptTelemetry(config))
+
+        await event_bus.publish(
+            HydraFlowEvent(type=EventType.PR_CREATED, data={"issue": 3, "pr": 30})
+        )
+        await event_bus.publish(
+            HydraFlowEvent(
+                type=EventType.MERGE_UPDATE, data={"pr": 30, "status": "merged"}
+            )
+        )
+        index.sync(PromptTelemetry(config))
+
+        assert index.rows[3]["status"] == "merged"
+        assert index.rows[3]["prs"][30]["merged"] is True
+
+    def test_shrunk_log_is_replayed(self, config, event_bus: EventBus) -> None:
+        telemetry = PromptTelemetry(config)
+        _record(telemetry, 7, 100)
+        _record(telemetry, 7, 100)
+        index = IssueHistoryIndex(config, event_bus)
+        index.sync(telemetry)
+
+        inferences = config.data_path("metrics", "prompt", "inferences.jsonl")
+        first_line = inferences.read_text().splitlines(keepends=True)[0]
+        inferences.write_text(first_line)
+        index.sync(PromptTelemetry(config))
+
+        assert index.rows[7]["inference"]["inference_calls"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+
+class TestIssueHistoryIndexSnapshot:
+    """Tests for the on-disk snapshot."""
+
+    def test_warm_start_does_not_recount_telemetry(
+        self, config, event_bus: EventBus
+    ) -> None:
+        telemetry = PromptTelemetry(config)
+        _record(telemetry, 7, 100)
+        IssueHistoryIndex(config, event_bus).sync(telemetry)
+
+        _record(telemetry, 7, 25)
+        index = IssueHistoryIndex(config, EventBus())
+        assert index.rows[7]["inference"]["total_tokens"] == 100
+        index.sync(telemetry)
+
+        assert index.rows[7]["inference"]["inference_calls"] == 2
+        assert index.rows[7]["inference"]["total_tokens"] == 125
+
+    def test_snapshot_without_offset_replays_telemetry(
+        self, config, event_bus: EventBus
+    ) -> None:
+        telemetry = PromptTelemetry(config)
+        _record(telemetry, 7, 100)
+        snapshot = config.data_path("metrics", "history_cache.json")
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        snapshot.write_text(
+            json.dumps(
+                {
+                    "event_count": 0,
+                    "telemetry_mtime": 0.0,
+                    "issue_rows": {
+                        "7": {
+                            "issue_number": 7,
+                            "title": "Enriched title",
+                            "prs": {},
+                            "linked_issues": {"9": {"target_id": 9}},
+                            "session_ids": ["sess-1"],
+                            "inference": {"inference_calls": 1, "total_tokens": 100},
+                        }
+                    },
+                    "pr_to_issue": {},
+                    "enriched_issues": [7],
+                }
+            )
+        )
+
+        index = IssueHistoryIndex(config, event_bus)
+        index.sync(telemetry)
+
+        row = index.rows[7]
+        assert row["title"] == "Enriched title"
+        assert list(row["linked_issues"]) == [9]
+        assert row["inference"]["total_tokens"] == 100
+        assert index.is_enriched(7)
+
+
+# ---------------------------------------------------------------------------
+# Views
+# ---------------------------------------------------------------------------
+
+
+class TestIssueHistoryIndexViews:
+    """Tests for range views, enrichment and entry rendering."""
+
+    @pytest.mark.asyncio
+    async def test_range_rows_copy_enrichment_from_index(
+        self, config, event_bus: EventBus
+    ) -> None:
+        await event_bus.publish(
+            HydraFlowEvent(
+                type=EventType.WORKER_UPDATE,
+                timestamp="2026-02-25T00:00:00+00:00",
+                data={"issue": 5, "status": "running"},
+            )
+        )
+        index = IssueHistoryIndex(config, event_bus)
+        index.sync(PromptTelemetry(config))
+        index.apply_github_issue(
+            5,
+            SimpleNamespace(
+                title="Real title",
+                url="https://github.com/o/r/issues/5",
+                labels=["epic:speed"],
+                milestone_number=None,
+                body="",
+            ),
+        )
+
+        rows = index.range_rows(
+            event_bus.get_history(),
+            [],
+            datetime(2026, 2, 24, tzinfo=UTC),
+            datetime(2026, 2, 26, tzinfo=UTC),
+        )
+
+        assert rows[5]["title"] == "Real title"
+        assert rows[5]["epic"] == "epic:speed"
+        assert rows[5]["status"] == "active"
+        assert rows[5] is not index.rows[5]
+
+    @pytest.mark.asyncio
+    async def test_entry_rendering_and_filters(
+        self, config, event_bus: EventBus
+    ) -> None:
+        await event_bus.publish(
+            HydraFlowEvent(
+                type=EventType.REVIEW_UPDATE,
+                data={"issue": 12, "status": "done", "title": "Speed up history"},
+            )
+        )
+        index = IssueHistoryIndex(config, event_bus)
+        index.sync(PromptTelemetry(config))
+        row = index.rows[12]
+
+        entry = build_history_entry(row, None)
+
+        assert entry.status == "reviewed"
+        assert entry.title == "Speed up history"
+        assert row_matches(row, "reviewed", "speed")
+        assert row_matches(row, "", "12")
+        assert not row_matches(row, "merged", "")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -1221,6 +1222,41 @@ class TestCrateGate:
         assert uncrated[0].id == 2
 
 
+# ── Overlap-aware ready queue ────────────────────────────────────────
+
+
+class TestOverlapScheduling:
+    """The ready queue defers issues whose plans overlap in-flight work."""
+
+    def test_take_prefers_issue_disjoint_from_running_work(
+        self, tmp_path: Path
+    ) -> None:
+        from overlap_scheduler import OverlapScheduler
+
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        config.plans_dir.mkdir(parents=True)
+        for number, path in ((1, "src/a.py"), (2, "src/a.py"), (3, "src/b.py")):
+            (config.plans_dir / f"issue-{number}.md").write_text(
+                f"## File Delta\n\nMODIFIED: {path}\n"
+            )
+        store = IssueStore(config, AsyncMock(), EventBus())
+        store.set_overlap_scheduler(OverlapScheduler(config))
+        store.mark_active(1, "implement")
+        store._route_issues(
+            [
+                TaskFactory.create(id=2, tags=["test-label"]),
+                TaskFactory.create(id=3, tags=["test-label"]),
+            ]
+        )
+
+        taken = store.get_implementable(1)
+
+        assert [t.id for t in taken] == [3]
+        assert [t.id for t in store._queues[STAGE_READY]] == [2]
+        assert store._queue_members[STAGE_READY] == {2}
+        assert 3 in store._in_flight
+
+
 # ── Additive-only queue (no eviction) ────────────────────────────────
 
 
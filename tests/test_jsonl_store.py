@@ -0,0 +1,124 @@
+"""Tests for jsonl_store.py — JsonlStore."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from jsonl_store import JsonlStore
+
+
+class _Item(BaseModel):
+    name: str
+    count: int = 0
+
+
+def _keyed(path: Path) -> JsonlStore[_Item]:
+    return JsonlStore(path, _Item, key=lambda item: item.name)
+
+
+# ---------------------------------------------------------------------------
+# Tail reads
+# ---------------------------------------------------------------------------
+
+
+class TestTail:
+    """Tests for reading the last records of the log."""
+
+    def test_returns_last_records_oldest_first(self, tmp_path: Path) -> None:
+        store = JsonlStore(tmp_path / "log.jsonl", _Item)
+        store.append(*(_Item(name=f"i{n}") for n in range(10)))
+
+        assert [r.name for r in store.tail(3)] == ["i7", "i8", "i9"]
+        assert len(store.tail(50)) == 10
+
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        assert JsonlStore(tmp_path / "absent.jsonl", _Item).tail(5) == []
+
+    def test_reads_across_block_boundaries(self, tmp_path: Path) -> None:
+        store = JsonlStore(tmp_path / "log.jsonl", _Item)
+        store.append(*(_Item(name=f"item-{n}", count=n) for n in range(200)))
+
+        with patch("jsonl_store._TAIL_BLOCK_SIZE", 37):
+            fresh = JsonlStore(tmp_path / "log.jsonl", _Item)
+            tail = fresh.tail(120)
+
+        assert [r.count for r in tail] == list(range(80, 200))
+
+    def test_skips_blank_and_malformed_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_text('{"name": "a"}\nnot json\n\n{"name": "b"}\n')
+
+        assert [r.name for r in JsonlStore(path, _Item).tail(5)] == ["a", "b"]
+
+    def test_cached_records_are_not_shared_with_callers(self, tmp_path: Path) -> None:
+        store = JsonlStore(tmp_path / "log.jsonl", _Item)
+        store.append(_Item(name="a", count=1))
+
+        store.tail(1)[0].count = 99
+
+        assert store.tail(1)[0].count == 1
+
+    def test_sees_external_rewrites(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        store = JsonlStore(path, _Item)
+        store.append(_Item(name="a"))
+        store.tail(1)
+
+        path.write_text('{"name": "b"}\n')
+
+        assert [r.name for r in store.tail(1)] == ["b"]
+
+
+# ---------------------------------------------------------------------------
+# Keyed stores
+# ---------------------------------------------------------------------------
+
+
+class TestKeyedStore:
+    """Tests for last-write-wins folding and compaction."""
+
+    def test_latest_keeps_first_seen_order(self, tmp_path: Path) -> None:
+        store = _keyed(tmp_path / "log.jsonl")
+        store.append(_Item(name="a", count=1), _Item(name="b", count=1))
+        store.append(_Item(name="a", count=2))
+
+        assert [(r.name, r.count) for r in store.latest()] == [("a", 2), ("b", 1)]
+
+    def test_updates_append_instead_of_rewriting(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        store = _keyed(path)
+        store.append(_Item(name="a", count=1))
+        store.latest()
+        inode = path.stat().st_ino
+
+        store.append(_Item(name="a", count=2))
+
+        assert path.stat().st_ino == inode
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_compact_drops_superseded_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        store = _keyed(path)
+        for n in range(5):
+            store.append(_Item(name="a", count=n))
+
+        store.compact()
+
+        assert path.read_text().splitlines() == ['{"name":"a","count":4}']
+        assert [r.count for r in _keyed(path).latest()] == [4]
+
+    def test_compacts_in_background_past_slack(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        store = _keyed(path)
+        store.latest()
+
+        with patch("jsonl_store._COMPACT_SLACK", 3):
+            for n in range(6):
+                store.append(_Item(name="a", count=n))
+            store.wait_for_compaction(timeout=5)
+
+        assert len(path.read_text().splitlines()) < 6
+        assert [r.count for r in store.latest()] == [5]
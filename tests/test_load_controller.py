@@ -0,0 +1,129 @@
+"""Tests for load_controller.py — LoadController."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import load_controller
+from load_controller import LoadController, LoadSample, sample_system_load
+from tests.helpers import ConfigFactory
+
+_CALM = LoadSample(load_per_core=0.5, free_memory_ratio=0.8, pressure=1.0)
+_HOT = LoadSample(load_per_core=4.0, free_memory_ratio=0.8, pressure=1.0)
+# Under every limit but inside the hysteresis band
+_WARM = LoadSample(load_per_core=2.5, free_memory_ratio=0.8, pressure=1.0)
+
+
+def _controller(tmp_path: Path) -> LoadController:
+    config = ConfigFactory.create(repo_root=tmp_path / "repo")
+    config.load_control_enabled = True
+    return LoadController(config, sampler=lambda: _CALM)
+
+
+class TestLoadController:
+    """Tests for stepping the concurrency fraction."""
+
+    def test_overload_steps_down_to_floor(self, tmp_path: Path) -> None:
+        controller = _controller(tmp_path)
+
+        for _ in range(10):
+            controller.observe(_HOT)
+
+        assert controller.fraction == 0.25
+        assert controller.limit(8) == 2
+        assert controller.limit(2) == 1
+
+    def test_memory_and_pressure_also_throttle(self, tmp_path: Path) -> None:
+        controller = _controller(tmp_path)
+
+        controller.observe(LoadSample(0.1, free_memory_ratio=0.05, pressure=0.0))
+        controller.observe(LoadSample(0.1, free_memory_ratio=0.9, pressure=90.0))
+
+        assert controller.fraction == 0.5
+
+    def test_recovery_needs_consecutive_calm_samples(self, tmp_path: Path) -> None:
+        controller = _controller(tmp_path)
+        controller.observe(_HOT)
+
+        controller.observe(_CALM)
+        controller.observe(_CALM)
+        controller.observe(_WARM)
+        controller.observe(_CALM)
+        controller.observe(_CALM)
+        assert controller.fraction == 0.75
+
+        controller.observe(_CALM)
+        assert controller.fraction == 1.0
+
+    def test_holds_steady_inside_hysteresis_band(self, tmp_path: Path) -> None:
+        controller = _controller(tmp_path)
+        controller.observe(_HOT)
+
+        for _ in range(10):
+            controller.observe(_WARM)
+
+        assert controller.fraction == 0.75
+
+    def test_samples_at_most_once_per_interval(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        now = [0.0]
+        calls: list[int] = []
+
+        def sampler() -> LoadSample:
+            calls.append(1)
+            return _HOT
+
+        controller = LoadController(config, sampler=sampler, clock=lambda: now[0])
+        controller.limit(4)
+        controller.limit(4)
+        now[0] = float(config.load_control_interval)
+        assert controller.limit(4) == 2
+
+        assert len(calls) == 2
+
+
+class TestSampling:
+    """Tests for reading /proc."""
+
+    def test_reads_pressure_and_meminfo(self, tmp_path: Path) -> None:
+        pressure = tmp_path / "pressure"
+        pressure.mkdir()
+        (pressure / "cpu").write_text(
+            "some avg10=12.50 avg60=3.00 avg300=1.00 total=10\n"
+            "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n"
+        )
+        (pressure / "io").write_text(
+            "some avg10=55.00 avg60=1.00 avg300=1.00 total=1\n"
+        )
+        meminfo = tmp_path / "meminfo"
+        meminfo.write_text("MemTotal: 1000 kB\nMemFree: 100 kB\nMemAvailable: 250 kB\n")
+
+        with (
+            patch.object(load_controller, "_PRESSURE_DIR", pressure),
+            patch.object(load_controller, "_MEMINFO", meminfo),
+        ):
+            sample = sample_system_load()
+
+        assert sample.pressure == 55.0
+        assert sample.free_memory_ratio == 0.25
+
+    def test_missing_proc_files_read_as_unloaded(self, tmp_path: Path) -> None:
+        with (
+            patch.object(load_controller, "_PRESSURE_DIR", tmp_path / "none"),
+            patch.object(load_controller, "_MEMINFO", tmp_path / "none"),
+        ):
+            sample = sample_system_load()
+
+        assert sample.pressure == 0.0
+        assert sample.free_memory_ratio == 1.0
+
+
+class TestEffectiveConcurrency:
+    """Tests for the process-wide controller."""
+
+    def test_disabled_returns_configured(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        with patch.object(load_controller, "_controller", None):
+            load_controller.configure_load_controller(config)
+            assert load_controller.effective_concurrency(5) == 5
@@ -0,0 +1,171 @@
+"""Tests for local_diff.py — LocalDiffProvider and numstat parsing."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from local_diff import LocalDiffProvider, parse_numstat_z
+from tests.conftest import PRInfoFactory
+from tests.helpers import ConfigFactory, make_review_phase
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def _make_branch_repo(tmp_path: Path) -> Path:
+    """Create a repo whose HEAD is one commit ahead of ``origin/main``."""
+    repo = tmp_path / "wt"
+    repo.mkdir()
+    _git(repo, "init", "-b", "main")
+    _git(repo, "config", "user.email", "test@test.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / "keep.py").write_text("a = 1\n")
+    (repo / "old_name.py").write_text("".join(f"line {i}\n" for i in range(20)))
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "base")
+    _git(repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+    _git(repo, "checkout", "-b", "agent/issue-1")
+    (repo / "keep.py").write_text("a = 2\nb = 3\n")
+    _git(repo, "mv", "old_name.py", "new_name.py")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "change")
+    return repo
+
+
+# ---------------------------------------------------------------------------
+# parse_numstat_z
+# ---------------------------------------------------------------------------
+
+
+class TestParseNumstatZ:
+    """Tests for parse_numstat_z."""
+
+    def test_plain_and_renamed_and_binary_records(self) -> None:
+        output = "2\t1\tkeep.py\x000\t0\t\x00old.py\x00new.py\x00-\t-\tlogo.png\x00"
+
+        stats = parse_numstat_z(output)
+
+        assert [(s.path, s.old_path, s.added, s.removed, s.binary) for s in stats] == [
+            ("keep.py", "", 2, 1, False),
+            ("new.py", "old.py", 0, 0, False),
+            ("logo.png", "", 0, 0, True),
+        ]
+
+    def test_empty_output(self) -> None:
+        assert parse_numstat_z("") == []
+
+
+# ---------------------------------------------------------------------------
+# LocalDiffProvider
+# ---------------------------------------------------------------------------
+
+
+class TestLocalDiffProvider:
+    """Tests for LocalDiffProvider against a real git checkout."""
+
+    @pytest.mark.asyncio
+    async def test_diff_and_stats_detect_renames(self, tmp_path: Path) -> None:
+        repo = _make_branch_repo(tmp_path)
+        provider = LocalDiffProvider(ConfigFactory.create(repo_root=tmp_path))
+
+        diff = await provider.get_diff(repo)
+        stats = await provider.get_file_stats(repo)
+
+        assert "rename from old_name.py" in diff
+        assert "+b = 3" in diff
+        by_path = {s.path: s for s in stats}
+        assert by_path["keep.py"].added == 2
+        assert by_path["keep.py"].removed == 1
+        assert by_path["new_name.py"].old_path == "old_name.py"
+        assert await provider.get_diff_names(repo) == ["keep.py", "new_name.py"]
+
+    @pytest.mark.asyncio
+    async def test_non_checkout_returns_empty(self, tmp_path: Path) -> None:
+        provider = LocalDiffProvider(ConfigFactory.create(repo_root=tmp_path))
+
+        assert await provider.get_diff(tmp_path) == ""
+        assert await provider.get_diff_names(None) == []
+
+    @pytest.mark.asyncio
+    async def test_missing_base_ref_returns_empty(self, tmp_path: Path) -> None:
+        repo = _make_branch_repo(tmp_path)
+        _git(repo, "update-ref", "-d", "refs/remotes/origin/main")
+        provider = LocalDiffProvider(ConfigFactory.create(repo_root=tmp_path))
+
+        assert await provider.get_diff(repo) == ""
+
+    @pytest.mark.asyncio
+    async def test_diff_since_limits_to_new_commits_and_paths(
+        self, tmp_path: Path
+    ) -> None:
+        repo = _make_branch_repo(tmp_path)
+        provider = LocalDiffProvider(ConfigFactory.create(repo_root=tmp_path))
+        reviewed = await provider.head_sha(repo)
+        (repo / "keep.py").write_text("a = 2\nb = 4\n")
+        (repo / "unrelated.py").write_text("x = 1\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-m", "fix")
+
+        delta = await provider.get_diff_since(repo, reviewed, ["keep.py"])
+
+        assert delta is not None
+        assert "-b = 3" in delta
+        assert "+b = 4" in delta
+        assert "+a = 2" not in delta
+        assert "unrelated.py" not in delta
+
+    @pytest.mark.asyncio
+    async def test_diff_since_non_ancestor_returns_none(self, tmp_path: Path) -> None:
+        repo = _make_branch_repo(tmp_path)
+        provider = LocalDiffProvider(ConfigFactory.create(repo_root=tmp_path))
+        reviewed = await provider.head_sha(repo)
+        _git(repo, "commit", "--amend", "-m", "rewritten")
+
+        assert await provider.get_diff_since(repo, reviewed, ["keep.py"]) is None
+        assert await provider.get_diff_since(tmp_path, reviewed, ["keep.py"]) is None
+
+
+# ---------------------------------------------------------------------------
+# ReviewPhase diff source selection
+# ---------------------------------------------------------------------------
+
+
+class TestReviewPhaseDiffSource:
+    """ReviewPhase prefers the local diff and falls back to the API."""
+
+    @pytest.mark.asyncio
+    async def test_local_diff_used_when_available(self, config, tmp_path) -> None:
+        phase = make_review_phase(config)
+        provider = AsyncMock(spec=LocalDiffProvider)
+        provider.get_diff.return_value = "local diff"
+        provider.get_diff_names.return_value = ["a.py"]
+        phase._diff_provider = provider
+        pr = PRInfoFactory.create()
+
+        assert await phase._get_pr_diff(pr, tmp_path) == "local diff"
+        assert await phase._get_pr_diff_names(pr, tmp_path) == ["a.py"]
+        phase._prs.get_pr_diff.assert_not_awaited()
+        phase._prs.get_pr_diff_names.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_api_when_local_empty(self, config, tmp_path) -> None:
+        phase = make_review_phase(config)
+        provider = AsyncMock(spec=LocalDiffProvider)
+        provider.get_diff.return_value = ""
+        provider.get_diff_names.return_value = []
+        phase._diff_provider = provider
+        phase._prs.get_pr_diff = AsyncMock(return_value="api diff")
+        phase._prs.get_pr_diff_names = AsyncMock(return_value=["b.py"])
+        pr = PRInfoFactory.create()
+
+        assert await phase._get_pr_diff(pr, tmp_path) == "api diff"
+        assert await phase._get_pr_diff_names(pr, tmp_path) == ["b.py"]
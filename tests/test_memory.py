@@ -18,6 +18,7 @@ from memory import (
     load_memory_digest,
     parse_memory_suggestion,
 )
+from memory_index import load_learning_index
 from models import MEMORY_TYPE_DISPLAY_ORDER, ManifestRefreshResult, MemoryType
 from state import StateTracker
 from tests.helpers import ConfigFactory
@@ -584,6 +585,24 @@ class TestMemorySyncWorkerCompactDigest:
         assert len(result) <= 520  # 500 + truncation marker
         assert "truncated" in result
 
+    @pytest.mark.asyncio
+    async def test_over_limit_skips_model_when_summarise_disabled(
+        self, tmp_path: Path
+    ) -> None:
+        """Retrieval-backed syncs dedupe and truncate without a model call."""
+        config = ConfigFactory.create(repo_root=tmp_path)
+        worker = MemorySyncWorker(config, MagicMock(), MagicMock())
+        learnings: list[MemorySyncWorker._TypedLearning] = [
+            (i, f"Learning about topic {i} " * 20, "", MemoryType.KNOWLEDGE)
+            for i in range(1, 20)
+        ]
+        worker._summarise_with_model = AsyncMock()  # type: ignore[method-assign]
+
+        result = await worker._compact_digest(learnings, max_chars=500, summarise=False)
+
+        worker._summarise_with_model.assert_not_called()
+        assert "truncated" in result
+
     @pytest.mark.asyncio
     async def test_compact_digest__preserves_type_grouping(
         self, tmp_path: Path
@@ -603,6 +622,30 @@ class TestMemorySyncWorkerCompactDigest:
 class TestMemorySyncWorkerSync:
     """Tests for the full sync method."""
 
+    @pytest.mark.asyncio
+    async def test_writes_learnings_index(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path)
+        state = MagicMock()
+        state.get_memory_state.return_value = ([], "", None)
+        worker = MemorySyncWorker(config, state, MagicMock())
+
+        await worker.sync(
+            [
+                {
+                    "number": 10,
+                    "title": "[Memory] Locks",
+                    "body": "**Type:** code\n\n**Learning:** Lock shared JSON writes",
+                    "createdAt": "2024-06-01T00:00:00Z",
+                }
+            ]
+        )
+
+        index = load_learning_index(config)
+        assert index is not None
+        [(_score, doc)] = index.search("json writes", k=5)
+        assert doc.number == 10
+        assert doc.memory_type is MemoryType.CODE
+
     @pytest.mark.asyncio
     async def test_no_issues_returns_zero_count(self, tmp_path: Path) -> None:
         config = ConfigFactory.create(repo_root=tmp_path)
@@ -0,0 +1,122 @@
+"""Tests for memory_index.py — BM25 retrieval over learnings."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from manifest_curator import CuratedLearning
+from memory_index import (
+    LearningDoc,
+    LearningIndex,
+    format_learnings,
+    load_learning_index,
+    tokenize,
+    write_learnings_index,
+)
+from models import MemoryType
+from tests.helpers import ConfigFactory
+
+_NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _doc(
+    number: int,
+    learning: str,
+    memory_type: MemoryType = MemoryType.KNOWLEDGE,
+    created_at: str = "",
+) -> LearningDoc:
+    return LearningDoc(
+        number=number,
+        title="",
+        learning=learning,
+        memory_type=memory_type,
+        created_at=created_at,
+    )
+
+
+class TestTokenize:
+    def test_splits_identifiers_and_paths(self) -> None:
+        assert tokenize("Fix StreamParser in src/stream_parser.py") == [
+            "fix",
+            "stream",
+            "parser",
+            "src",
+            "stream",
+            "parser",
+            "py",
+        ]
+
+
+class TestLearningIndex:
+    def test_ranks_matching_learnings_first(self) -> None:
+        index = LearningIndex(
+            [
+                _doc(1, "Dashboard colours come from theme tokens"),
+                _doc(2, "Retry gh api calls on rate limit errors"),
+                _doc(3, "The gh CLI needs GH_TOKEN in docker containers"),
+            ],
+            now=_NOW,
+        )
+
+        results = index.search("gh api rate limit", k=5)
+
+        assert [doc.number for _score, doc in results] == [2, 3]
+
+    def test_type_and_recency_boost_break_ties(self) -> None:
+        index = LearningIndex(
+            [
+                _doc(1, "Run migrations before tests", created_at="2020-01-01"),
+                _doc(2, "Run migrations before tests", created_at="2024-12-30"),
+                _doc(
+                    3,
+                    "Run migrations before tests",
+                    MemoryType.INSTRUCTION,
+                    created_at="2020-01-01",
+                ),
+            ],
+            now=_NOW,
+        )
+
+        ranked = [doc.number for _score, doc in index.search("migrations", k=3)]
+
+        assert ranked == [2, 3, 1]
+
+    def test_respects_k_and_empty_query(self) -> None:
+        index = LearningIndex([_doc(n, "shared words here") for n in range(5)])
+
+        assert len(index.search("shared words", k=2)) == 2
+        assert index.search("", k=2) == []
+        assert index.search("shared", k=0) == []
+
+
+class TestPersistence:
+    def test_write_then_load_round_trips(self, tmp_path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path)
+        assert load_learning_index(config) is None
+
+        write_learnings_index(
+            config,
+            [
+                CuratedLearning(
+                    number=7,
+                    title="Locks",
+                    learning="Use file_lock around shared JSON writes",
+                    created_at="2024-06-01T00:00:00Z",
+                    memory_type=MemoryType.CODE,
+                )
+            ],
+        )
+        index = load_learning_index(config)
+
+        assert index is not None
+        [(_score, doc)] = index.search("shared json", k=3)
+        assert doc.number == 7
+        assert doc.memory_type is MemoryType.CODE
+
+    def test_format_respects_char_budget(self) -> None:
+        results = [(1.0, _doc(n, "x" * 100)) for n in range(5)]
+
+        text = format_learnings(results, max_chars=250)
+
+        assert text.count("\n") == 1
+        assert text.startswith("- **#0** (knowledge): ")
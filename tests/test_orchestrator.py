@@ -414,6 +414,29 @@ class TestRunCallsSanitizeRepo:
 class TestRunFinallyTerminatesRunners:
     """Tests that run() finally block terminates all runners."""
 
+    @pytest.mark.asyncio
+    async def test_run_finally_cleans_up_subprocess_runner(
+        self, config: HydraFlowConfig
+    ) -> None:
+        """Pooled containers should not outlive run()."""
+        orch = HydraFlowOrchestrator(config)
+        orch._prs.ensure_labels_exist = AsyncMock()  # type: ignore[method-assign]
+        _mock_fetcher_noop(orch)
+
+        async def plan_and_stop() -> list[PlanResult]:
+            orch._stop_event.set()
+            return []
+
+        orch._planner_phase.plan_issues = plan_and_stop  # type: ignore[method-assign]
+        orch._implementer.run_batch = AsyncMock(return_value=([], []))  # type: ignore[method-assign]
+
+        with patch.object(
+            orch._subprocess_runner, "cleanup", new_callable=AsyncMock
+        ) as mock_cleanup:
+            await orch.run()
+
+        mock_cleanup.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_run_finally_terminates_all_runners(
         self, config: HydraFlowConfig
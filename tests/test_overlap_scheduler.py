@@ -0,0 +1,161 @@
+"""Tests for overlap_scheduler.py — file-overlap-aware ready-queue ordering."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from config import HydraFlowConfig
+from overlap_scheduler import OverlapScheduler
+from tests.conftest import TaskFactory
+from tests.helpers import ConfigFactory
+
+
+@pytest.fixture
+def cfg(tmp_path: Path) -> HydraFlowConfig:
+    return ConfigFactory.create(repo_root=tmp_path / "repo")
+
+
+def _plan(config: HydraFlowConfig, issue: int, *files: str) -> None:
+    config.plans_dir.mkdir(parents=True, exist_ok=True)
+    delta = "\n".join(f"MODIFIED: {f}" for f in files)
+    (config.plans_dir / f"issue-{issue}.md").write_text(
+        f"## Summary\n\nDo it.\n\n## File Delta\n\n{delta}\n"
+    )
+
+
+class TestPlannedFiles:
+    """Tests for reading planned files from saved plans."""
+
+    def test_reads_file_delta_and_tracks_edits(self, cfg: HydraFlowConfig) -> None:
+        scheduler = OverlapScheduler(cfg)
+        _plan(cfg, 1, "src/a.py")
+
+        assert scheduler.planned_files(1) == {"src/a.py"}
+
+        _plan(cfg, 1, "src/a.py", "src/bb.py")
+
+        assert scheduler.planned_files(1) == {"src/a.py", "src/bb.py"}
+
+    def test_missing_plan_is_empty(self, cfg: HydraFlowConfig) -> None:
+        assert OverlapScheduler(cfg).planned_files(99) == frozenset()
+
+
+class TestChoose:
+    """Tests for picking the next issues to implement."""
+
+    def test_prefers_disjoint_issue_over_queue_order(
+        self, cfg: HydraFlowConfig
+    ) -> None:
+        _plan(cfg, 1, "src/a.py")
+        _plan(cfg, 2, "src/a.py", "src/b.py", "src/c.py")
+        _plan(cfg, 3, "src/d.py")
+        scheduler = OverlapScheduler(cfg)
+        queued = [TaskFactory.create(id=2), TaskFactory.create(id=3)]
+
+        chosen = scheduler.choose(queued, running={1}, max_count=1)
+
+        assert [t.id for t in chosen] == [3]
+
+    def test_holds_heavy_overlap_until_deferral_cap(self, cfg: HydraFlowConfig) -> None:
+        cfg.max_overlap_deferrals = 2
+        _plan(cfg, 1, "src/a.py", "src/b.py")
+        _plan(cfg, 2, "src/a.py")
+        scheduler = OverlapScheduler(cfg)
+        queued = [TaskFactory.create(id=2)]
+
+        assert scheduler.choose(queued, running={1}, max_count=1) == []
+        assert scheduler.choose(queued, running={1}, max_count=1) == []
+        assert [t.id for t in scheduler.choose(queued, running={1}, max_count=1)] == [2]
+
+    def test_batch_avoids_overlap_among_its_own_picks(
+        self, cfg: HydraFlowConfig
+    ) -> None:
+        _plan(cfg, 1, "src/a.py")
+        _plan(cfg, 2, "src/a.py")
+        _plan(cfg, 3, "src/b.py")
+        scheduler = OverlapScheduler(cfg)
+        queued = [TaskFactory.create(id=n) for n in (1, 2, 3)]
+
+        chosen = scheduler.choose(queued, running=set(), max_count=3)
+
+        assert [t.id for t in chosen] == [1, 3]
+
+    def test_zero_deferrals_is_fifo(self, cfg: HydraFlowConfig) -> None:
+        cfg.max_overlap_deferrals = 0
+        _plan(cfg, 1, "src/a.py")
+        _plan(cfg, 2, "src/a.py")
+        _plan(cfg, 3, "src/b.py")
+        scheduler = OverlapScheduler(cfg)
+        queued = [TaskFactory.create(id=2), TaskFactory.create(id=3)]
+
+        chosen = scheduler.choose(queued, running={1}, max_count=2)
+
+        assert [t.id for t in chosen] == [2, 3]
+
+    def test_unplanned_issues_are_never_held(self, cfg: HydraFlowConfig) -> None:
+        _plan(cfg, 1, "src/a.py")
+        scheduler = OverlapScheduler(cfg)
+
+        chosen = scheduler.choose([TaskFactory.create(id=5)], running={1}, max_count=1)
+
+        assert [t.id for t in chosen] == [5]
+
+
+class TestRecordOutcome:
+    """Tests for logging predicted vs actual overlaps."""
+
+    @pytest.mark.asyncio
+    async def test_records_predicted_and_actual_overlaps(
+        self, cfg: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        _plan(cfg, 1, "src/a.py", "src/b.py")
+        _plan(cfg, 2, "src/c.py", "src/e.py")
+        _plan(cfg, 3, "src/b.py", "src/d.py", "src/f.py")
+        scheduler = OverlapScheduler(cfg)
+        scheduler.choose([TaskFactory.create(id=3)], running={1, 2}, max_count=1)
+        scheduler._diffs.get_diff_names = AsyncMock(
+            return_value=["src/c.py", "src/d.py"]
+        )
+
+        await scheduler.record_outcome(3, tmp_path)
+
+        path = cfg.data_path("metrics", "file_overlap.jsonl")
+        [record] = [json.loads(line) for line in path.read_text().splitlines()]
+        assert record["issue_number"] == 3
+        assert record["peers"] == [1, 2]
+        assert record["planned_files"] == ["src/b.py", "src/d.py", "src/f.py"]
+        assert record["actual_files"] == ["src/c.py", "src/d.py"]
+        assert record["predicted_overlaps"] == {"1": ["src/b.py"]}
+        assert record["actual_overlaps"] == {"2": ["src/c.py"]}
+
+    @pytest.mark.asyncio
+    async def test_unscheduled_issue_is_not_recorded(
+        self, cfg: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        scheduler = OverlapScheduler(cfg)
+        scheduler._diffs.get_diff_names = AsyncMock(return_value=["x.py"])
+
+        await scheduler.record_outcome(7, tmp_path)
+
+        scheduler._diffs.get_diff_names.assert_not_awaited()
+        assert not cfg.data_path("metrics", "file_overlap.jsonl").exists()
+
+    @pytest.mark.asyncio
+    async def test_discarded_issue_is_not_recorded(
+        self, cfg: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        _plan(cfg, 1, "src/a.py")
+        _plan(cfg, 2, "src/a.py")
+        cfg.max_overlap_deferrals = 0
+        scheduler = OverlapScheduler(cfg)
+        scheduler.choose([TaskFactory.create(id=2)], running={1}, max_count=1)
+        scheduler._diffs.get_diff_names = AsyncMock(return_value=["src/a.py"])
+
+        scheduler.discard(2)
+        await scheduler.record_outcome(2, tmp_path)
+
+        scheduler._diffs.get_diff_names.assert_not_awaited()
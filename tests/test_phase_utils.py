@@ -198,6 +198,33 @@ class TestRunRefillingPool:
         results = await run_refilling_pool(supply, worker, 2, stop)
         assert sorted(results) == [1, 2, 3, 4]
 
+    @pytest.mark.asyncio
+    async def test_load_controller_limits_concurrency(self) -> None:
+        """The pool should refill only up to the load-scaled limit."""
+        items = list(range(6))
+        stop = asyncio.Event()
+        concurrent_count = 0
+        max_observed_concurrent = 0
+
+        def supply() -> list[int]:
+            if items:
+                return [items.pop(0)]
+            return []
+
+        async def worker(_idx: int, item: int) -> int:
+            nonlocal concurrent_count, max_observed_concurrent
+            concurrent_count += 1
+            max_observed_concurrent = max(max_observed_concurrent, concurrent_count)
+            await asyncio.sleep(0.01)
+            concurrent_count -= 1
+            return item
+
+        with patch("phase_utils.effective_concurrency", return_value=1):
+            results = await run_refilling_pool(supply, worker, 4, stop)
+
+        assert sorted(results) == list(range(6))
+        assert max_observed_concurrent == 1
+
     @pytest.mark.asyncio
     async def test_stop_event_cancels_pool(self) -> None:
         """Setting stop_event should end the pool."""
@@ -18,7 +18,7 @@ from events import EventType
 from models import ReviewVerdict
 from pr_manager import PRManager
 from tests.conftest import PRInfoFactory, SubprocessMockBuilder
-from tests.helpers import ConfigFactory
+from tests.helpers import ConfigFactory, make_proc
 
 # ---------------------------------------------------------------------------
 # _chunk_body (static method)
@@ -3635,9 +3635,6 @@ class TestFetchCiFailureLogs:
         async def side_effect(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            mock_proc = AsyncMock()
-            mock_proc.wait = AsyncMock(return_value=0)
-            mock_proc.returncode = 0
             if call_count == 1:
                 # First call: gh pr checks
                 stdout = checks_json.encode()
@@ -3646,8 +3643,7 @@ class TestFetchCiFailureLogs:
                 stdout = (
                     b"Error in test_foo.py line 42\nAssertionError: expected 1 got 2\n"
                 )
-            mock_proc.communicate = AsyncMock(return_value=(stdout, b""))
-            return mock_proc
+            return make_proc(returncode=0, stdout=stdout)
 
         with patch("asyncio.create_subprocess_exec", side_effect=side_effect):
             result = await manager.fetch_ci_failure_logs(101)
@@ -3709,15 +3705,11 @@ class TestFetchCiFailureLogs:
         async def side_effect(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            mock_proc = AsyncMock()
-            mock_proc.wait = AsyncMock(return_value=0)
-            mock_proc.returncode = 0
             if call_count == 1:
                 stdout = checks_json.encode()
             else:
                 stdout = b"failure log output\n"
-            mock_proc.communicate = AsyncMock(return_value=(stdout, b""))
-            return mock_proc
+            return make_proc(returncode=0, stdout=stdout)
 
         with patch("asyncio.create_subprocess_exec", side_effect=side_effect):
             result = await manager.fetch_ci_failure_logs(101)
@@ -3765,12 +3757,8 @@ class TestFetchCiFailureLogs:
         async def side_effect(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            mock_proc = AsyncMock()
-            mock_proc.wait = AsyncMock(return_value=0)
-            mock_proc.returncode = 0
             stdout = checks_json.encode() if call_count == 1 else b"   \n  \n"
-            mock_proc.communicate = AsyncMock(return_value=(stdout, b""))
-            return mock_proc
+            return make_proc(returncode=0, stdout=stdout)
 
         with patch("asyncio.create_subprocess_exec", side_effect=side_effect):
             result = await manager.fetch_ci_failure_logs(101)
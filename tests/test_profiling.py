@@ -0,0 +1,168 @@
+"""Tests for profiling.py — stack sampling, stall detection and task dumps."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from profiling import (
+    SlowCallbackMonitor,
+    StackSampler,
+    capture_profile,
+    collapse_stack,
+    format_collapsed,
+    start_loop_profiling,
+    stop_loop_profiling,
+    task_stacks,
+)
+from tests.helpers import ConfigFactory
+
+
+def _busy_wait(seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+class TestCollapsedStacks:
+    """Tests for the collapsed-stack helpers."""
+
+    def test_collapse_stack_is_root_first(self) -> None:
+        def inner() -> str:
+            return collapse_stack(sys._getframe())
+
+        stack = inner()
+
+        assert stack.endswith(
+            "test_profiling.py:test_collapse_stack_is_root_first"
+            ";test_profiling.py:inner"
+        )
+
+    def test_format_collapsed_orders_by_count(self) -> None:
+        counts = Counter({"a;b": 1, "a;c": 3})
+
+        assert format_collapsed(counts) == "a;c 3\na;b 1\n"
+
+
+class TestStackSampler:
+    """Tests for the sampling thread."""
+
+    def test_samples_target_thread(self) -> None:
+        stop = threading.Event()
+
+        def spin() -> None:
+            while not stop.is_set():
+                _busy_wait(0.001)
+
+        worker = threading.Thread(target=spin)
+        worker.start()
+        sampler = StackSampler(worker.ident or 0, sample_hz=500)
+        sampler.start()
+        try:
+            time.sleep(0.1)
+        finally:
+            sampler.stop()
+            stop.set()
+            worker.join()
+
+        counts = sampler.snapshot()
+        assert sum(counts.values()) > 0
+        assert any("test_profiling.py:spin" in stack for stack in counts)
+        assert not sampler.running
+
+
+class TestSlowCallbackMonitor:
+    """Tests for the blocked-loop watchdog."""
+
+    @pytest.mark.asyncio
+    async def test_logs_stack_of_blocking_callback(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monitor = SlowCallbackMonitor(asyncio.get_running_loop(), threshold_ms=40)
+        with caplog.at_level(logging.WARNING, logger="hydraflow.profiling"):
+            monitor.start()
+            try:
+                await asyncio.sleep(0.02)
+                _busy_wait(0.2)
+                await asyncio.sleep(0.02)
+            finally:
+                monitor.stop()
+
+        assert "Event loop blocked" in caplog.text
+        assert "_busy_wait" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_is_not_reported(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monitor = SlowCallbackMonitor(asyncio.get_running_loop(), threshold_ms=40)
+        with caplog.at_level(logging.WARNING, logger="hydraflow.profiling"):
+            monitor.start()
+            try:
+                await asyncio.sleep(0.15)
+            finally:
+                monitor.stop()
+
+        assert "Event loop blocked" not in caplog.text
+
+
+class TestCaptureProfile:
+    """Tests for on-demand capture and task listing."""
+
+    @pytest.mark.asyncio
+    async def test_capture_returns_samples_and_tasks(self) -> None:
+        async def parked() -> None:
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(parked(), name="parked-task")
+        try:
+            profile = await capture_profile(0.1, sample_hz=200)
+        finally:
+            task.cancel()
+
+        assert profile["samples"] > 0
+        assert profile["collapsed"].endswith("\n")
+        parked_row = next(t for t in profile["tasks"] if t["name"] == "parked-task")
+        assert parked_row["coro"].endswith("parked")
+        assert any("in parked" in frame for frame in parked_row["stack"])
+
+    @pytest.mark.asyncio
+    async def test_capture_reuses_continuous_sampler(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        config.profiling_enabled = True
+        config.profiling_sample_hz = 200
+        profiler = start_loop_profiling(config)
+        try:
+            await asyncio.sleep(0.05)
+            profile = await capture_profile(0.1, sample_hz=1)
+            assert profiler.sampler is not None
+            total = sum(profiler.sampler.snapshot().values())
+        finally:
+            stop_loop_profiling()
+
+        assert 0 < profile["samples"] < total
+
+    @pytest.mark.asyncio
+    async def test_start_is_noop_when_disabled(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        profiler = start_loop_profiling(config)
+        stop_loop_profiling()
+
+        assert profiler.sampler is None
+        assert profiler.monitor is None
+
+    @pytest.mark.asyncio
+    async def test_task_stacks_lists_current_task(self) -> None:
+        current = asyncio.current_task()
+        assert current is not None
+
+        names = [t["name"] for t in task_stacks()]
+
+        assert current.get_name() in names
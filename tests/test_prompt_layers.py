@@ -0,0 +1,69 @@
+"""Tests for prompt_layers.py — layered prompt assembly."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from agent import AgentRunner
+from events import EventBus
+from planner import PlannerRunner
+from prompt_layers import SYSTEM_PREFIX, PromptLayers
+from tests.conftest import TaskFactory
+from tests.helpers import ConfigFactory
+
+
+class TestPromptLayers:
+    """Tests for rendering and prefix stats."""
+
+    def test_render_orders_layers_and_skips_empty(self) -> None:
+        layers = PromptLayers(phase="## Phase\n", issue="\n## Issue", repo="")
+
+        assert layers.render() == f"{SYSTEM_PREFIX}\n\n## Phase\n\n## Issue"
+
+    def test_prefix_excludes_issue_layer(self) -> None:
+        first = PromptLayers(repo="ctx", phase="phase", issue="issue #1")
+        second = PromptLayers(repo="ctx", phase="phase", issue="issue #2")
+
+        assert first.render().startswith(first.prefix())
+        assert first.prefix() == second.prefix()
+        assert (
+            first.stats()["prompt_prefix_hash"] == second.stats()["prompt_prefix_hash"]
+        )
+        assert first.stats()["prompt_prefix_chars"] == len(first.prefix())
+
+
+class TestRunnerPrefixes:
+    """Runner prompts share everything before the issue layer."""
+
+    def _config(self, tmp_path: Path):
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        manifest = config.data_path("manifest", "manifest.md")
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        manifest.write_text("python, make, pytest")
+        return config
+
+    def test_implementer_prefix_is_shared_across_issues(self, tmp_path: Path) -> None:
+        runner = AgentRunner(self._config(tmp_path), EventBus())
+        first = TaskFactory.create(id=1, title="One", body="Fix one")
+        second = TaskFactory.create(id=2, title="Two", body="Fix two")
+
+        prompt_1, stats_1 = runner._build_prompt_with_stats(first)
+        prompt_2, stats_2 = runner._build_prompt_with_stats(second)
+
+        assert stats_1["prompt_prefix_hash"] == stats_2["prompt_prefix_hash"]
+        prefix = prompt_1[: stats_1["prompt_prefix_chars"]]
+        assert prompt_2.startswith(prefix)
+        assert "python, make, pytest" in prefix
+        assert "#1" not in prefix
+        assert "Fix one" not in prefix
+
+    def test_runners_share_system_and_repo_layers(self, tmp_path: Path) -> None:
+        config = self._config(tmp_path)
+        task = TaskFactory.create(id=7, title="Seven", body="Do seven")
+
+        impl, _ = AgentRunner(config, EventBus())._build_prompt_with_stats(task)
+        plan, _ = PlannerRunner(config, EventBus())._build_prompt_with_stats(task)
+
+        shared = f"{SYSTEM_PREFIX}\n\n## Project Context\n\npython, make, pytest"
+        assert impl.startswith(shared)
+        assert plan.startswith(shared)
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
 
+import prompt_telemetry
 from model_pricing import ModelPricingTable
 from prompt_telemetry import PromptTelemetry, _as_float, parse_command_tool_model
 from tests.helpers import ConfigFactory
@@ -438,6 +442,7 @@ class TestPromptTelemetry:
                 success=True,
                 stats={"input_tokens": 1000, "output_tokens": 200},
             )
+        telemetry.checkpoint()
         pr_file = config.data_path("metrics", "prompt", "pr_stats.json")
         rollup = json.loads(pr_file.read_text())
         pr_cost = rollup["prs"]["700"]["estimated_cost_usd"]
@@ -445,6 +450,281 @@ class TestPromptTelemetry:
         assert abs(pr_cost - round(single_cost * 3, 6)) < 1e-6
 
 
+def _record(telemetry: PromptTelemetry, **overrides: object) -> None:
+    kwargs: dict[str, Any] = {
+        "source": "implementer",
+        "tool": "claude",
+        "model": "opus",
+        "issue_number": 1,
+        "pr_number": 10,
+        "session_id": "sess",
+        "prompt_chars": 100,
+        "transcript_chars": 50,
+        "duration_seconds": 0.1,
+        "success": True,
+        "stats": {"total_tokens": 5},
+    }
+    kwargs.update(overrides)
+    telemetry.record(**kwargs)
+
+
+def _restart() -> None:
+    """Drop the process-wide aggregates, as a fresh process would start."""
+    prompt_telemetry._AGGREGATES.clear()
+
+
+class TestPromptTelemetryAggregate:
+    """In-memory aggregate, periodic checkpoints and JSONL replay."""
+
+    def test_instances_share_one_aggregate(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        first = PromptTelemetry(config, clock=lambda: 0.0)
+        _record(first)
+
+        with patch.object(PromptTelemetry, "_load_checkpoint") as load:
+            second = PromptTelemetry(config)
+            assert second.get_lifetime_totals()["inference_calls"] == 1
+
+        load.assert_not_called()
+        assert second._shared is first._shared
+
+    def test_checkpoint_is_periodic_not_per_record(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        telemetry = PromptTelemetry(config, clock=lambda: 0.0)
+        pr_file = config.data_path("metrics", "prompt", "pr_stats.json")
+
+        _record(telemetry)
+        first = pr_file.read_text()
+        _record(telemetry)
+
+        assert pr_file.read_text() == first
+        assert telemetry.get_lifetime_totals()["inference_calls"] == 2
+
+        telemetry.checkpoint()
+        rollup = json.loads(pr_file.read_text())
+        assert rollup["lifetime"]["inference_calls"] == 2
+        inf_file = config.data_path("metrics", "prompt", "inferences.jsonl")
+        assert rollup["inferences_offset"] == inf_file.stat().st_size
+
+    def test_other_instance_catches_up_from_log(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        writer = PromptTelemetry(config, clock=lambda: 0.0)
+        _record(writer)
+        reader = PromptTelemetry(config)
+        assert reader.get_pr_totals(10)["inference_calls"] == 1
+
+        _record(writer)
+        _record(writer)
+
+        assert reader.get_pr_totals(10)["inference_calls"] == 3
+
+    def test_rebuilds_from_log_without_checkpoint(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        telemetry = PromptTelemetry(config)
+        for issue in (1, 2, 2):
+            _record(telemetry, issue_number=issue)
+        config.data_path("metrics", "prompt", "pr_stats.json").unlink()
+        _restart()
+
+        rebuilt = PromptTelemetry(config)
+
+        assert rebuilt.get_issue_totals()[2]["inference_calls"] == 2
+        assert rebuilt.get_lifetime_totals()["inference_calls"] == 3
+
+    def test_rebuilds_when_log_shrinks(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        telemetry = PromptTelemetry(config)
+        _record(telemetry)
+        _record(telemetry)
+        telemetry.checkpoint()
+        inf_file = config.data_path("metrics", "prompt", "inferences.jsonl")
+        inf_file.write_text(inf_file.read_text().splitlines()[0] + "\n")
+        _restart()
+
+        assert PromptTelemetry(config).get_lifetime_totals()["inference_calls"] == 1
+
+    def test_legacy_checkpoint_without_offset_covers_existing_log(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        telemetry = PromptTelemetry(config)
+        _record(telemetry)
+        pr_file = config.data_path("metrics", "prompt", "pr_stats.json")
+        legacy = json.loads(pr_file.read_text())
+        legacy.pop("inferences_offset")
+        pr_file.write_text(json.dumps(legacy, indent=2))
+        _restart()
+
+        reloaded = PromptTelemetry(config)
+        _record(reloaded)
+
+        assert reloaded.get_lifetime_totals()["inference_calls"] == 2
+
+    def test_partial_trailing_line_is_not_consumed(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        telemetry = PromptTelemetry(config)
+        _record(telemetry)
+        inf_file = config.data_path("metrics", "prompt", "inferences.jsonl")
+        line = inf_file.read_text()
+        with inf_file.open("a") as f:
+            f.write(line[:20])
+
+        assert telemetry.get_lifetime_totals()["inference_calls"] == 1
+        with inf_file.open("a") as f:
+            f.write(line[20:])
+        assert telemetry.get_lifetime_totals()["inference_calls"] == 2
+
+    def test_oldest_sessions_expire_at_checkpoint(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        telemetry = PromptTelemetry(config, clock=lambda: 0.0)
+        with patch("prompt_telemetry._MAX_SESSIONS", 2):
+            for sid in ("a", "b", "c"):
+                _record(telemetry, session_id=sid)
+            telemetry.checkpoint()
+
+        assert telemetry.get_session_totals("a") == {}
+        assert telemetry.get_session_totals("c")["inference_calls"] == 1
+        assert telemetry.get_lifetime_totals()["inference_calls"] == 3
+
+    def test_prefix_cache_hit_rate_per_source(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        telemetry = PromptTelemetry(config)
+        usage = {
+            "input_tokens": 100,
+            "cache_creation_input_tokens": 300,
+            "cache_read_input_tokens": 0,
+            "output_tokens": 10,
+            "prompt_prefix_hash": "abc123",
+            "prompt_prefix_chars": 4000,
+            "layer_chars": {"system": 10, "repo": 3000, "phase": 990, "issue": 500},
+        }
+        _record(telemetry, source="implementer", stats=usage)
+        _record(
+            telemetry,
+            source="implementer",
+            stats={
+                **usage,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 300,
+            },
+        )
+        _record(telemetry, source="triage", stats={"total_tokens": 5})
+
+        rows = telemetry.load_inferences(limit=10)
+        assert rows[1]["prefix_cache_hit_rate"] == 0.75
+        assert rows[1]["prompt_prefix_hash"] == "abc123"
+        assert rows[1]["layer_chars"]["repo"] == 3000
+        assert telemetry.get_prefix_cache_hit_rates() == {"implementer": 0.375}
+
+
+def _write_rows(path, count: int, start: datetime) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        for i in range(count):
+            ts = (start + timedelta(minutes=i)).isoformat()
+            f.write(json.dumps({"i": i, "timestamp": ts}, sort_keys=True) + "\n")
+
+
+class TestInferenceReaders:
+    """Reverse tail reads and time-indexed range reads."""
+
+    _START = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def _inf_file(self, config):
+        return config.data_path("metrics", "prompt", "inferences.jsonl")
+
+    def test_tail_reads_newest_rows_across_blocks(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        _write_rows(self._inf_file(config), 200, self._START)
+        telemetry = PromptTelemetry(config)
+
+        with patch("prompt_telemetry._TAIL_BLOCK_SIZE", 97):
+            rows = telemetry.load_inferences(limit=25)
+
+        assert [r["i"] for r in rows] == list(range(175, 200))
+
+    def test_tail_skips_corrupt_and_partial_lines(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        inf_file = self._inf_file(config)
+        _write_rows(inf_file, 3, self._START)
+        with inf_file.open("a") as f:
+            f.write('not json\n\n[1, 2]\n{"i": 9')
+        telemetry = PromptTelemetry(config)
+
+        assert [r["i"] for r in telemetry.load_inferences(limit=10)] == [0, 1, 2]
+
+    def test_offset_read_stops_before_partial_line(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        inf_file = self._inf_file(config)
+        _write_rows(inf_file, 3, self._START)
+        telemetry = PromptTelemetry(config)
+        rows, offset = telemetry.load_inferences_from(0)
+        with inf_file.open("a") as f:
+            f.write('{"i": 3}\n{"i": 4')
+
+        more, new_offset = telemetry.load_inferences_from(offset)
+
+        assert [r["i"] for r in rows] == [0, 1, 2]
+        assert [r["i"] for r in more] == [3]
+        assert new_offset == inf_file.stat().st_size - len('{"i": 4')
+        assert telemetry.load_inferences_from(10**9) == ([], 0)
+
+    def test_range_read_returns_only_matching_rows(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        _write_rows(self._inf_file(config), 500, self._START)
+        telemetry = PromptTelemetry(config)
+        since = self._START + timedelta(minutes=120)
+        until = self._START + timedelta(minutes=130)
+
+        with patch("prompt_telemetry._TIME_INDEX_STRIDE", 512):
+            rows = telemetry.load_inferences_between(since, until)
+
+        assert [r["i"] for r in rows] == list(range(120, 131))
+
+    def test_range_read_decodes_only_indexed_window(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        _write_rows(self._inf_file(config), 2000, self._START)
+        telemetry = PromptTelemetry(config)
+        since = self._START + timedelta(minutes=1000)
+
+        with (
+            patch("prompt_telemetry._TIME_INDEX_STRIDE", 1024),
+            patch.object(
+                telemetry, "_decode_line", wraps=telemetry._decode_line
+            ) as decode,
+        ):
+            telemetry._time_index()
+            decode.reset_mock()
+            rows = telemetry.load_inferences_between(
+                since, since + timedelta(minutes=4)
+            )
+
+        assert [r["i"] for r in rows] == list(range(1000, 1005))
+        assert decode.call_count < 100
+
+    def test_range_index_extends_after_append(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        inf_file = self._inf_file(config)
+        _write_rows(inf_file, 100, self._START)
+        telemetry = PromptTelemetry(config)
+        late = self._START + timedelta(days=1)
+
+        with patch("prompt_telemetry._TIME_INDEX_STRIDE", 256):
+            assert telemetry.load_inferences_between(late, None) == []
+            with inf_file.open("a") as f:
+                f.write(json.dumps({"i": 999, "timestamp": late.isoformat()}) + "\n")
+            rows = telemetry.load_inferences_between(late, None)
+
+        assert [r["i"] for r in rows] == [999]
+
+    def test_range_limit_keeps_newest(self, tmp_path):
+        config = ConfigFactory.create(repo_root=tmp_path)
+        _write_rows(self._inf_file(config), 50, self._START)
+        telemetry = PromptTelemetry(config)
+
+        rows = telemetry.load_inferences_between(self._START, None, limit=5)
+
+        assert [r["i"] for r in rows] == [45, 46, 47, 48, 49]
+
+
 class TestAsFloat:
     def test_int_value(self):
         assert _as_float(42) == 42.0
@@ -0,0 +1,81 @@
+"""Read-path benchmark for PromptTelemetry on a synthetic 1M-row log.
+
+Compares the reverse tail reader and the time-indexed range reader with a
+full forward decode of the file.  Excluded from default runs via the
+``soak`` marker.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from prompt_telemetry import PromptTelemetry
+from tests.helpers import ConfigFactory
+
+pytestmark = pytest.mark.soak
+
+_ROWS = 1_000_000
+_START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(scope="module")
+def telemetry(tmp_path_factory: pytest.TempPathFactory) -> PromptTelemetry:
+    root = tmp_path_factory.mktemp("telemetry")
+    config = ConfigFactory.create(repo_root=root)
+    path = config.data_path("metrics", "prompt", "inferences.jsonl")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        for i in range(_ROWS):
+            row = {
+                "issue_number": i % 500 + 1,
+                "model": "sonnet",
+                "session_id": f"sess-{i // 1000}",
+                "source": "implementer",
+                "timestamp": (_START + timedelta(seconds=i)).isoformat(),
+                "total_tokens": 1000,
+            }
+            f.write(json.dumps(row, sort_keys=True) + "\n")
+    return PromptTelemetry(config)
+
+
+def _timed(fn):  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _full_decode(telemetry: PromptTelemetry) -> list[dict[str, object]]:
+    with open(telemetry._inferences_file) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_tail_reader_vs_full_decode(telemetry: PromptTelemetry) -> None:
+    rows, tail_s = _timed(lambda: telemetry.load_inferences(limit=5000))
+    _, full_s = _timed(lambda: _full_decode(telemetry))
+
+    print(f"\ntail(5000): {tail_s * 1000:.1f} ms  full decode: {full_s * 1000:.1f} ms")
+    assert len(rows) == 5000
+    assert rows[-1]["timestamp"] == (_START + timedelta(seconds=_ROWS - 1)).isoformat()
+    assert tail_s < full_s
+
+
+def test_range_reader_vs_full_decode(telemetry: PromptTelemetry) -> None:
+    since = _START + timedelta(seconds=400_000)
+    until = since + timedelta(hours=1)
+
+    _, index_s = _timed(telemetry._time_index)
+    rows, range_s = _timed(
+        lambda: telemetry.load_inferences_between(since, until, limit=50000)
+    )
+    _, full_s = _timed(lambda: _full_decode(telemetry))
+
+    print(
+        f"\nindex build: {index_s * 1000:.1f} ms  range(1h): {range_s * 1000:.1f} ms"
+        f"  full decode: {full_s * 1000:.1f} ms"
+    )
+    assert len(rows) == 3601
+    assert range_s < full_s
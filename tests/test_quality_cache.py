@@ -0,0 +1,134 @@
+"""Tests for quality_cache.py — QualityGateCache."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from quality_cache import QualityGateCache
+from tests.helpers import ConfigFactory
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def worktree(tmp_path: Path) -> Path:
+    wt = tmp_path / "wt"
+    wt.mkdir()
+    _git(wt, "init", "-q")
+    _git(wt, "config", "user.email", "t@example.com")
+    _git(wt, "config", "user.name", "t")
+    (wt / "a.py").write_text("x = 1\n")
+    (wt / ".gitignore").write_text("build/\n")
+    _git(wt, "add", "-A")
+    _git(wt, "commit", "-qm", "init")
+    return wt
+
+
+def _cache(tmp_path: Path) -> QualityGateCache:
+    return QualityGateCache(ConfigFactory.create(repo_root=tmp_path / "repo"))
+
+
+class TestQualityGateCacheKey:
+    """Tests for the content-addressed key."""
+
+    @pytest.mark.asyncio
+    async def test_key_is_stable_for_unchanged_tree(
+        self, tmp_path: Path, worktree: Path
+    ) -> None:
+        cache = _cache(tmp_path)
+
+        first = await cache.key(worktree, "quality")
+        second = await cache.key(worktree, "quality")
+
+        assert first is not None
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_key_covers_uncommitted_and_untracked_files(
+        self, tmp_path: Path, worktree: Path
+    ) -> None:
+        cache = _cache(tmp_path)
+        clean = await cache.key(worktree, "quality")
+
+        (worktree / "a.py").write_text("x = 2\n")
+        edited = await cache.key(worktree, "quality")
+        (worktree / "b.py").write_text("y = 1\n")
+        untracked = await cache.key(worktree, "quality")
+
+        assert len({clean, edited, untracked}) == 3
+        # The real index is left alone.
+        assert _git(worktree, "diff", "--cached", "--name-only") == ""
+        assert "?? b.py" in _git(worktree, "status", "--porcelain")
+
+    @pytest.mark.asyncio
+    async def test_ignored_files_do_not_change_key(
+        self, tmp_path: Path, worktree: Path
+    ) -> None:
+        cache = _cache(tmp_path)
+        before = await cache.key(worktree, "quality")
+
+        (worktree / "build").mkdir()
+        (worktree / "build" / "out.o").write_text("binary")
+
+        assert await cache.key(worktree, "quality") == before
+
+    @pytest.mark.asyncio
+    async def test_key_differs_per_target(self, tmp_path: Path, worktree: Path) -> None:
+        cache = _cache(tmp_path)
+
+        quality = await cache.key(worktree, "quality")
+        lint = await cache.key(worktree, "lint")
+
+        assert quality != lint
+
+    @pytest.mark.asyncio
+    async def test_no_key_outside_git_or_when_disabled(
+        self, tmp_path: Path, worktree: Path
+    ) -> None:
+        cache = _cache(tmp_path)
+        plain = tmp_path / "plain"
+        plain.mkdir()
+
+        assert await cache.key(plain, "quality") is None
+
+        cache._config.quality_cache_enabled = False
+        assert await cache.key(worktree, "quality") is None
+
+
+class TestQualityGateCacheEntries:
+    """Tests for storing and evicting results."""
+
+    def test_get_returns_stored_result(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+
+        assert cache.get("k", "quality") is None
+        cache.put("k", "quality", False, "`make quality` failed:\nboom")
+
+        assert cache.get("k", "quality") == (False, "`make quality` failed:\nboom")
+        assert _cache(tmp_path).get("k", "quality") is not None
+
+    def test_oldest_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        cache._config.quality_cache_max_entries = 2
+
+        for key in ("a", "b", "c"):
+            cache.put(key, "quality", True, "OK")
+
+        assert cache.get("a", "quality") is None
+        assert cache.get("c", "quality") == (True, "OK")
+
+    def test_corrupt_file_is_treated_as_empty(self, tmp_path: Path) -> None:
+        cache = _cache(tmp_path)
+        cache._path.parent.mkdir(parents=True, exist_ok=True)
+        cache._path.write_text("{not json")
+
+        assert cache.get("k", "quality") is None
+        cache.put("k", "quality", True, "OK")
+        assert cache.get("k", "quality") == (True, "OK")
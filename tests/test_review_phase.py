@@ -4807,7 +4807,9 @@ class TestPreReviewChecks:
         assert context.visual_decision == decision
         assert context.code_scanning_alerts == alerts
         phase._prs.post_pr_comment.assert_awaited_once()
-        phase._run_delta_verification.assert_awaited_once_with(pr, "diff text")
+        phase._run_delta_verification.assert_awaited_once_with(
+            pr, "diff text", wt_path=None
+        )
 
 
 class TestRunPostReviewActions:
@@ -21,8 +21,10 @@ from models import (
     ConflictResolutionResult,
     CriterionResult,
     CriterionVerdict,
+    DiffFileStat,
     JudgeVerdict,
     PRInfo,
+    ReviewCheckpoint,
     ReviewResult,
     ReviewVerdict,
     Task,
@@ -1975,9 +1977,171 @@ class TestCheckShaSkipGuard:
         assert result is None
 
 
+_PR_DIFF = "diff --git a/src/app.py b/src/app.py\n+full change\n"
+_DELTA = "diff --git a/src/app.py b/src/app.py\n-old\n+new\n"
+
+
+def _incremental_phase(config: HydraFlowConfig, delta: str | None = _DELTA):
+    from local_diff import LocalDiffProvider
+
+    phase = make_review_phase(config)
+    provider = AsyncMock(spec=LocalDiffProvider)
+    provider.get_diff_since.return_value = delta
+    provider.get_file_stats.return_value = [DiffFileStat(path="src/app.py", added=1)]
+    phase._diff_provider = provider
+    return phase
+
+
+class TestPlanIncrementalReview:
+    """Tests for choosing between an incremental and a full review."""
+
+    @pytest.mark.asyncio
+    async def test_builds_delta_from_last_reviewed_sha(
+        self, config: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        phase = _incremental_phase(config)
+        prior = ReviewCheckpoint(
+            verdict=ReviewVerdict.REQUEST_CHANGES, findings=["[HIGH] x - y - z"]
+        )
+
+        plan = await phase._plan_incremental_review(
+            PRInfoFactory.create(), tmp_path, "sha1", prior
+        )
+
+        assert plan is not None
+        assert plan.since_sha == "sha1"
+        assert plan.delta_diff == _DELTA
+        assert plan.changed_files == ["src/app.py"]
+        assert plan.prior == prior
+        assert plan.streak == 1
+        phase._diff_provider.get_diff_since.assert_awaited_once_with(
+            tmp_path, "sha1", ["src/app.py"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_delta_covers_renamed_and_spaced_paths(
+        self, config: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        phase = _incremental_phase(config)
+        phase._diff_provider.get_file_stats.return_value = [
+            DiffFileStat(path="docs/new name.md", old_path="docs/old name.md"),
+            DiffFileStat(path='src/"quoted".py', added=1),
+        ]
+        prior = ReviewCheckpoint(verdict=ReviewVerdict.COMMENT)
+
+        plan = await phase._plan_incremental_review(
+            PRInfoFactory.create(), tmp_path, "sha1", prior
+        )
+
+        assert plan is not None
+        assert plan.changed_files == ["docs/new name.md", 'src/"quoted".py']
+        phase._diff_provider.get_diff_since.assert_awaited_once_with(
+            tmp_path,
+            "sha1",
+            ["docs/new name.md", "docs/old name.md", 'src/"quoted".py'],
+        )
+
+    @pytest.mark.asyncio
+    async def test_full_review_without_prior_review(
+        self, config: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        phase = _incremental_phase(config)
+        pr = PRInfoFactory.create()
+        prior = ReviewCheckpoint(verdict=ReviewVerdict.COMMENT)
+
+        assert await phase._plan_incremental_review(pr, tmp_path, None, prior) is None
+        assert await phase._plan_incremental_review(pr, tmp_path, "sha1", None) is None
+
+    @pytest.mark.asyncio
+    async def test_full_review_forced_after_interval(
+        self, config: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        config.full_review_interval = 2
+        phase = _incremental_phase(config)
+        prior = ReviewCheckpoint(verdict=ReviewVerdict.COMMENT, incremental_streak=2)
+
+        plan = await phase._plan_incremental_review(
+            PRInfoFactory.create(), tmp_path, "sha1", prior
+        )
+
+        assert plan is None
+        phase._diff_provider.get_diff_since.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_full_review_on_large_or_unavailable_delta(
+        self, config: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        config.incremental_review_max_delta_lines = 1
+        prior = ReviewCheckpoint(verdict=ReviewVerdict.COMMENT)
+        pr = PRInfoFactory.create()
+
+        too_large = _incremental_phase(config)
+        rebased = _incremental_phase(config, delta=None)
+
+        assert (
+            await too_large._plan_incremental_review(pr, tmp_path, "sha1", prior)
+            is None
+        )
+        assert (
+            await rebased._plan_incremental_review(pr, tmp_path, "sha1", prior) is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_review_receives_incremental_plan(
+        self, config: HydraFlowConfig, tmp_path: Path
+    ) -> None:
+        phase = _incremental_phase(config)
+        pr = PRInfoFactory.create()
+        phase._state.set_last_reviewed_sha(pr.issue_number, "sha1")
+        phase._state.set_review_checkpoint(
+            pr.issue_number, ReviewCheckpoint(verdict=ReviewVerdict.REQUEST_CHANGES)
+        )
+        phase._reviewers.review = AsyncMock(
+            return_value=ReviewResultFactory.create(
+                verdict=ReviewVerdict.REQUEST_CHANGES
+            )
+        )
+
+        await phase._run_and_post_review(
+            pr, TaskFactory.create(), tmp_path, _PR_DIFF, 0
+        )
+
+        incremental = phase._reviewers.review.call_args.kwargs["incremental"]
+        assert incremental.since_sha == "sha1"
+        assert incremental.delta_diff == _DELTA
+
+
 class TestRecordReviewOutcome:
     """Tests for the _record_review_outcome extracted helper."""
 
+    @pytest.mark.asyncio
+    async def test_stores_checkpoint_for_next_review(
+        self, config: HydraFlowConfig
+    ) -> None:
+        phase = make_review_phase(config)
+        pr = PRInfoFactory.create()
+        result = ReviewResultFactory.create(
+            verdict=ReviewVerdict.REQUEST_CHANGES, summary="Needs work"
+        )
+        result.findings = ["[LOW] a.py - nit - fix"]
+        result.incremental_streak = 1
+        phase._prs.get_pr_head_sha = AsyncMock(return_value="sha")
+
+        await phase._record_review_outcome(pr, result)
+
+        assert phase._state.get_review_checkpoint(pr.issue_number) == ReviewCheckpoint(
+            verdict=ReviewVerdict.REQUEST_CHANGES,
+            summary="Needs work",
+            findings=["[LOW] a.py - nit - fix"],
+            incremental_streak=1,
+        )
+
+        await phase._record_review_outcome(
+            pr, ReviewResultFactory.create(transcript="")
+        )
+
+        assert phase._state.get_review_checkpoint(pr.issue_number) is None
+
     @pytest.mark.asyncio
     async def test_records_all_state(self, config: HydraFlowConfig) -> None:
         """Should call all expected state tracker methods."""
@@ -13,8 +13,13 @@ import pytest
 
 from base_runner import BaseRunner
 from events import EventType
-from models import ReviewerStatus, ReviewVerdict
-from reviewer import ReviewRunner
+from models import (
+    IncrementalReview,
+    ReviewCheckpoint,
+    ReviewerStatus,
+    ReviewVerdict,
+)
+from reviewer import ReviewRunner, extract_findings
 from tests.conftest import PRInfoFactory
 from tests.helpers import ConfigFactory, make_streaming_proc
 
@@ -208,6 +213,53 @@ def test_build_review_prompt_fix_section_runs_tests_when_ci_disabled(
     assert "`make test`" in prompt
 
 
+def test_build_review_prompt_incremental_shows_delta_and_prior_findings(
+    config, event_bus, pr_info, task
+):
+    runner = _make_runner(config, event_bus)
+    full = "diff --git a/foo.py b/foo.py\n+original line"
+    incremental = IncrementalReview(
+        since_sha="abc123def4567890",
+        delta_diff="diff --git a/foo.py b/foo.py\n+fixed line",
+        changed_files=["foo.py"],
+        prior=ReviewCheckpoint(
+            verdict=ReviewVerdict.REQUEST_CHANGES,
+            summary="Missing error handling",
+            findings=["[HIGH] foo.py:3 - unchecked None - guard it"],
+        ),
+    )
+
+    prompt, stats = runner._build_review_prompt_with_stats(
+        pr_info, task, full, incremental=incremental
+    )
+
+    assert "## Incremental Re-review" in prompt
+    assert "**request-changes**" in prompt
+    assert "- [HIGH] foo.py:3 - unchecked None - guard it" in prompt
+    assert "## Changes Since Last Review (`abc123def456..HEAD`)" in prompt
+    assert "+fixed line" in prompt
+    assert "+original line" not in prompt
+    assert stats["review_mode"] == "incremental"
+    assert prompt.index("## Review Instructions") < prompt.index(
+        "## Incremental Re-review"
+    )
+
+
+def test_extract_findings_dedupes_compact_schema_lines():
+    transcript = (
+        "Findings:\n"
+        "- `[HIGH] a.py:1 - bug - fix it`\n"
+        "[LOW] b.py - nit - rename\n"
+        "- [HIGH] a.py:1 - bug - fix it\n"
+        "Use `HIGH|MEDIUM|LOW`.\n"
+    )
+
+    assert extract_findings(transcript) == [
+        "[HIGH] a.py:1 - bug - fix it",
+        "[LOW] b.py - nit - rename",
+    ]
+
+
 # ---------------------------------------------------------------------------
 # _parse_verdict
 # ---------------------------------------------------------------------------
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -47,6 +48,36 @@ class TestRunContext:
         transcript = (run_dir / "transcript.log").read_text()
         assert transcript == "line 1\nline 2"
 
+    def test_append_transcript_streams_before_finalize(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "run1"
+        run_dir.mkdir()
+        ctx = RunContext(run_dir, issue_number=42, timestamp="20260101T000000Z")
+        ctx.append_transcript("line 1")
+        ctx.append_transcript("line 2")
+
+        assert (run_dir / "transcript.log").read_text() == "line 1\nline 2"
+
+    def test_compressed_transcript_buffers_until_frame_is_due(
+        self, tmp_path: Path
+    ) -> None:
+        run_dir = tmp_path / "run1"
+        run_dir.mkdir()
+        ctx = RunContext(
+            run_dir,
+            issue_number=42,
+            timestamp="20260101T000000Z",
+            compress_transcript=True,
+        )
+        ctx.append_transcript("line 1")
+
+        assert (run_dir / "transcript.log.gz").stat().st_size == 0
+
+        with patch("run_recorder._FLUSH_INTERVAL_SECONDS", 0):
+            ctx.append_transcript("line 2")
+
+        assert (run_dir / "transcript.log.gz").stat().st_size > 0
+        ctx.finalize("success")
+
     def test_save_diff_writes_patch(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "run1"
         run_dir.mkdir()
@@ -231,6 +262,165 @@ class TestRunRecorder:
         assert recorder.runs_dir == tmp_path / "repo" / ".hydraflow" / "runs"
 
 
+# ---------------------------------------------------------------------------
+# Compressed transcripts
+# ---------------------------------------------------------------------------
+
+
+class TestCompressedTranscripts:
+    """Tests for gzip-framed transcripts and ranged reads."""
+
+    def _record(self, tmp_path: Path, lines: list[str]) -> tuple[RunRecorder, str]:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        config.artifact_compress_transcripts = True
+        recorder = RunRecorder(config)
+        ctx = recorder.start(42)
+        with patch("run_recorder._FRAME_BYTES", 64):
+            for line in lines:
+                ctx.append_transcript(line)
+            ctx.finalize("success")
+        return recorder, ctx.run_dir.name
+
+    def test_transcript_is_decompressed_transparently(self, tmp_path: Path) -> None:
+        lines = [f"line {i} " + "x" * 20 for i in range(50)]
+        recorder, ts = self._record(tmp_path, lines)
+
+        run_dir = recorder.runs_dir / "42" / ts
+        assert not (run_dir / "transcript.log").exists()
+        assert (run_dir / "transcript.log.gz").is_file()
+        assert recorder.get_run_artifact(42, ts, "transcript.log") == "\n".join(lines)
+
+    def test_range_read_spans_frames(self, tmp_path: Path) -> None:
+        lines = [f"line {i} " + "x" * 20 for i in range(50)]
+        recorder, ts = self._record(tmp_path, lines)
+        full = "\n".join(lines).encode()
+
+        ranged = recorder.read_run_artifact_range(42, ts, "transcript.log", 100, 300)
+
+        assert ranged == (full[100:400], len(full))
+
+    def test_truncated_tail_frame_is_ignored(self, tmp_path: Path) -> None:
+        recorder, ts = self._record(tmp_path, ["a" * 100, "b" * 100])
+        gz_path = recorder.runs_dir / "42" / ts / "transcript.log.gz"
+        data = gz_path.read_bytes()
+        gz_path.write_bytes(data[:-5])
+
+        content = recorder.get_run_artifact(42, ts, "transcript.log")
+
+        assert content is not None
+        assert content.startswith("a" * 64)
+
+    def test_storage_stats_report_compression_ratio(self, tmp_path: Path) -> None:
+        recorder, _ts = self._record(tmp_path, ["same line"] * 500)
+
+        stats = recorder.get_storage_stats()
+
+        assert stats["transcript_uncompressed_bytes"] == len(
+            "\n".join(["same line"] * 500)
+        )
+        assert stats["transcript_compression_ratio"] > 1.0
+
+    def test_plain_transcript_range_read(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        recorder = RunRecorder(config)
+        ctx = recorder.start(42)
+        ctx.append_transcript("hello world")
+        ctx.finalize("success")
+
+        ranged = recorder.read_run_artifact_range(
+            42, ctx.run_dir.name, "transcript.log", 6
+        )
+
+        assert ranged == (b"world", 11)
+        assert recorder.get_storage_stats()["transcript_compression_ratio"] == 1.0
+
+
+# ---------------------------------------------------------------------------
+# Run catalog
+# ---------------------------------------------------------------------------
+
+
+class TestRunCatalog:
+    """Tests for the catalog that backs listing, stats and retention."""
+
+    def _make_recorder(self, tmp_path: Path) -> RunRecorder:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        return RunRecorder(config)
+
+    def _finish_run(self, recorder: RunRecorder, issue: int) -> str:
+        ctx = recorder.start(issue)
+        ctx.save_plan("x" * 100)
+        ctx.finalize("success")
+        return ctx.run_dir.name
+
+    def test_warm_start_answers_from_catalog_without_walking(
+        self, tmp_path: Path
+    ) -> None:
+        self._finish_run(self._make_recorder(tmp_path), 42)
+
+        recorder = self._make_recorder(tmp_path)
+        with patch("run_recorder._measure_run", side_effect=AssertionError):
+            stats = recorder.get_storage_stats()
+            runs = recorder.list_runs(42)
+
+        assert stats["total_runs"] == 1
+        assert stats["total_bytes"] > 100
+        assert [r.outcome for r in runs] == ["success"]
+
+    def test_missing_catalog_is_rebuilt_from_disk(self, tmp_path: Path) -> None:
+        recorder = self._make_recorder(tmp_path)
+        ts = self._finish_run(recorder, 42)
+        (recorder.runs_dir / "catalog.jsonl").unlink()
+
+        rebuilt = self._make_recorder(tmp_path)
+
+        assert [r.timestamp for r in rebuilt.list_runs(42)] == [ts]
+        assert (recorder.runs_dir / "catalog.jsonl").is_file()
+
+    def test_runs_recorded_by_another_recorder_are_visible(
+        self, tmp_path: Path
+    ) -> None:
+        reader = self._make_recorder(tmp_path)
+        writer = self._make_recorder(tmp_path)
+        assert reader.list_issues() == []
+
+        self._finish_run(writer, 7)
+
+        assert reader.list_issues() == [7]
+        assert len(reader.list_runs(7)) == 1
+
+    def test_unfinished_run_is_measured_on_load(self, tmp_path: Path) -> None:
+        recorder = self._make_recorder(tmp_path)
+        ctx = recorder.start(42)
+        ctx.save_plan("x" * 500)
+
+        stats = self._make_recorder(tmp_path).get_storage_stats()
+
+        assert stats["total_runs"] == 1
+        assert stats["total_bytes"] == 500
+        assert recorder.list_runs(42) == []
+
+    def test_catalog_is_compacted_after_purge(self, tmp_path: Path) -> None:
+        recorder = self._make_recorder(tmp_path)
+        runs_dir = recorder.runs_dir / "42"
+        for day in range(1, 4):
+            ts = f"202001{day:02d}T000000Z"
+            (runs_dir / ts).mkdir(parents=True)
+            ctx = RunContext(
+                runs_dir / ts,
+                42,
+                ts,
+                on_finalize=recorder._on_run_finalized,
+            )
+            ctx.finalize("success")
+
+        with patch("run_recorder._CATALOG_COMPACT_SLACK", 0):
+            assert recorder.purge_expired(retention_days=30) == 3
+
+        assert recorder.get_storage_stats()["total_runs"] == 0
+        assert (recorder.runs_dir / "catalog.jsonl").read_text() == ""
+
+
 # ---------------------------------------------------------------------------
 # RunManifest model
 # ---------------------------------------------------------------------------
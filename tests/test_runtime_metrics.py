@@ -0,0 +1,131 @@
+"""Tests for runtime_metrics.py — counters, gauges, histograms and hooks."""
+
+from __future__ import annotations
+
+import pytest
+
+from events import EventBus, EventType
+from execution import SimpleResult
+from runtime_metrics import REGISTRY, MetricsRegistry
+from state import StateTracker
+from subprocess_util import run_subprocess
+from tests.conftest import EventFactory
+
+# ---------------------------------------------------------------------------
+# Registry and exposition format
+# ---------------------------------------------------------------------------
+
+
+class TestMetricsRegistry:
+    """Tests for metric types and text rendering."""
+
+    def test_counter_renders_labelled_samples(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs run", ("kind",))
+        counter.inc("build")
+        counter.inc("build", amount=2)
+        counter.inc('we"ird')
+
+        text = registry.render()
+
+        assert "# HELP jobs_total Jobs run\n# TYPE jobs_total counter\n" in text
+        assert 'jobs_total{kind="build"} 3\n' in text
+        assert 'jobs_total{kind="we\\"ird"} 1\n' in text
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        registry = MetricsRegistry()
+        hist = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            hist.observe(value)
+
+        lines = registry.render().splitlines()
+
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_sum 6.25" in lines
+        assert "latency_seconds_count 4" in lines
+
+    def test_gauge_function_is_sampled_at_render(self) -> None:
+        registry = MetricsRegistry()
+        depth = {"n": 1}
+        registry.gauge("queue_depth", "Depth").set_function(lambda: depth["n"])
+        depth["n"] = 7
+
+        assert "queue_depth 7\n" in registry.render()
+
+    def test_registration_is_idempotent_per_name(self) -> None:
+        registry = MetricsRegistry()
+        first = registry.counter("x_total", "X")
+
+        assert registry.counter("x_total", "X") is first
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("x_total", "X")
+
+    def test_wrong_label_count_raises(self) -> None:
+        counter = MetricsRegistry().counter("y_total", "Y", ("a", "b"))
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc("only-one")
+
+
+# ---------------------------------------------------------------------------
+# Subsystem hooks
+# ---------------------------------------------------------------------------
+
+
+class _StaticRunner:
+    def __init__(self, result: SimpleResult) -> None:
+        self._result = result
+
+    async def run_simple(self, *args, **kwargs) -> SimpleResult:  # noqa: ANN001, D401
+        return self._result
+
+
+class TestSubsystemHooks:
+    """Tests that hot paths update the process-wide registry."""
+
+    @pytest.mark.asyncio
+    async def test_subprocess_latency_and_failures(self) -> None:
+        hist = REGISTRY.histogram(
+            "hydraflow_subprocess_duration_seconds", "", ("command",)
+        )
+        failures = REGISTRY.counter(
+            "hydraflow_subprocess_failures_total", "", ("command", "reason")
+        )
+        before_count = hist.count("uv")
+        before_failures = failures.value("uv", "exit")
+
+        await run_subprocess(
+            "uv", "sync", runner=_StaticRunner(SimpleResult("", "", 0))
+        )
+        with pytest.raises(RuntimeError):
+            await run_subprocess(
+                "uv", "sync", runner=_StaticRunner(SimpleResult("", "boom", 2))
+            )
+
+        assert hist.count("uv") == before_count + 2
+        assert failures.value("uv", "exit") == before_failures + 1
+
+    @pytest.mark.asyncio
+    async def test_event_bus_counts_drops(self) -> None:
+        dropped = REGISTRY.counter("hydraflow_event_bus_dropped_total", "")
+        before = dropped.value()
+        bus = EventBus()
+        bus.subscribe(max_queue=1)
+
+        for i in range(3):
+            await bus.publish(
+                EventFactory.create(type=EventType.WORKER_UPDATE, data={"n": i})
+            )
+
+        assert dropped.value() == before + 2
+        assert bus.subscriber_count == 1
+        assert bus.max_queue_depth == 1
+
+    def test_state_save_is_timed(self, tmp_path) -> None:
+        hist = REGISTRY.histogram("hydraflow_state_save_seconds", "")
+        before = hist.count()
+
+        StateTracker(tmp_path / "state.json").save()
+
+        assert hist.count() == before + 1
@@ -14,6 +14,8 @@ from models import (
     BackgroundWorkerState,
     LifetimeStats,
     PendingReport,
+    ReviewCheckpoint,
+    ReviewVerdict,
     SessionLog,
     SessionStatus,
     StateData,
@@ -95,6 +97,7 @@ class TestInitialization:
             "processed_issues",
             "releases",
             "review_attempts",
+            "review_checkpoints",
             "review_feedback",
             "reviewed_prs",
             "session_counters",
@@ -2014,6 +2017,26 @@ class TestLastReviewedSha:
         assert tracker.get_last_reviewed_sha(2) == "sha-issue-2"
 
 
+class TestReviewCheckpoint:
+    """Tests for set/get/clear_review_checkpoint."""
+
+    def test_persists_across_reload_and_clears(self, tmp_path: Path) -> None:
+        state_file = tmp_path / "state.json"
+        checkpoint = ReviewCheckpoint(
+            verdict=ReviewVerdict.REQUEST_CHANGES,
+            summary="Needs tests",
+            findings=["[MEDIUM] a.py - untested - add test"],
+            incremental_streak=2,
+        )
+        StateTracker(state_file).set_review_checkpoint(42, checkpoint)
+
+        tracker = StateTracker(state_file)
+        assert tracker.get_review_checkpoint(42) == checkpoint
+
+        tracker.clear_review_checkpoint(42)
+        assert tracker.get_review_checkpoint(42) is None
+
+
 # ---------------------------------------------------------------------------
 # Narrowed exception handling (issue #879)
 # ---------------------------------------------------------------------------
@@ -455,6 +455,7 @@ class TestRunSubprocessWithRetry:
             gh_token="ghp_test",
             timeout=120.0,
             runner=None,
+            capture=None,
         )
 
 
@@ -611,6 +612,7 @@ class TestRetryWithTimeout:
             gh_token="",
             timeout=60.0,
             runner=None,
+            capture=None,
         )
 
 
@@ -0,0 +1,195 @@
+"""Tests for test_impact.py — affected-test selection."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from execution import HostRunner
+from test_impact import (
+    STACK_IMPACT_RULES,
+    changed_files,
+    mapped_tests,
+    parse_impact_rules,
+    python_impacted_tests,
+    select_impacted_tests,
+)
+from tests.helpers import ConfigFactory
+
+
+def _write(root: Path, rel: str, text: str = "") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def py_repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    _write(root, "pyproject.toml", "[project]\nname = 'x'\n")
+    _write(root, "src/pkg/__init__.py")
+    _write(root, "src/pkg/core.py", "VALUE = 1\n")
+    _write(root, "src/pkg/service.py", "from .core import VALUE\n")
+    _write(root, "src/other.py", "import json\n")
+    _write(root, "tests/conftest.py")
+    _write(root, "tests/test_service.py", "from pkg.service import VALUE\n")
+    _write(root, "tests/test_other.py", "import other\n")
+    _write(root, "tests/unit/conftest.py")
+    _write(root, "tests/unit/test_core.py", "from pkg import core\n")
+    return root
+
+
+class TestPythonImpactedTests:
+    """Tests for import-graph selection."""
+
+    def test_transitive_and_relative_imports(self, py_repo: Path) -> None:
+        assert python_impacted_tests(py_repo, ["src/pkg/core.py"]) == [
+            "tests/test_service.py",
+            "tests/unit/test_core.py",
+        ]
+
+    def test_changed_test_selects_itself(self, py_repo: Path) -> None:
+        assert python_impacted_tests(py_repo, ["tests/test_other.py"]) == [
+            "tests/test_other.py"
+        ]
+
+    def test_deleted_module_selects_importers(self, py_repo: Path) -> None:
+        (py_repo / "src/other.py").unlink()
+
+        assert python_impacted_tests(py_repo, ["src/other.py"]) == [
+            "tests/test_other.py"
+        ]
+
+    def test_changed_conftest_selects_its_directory(self, py_repo: Path) -> None:
+        assert python_impacted_tests(py_repo, ["tests/unit/conftest.py"]) == [
+            "tests/unit"
+        ]
+
+    def test_non_python_changes_select_nothing(self, py_repo: Path) -> None:
+        assert python_impacted_tests(py_repo, ["README.md"]) == []
+
+
+class TestMappedTests:
+    """Tests for rule-based selection on other stacks."""
+
+    def test_node_sibling_tests(self, tmp_path: Path) -> None:
+        _write(tmp_path, "src/app.ts")
+        _write(tmp_path, "src/app.test.ts")
+        _write(tmp_path, "src/util.js")
+        _write(tmp_path, "src/__tests__/util.test.js")
+
+        targets = mapped_tests(
+            tmp_path, ["src/app.ts", "src/util.js"], STACK_IMPACT_RULES["node"]
+        )
+
+        assert targets == ["src/__tests__/util.test.js", "src/app.test.ts"]
+
+    def test_go_maps_to_package_dirs(self, tmp_path: Path) -> None:
+        _write(tmp_path, "pkg/api/handler.go")
+
+        targets = mapped_tests(
+            tmp_path, ["pkg/api/handler.go", "main.go"], STACK_IMPACT_RULES["go"]
+        )
+
+        assert targets == ["./", "./pkg/api/"]
+
+    def test_extra_rules_and_missing_targets(self, tmp_path: Path) -> None:
+        _write(tmp_path, "checks/lib_check.sh")
+        extra = parse_impact_rules([r"^lib/(\w+)\.sh$ => checks/{1}_check.sh"])
+
+        targets = mapped_tests(
+            tmp_path,
+            ["lib/lib.sh", "app/models/user.rb"],
+            STACK_IMPACT_RULES["ruby"],
+            extra,
+        )
+
+        assert targets == ["checks/lib_check.sh"]
+
+    def test_parse_impact_rules_skips_malformed(self) -> None:
+        rules = parse_impact_rules(["no arrow", "([ => x", r"^a/(.*)$ => t/{1}"])
+
+        assert rules == [(r"^a/(.*)$", "t/{1}")]
+
+
+class TestSelectImpactedTests:
+    """Tests for per-stack selection."""
+
+    def test_python_stack_uses_override_command(
+        self, py_repo: Path, tmp_path: Path
+    ) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "cfg")
+        config.incremental_test_command = "uv run pytest -x"
+
+        [selection] = select_impacted_tests(config, py_repo, ["src/other.py"])
+
+        assert selection.stack == "python"
+        assert selection.argv == ["uv", "run", "pytest", "-x", "tests/test_other.py"]
+
+    def test_unmapped_stack_selects_nothing(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "cfg")
+        root = tmp_path / "rust"
+        _write(root, "Cargo.toml")
+        _write(root, "src/lib.rs")
+
+        assert select_impacted_tests(config, root, ["src/lib.rs"]) == []
+
+    @pytest.mark.parametrize(
+        ("returncode", "output", "expected"),
+        [
+            (1, "FAILED tests/test_other.py::test_x", True),
+            (1, "/usr/bin/python: No module named pytest", False),
+            (4, "ERROR: usage", False),
+            (5, "no tests ran", False),
+            (127, "python: command not found", False),
+        ],
+    )
+    def test_only_genuine_failures_count(
+        self,
+        py_repo: Path,
+        tmp_path: Path,
+        returncode: int,
+        output: str,
+        expected: bool,
+    ) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "cfg")
+
+        [selection] = select_impacted_tests(config, py_repo, ["src/other.py"])
+
+        assert selection.is_test_failure(returncode, output) is expected
+
+
+class TestChangedFiles:
+    """Tests for listing a worktree's changes."""
+
+    @pytest.mark.asyncio
+    async def test_includes_committed_uncommitted_and_untracked(
+        self, tmp_path: Path
+    ) -> None:
+        def git(*args: str) -> None:
+            subprocess.run(
+                ["git", *args], cwd=tmp_path, check=True, capture_output=True
+            )
+
+        git("init", "-q", "-b", "main")
+        git("config", "user.email", "t@example.com")
+        git("config", "user.name", "t")
+        _write(tmp_path, "a.py", "a = 1\n")
+        _write(tmp_path, "b.py", "b = 1\n")
+        git("add", "-A")
+        git("commit", "-qm", "base")
+        git("checkout", "-qb", "feature")
+        _write(tmp_path, "a.py", "a = 2\n")
+        git("commit", "-qam", "change a")
+        _write(tmp_path, "b.py", "b = 2\n")
+        _write(tmp_path, "c.py", "c = 1\n")
+
+        changed = await changed_files(tmp_path, "main", HostRunner(), timeout=30)
+
+        assert changed == ["a.py", "b.py", "c.py"]
+
+    @pytest.mark.asyncio
+    async def test_returns_none_outside_git(self, tmp_path: Path) -> None:
+        assert await changed_files(tmp_path, "main", HostRunner(), timeout=30) is None
@@ -8,10 +8,10 @@ from pathlib import Path
 
 import pytest
 
-from events import EventBus, EventType, HydraFlowEvent
+from events import EventBus, EventLog, EventType, HydraFlowEvent
 from state import StateTracker
 from tests.conftest import EventFactory
-from timeline import TimelineBuilder
+from timeline import TimelineBuilder, TimelineIndex
 
 
 def _ts(offset_seconds: int = 0) -> str:
@@ -614,6 +614,74 @@ class TestEdgeCases:
         assert "implement" in stage_names
 
 
+# ---------------------------------------------------------------------------
+# Incremental index
+# ---------------------------------------------------------------------------
+
+
+class TestTimelineIndex:
+    @pytest.mark.asyncio
+    async def test_pr_events_before_pr_created_are_claimed(
+        self, event_bus: EventBus
+    ) -> None:
+        index = TimelineIndex(event_bus)
+        await event_bus.publish(_event(EventType.CI_CHECK, 0, pr=7, status="passed"))
+        await event_bus.publish(_event(EventType.WORKER_UPDATE, 5, issue=42))
+        await event_bus.publish(_event(EventType.PR_CREATED, 10, issue=42, pr=7))
+
+        events = index.events_for(42)
+
+        assert [e.type for e in events] == [
+            EventType.CI_CHECK,
+            EventType.WORKER_UPDATE,
+            EventType.PR_CREATED,
+        ]
+        assert index.issue_numbers() == [42]
+
+    @pytest.mark.asyncio
+    async def test_matches_full_rebuild(self, event_bus: EventBus) -> None:
+        await event_bus.publish(_event(EventType.TRIAGE_UPDATE, 0, issue=1))
+        index = TimelineIndex(event_bus)
+        await event_bus.publish(_event(EventType.PR_CREATED, 5, issue=1, pr=10))
+        await event_bus.publish(
+            _event(EventType.MERGE_UPDATE, 9, pr=10, status="merged")
+        )
+        await event_bus.publish(_event(EventType.PLANNER_UPDATE, 3, issue=2))
+
+        indexed = TimelineBuilder(event_bus, index=index).build_all()
+
+        assert indexed == TimelineBuilder(event_bus).build_all()
+
+    @pytest.mark.asyncio
+    async def test_events_leave_with_bus_history_window(self) -> None:
+        bus = EventBus(max_history=3)
+        index = TimelineIndex(bus)
+        await bus.publish(_event(EventType.TRIAGE_UPDATE, 0, issue=1))
+        for offset in range(1, 4):
+            await bus.publish(_event(EventType.PLANNER_UPDATE, offset, issue=2))
+
+        assert index.events_for(1) == []
+        assert index.issue_numbers() == [2]
+        assert TimelineBuilder(bus, index=index).build_for_issue(1) is None
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_after_history_loaded_from_disk(
+        self, tmp_path: Path
+    ) -> None:
+        log = EventLog(tmp_path / "events.jsonl")
+        await log.append(_event(EventType.TRIAGE_UPDATE, 0, issue=5))
+        bus = EventBus(event_log=log)
+        index = TimelineIndex(bus)
+
+        await bus.load_history_from_disk()
+        await bus.publish(_event(EventType.PLANNER_UPDATE, 10, issue=5))
+
+        assert [e.type for e in index.events_for(5)] == [
+            EventType.TRIAGE_UPDATE,
+            EventType.PLANNER_UPDATE,
+        ]
+
+
 # ---------------------------------------------------------------------------
 # API endpoint integration
 # ---------------------------------------------------------------------------
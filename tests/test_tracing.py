@@ -0,0 +1,227 @@
+"""Tests for tracing.py — span recording, export and waterfalls."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import tracing
+from tests.helpers import ConfigFactory
+from tracing import (
+    SPAN_FILE,
+    Tracer,
+    build_waterfall,
+    child_span,
+    load_issue_spans,
+    span,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _read_spans(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+# ---------------------------------------------------------------------------
+# Tracer
+# ---------------------------------------------------------------------------
+
+
+class TestTracer:
+    """Tests for span nesting, attributes and export."""
+
+    def test_children_link_to_parent_and_inherit_issue(self, tmp_path: Path) -> None:
+        path = tmp_path / SPAN_FILE
+        tracer = Tracer(path)
+
+        with tracer.span("phase.review", issue=5), tracer.span("ci.wait", pr=50) as ci:
+            assert ci is not None
+            ci.set_attribute("passed", True)
+            with tracer.span("subprocess", cmd="gh pr"):
+                pass
+
+        records = {r["name"]: r for r in _read_spans(path)}
+        root = records["phase.review"]
+        assert root["parent_id"] is None
+        assert records["ci.wait"]["parent_id"] == root["span_id"]
+        assert records["ci.wait"]["attrs"] == {"passed": True}
+        sub = records["subprocess"]
+        assert sub["parent_id"] == records["ci.wait"]["span_id"]
+        assert (sub["issue"], sub["pr"]) == (5, 50)
+        assert {r["trace_id"] for r in records.values()} == {root["trace_id"]}
+
+    @pytest.mark.asyncio
+    async def test_spans_in_child_tasks_keep_their_parent(self, tmp_path: Path) -> None:
+        path = tmp_path / SPAN_FILE
+        tracer = Tracer(path)
+
+        async def _work(n: int) -> None:
+            with tracer.span("agent", attempt=n):
+                await asyncio.sleep(0)
+
+        with tracer.span("phase.implement", issue=9):
+            await asyncio.gather(_work(1), _work(2))
+
+        records = _read_spans(path)
+        root = next(r for r in records if r["name"] == "phase.implement")
+        agents = [r for r in records if r["name"] == "agent"]
+        assert len(agents) == 2
+        assert all(a["parent_id"] == root["span_id"] for a in agents)
+        assert all(a["issue"] == 9 for a in agents)
+
+    def test_unsampled_trace_records_nothing(self, tmp_path: Path) -> None:
+        path = tmp_path / SPAN_FILE
+        tracer = Tracer(path, sample_rate=0.5, rng=lambda: 0.9)
+
+        with tracer.span("phase.plan", issue=1) as root:
+            assert root is None
+            with tracer.span("subprocess") as child:
+                assert child is None
+
+        assert not path.exists()
+
+    def test_short_child_spans_are_dropped(self, tmp_path: Path) -> None:
+        path = tmp_path / SPAN_FILE
+        tracer = Tracer(path, min_duration_ms=60_000)
+
+        with tracer.span("phase.plan", issue=1), tracer.span("subprocess"):
+            pass
+
+        assert [r["name"] for r in _read_spans(path)] == ["phase.plan"]
+
+    def test_exception_marks_span_as_error(self, tmp_path: Path) -> None:
+        path = tmp_path / SPAN_FILE
+        tracer = Tracer(path)
+
+        with pytest.raises(RuntimeError), tracer.span("workspace.create", issue=3):
+            raise RuntimeError("boom")
+
+        (record,) = _read_spans(path)
+        assert record["status"] == "error"
+        assert record["attrs"]["error"] == "RuntimeError"
+
+    def test_child_spans_are_buffered_until_root_ends(self, tmp_path: Path) -> None:
+        path = tmp_path / SPAN_FILE
+        tracer = Tracer(path)
+
+        with tracer.span("phase.plan", issue=1):
+            with tracer.span("subprocess"):
+                pass
+            assert not path.exists()
+
+        assert len(_read_spans(path)) == 2
+
+    def test_file_rotates_when_large(self, tmp_path: Path) -> None:
+        path = tmp_path / SPAN_FILE
+        tracer = Tracer(path)
+        with patch("tracing._MAX_FILE_BYTES", 1):
+            with tracer.span("phase.plan", issue=1):
+                pass
+            with tracer.span("phase.plan", issue=1):
+                pass
+
+        assert len(_read_spans(path.with_name(SPAN_FILE + ".1"))) == 1
+        assert len(load_issue_spans(path, 1)) == 2
+
+
+# ---------------------------------------------------------------------------
+# Process-wide tracer
+# ---------------------------------------------------------------------------
+
+
+class TestConfigureTracing:
+    """Tests for the module-level tracer."""
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        with patch.object(tracing, "_tracer", None):
+            tracing.configure_tracing(config)
+            assert tracing.get_tracer() is None
+            with span("subprocess") as handle:
+                assert handle is None
+
+    def test_enabled_writes_under_data_root(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        config.tracing_enabled = True
+        with patch.object(tracing, "_tracer", None):
+            tracing.configure_tracing(config)
+            with span("phase.find", issue=4):
+                pass
+            tracer = tracing.get_tracer()
+
+        assert tracer is not None
+        assert tracer.path == config.data_path("traces", SPAN_FILE)
+        assert [r["issue"] for r in _read_spans(tracer.path)] == [4]
+
+    def test_child_span_only_records_under_a_parent(self, tmp_path: Path) -> None:
+        config = ConfigFactory.create(repo_root=tmp_path / "repo")
+        config.tracing_enabled = True
+        with patch.object(tracing, "_tracer", None):
+            tracing.configure_tracing(config)
+            with child_span("subprocess", cmd="gh api") as orphan:
+                assert orphan is None
+            with span("phase.review", pr=7), child_span("subprocess") as child:
+                assert child is not None
+            tracer = tracing.get_tracer()
+
+        assert tracer is not None
+        names = [r["name"] for r in _read_spans(tracer.path)]
+        assert sorted(names) == ["phase.review", "subprocess"]
+
+
+# ---------------------------------------------------------------------------
+# Waterfall
+# ---------------------------------------------------------------------------
+
+
+class TestBuildWaterfall:
+    """Tests for waterfall layout and latency breakdown."""
+
+    def test_self_time_excludes_children(self) -> None:
+        spans = [
+            {
+                "name": "phase.implement",
+                "span_id": "a",
+                "parent_id": None,
+                "start": 100.0,
+                "duration_ms": 10_000.0,
+            },
+            {
+                "name": "agent",
+                "span_id": "b",
+                "parent_id": "a",
+                "start": 101.0,
+                "duration_ms": 6_000.0,
+            },
+            {
+                "name": "subprocess",
+                "span_id": "c",
+                "parent_id": "b",
+                "start": 102.0,
+                "duration_ms": 1_000.0,
+            },
+        ]
+
+        waterfall = build_waterfall(7, spans)
+
+        assert waterfall["total_ms"] == 10_000.0
+        rows = {r["name"]: r for r in waterfall["spans"]}
+        assert rows["agent"]["offset_ms"] == 1_000.0
+        assert rows["subprocess"]["depth"] == 2
+        breakdown = {b["name"]: b["self_ms"] for b in waterfall["breakdown"]}
+        assert breakdown == {
+            "phase.implement": 4_000.0,
+            "agent": 5_000.0,
+            "subprocess": 1_000.0,
+        }
+        assert waterfall["breakdown"][0]["name"] == "agent"
+
+    def test_empty(self) -> None:
+        assert build_waterfall(7, [])["spans"] == []
@@ -205,6 +205,55 @@ class TestCreate:
 
         assert result == config.worktree_path_for_issue(99)
 
+    @pytest.mark.asyncio
+    async def test_create_evicts_idle_workspaces_over_disk_quota(
+        self, config, tmp_path: Path
+    ) -> None:
+        """create should destroy quota victims before cloning."""
+        manager = WorkspaceManager(config)
+        config.worktree_base.mkdir(parents=True, exist_ok=True)
+        accountant = MagicMock()
+        accountant.plan_evictions.return_value = [3, 5]
+        manager.set_disk_accountant(accountant)
+
+        with (
+            patch("asyncio.create_subprocess_exec", return_value=make_proc()),
+            patch.object(manager, "_remote_branch_exists", return_value=False),
+            patch.object(manager, "_setup_env"),
+            patch.object(manager, "_create_venv", new_callable=AsyncMock),
+            patch.object(manager, "_install_hooks", new_callable=AsyncMock),
+            patch.object(
+                manager, "_destroy_unlocked", new_callable=AsyncMock
+            ) as destroy,
+        ):
+            await manager.create(issue_number=7, branch="agent/issue-7")
+
+        assert [c.args[0] for c in destroy.await_args_list] == [3, 5]
+        assert [c.args[0] for c in accountant.record_eviction.call_args_list] == [3, 5]
+        accountant.plan_evictions.assert_called_once_with({7})
+
+    @pytest.mark.asyncio
+    async def test_create_continues_when_quota_check_fails(
+        self, config, tmp_path: Path
+    ) -> None:
+        """A failing disk scan should not block workspace creation."""
+        manager = WorkspaceManager(config)
+        config.worktree_base.mkdir(parents=True, exist_ok=True)
+        accountant = MagicMock()
+        accountant.plan_evictions.side_effect = OSError("scan failed")
+        manager.set_disk_accountant(accountant)
+
+        with (
+            patch("asyncio.create_subprocess_exec", return_value=make_proc()),
+            patch.object(manager, "_remote_branch_exists", return_value=False),
+            patch.object(manager, "_setup_env"),
+            patch.object(manager, "_create_venv", new_callable=AsyncMock),
+            patch.object(manager, "_install_hooks", new_callable=AsyncMock),
+        ):
+            result = await manager.create(issue_number=7, branch="agent/issue-7")
+
+        assert result == config.worktree_path_for_issue(7)
+
     @pytest.mark.asyncio
     async def test_create_dry_run_skips_git_commands(
         self, dry_config, tmp_path: Path
@@ -503,6 +552,42 @@ class TestDestroy:
 
         assert not wt_path.exists()
 
+    @pytest.mark.asyncio
+    async def test_destroy_removes_quality_spill_files(
+        self, config, tmp_path: Path
+    ) -> None:
+        """destroy should delete spilled make quality output for the workspace."""
+        manager = WorkspaceManager(config)
+        wt_path = config.worktree_path_for_issue(7)
+        wt_path.mkdir(parents=True, exist_ok=True)
+        spill = config.quality_spill_path(wt_path)
+        spill.parent.mkdir(parents=True, exist_ok=True)
+        mine = spill.with_name(f"{spill.name}.stdout.log")
+        other = spill.with_name("issue-70.stdout.log")
+        mine.write_text("full output")
+        other.write_text("keep")
+
+        await manager.destroy(issue_number=7)
+
+        assert not mine.exists()
+        assert other.exists()
+
+    @pytest.mark.asyncio
+    async def test_destroy_releases_runner_resources(
+        self, config, tmp_path: Path
+    ) -> None:
+        """destroy should let the runner drop pooled containers for the workspace."""
+        manager = WorkspaceManager(config)
+        runner = AsyncMock()
+        manager.set_subprocess_runner(runner)
+        wt_path = config.worktree_path_for_issue(7)
+        wt_path.mkdir(parents=True, exist_ok=True)
+
+        await manager.destroy(issue_number=7)
+
+        runner.release_workspace.assert_awaited_once_with(str(wt_path))
+        assert not wt_path.exists()
+
     @pytest.mark.asyncio
     async def test_destroy_handles_non_existent_worktree_gracefully(
         self, config, tmp_path: Path
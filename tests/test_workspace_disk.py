@@ -0,0 +1,209 @@
+"""Tests for workspace_disk.py — WorkspaceDiskAccountant."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from state import StateTracker
+from tests.helpers import ConfigFactory
+from workspace_disk import WorkspaceDiskAccountant, is_workspace_busy
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_accountant(
+    tmp_path: Path,
+    *,
+    quota_mb: int = 0,
+    in_pipeline: set[int] | None = None,
+    clock: _Clock | None = None,
+) -> tuple[WorkspaceDiskAccountant, StateTracker]:
+    config = ConfigFactory.create(
+        repo_root=tmp_path / "repo",
+        worktree_base=tmp_path / "wt",
+        state_file=tmp_path / "state.json",
+    )
+    config.worktree_disk_quota_mb = quota_mb
+    state = StateTracker(config.state_file)
+    pipeline = in_pipeline or set()
+    accountant = WorkspaceDiskAccountant(
+        config, state, lambda n: n in pipeline, rescan_after=60, clock=clock or _Clock()
+    )
+    return accountant, state
+
+
+def _make_workspace(
+    accountant: WorkspaceDiskAccountant, issue_number: int, size: int, mtime: float
+) -> Path:
+    path = accountant._config.worktree_path_for_issue(issue_number)
+    (path / "sub").mkdir(parents=True)
+    (path / "sub" / "blob.bin").write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Usage accounting
+# ---------------------------------------------------------------------------
+
+
+class TestUsageStats:
+    """Tests for WorkspaceDiskAccountant.get_usage_stats."""
+
+    def test_no_workspaces(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path)
+
+        stats = accountant.get_usage_stats()
+
+        assert stats["total_bytes"] == 0
+        assert stats["workspaces"] == []
+
+    def test_per_workspace_and_total(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path)
+        _make_workspace(accountant, 1, 64 * 1024, 100)
+        _make_workspace(accountant, 2, 8 * 1024, 200)
+
+        stats = accountant.get_usage_stats()
+
+        by_issue = {w["issue_number"]: w["bytes"] for w in stats["workspaces"]}
+        assert by_issue[1] >= 64 * 1024
+        assert by_issue[1] > by_issue[2]
+        assert stats["total_bytes"] == by_issue[1] + by_issue[2]
+
+    def test_hardlinks_across_workspaces_counted_once(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path)
+        first = _make_workspace(accountant, 1, 64 * 1024, 100)
+        second = _make_workspace(accountant, 2, 0, 200)
+        os.link(first / "sub" / "blob.bin", second / "sub" / "shared.bin")
+
+        stats = accountant.get_usage_stats()
+
+        by_issue = {w["issue_number"]: w["bytes"] for w in stats["workspaces"]}
+        assert by_issue[2] >= 64 * 1024
+        assert stats["total_bytes"] == by_issue[1]
+
+    def test_new_files_picked_up_immediately(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path)
+        path = _make_workspace(accountant, 1, 8 * 1024, 100)
+        before = accountant.get_usage_stats()["total_bytes"]
+
+        (path / "sub" / "more.bin").write_bytes(b"x" * 64 * 1024)
+
+        assert accountant.get_usage_stats()["total_bytes"] > before
+
+    def test_unchanged_directories_served_from_cache(self, tmp_path: Path) -> None:
+        clock = _Clock()
+        accountant, _state = _make_accountant(tmp_path, clock=clock)
+        path = _make_workspace(accountant, 1, 8 * 1024, 100)
+        before = accountant.get_usage_stats()["total_bytes"]
+        sub = path / "sub"
+        mtime_ns = sub.stat().st_mtime_ns
+
+        # Grow a file in place and keep the directory mtime unchanged.
+        with (sub / "blob.bin").open("ab") as f:
+            f.write(b"x" * 64 * 1024)
+        os.utime(sub, ns=(mtime_ns, mtime_ns))
+        cached = accountant.get_usage_stats()["total_bytes"]
+        clock.now += 61
+        rescanned = accountant.get_usage_stats()["total_bytes"]
+
+        assert cached == before
+        assert rescanned > before
+
+
+# ---------------------------------------------------------------------------
+# Quota enforcement
+# ---------------------------------------------------------------------------
+
+
+class TestPlanEvictions:
+    """Tests for WorkspaceDiskAccountant.plan_evictions."""
+
+    def test_disabled_quota_never_evicts(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path, quota_mb=0)
+        _make_workspace(accountant, 1, 2 * 1024 * 1024, 100)
+
+        assert accountant.plan_evictions() == []
+
+    def test_under_quota_returns_nothing(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path, quota_mb=10)
+        _make_workspace(accountant, 1, 64 * 1024, 100)
+
+        assert accountant.plan_evictions() == []
+
+    def test_over_quota_picks_oldest_idle_until_under(self, tmp_path: Path) -> None:
+        accountant, state = _make_accountant(tmp_path, quota_mb=1, in_pipeline={3})
+        _make_workspace(accountant, 1, 1024 * 1024, 100)
+        _make_workspace(accountant, 2, 1024 * 1024, 200)
+        _make_workspace(accountant, 3, 1024 * 1024, 50)
+        _make_workspace(accountant, 4, 1024 * 1024, 10)
+        _make_workspace(accountant, 5, 8 * 1024, 300)
+        state.set_active_issue_numbers([4])
+
+        # 3 and 4 are busy and stay; evicting 1 and 2 is not enough, and
+        # 5 is then evicted too.
+        assert accountant.plan_evictions() == [1, 2, 5]
+        assert accountant.plan_evictions(exclude={1}) == [2, 5]
+
+    def test_stops_once_under_quota(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path, quota_mb=2)
+        _make_workspace(accountant, 1, 1024 * 1024, 100)
+        _make_workspace(accountant, 2, 1024 * 1024, 200)
+        _make_workspace(accountant, 3, 512 * 1024, 300)
+
+        assert accountant.plan_evictions() == [1]
+
+    def test_shared_hardlinks_not_freed_by_one_victim(self, tmp_path: Path) -> None:
+        accountant, _state = _make_accountant(tmp_path, quota_mb=1)
+        first = _make_workspace(accountant, 1, 1536 * 1024, 100)
+        second = _make_workspace(accountant, 2, 0, 200)
+        os.link(first / "sub" / "blob.bin", second / "sub" / "shared.bin")
+
+        # Evicting 1 frees nothing while 2 still links the blob.
+        assert accountant.plan_evictions() == [1, 2]
+
+    def test_no_idle_candidates_returns_nothing(self, tmp_path: Path) -> None:
+        accountant, state = _make_accountant(tmp_path, quota_mb=1)
+        _make_workspace(accountant, 1, 2 * 1024 * 1024, 100)
+        state.set_hitl_cause(1, "stuck")
+
+        assert accountant.plan_evictions() == []
+
+    def test_record_eviction_drops_state_entry(self, tmp_path: Path) -> None:
+        accountant, state = _make_accountant(tmp_path)
+        state.set_worktree(1, "/p/1")
+
+        accountant.record_eviction(1)
+
+        assert state.get_active_worktrees() == {}
+
+
+class TestIsWorkspaceBusy:
+    """Tests for the busy predicate shared with workspace GC."""
+
+    def test_active_hitl_and_pipeline_issues_are_busy(self, tmp_path: Path) -> None:
+        _accountant, state = _make_accountant(tmp_path)
+        state.set_active_issue_numbers([1])
+        state.set_hitl_cause(2, "stuck")
+
+        def in_pipeline(n: int) -> bool:
+            return n == 3
+
+        assert is_workspace_busy(state, 1)
+        assert is_workspace_busy(state, 2)
+        assert is_workspace_busy(state, 3, in_pipeline)
+        assert not is_workspace_busy(state, 3)
+        assert not is_workspace_busy(state, 4, in_pipeline)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from events import EventType
 from state import StateTracker
 from tests.helpers import make_bg_loop_deps
-from workspace_gc_loop import _MAX_GC_PER_CYCLE, WorkspaceGCLoop
+from workspace_gc_loop import _MAX_GC_PER_CYCLE, WorkspaceGCLoop, _IssueSnapshot
 
 # Force-delete flag for branch deletion assertions
 _FORCE_DEL = chr(45) + chr(68)
@@ -61,6 +63,8 @@ def _make_loop(
         is_in_pipeline_cb=lambda n: n in in_pipeline,
     )
     loop._issue_has_pipeline_label = AsyncMock(return_value=False)  # type: ignore[method-assign]
+    # Force the per-issue path; batched-snapshot tests opt in explicitly.
+    loop._fetch_gc_snapshot = AsyncMock(return_value=None)  # type: ignore[method-assign]
     loop._collect_orphaned_branches = AsyncMock(return_value=0)  # type: ignore[method-assign]
     return loop, state, deps.stop_event
 
@@ -681,3 +685,194 @@ class TestWorktreeGCPipelineProtection:
             count = await loop._collect_orphaned_branches()
         assert count == 0
         assert m.await_count == 1
+
+
+class TestWorktreeGCBatchedSnapshot:
+    """Decisions made from one bulk snapshot instead of per-issue calls."""
+
+    @staticmethod
+    def _snapshot(
+        issues: dict[int, tuple[str, set[str]]], open_heads: set[str] | None = None
+    ) -> tuple[dict[int, _IssueSnapshot], set[str]]:
+        return (
+            {
+                n: _IssueSnapshot(state=state, labels=frozenset(labels))
+                for n, (state, labels) in issues.items()
+            },
+            open_heads or set(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_collects_closed_and_skips_protected(self, tmp_path: Path) -> None:
+        loop, state, _stop = _make_loop(
+            tmp_path,
+            active_worktrees={1: "/p/1", 2: "/p/2", 3: "/p/3", 4: "/p/4"},
+        )
+        loop._fetch_gc_snapshot = AsyncMock(  # type: ignore[method-assign]
+            return_value=self._snapshot(
+                {
+                    1: ("closed", set()),
+                    2: ("open", {loop._config.ready_label[0]}),
+                    3: ("open", set()),
+                    4: ("open", set()),
+                },
+                open_heads={loop._config.branch_for_issue(4)},
+            )
+        )
+        loop._get_issue_state = AsyncMock()
+
+        result = await loop._do_work()
+
+        assert result["collected"] == 2
+        assert result["skipped"] == 2
+        destroyed = {c.args[0] for c in loop._worktrees.destroy.await_args_list}
+        assert destroyed == {1, 3}
+        assert set(state.get_active_worktrees()) == {2, 4}
+        loop._get_issue_state.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_locally_busy_issues_not_queried(self, tmp_path: Path) -> None:
+        loop, _state, _stop = _make_loop(
+            tmp_path,
+            active_worktrees={1: "/p/1", 2: "/p/2"},
+            active_issue_numbers=[1],
+        )
+        loop._fetch_gc_snapshot = AsyncMock(  # type: ignore[method-assign]
+            return_value=self._snapshot({2: ("closed", set())})
+        )
+
+        result = await loop._do_work()
+
+        loop._fetch_gc_snapshot.assert_awaited_once_with([2])
+        loop._worktrees.destroy.assert_awaited_once_with(2)
+        assert result["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_issue_claimed_before_destroy_is_skipped(
+        self, tmp_path: Path
+    ) -> None:
+        loop, state, _stop = _make_loop(
+            tmp_path, active_worktrees={1: "/p/1", 2: "/p/2"}
+        )
+
+        async def _snapshot_then_claim(
+            issue_numbers: list[int],
+        ) -> tuple[dict[int, _IssueSnapshot], set[str]]:
+            state.set_active_issue_numbers([1])
+            return self._snapshot({n: ("closed", set()) for n in issue_numbers})
+
+        loop._fetch_gc_snapshot = _snapshot_then_claim  # type: ignore[method-assign]
+
+        result = await loop._do_work()
+
+        loop._worktrees.destroy.assert_awaited_once_with(2)
+        assert result["collected"] == 1
+        assert result["skipped"] == 1
+        assert set(state.get_active_worktrees()) == {1}
+
+    @pytest.mark.asyncio
+    async def test_orphaned_dirs_included_and_bytes_reported(
+        self, tmp_path: Path
+    ) -> None:
+        loop, _state, _stop = _make_loop(tmp_path)
+        orphan = loop._config.worktree_path_for_issue(99)
+        orphan.mkdir(parents=True)
+        (orphan / "blob.bin").write_bytes(b"x" * 8192)
+        loop._fetch_gc_snapshot = AsyncMock(  # type: ignore[method-assign]
+            return_value=self._snapshot({99: ("closed", set())})
+        )
+
+        result = await loop._do_work()
+
+        loop._worktrees.destroy.assert_awaited_once_with(99)
+        assert result["bytes_reclaimed"] >= 4096
+
+    @pytest.mark.asyncio
+    async def test_destroy_error_counted(self, tmp_path: Path) -> None:
+        loop, _state, _stop = _make_loop(
+            tmp_path, active_worktrees={1: "/p/1", 2: "/p/2"}
+        )
+        loop._fetch_gc_snapshot = AsyncMock(  # type: ignore[method-assign]
+            return_value=self._snapshot({1: ("closed", set()), 2: ("closed", set())})
+        )
+        loop._worktrees.destroy = AsyncMock(side_effect=[RuntimeError("boom"), None])
+
+        result = await loop._do_work()
+
+        assert result["collected"] == 1
+        assert result["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_issue_is_skipped(self, tmp_path: Path) -> None:
+        loop, _state, _stop = _make_loop(tmp_path, active_worktrees={1: "/p/1"})
+        loop._fetch_gc_snapshot = AsyncMock(  # type: ignore[method-assign]
+            return_value=self._snapshot({})
+        )
+
+        result = await loop._do_work()
+
+        loop._worktrees.destroy.assert_not_awaited()
+        assert result["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_pr_heads_are_paginated(self, tmp_path: Path) -> None:
+        loop, _state, _stop = _make_loop(tmp_path)
+
+        with patch(
+            "workspace_gc_loop.run_subprocess",
+            new_callable=AsyncMock,
+            return_value="b1\nb2\n",
+        ) as run:
+            heads = await loop._fetch_open_pr_heads()
+
+        assert heads == {"b1", "b2"}
+        args = run.await_args.args
+        assert args[:4] == ("gh", "api", "graphql", "--paginate")
+        assert "after: $endCursor" in args[5]
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_issue_does_not_fail_the_chunk(
+        self, tmp_path: Path
+    ) -> None:
+        loop, _state, _stop = _make_loop(tmp_path)
+        body = {
+            "data": {
+                "repository": {
+                    "i1": {"state": "CLOSED", "labels": {"nodes": []}},
+                    "i2": None,
+                }
+            },
+            "errors": [{"type": "NOT_FOUND", "path": ["repository", "i2"]}],
+        }
+        error = RuntimeError("gh failed")
+        error.__cause__ = subprocess.CalledProcessError(
+            1, ["gh"], output=json.dumps(body), stderr="Could not resolve"
+        )
+
+        with patch(
+            "workspace_gc_loop.run_subprocess",
+            new_callable=AsyncMock,
+            side_effect=error,
+        ):
+            snapshot = await loop._fetch_issue_chunk([1, 2])
+
+        assert snapshot == {1: _IssueSnapshot(state="closed", labels=frozenset())}
+
+    @pytest.mark.asyncio
+    async def test_other_graphql_errors_fail_the_chunk(self, tmp_path: Path) -> None:
+        loop, _state, _stop = _make_loop(tmp_path)
+        body = {"data": None, "errors": [{"type": "RATE_LIMITED"}]}
+        error = RuntimeError("gh failed")
+        error.__cause__ = subprocess.CalledProcessError(
+            1, ["gh"], output=json.dumps(body)
+        )
+
+        with (
+            patch(
+                "workspace_gc_loop.run_subprocess",
+                new_callable=AsyncMock,
+                side_effect=error,
+            ),
+            pytest.raises(RuntimeError, match="gh failed"),
+        ):
+            await loop._fetch_issue_chunk([1])